@@ -4,12 +4,14 @@ This module provides FastAPI dependency functions that can be injected into API
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, AsyncGenerator
 
 from fastapi import Depends, HTTPException, status, Request  # fastapi 0.103.0+
 from sqlalchemy.orm import Session  # sqlalchemy 2.0.0+
+from sqlalchemy.ext.asyncio import AsyncSession  # sqlalchemy 2.0.0+
 
 from ..db.session import get_db, DatabaseSessionManager  # Import database session context manager
+from ..db.async_session import AsyncDatabaseSessionManager  # Import async database session manager
 from ..core.auth import authenticate_request, get_api_key_from_header, APIKeyAuthenticator  # Import authentication function
 from ..services.data.stocks import StockService  # Import stock data service
 from ..services.data.brokers import BrokerService  # Import broker data service
@@ -24,6 +26,8 @@ logger = logging.getLogger(__name__)
 
 # Initialize global instances
 db_session_manager = DatabaseSessionManager()
+read_db_session_manager = DatabaseSessionManager(read_only=True)
+async_db_session_manager = AsyncDatabaseSessionManager()
 api_key_authenticator = APIKeyAuthenticator()
 stock_service = StockService()
 broker_service = BrokerService()
@@ -44,6 +48,32 @@ def get_db_session() -> Session:
         # Session is automatically closed after the endpoint execution
 
 
+def get_read_db_session() -> Session:
+    """
+    Dependency function that provides a read-only database session routed to replicas
+
+    Use for reporting and analytics endpoints that tolerate replica lag.
+
+    Returns:
+        Session: SQLAlchemy database session
+    """
+    with read_db_session_manager.get_session() as session:
+        yield session
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function that provides an async database session
+
+    Use in async endpoints so database I/O does not block the event loop.
+
+    Returns:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with async_db_session_manager.get_session() as session:
+        yield session
+
+
 def get_auth_from_request(request: Request) -> Dict[str, Any]:
     """
     Dependency function that authenticates the request and returns client information
@@ -84,6 +114,28 @@ def get_auth_from_request(request: Request) -> Dict[str, Any]:
         )
 
 
+def require_admin(auth_result: Dict[str, Any] = Depends(get_auth_from_request)) -> str:
+    """
+    Dependency function that restricts an endpoint to administrator clients
+
+    Args:
+        auth_result: Authentication result of the request
+
+    Returns:
+        str: Client ID of the administrator
+    """
+    # Only clients listed in ADMIN_CLIENT_IDS may call admin endpoints
+    client_id = auth_result.get("client_id")
+    if client_id not in get_settings().admin_client_ids:
+        logger.warning(f"Client {client_id} denied access to admin endpoint")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator access required"
+        )
+
+    return client_id
+
+
 def get_client_id(auth_result: Dict[str, Any]) -> str:
     """
     Dependency function that extracts the client ID from the authenticated request
@@ -170,7 +222,7 @@ async def get_broker_config(
     """
     try:
         # Use broker_service to get broker configuration by client_id
-        broker_config = broker_service.get_broker(client_id)
+        broker_config = await broker_service.get_broker_async(client_id)
         # Return the broker configuration
         return broker_config
     except Exception as e:
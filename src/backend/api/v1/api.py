@@ -5,8 +5,8 @@ This module aggregates all endpoint routers from different modules and configure
 
 import logging  # Standard library for logging
 from fastapi import APIRouter, Depends  # fastapi 0.103.0+ - Import FastAPI's APIRouter and Depends for creating and configuring API routes
-from .endpoints import health, rates, calculate, config  # Internal imports - Import endpoint-specific routers
-from ..deps import authenticate_api_key  # Internal imports - Import authentication dependency for API endpoints
+from .endpoints import health, rates, calculate, config, admin  # Internal imports - Import endpoint-specific routers
+from ..deps import authenticate_api_key, require_admin  # Internal imports - Import authentication dependency for API endpoints
 from ...core.constants import API_VERSION  # Internal imports - Import API version constant for versioning information
 from ...utils.logging import setup_logger  # Internal imports - Import function to set up logger for the API module
 from ...core.middleware import get_exempt_paths  # Internal imports - Import function to get paths exempt from authentication
@@ -37,6 +37,9 @@ def configure_routes():
     # Include config router with authentication dependency
     api_router.include_router(config.router, dependencies=[Depends(authenticate_api_key)])
 
+    # Include admin router restricted to administrator clients
+    api_router.include_router(admin.router, dependencies=[Depends(require_admin)])
+
     # Log successful router configuration
     logger.info("API v1 router configured with all endpoints")
 
@@ -9,10 +9,12 @@ from .health import router as health_router  # Import health check endpoints rou
 from .rates import router as rates_router  # Import borrow rates endpoints router
 from .calculate import router as calculate_router  # Import fee calculation endpoints router
 from .config import router as config_router  # Import configuration endpoints router
+from .admin import router as admin_router  # Import administrative profiler endpoints router
 
 __all__ = [
     "health_router",  # Export health check endpoints router for API configuration
     "rates_router",  # Export borrow rates endpoints router for API configuration
     "calculate_router",  # Export fee calculation endpoints router for API configuration
     "config_router",  # Export configuration endpoints router for API configuration
+    "admin_router",  # Export administrative profiler endpoints router for API configuration
 ]
\ No newline at end of file
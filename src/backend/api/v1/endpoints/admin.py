@@ -0,0 +1,114 @@
+"""
+Implements administrative endpoints for the Borrow Rate & Locate Fee Pricing Engine API.
+This module exposes the in-process sampling profiler so operators can capture folded stacks from a running worker, attributed to endpoints, correlation IDs and calculation stages, without redeploying. Access is restricted to the clients listed in ADMIN_CLIENT_IDS and the profiler must be enabled with PROFILER_ENABLED.
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status  # fastapi 0.103.0+
+from fastapi.responses import PlainTextResponse
+
+from ...deps import require_admin  # Restrict endpoints to administrator clients
+from ....config.settings import get_settings  # Access application configuration settings
+from ....utils.logging import setup_logger  # Import logging utility for admin operations
+from ....utils.profiler import profiler, DEFAULT_MAX_DURATION  # Per-worker sampling profiler
+
+# Initialize router and logger
+router = APIRouter(prefix='/admin/profiler', tags=['admin'])
+logger = setup_logger('api.admin')
+
+
+def ensure_profiler_enabled() -> None:
+    """
+    Rejects profiler requests unless PROFILER_ENABLED is set.
+    """
+    if not get_settings().profiler_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiler is disabled")
+
+
+@router.post('/start')
+def start_profiler(
+    interval_ms: float = Query(10.0, ge=1.0, le=1000.0, description="Milliseconds between samples"),
+    duration_seconds: float = Query(60.0, gt=0, le=DEFAULT_MAX_DURATION, description="Seconds until sampling stops by itself"),
+    client_id: str = Depends(require_admin)
+) -> Dict[str, Any]:
+    """
+    Starts sampling stacks in the worker that serves this request
+
+    Args:
+        interval_ms: Milliseconds between samples
+        duration_seconds: Seconds until sampling stops by itself
+        client_id: Administrator client ID
+
+    Returns:
+        Dict[str, Any]: Profiler status, including the worker pid
+    """
+    ensure_profiler_enabled()
+    try:
+        result = profiler.start(interval=interval_ms / 1000, duration=duration_seconds)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    logger.info(f"Profiler started by {client_id}")
+    return result
+
+
+@router.post('/stop')
+def stop_profiler(client_id: str = Depends(require_admin)) -> Dict[str, Any]:
+    """
+    Stops sampling and keeps the collected samples for download
+
+    Args:
+        client_id: Administrator client ID
+
+    Returns:
+        Dict[str, Any]: Profiler status
+    """
+    ensure_profiler_enabled()
+    logger.info(f"Profiler stopped by {client_id}")
+    return profiler.stop()
+
+
+@router.get('/status')
+def get_profiler_status(client_id: str = Depends(require_admin)) -> Dict[str, Any]:
+    """
+    Returns the profiler state of the worker that serves this request
+
+    Args:
+        client_id: Administrator client ID
+
+    Returns:
+        Dict[str, Any]: Profiler status
+    """
+    ensure_profiler_enabled()
+    return profiler.status()
+
+
+@router.get('/folded', response_class=PlainTextResponse)
+def download_folded_stacks(
+    route: Optional[str] = Query(None, description="Only samples for this route template, e.g. /api/v1/rates/{ticker}"),
+    correlation_id: Optional[str] = Query(None, description="Only samples for this correlation ID"),
+    by_stage: bool = Query(True, description="Split stacks by calculation stage"),
+    client_id: str = Depends(require_admin)
+) -> PlainTextResponse:
+    """
+    Downloads collected samples as folded stacks for flamegraph.pl or speedscope
+
+    Args:
+        route: Only include samples for this route template
+        correlation_id: Only include samples for this correlation ID
+        by_stage: Add the calculation stage as the second root frame
+        client_id: Administrator client ID
+
+    Returns:
+        PlainTextResponse: Folded stacks, one 'frame;frame;... count' line per stack
+    """
+    ensure_profiler_enabled()
+    return PlainTextResponse(
+        profiler.folded(route=route, correlation_id=correlation_id, by_stage=by_stage),
+        headers={"Content-Disposition": 'attachment; filename="profile.folded"'}
+    )
+
+
+# Export the router for inclusion in the main API
+__all__ = ["router"]
@@ -4,22 +4,30 @@ This module handles client requests for fee calculations, validates input parame
 performs calculations, and returns standardized responses with fee details.
 """
 
+import asyncio
 import logging
 from decimal import Decimal
+from typing import Any, Dict, List, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status  # fastapi 0.103.0+
 from fastapi.security import APIKeyHeader
-from sqlalchemy.orm import Session  # sqlalchemy 2.0.0+
+from sqlalchemy.ext.asyncio import AsyncSession  # sqlalchemy 2.0.0+
 
-from ...api.deps import get_db, authenticate_api_key, validate_ticker, validate_position_value, validate_loan_days, get_redis_cache  # Internal imports
+from ...api.deps import get_async_db_session, authenticate_api_key, validate_ticker, validate_position_value, validate_loan_days, get_redis_cache  # Internal imports
 from ...schemas.request import CalculateLocateRequest  # Internal imports
 from ...schemas.response import CalculateLocateResponse, BaseResponse  # Internal imports
 from ...schemas.calculation import FeeBreakdownSchema  # Internal imports
 from ...services.calculation.locate_fee import calculate_locate_fee  # Internal imports
+from ...services.calculation.borrow_rate import get_borrow_rate_with_source  # Internal imports
 from ...services.data.brokers import BrokerService, broker_service  # Internal imports
+from ...services.data.reference import reference_data  # In-memory stock and broker snapshot
+from ...services.audit.logger import AuditLogger  # Internal imports
+from ...services.audit.utils import create_data_source_entry  # Internal imports
+from ...services.cache import get_ticker_filter  # Import ticker universe filter
+from ...db.crud.stocks import async_stock  # Internal imports
 from ...core.constants import ErrorCodes, TransactionFeeType  # Internal imports
 from ...core.errors import create_error_response  # Internal imports
-from ...core.exceptions import ClientNotFoundException, CalculationException  # Internal imports
+from ...core.exceptions import ClientNotFoundException, TickerNotFoundException, CalculationException  # Internal imports
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -27,19 +35,65 @@ logger = logging.getLogger(__name__)
 # Create API router
 router = APIRouter(tags=["calculations"])
 
+# Audit trail writer; records are stored through the request's async session
+audit_logger = AuditLogger()
+
+
+def calculate_fee_with_data_sources(
+    ticker: str,
+    position_value: Decimal,
+    loan_days: int,
+    broker_config: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Calculate a locate fee and record which data sources it used.
+
+    Blocking (cache, database and SecLend API calls); async handlers run it in a worker thread.
+
+    Args:
+        ticker: Stock symbol
+        position_value: Monetary value of the position
+        loan_days: Duration of the loan in days
+        broker_config: Broker configuration with markup_percentage, transaction_fee_type and transaction_amount
+
+    Returns:
+        Tuple[Dict[str, Any], List[Dict[str, Any]]]: Calculation result and data source entries for the audit trail
+    """
+    borrow_rate, rate_source = get_borrow_rate_with_source(ticker)
+
+    # The rate is passed in, so the locate fee cache (keyed without it) is bypassed
+    calculation_result = calculate_locate_fee(
+        ticker=ticker,
+        position_value=position_value,
+        loan_days=loan_days,
+        markup_percentage=broker_config["markup_percentage"],
+        fee_type=broker_config["transaction_fee_type"],
+        fee_amount=broker_config["transaction_amount"],
+        borrow_rate=borrow_rate,
+        use_cache=False
+    )
+
+    data_sources = [
+        create_data_source_entry("broker_service", "broker_config", False),
+        create_data_source_entry(
+            "borrow_rate_engine", "borrow_rate", rate_source == "fallback", {"rate_source": rate_source}
+        )
+    ]
+    return calculation_result, data_sources
+
 
 @router.post("/calculate-locate", response_model=CalculateLocateResponse, status_code=status.HTTP_200_OK)
 @router.get("/calculate-locate", response_model=CalculateLocateResponse, status_code=status.HTTP_200_OK)
 async def calculate_locate_fee_endpoint(
     request: CalculateLocateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> CalculateLocateResponse:
     """
     API endpoint for calculating locate fees.
 
     Args:
         request (CalculateLocateRequest): Request model containing ticker, position_value, loan_days, and client_id.
-        db (Session): Database session dependency.
+        db (AsyncSession): Async database session dependency.
 
     Returns:
         CalculateLocateResponse: Locate fee calculation response with total fee and breakdown.
@@ -48,22 +102,22 @@ async def calculate_locate_fee_endpoint(
     logger.info(f"Received locate fee calculation request: ticker={request.ticker}, position_value={request.position_value}, loan_days={request.loan_days}, client_id={request.client_id}")
 
     try:
-        # Try to retrieve broker configuration using broker_service.get_broker(client_id)
-        broker_config = broker_service.get_broker(request.client_id)
-
-        # Extract markup_percentage, fee_type, and fee_amount from broker configuration
-        markup_percentage = broker_config["markup_percentage"]
-        fee_type = broker_config["transaction_fee_type"]
-        fee_amount = broker_config["transaction_amount"]
-
-        # Call calculate_locate_fee with ticker, position_value, loan_days, markup_percentage, fee_type, and fee_amount
-        calculation_result = calculate_locate_fee(
-            ticker=request.ticker,
-            position_value=request.position_value,
-            loan_days=request.loan_days,
-            markup_percentage=markup_percentage,
-            fee_type=fee_type,
-            fee_amount=fee_amount
+        # Reject unknown tickers, from the reference snapshot if loaded and the database otherwise
+        get_ticker_filter().check(request.ticker)
+        snapshot = reference_data.snapshot
+        if snapshot is None or snapshot.get_stock(request.ticker) is None:
+            await async_stock.get_by_ticker_or_404(db, request.ticker)
+
+        # Try to retrieve broker configuration without blocking the event loop
+        broker_config = await broker_service.get_broker_async(request.client_id)
+
+        # Calculate the fee off the event loop, noting whether fallback data was used
+        calculation_result, data_sources = await asyncio.to_thread(
+            calculate_fee_with_data_sources,
+            request.ticker,
+            request.position_value,
+            request.loan_days,
+            broker_config
         )
 
         # Create FeeBreakdownSchema from the calculation result breakdown
@@ -77,8 +131,35 @@ async def calculate_locate_fee_endpoint(
             borrow_rate_used=Decimal(calculation_result["borrow_rate_used"])
         )
         logger.info(f"Successfully calculated locate fee for ticker: {request.ticker}, total_fee: {response.total_fee}")
+
+        # Record the calculation in the audit trail through the injected async session
+        await audit_logger.log_calculation_async(
+            db,
+            ticker=request.ticker,
+            position_value=request.position_value,
+            loan_days=request.loan_days,
+            client_id=request.client_id,
+            borrow_rate=response.borrow_rate_used,
+            total_fee=response.total_fee,
+            breakdown=calculation_result["breakdown"],
+            data_sources=data_sources
+        )
         return response
 
+    except TickerNotFoundException as e:
+        # Handle TickerNotFoundException by returning appropriate error response, rejecting repeats without lookups
+        logger.warning(f"Ticker not found: {request.ticker}")
+        get_ticker_filter().record_not_found(request.ticker)
+        error_response = create_error_response(
+            message=str(e),
+            error_code=ErrorCodes.TICKER_NOT_FOUND,
+            details={"ticker": request.ticker}
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=error_response["error"]
+        )
+
     except ClientNotFoundException as e:
         # Handle ClientNotFoundException by returning appropriate error response
         logger.warning(f"Client not found: {str(e)}")
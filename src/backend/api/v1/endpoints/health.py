@@ -17,6 +17,8 @@ from ....api.deps import get_db, get_redis_cache, get_seclend_client, get_market
 from ....schemas.response import HealthResponse  # Import health response schema for standardized API responses
 from ....utils.logging import setup_logger  # Import logging utility for health check operations
 from ....core.constants import API_VERSION  # Import API version constant for health response
+from ....config.settings import get_settings
+from ....services.health import HealthMonitor
 
 # Initialize router and logger
 router = APIRouter(tags=['health'])
@@ -25,6 +27,9 @@ logger = setup_logger('api.health')
 # Define API version
 VERSION = "1.0.0"
 
+# Background health monitor, created on first use
+_health_monitor = None
+
 
 def check_database_health() -> Dict[str, str]:
     """
@@ -148,19 +153,48 @@ def get_system_health() -> Dict:
     return health_report
 
 
+def get_health_monitor() -> HealthMonitor:
+    """
+    Returns the shared health monitor with a probe registered for each component.
+
+    Probe intervals and timeouts come from the health_checks settings. The monitor
+    is started and stopped by the application lifecycle handlers.
+
+    Returns:
+        HealthMonitor: Shared health monitor instance
+    """
+    global _health_monitor
+
+    if _health_monitor is None:
+        settings = get_settings()
+        monitor = HealthMonitor(version=VERSION)
+        checks = {
+            "database": check_database_health,
+            "cache": check_cache_health,
+            "external_apis": check_external_apis_health
+        }
+        for name, check in checks.items():
+            schedule = settings.health_checks.get(name, {})
+            monitor.register(name, check, schedule.get("interval", 10), schedule.get("timeout", 2))
+        _health_monitor = monitor
+
+    return _health_monitor
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """
     API endpoint handler for health check requests.
 
+    Serves the latest snapshot from the background health monitor without
+    touching any dependency.
+
     Returns:
         HealthResponse: Health check response with system status
     """
     logger.debug("Received health check request")
-    # Get system health status using get_system_health()
-    system_health = get_system_health()
-    # Create HealthResponse with status, version, components, and current timestamp
-    health_response = HealthResponse(**system_health)
+    # Create HealthResponse from the latest health snapshot
+    health_response = HealthResponse(**get_health_monitor().snapshot)
     # Return the health response
     return health_response
 
@@ -174,19 +208,15 @@ async def readiness_check():
         Dict[str, str]: Simple readiness status response
     """
     logger.debug("Received readiness check request")
-    try:
-        # Check database connectivity using ping_database()
-        if ping_database():
-            # If database is connected, return status 'ready'
-            logger.info("Readiness check passed: database connected")
-            return {"status": "ready"}
-        else:
-            # If database is not connected, raise HTTPException with 503 status code
-            logger.warning("Readiness check failed: database not connected")
-            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Database not connected")
-    except Exception as e:
-        logger.error(f"Readiness check failed: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    monitor = get_health_monitor()
+    if monitor.is_ready():
+        # If the latest database probe is fresh and connected, return status 'ready'
+        return {"status": "ready"}
+
+    # If the database is not connected (or not yet probed), raise HTTPException with 503 status code
+    database_status = monitor.snapshot["components"].get("database", "pending")
+    logger.warning(f"Readiness check failed: database {database_status}")
+    raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Database {database_status}")
 
 
 @router.get("/liveness")
@@ -198,6 +228,8 @@ async def liveness_check():
         Dict[str, str]: Simple liveness status response
     """
     logger.debug("Received liveness check request")
+    if not get_health_monitor().is_alive():
+        logger.error("Liveness check failed: health monitor stopped")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Health monitor stopped")
     # Return status 'alive' to indicate the service is running
-    logger.info("Liveness check passed: service is alive")
-    return {"status": "alive"}
\ No newline at end of file
+    return {"status": "alive"}
@@ -3,21 +3,31 @@ Implements the REST API endpoints for retrieving borrow rates in the Borrow Rate
 This module provides endpoints to get current borrow rates for specific securities, including volatility and event risk adjustments. It handles authentication, input validation, caching, and error handling for all rate-related API requests.
 """
 
+import hashlib
+import json
 import logging
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 # FastAPI imports
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status  # fastapi 0.103.0+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Path, Response, status  # fastapi 0.103.0+
+from fastapi import status as http_status  # For handlers whose path parameter is named status
+from fastapi.responses import StreamingResponse  # For NDJSON streaming of multi-ticker rates
+from pydantic import ValidationError  # pydantic 2.4.0+
 
 # Internal imports
 from ...api.deps import get_db, get_redis_cache, authenticate_api_key, validate_ticker  # Import database session context manager
-from ...schemas.response import BorrowRateResponse  # Import response model
+from ...schemas.request import GetRatesRequest  # Import multi-ticker request model
+from ...schemas.response import BorrowRateResponse, MultiTickerRateResponse, TickerRateResult  # Import response models
 from ...services.data.stocks import StockService  # Import stock data service
+from ...services.data.reference import reference_data  # In-memory stock and broker snapshot
 from ...services.calculation.borrow_rate import calculate_borrow_rate  # Import borrow rate calculation function
+from ...services.calculation.borrow_rate import get_borrow_rates_bulk, iter_borrow_rates_bulk  # Import bulk borrow rate resolution
 from ...core.constants import BorrowStatus  # Import borrow status enum
 from ...core.exceptions import TickerNotFoundException, ExternalAPIException  # Import exception class
 from ...services.cache.redis import RedisCache  # Import Redis cache client
+from ...services.cache import get_ticker_filter  # Import ticker universe filter
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -25,6 +35,40 @@ logger = logging.getLogger(__name__)
 # Create API router instance
 router = APIRouter(tags=["rates"])
 
+# Multi-ticker requests with more tickers than this are streamed as NDJSON
+NDJSON_STREAM_THRESHOLD = 200
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+# Registered before '/{ticker}' so that '/rates' is not taken for a ticker symbol
+@router.get('/rates', response_model=MultiTickerRateResponse, status_code=status.HTTP_200_OK)
+async def get_borrow_rates(
+    tickers: str = Query(..., description="Comma-separated stock ticker symbols, e.g. AAPL,MSFT,GME"),
+    accept: Optional[str] = Header(None, description="application/x-ndjson to stream one rate per line"),
+    client_id: str = Depends(authenticate_api_key)
+) -> MultiTickerRateResponse:
+    """
+    Endpoint to get the current borrow rates of several tickers
+    """
+    try:
+        request = GetRatesRequest(tickers=[ticker for ticker in tickers.split(",") if ticker.strip()])
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    return await _get_rates_response(request.tickers, accept)
+
+
+@router.post('/rates', response_model=MultiTickerRateResponse, status_code=status.HTTP_200_OK)
+async def query_borrow_rates(
+    request: GetRatesRequest,
+    accept: Optional[str] = Header(None, description="application/x-ndjson to stream one rate per line"),
+    client_id: str = Depends(authenticate_api_key)
+) -> MultiTickerRateResponse:
+    """
+    Endpoint to get the current borrow rates of a list of tickers too long for a query string
+    """
+    return await _get_rates_response(request.tickers, accept)
+
 
 @router.get('/{ticker}', response_model=BorrowRateResponse, status_code=status.HTTP_200_OK)
 @router.get('/ticker/{ticker}', response_model=BorrowRateResponse, status_code=status.HTTP_200_OK)
@@ -41,6 +85,9 @@ async def get_borrow_rate(
     logger.info(f"Request received to get borrow rate for ticker: {ticker}")
 
     try:
+        # Reject unknown tickers without touching the cache, database or external APIs
+        get_ticker_filter().check(ticker)
+
         # Initialize StockService with the provided cache and db session
         stock_service = StockService(cache=cache, db=db)
 
@@ -60,8 +107,9 @@ async def get_borrow_rate(
         return response
 
     except TickerNotFoundException as e:
-        # Handle TickerNotFoundException and return 404 Not Found
+        # Handle TickerNotFoundException and return 404 Not Found, rejecting repeats without lookups
         logger.warning(f"Ticker not found: {ticker}")
+        get_ticker_filter().record_not_found(ticker)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
     except ExternalAPIException as e:
@@ -77,9 +125,12 @@ async def get_borrow_rate(
 
 @router.get('/status/{status}', response_model=List[BorrowRateResponse], status_code=status.HTTP_200_OK)
 async def get_borrow_rates_by_status(
+    response: Response,
     status: BorrowStatus = Path(..., title="Borrow status (EASY, MEDIUM, HARD)"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    after: Optional[str] = Query(None, description="Only return tickers after this one (keyset pagination, see the X-Next-After header)"),
+    if_none_match: Optional[str] = Header(None, description="ETag of a previously returned page"),
     client_id: str = Depends(authenticate_api_key),
     cache: RedisCache = Depends(get_redis_cache),
     db: any = Depends(get_db)
@@ -90,35 +141,63 @@ async def get_borrow_rates_by_status(
     logger.info(f"Request received to get borrow rates by status: {status}")
 
     try:
-        # Initialize StockService with the provided cache and db session
-        stock_service = StockService(cache=cache, db=db)
-
-        # Get stocks with the specified borrow status using stock_service.get_stocks_by_borrow_status
-        stocks = await stock_service.get_stocks_by_borrow_status(status=status, skip=skip, limit=limit)
-
-        # Create BorrowRateResponse objects for each stock
-        borrow_rates = []
-        for stock in stocks:
-            rate_data = await stock_service.get_current_borrow_rate(stock.ticker)
-            borrow_rates.append(
-                BorrowRateResponse(
-                    status="success",
-                    ticker=stock.ticker,
-                    current_rate=rate_data["current_rate"],
-                    borrow_status=rate_data["borrow_status"],
-                    volatility_index=rate_data["volatility_index"],
-                    event_risk_factor=rate_data["event_risk_factor"],
-                    last_updated=rate_data["last_updated"]
+        # Without a reference snapshot, fall back to per-stock lookups through the stock service
+        snapshot = reference_data.snapshot
+        if snapshot is None:
+            stock_service = StockService(cache=cache, db=db)
+            stocks = await stock_service.get_stocks_by_borrow_status(status=status, skip=skip, limit=limit)
+            borrow_rates = []
+            for stock in stocks:
+                rate_data = await stock_service.get_current_borrow_rate(stock.ticker)
+                borrow_rates.append(
+                    BorrowRateResponse(
+                        status="success",
+                        ticker=stock.ticker,
+                        current_rate=rate_data["current_rate"],
+                        borrow_status=rate_data["borrow_status"],
+                        volatility_index=rate_data["volatility_index"],
+                        event_risk_factor=rate_data["event_risk_factor"],
+                        last_updated=rate_data["last_updated"]
+                    )
                 )
-            )
+            return borrow_rates
 
-        # Return list of BorrowRateResponse objects
+        # Get the page of stocks from the reference snapshot
+        stocks = snapshot.get_stocks_by_borrow_status(status, skip=skip, limit=limit, after=after)
+        page_headers = {"Cache-Control": "private, no-cache"}
+        if len(stocks) == limit:
+            page_headers["X-Next-After"] = stocks[-1].ticker
+
+        # Resolve all rates of the page with bulk cache lookups and concurrent calculation of misses
+        rates = await get_borrow_rates_bulk(
+            [stock.ticker for stock in stocks],
+            {stock.ticker: stock.min_borrow_rate for stock in stocks}
+        )
+        borrow_rates = [_build_rate_response(stock, rates[stock.ticker]) for stock in stocks if stock.ticker in rates]
+        response.headers.update(page_headers)
+
+        # A partial page is flagged and never given an ETag, so it is not revalidated as complete
+        failed = [stock.ticker for stock in stocks if stock.ticker not in rates]
+        if failed:
+            logger.warning(f"Borrow rates unavailable for {len(failed)} tickers with status {status}: {failed}")
+            response.headers["X-Failed-Tickers"] = ",".join(failed)
+            return borrow_rates
+
+        # The ETag covers the rate values returned, whichever tier they were served from
+        etag = _make_etag([
+            [rate.ticker, rate.current_rate, rate.borrow_status, rate.volatility_index, rate.event_risk_factor]
+            for rate in borrow_rates
+        ], page_headers.get("X-Next-After"))
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers=dict(page_headers, ETag=etag))
+
+        response.headers["ETag"] = etag
         return borrow_rates
 
     except Exception as e:
         # Handle exceptions and return appropriate error responses
         logger.exception(f"Error getting borrow rates by status: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+        raise HTTPException(status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 @router.get('/{ticker}/calculate', response_model=BorrowRateResponse, status_code=status.HTTP_200_OK)
@@ -136,11 +215,17 @@ async def calculate_custom_rate(
     logger.info(f"Request received to calculate custom rate for ticker: {ticker}")
 
     try:
+        # Reject unknown tickers without touching the cache, database or external APIs
+        get_ticker_filter().check(ticker)
+
         # Initialize StockService with the provided cache and db session
         stock_service = StockService(cache=cache, db=db)
 
-        # Get stock data to verify ticker exists and get minimum rate
-        stock = await stock_service.get_stock_or_404(ticker)
+        # Get stock data to verify ticker exists and get minimum rate, from the reference snapshot if loaded
+        snapshot = reference_data.snapshot
+        stock = snapshot.get_stock(ticker) if snapshot is not None else None
+        if stock is None:
+            stock = await stock_service.get_stock_or_404(ticker)
         min_rate = stock.min_borrow_rate
 
         # Calculate borrow rate using calculate_borrow_rate with provided parameters
@@ -154,13 +239,14 @@ async def calculate_custom_rate(
             borrow_status=stock.borrow_status.value,
             volatility_index=volatility_index,
             event_risk_factor=event_risk_factor,
-            last_updated=stock.updated_at
+            last_updated=stock.last_updated
         )
         return response
 
     except TickerNotFoundException as e:
-        # Handle TickerNotFoundException and return 404 Not Found
+        # Handle TickerNotFoundException and return 404 Not Found, rejecting repeats without lookups
         logger.warning(f"Ticker not found: {ticker}")
+        get_ticker_filter().record_not_found(ticker)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
     except ExternalAPIException as e:
@@ -171,4 +257,125 @@ async def calculate_custom_rate(
     except Exception as e:
         # Handle exceptions and return appropriate error responses
         logger.exception(f"Error calculating custom rate: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+async def _get_rates_response(tickers: List[str], accept: Optional[str]) -> Any:
+    """
+    Resolve the rates of deduplicated tickers, as one JSON document or streamed as NDJSON.
+    """
+    logger.info(f"Request received to get borrow rates for {len(tickers)} tickers")
+
+    try:
+        # Report tickers known to be missing without any lookup
+        ticker_filter = get_ticker_filter()
+        snapshot = reference_data.snapshot
+        stocks: Dict[str, Any] = {}
+        not_found = []
+        for ticker in tickers:
+            stock = snapshot.get_stock(ticker) if snapshot is not None else None
+            if not ticker_filter.might_exist(ticker) or (snapshot is not None and stock is None):
+                not_found.append(ticker)
+            else:
+                stocks[ticker] = stock
+        found = list(stocks)
+        min_rates = {ticker: stock.min_borrow_rate for ticker, stock in stocks.items() if stock is not None}
+
+        # Large lists are streamed so cached rates reach the client before the misses are calculated
+        if len(found) > NDJSON_STREAM_THRESHOLD or (accept is not None and NDJSON_MEDIA_TYPE in accept):
+            return StreamingResponse(
+                _stream_rates(found, stocks, min_rates, not_found),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers={"Cache-Control": "private, no-cache"}
+            )
+
+        records = await get_borrow_rates_bulk(found, min_rates)
+        return MultiTickerRateResponse(
+            status="success",
+            rates=[_build_ticker_rate(ticker, stocks[ticker], records[ticker]) for ticker in found if ticker in records],
+            not_found=not_found,
+            failed=[ticker for ticker in found if ticker not in records]
+        )
+
+    except Exception as e:
+        # Handle exceptions and return appropriate error responses
+        logger.exception(f"Error getting borrow rates for multiple tickers: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+async def _stream_rates(
+    tickers: List[str],
+    stocks: Dict[str, Any],
+    min_rates: Dict[str, Decimal],
+    not_found: List[str]
+):
+    """
+    Yield one NDJSON line per ticker, each batch as soon as iter_borrow_rates_bulk resolves it.
+    """
+    for ticker in not_found:
+        yield json.dumps({"ticker": ticker, "error": "not_found"}) + "\n"
+
+    resolved = set()
+    async for batch in iter_borrow_rates_bulk(tickers, min_rates):
+        for ticker, record in batch.items():
+            resolved.add(ticker)
+            yield _build_ticker_rate(ticker, stocks[ticker], record).model_dump_json() + "\n"
+
+    for ticker in tickers:
+        if ticker not in resolved:
+            yield json.dumps({"ticker": ticker, "error": "failed"}) + "\n"
+
+
+def _build_ticker_rate(ticker: str, stock: Optional[Any], record: Dict[str, Any]) -> TickerRateResult:
+    """
+    Build a multi-ticker rate entry from a record of get_borrow_rates_bulk and the stock, if known.
+    """
+    borrow_status = stock.borrow_status if stock is not None else record.get("borrow_status")
+    updated_at = record.get("updated_at")
+    if updated_at:
+        last_updated = datetime.fromtimestamp(updated_at, tz=timezone.utc)
+    else:
+        last_updated = stock.last_updated if stock is not None else None
+    return TickerRateResult(
+        ticker=ticker,
+        current_rate=record["borrow_rate"],
+        borrow_status=getattr(borrow_status, "value", borrow_status),
+        volatility_index=record["volatility"],
+        event_risk_factor=record["event_risk_factor"],
+        last_updated=last_updated,
+        source=record["source"]
+    )
+
+
+def _build_rate_response(stock: Any, record: Dict[str, Any]) -> BorrowRateResponse:
+    """
+    Build a borrow rate response from a stock and its record from get_borrow_rates_bulk.
+    """
+    updated_at = record.get("updated_at")
+    return BorrowRateResponse(
+        status="success",
+        ticker=stock.ticker,
+        current_rate=record["borrow_rate"],
+        borrow_status=stock.borrow_status.value,
+        volatility_index=record["volatility"],
+        event_risk_factor=record["event_risk_factor"],
+        last_updated=datetime.fromtimestamp(updated_at, tz=timezone.utc) if updated_at else stock.last_updated
+    )
+
+
+def _make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values a response depends on.
+    """
+    digest = hashlib.sha256(json.dumps(parts, default=str).encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches an ETag.
+    """
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
\ No newline at end of file
@@ -8,7 +8,7 @@ configuration across different deployment environments.
 
 import os
 import enum
-from typing import Dict, Any, Optional, ClassVar, Dict
+from typing import Dict, Any, Optional, ClassVar, Dict, List
 from dotenv import load_dotenv  # python-dotenv 1.0.0+
 from pydantic import BaseModel, Field, validator  # pydantic 2.4.0+
 
@@ -108,6 +108,9 @@ class EnvironmentVariables(BaseModel):
     # Database settings
     database_url: str
     redis_url: str
+    database_replica_urls: List[str]
+    database_replica_max_lag: float
+    database_replica_lag_check_interval: float
     
     # External API configurations
     seclend_api: Dict[str, Any]
@@ -117,9 +120,20 @@ class EnvironmentVariables(BaseModel):
     # Performance settings
     default_cache_ttl: int
     default_rate_limit: int
+    middleware_mode: str
+    metrics_enabled: bool
+    profiler_enabled: bool
+    cache_codecs: Dict[str, Any]
+    near_cache: Dict[str, Any]
+    shared_rate_table: Dict[str, Any]
+    reference_data: Dict[str, Any]
+    health_checks: Dict[str, Dict[str, float]]
     
     # Security settings
     api_keys: Dict[str, Dict[str, Any]]
+    api_key_hmac_secret: str
+    legacy_api_key_lookup: Dict[str, Any]
+    admin_client_ids: List[str]
     
     # Logging settings
     logging: Dict[str, Any]
@@ -147,6 +161,13 @@ class EnvironmentVariables(BaseModel):
         data["database_url"] = env_vars.get("DATABASE_URL")
         data["redis_url"] = env_vars.get("REDIS_URL")
         
+        # Optional read replicas - comma-separated URLs, empty means primary only
+        data["database_replica_urls"] = [
+            url.strip() for url in env_vars.get("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+        ]
+        data["database_replica_max_lag"] = float(env_vars.get("DATABASE_REPLICA_MAX_LAG", "5"))  # Seconds
+        data["database_replica_lag_check_interval"] = float(env_vars.get("DATABASE_REPLICA_LAG_CHECK_INTERVAL", "5"))  # Seconds
+        
         # Configure external APIs
         data["seclend_api"] = self.load_external_api_config(env_vars, "SECLEND")
         data["market_volatility_api"] = self.load_external_api_config(env_vars, "MARKET_VOLATILITY")
@@ -155,15 +176,92 @@ class EnvironmentVariables(BaseModel):
         # Performance settings
         data["default_cache_ttl"] = int(env_vars.get("DEFAULT_CACHE_TTL", "300"))  # Default 5 minutes
         data["default_rate_limit"] = int(env_vars.get("DEFAULT_RATE_LIMIT", "60"))  # Default 60 requests/minute
+        data["middleware_mode"] = env_vars.get("MIDDLEWARE_MODE", "stacked").lower()  # "stacked" or "fused"
+        data["metrics_enabled"] = env_vars.get("METRICS_ENABLED", "true").lower() == "true"
+        data["profiler_enabled"] = env_vars.get("PROFILER_ENABLED", "false").lower() == "true"
+        
+        # Cache value codecs - default codec plus per key type overrides, e.g. "borrow_rate=msgpack,calculation=msgpack"
+        data["cache_codecs"] = {
+            "default": env_vars.get("CACHE_CODEC", "json").lower(),
+            "types": {
+                data_type.strip(): codec.strip().lower()
+                for data_type, _, codec in (item.partition("=") for item in env_vars.get("CACHE_CODECS", "").split(","))
+                if data_type.strip() and codec.strip()
+            },
+            "compression_threshold": int(env_vars.get("CACHE_COMPRESSION_THRESHOLD", "1024"))  # Bytes, 0 disables compression
+        }
+        
+        # Process-local near cache for hot key types, kept coherent over Redis pub/sub
+        data["near_cache"] = {
+            "enabled": env_vars.get("CACHE_NEAR_ENABLED", "false").lower() == "true",
+            "key_types": [
+                key_type.strip()
+                for key_type in env_vars.get("CACHE_NEAR_TYPES", "borrow_rate,broker_config").split(",")
+                if key_type.strip()
+            ],
+            "max_ttl": int(env_vars.get("CACHE_NEAR_MAX_TTL", "60")),  # Seconds, caps staleness if an invalidation is lost
+            "max_entries": int(env_vars.get("CACHE_NEAR_MAX_ENTRIES", "10000"))
+        }
+        
+        # Shared-memory rate table read by all worker processes, filled by one elected refresher
+        data["shared_rate_table"] = {
+            "enabled": env_vars.get("SHARED_RATE_TABLE_ENABLED", "false").lower() == "true",
+            "path": env_vars.get("SHARED_RATE_TABLE_PATH") or None,  # Defaults to /dev/shm/borrow_rate_table
+            "capacity": int(env_vars.get("SHARED_RATE_TABLE_CAPACITY", "8192")),  # Record slots, about 2x the ticker universe
+            "refresh_interval": float(env_vars.get("SHARED_RATE_TABLE_REFRESH_INTERVAL", "5")),
+            "max_age": float(env_vars.get("SHARED_RATE_TABLE_MAX_AGE", "30"))  # Seconds before a record is no longer served
+        }
+        
+        # In-memory stock and broker snapshot, reloaded on change notification or version poll
+        data["reference_data"] = {
+            "enabled": env_vars.get("REFERENCE_DATA_ENABLED", "true").lower() == "true",
+            "poll_interval": float(env_vars.get("REFERENCE_DATA_POLL_INTERVAL", "10"))  # Seconds
+        }
+        
+        # Background health probe schedule per component, in seconds
+        data["health_checks"] = {
+            "database": {
+                "interval": float(env_vars.get("HEALTH_DATABASE_INTERVAL", "10")),
+                "timeout": float(env_vars.get("HEALTH_DATABASE_TIMEOUT", "2"))
+            },
+            "cache": {
+                "interval": float(env_vars.get("HEALTH_CACHE_INTERVAL", "10")),
+                "timeout": float(env_vars.get("HEALTH_CACHE_TIMEOUT", "1"))
+            },
+            "external_apis": {
+                "interval": float(env_vars.get("HEALTH_EXTERNAL_APIS_INTERVAL", "30")),
+                "timeout": float(env_vars.get("HEALTH_EXTERNAL_APIS_TIMEOUT", "5"))
+            }
+        }
         
         # Load API keys from environment
         data["api_keys"] = self.load_api_keys(env_vars)
         
+        # Secret for the keyed digest used to look up stored API keys - required outside tests
+        data["api_key_hmac_secret"] = env_vars.get("API_KEY_HMAC_SECRET", "")
+        if not data["api_key_hmac_secret"] and env_vars.get("ENVIRONMENT", "development").lower() != "test":
+            raise ValueError("API_KEY_HMAC_SECRET must be set; API key digests would otherwise be unkeyed")
+        
+        # Bcrypt scan over keys created before digests existed, bounded per process
+        data["legacy_api_key_lookup"] = {
+            "enabled": env_vars.get("LEGACY_API_KEY_LOOKUP_ENABLED", "true").lower() == "true",
+            "rate": float(env_vars.get("LEGACY_API_KEY_LOOKUP_RATE", "2")),  # Scans per second, excess unknown keys are rejected
+            "max_rows": int(env_vars.get("LEGACY_API_KEY_LOOKUP_MAX_ROWS", "50"))  # Bcrypt verifies per scan
+        }
+        
+        # Clients allowed to call the admin endpoints
+        data["admin_client_ids"] = [
+            client_id.strip() for client_id in env_vars.get("ADMIN_CLIENT_IDS", "").split(",") if client_id.strip()
+        ]
+        
         # Configure logging
         data["logging"] = {
             "level": env_vars.get("LOG_LEVEL", "INFO"),
             "format": env_vars.get("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
             "file": env_vars.get("LOG_FILE", None),
+            "async": env_vars.get("LOG_ASYNC", "false").lower() == "true",  # Write logs from a background thread
+            "sample_rate": float(env_vars.get("LOG_SAMPLE_RATE", "0")),  # Per-logger INFO/DEBUG records per second, 0 = no sampling
+            "sample_burst": float(env_vars.get("LOG_SAMPLE_BURST", "0")) or None,
             "sentry_dsn": env_vars.get("SENTRY_DSN", None)
         }
         
@@ -184,7 +282,7 @@ class EnvironmentVariables(BaseModel):
         
         # Look for environment variables with API_KEY_ prefix
         for key, value in env_vars.items():
-            if key.startswith("API_KEY_"):
+            if key.startswith("API_KEY_") and key != "API_KEY_HMAC_SECRET":
                 # Parse client_id from the key name
                 client_id = key.replace("API_KEY_", "").lower()
                 
@@ -14,8 +14,17 @@ import json
 import logging
 import logging.config
 import logging.handlers
+import atexit
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import orjson  # orjson 3.9.0+
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
 
 from .settings import get_settings
 
@@ -29,6 +38,19 @@ APP_LOG_FILE = 'app.log'
 ERROR_LOG_FILE = 'error.log'
 MAX_BYTES = 10485760  # 10MB
 BACKUP_COUNT = 10
+UNSAMPLED_LOGGERS = ('audit', 'compliance')  # regulatory trails, never rate limited
+
+# LogRecord attributes that are not user-supplied extra fields
+RESERVED_RECORD_ATTRS = frozenset((
+    'args', 'asctime', 'created', 'exc_info', 'exc_text', 'filename',
+    'funcName', 'id', 'levelname', 'levelno', 'lineno', 'module',
+    'msecs', 'message', 'msg', 'name', 'pathname', 'process',
+    'processName', 'relativeCreated', 'stack_info', 'thread',
+    'threadName', 'correlation_id', 'taskName'
+))
+
+# Listeners draining the log queues when asynchronous logging is enabled
+_queue_listeners: List[logging.handlers.QueueListener] = []
 
 
 class CorrelationIdFilter(logging.Filter):
@@ -54,10 +76,10 @@ class CorrelationIdFilter(logging.Filter):
             bool: Always True to include the record
         """
         # Import here to avoid circular import
-        from ..core.context import get_correlation_id
+        from ..core.logging import correlation_id_var
         
         if not hasattr(record, 'correlation_id'):
-            record.correlation_id = get_correlation_id() or 'NONE'
+            record.correlation_id = correlation_id_var.get() or 'NONE'
         return True
 
 
@@ -126,6 +148,214 @@ class JsonFormatter(logging.Formatter):
         return logging.Formatter().formatException(exc_info)
 
 
+class FastJsonFormatter(JsonFormatter):
+    """
+    JSON formatter that serializes each record in a single encoder pass.
+    
+    Unlike JsonFormatter it does not trial-encode every extra attribute; values the
+    encoder cannot handle natively (Decimal, enums, arbitrary objects) are converted
+    with str(). Uses orjson when it is installed.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format the log record as a JSON string.
+        
+        Args:
+            record: The log record to format
+            
+        Returns:
+            str: JSON-formatted log entry
+        """
+        log_data = {
+            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'correlation_id': getattr(record, 'correlation_id', 'NONE'),
+            'message': record.getMessage()
+        }
+        
+        # Add any extra attributes set on the log record
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_RECORD_ATTRS:
+                log_data[key] = value
+        
+        # Add exception info if present
+        if record.exc_info:
+            log_data['exception'] = self.formatException(record.exc_info)
+        
+        if orjson is not None:
+            return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(log_data, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Per-logger rate limit for high-volume log records.
+    
+    Records below WARNING are admitted through a token bucket per logger name
+    (rate records per second, up to burst at once); the rest are dropped. WARNING
+    and above always pass, as do records from the UNSAMPLED_LOGGERS trees. The
+    next admitted record from a logger carries the number of records dropped
+    since its previous one as sampled_dropped.
+    """
+    
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initialize the sampling filter.
+        
+        Args:
+            rate: Records per second admitted per logger below WARNING
+            burst: Bucket size, defaults to one second of records
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst or max(rate, 1.0)
+        self._buckets: Dict[str, List[float]] = {}  # logger name -> [tokens, last refill, dropped]
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether the record is emitted.
+        
+        Args:
+            record: The log record to process
+            
+        Returns:
+            bool: True to emit the record
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+        if record.name.split('.', 1)[0] in UNSAMPLED_LOGGERS:
+            return True
+        
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [self.burst, now, 0]
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            
+            bucket[0] -= 1
+            dropped, bucket[2] = bucket[2], 0
+        
+        if dropped:
+            record.sampled_dropped = dropped
+        return True
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler for an in-process queue.
+    
+    The standard QueueHandler formats each record in the calling thread so it can
+    be pickled; within one process the record can be handed over as is, leaving
+    message formatting and serialization to the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Return the record unchanged for the listener thread.
+        
+        Args:
+            record: The log record to enqueue
+            
+        Returns:
+            logging.LogRecord: The same record
+        """
+        return record
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Enqueue the record without formatting it.
+        
+        Args:
+            record: The log record to enqueue
+        """
+        try:
+            self.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+
+def create_queue_handler(handlers: List[logging.Handler], sample_rate: float = 0,
+                         sample_burst: Optional[float] = None
+                         ) -> Tuple[LocalQueueHandler, logging.handlers.QueueListener]:
+    """
+    Create a queue handler whose records are written by a background listener.
+    
+    Correlation IDs are attached in the calling thread, where the request context
+    lives; formatting and I/O happen in the listener thread.
+    
+    Args:
+        handlers: Handlers the listener writes to, each keeping its own level
+        sample_rate: Per-logger records per second below WARNING, 0 disables sampling
+        sample_burst: Sampling bucket size
+        
+    Returns:
+        tuple: The queue handler and its (not yet started) listener
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = LocalQueueHandler(log_queue)
+    queue_handler.addFilter(CorrelationIdFilter())
+    if sample_rate > 0:
+        queue_handler.addFilter(SamplingFilter(sample_rate, sample_burst))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    return queue_handler, listener
+
+
+def stop_async_logging() -> None:
+    """
+    Flush and stop the background log listeners, if running.
+    """
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+def enable_async_logging(sample_rate: float = 0, sample_burst: Optional[float] = None) -> None:
+    """
+    Move the configured log handlers behind queues drained by background listeners.
+    
+    Loggers sharing the same set of handlers share one queue handler and listener,
+    so routing (e.g. audit records to the audit file only) is unchanged. The
+    listeners are flushed at exit.
+    
+    Args:
+        sample_rate: Per-logger records per second below WARNING, 0 disables sampling
+        sample_burst: Sampling bucket size
+    """
+    stop_async_logging()
+    
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger) and logger.handlers
+    ]
+    
+    queue_handlers: Dict[Tuple[logging.Handler, ...], LocalQueueHandler] = {}
+    for logger in loggers:
+        handlers = tuple(logger.handlers)
+        if not handlers or all(isinstance(h, LocalQueueHandler) for h in handlers):
+            continue
+        if handlers not in queue_handlers:
+            queue_handler, listener = create_queue_handler(list(handlers), sample_rate, sample_burst)
+            listener.start()
+            _queue_listeners.append(listener)
+            queue_handlers[handlers] = queue_handler
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handlers[handlers])
+    
+    atexit.unregister(stop_async_logging)
+    atexit.register(stop_async_logging)
+
+
 def create_console_handler(log_format: str, date_format: str, log_level: int) -> logging.StreamHandler:
     """
     Create a console log handler with appropriate formatter.
@@ -227,7 +457,7 @@ def configure_logging() -> None:
                 'datefmt': date_format
             },
             'json': {
-                '()': 'src.backend.config.logging_config.JsonFormatter'
+                '()': 'src.backend.config.logging_config.FastJsonFormatter'
             }
         },
         'filters': {
@@ -307,6 +537,13 @@ def configure_logging() -> None:
     
     # Apply the configuration
     logging.config.dictConfig(config)
+    
+    # Hand records to a background writer so request threads never block on log I/O
+    if logging_config.get('async'):
+        enable_async_logging(
+            sample_rate=float(logging_config.get('sample_rate', 0)),
+            sample_burst=logging_config.get('sample_burst')
+        )
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -121,6 +121,11 @@ class Settings:
         self.database_url = env.database_url
         self.redis_url = env.redis_url
         
+        # Read replica routing
+        self.database_replica_urls = env.database_replica_urls
+        self.database_replica_max_lag = env.database_replica_max_lag
+        self.database_replica_lag_check_interval = env.database_replica_lag_check_interval
+        
         # External API configurations
         self.seclend_api = env.seclend_api
         self.market_volatility_api = env.market_volatility_api
@@ -129,9 +134,20 @@ class Settings:
         # Performance settings
         self.default_cache_ttl = env.default_cache_ttl
         self.default_rate_limit = env.default_rate_limit
+        self.middleware_mode = env.middleware_mode
+        self.metrics_enabled = env.metrics_enabled
+        self.profiler_enabled = env.profiler_enabled
+        self.cache_codecs = env.cache_codecs
+        self.near_cache = env.near_cache
+        self.shared_rate_table = env.shared_rate_table
+        self.reference_data = env.reference_data
+        self.health_checks = env.health_checks
         
         # Security settings
         self.api_keys = env.api_keys
+        self.api_key_hmac_secret = env.api_key_hmac_secret
+        self.legacy_api_key_lookup = env.legacy_api_key_lookup
+        self.admin_client_ids = env.admin_client_ids
         
         # Logging configuration
         self.logging = env.logging
@@ -13,22 +13,24 @@ from typing import Dict, Optional, Any
 from fastapi import Request  # fastapi 0.103.0
 
 from .security import (
-    verify_api_key,
-    get_client_for_api_key,
+    compute_api_key_digest,
     create_access_token,
     decode_access_token
 )
 from .exceptions import AuthenticationException, RateLimitExceededException
 from .constants import ErrorCodes
+from .principal_cache import principal_cache, principal_from_api_key, is_principal_usable
 from ..utils.logging import setup_logger
+from ..services.cache import get_redis_cache
 from ..services.cache.redis import RedisCache
-from ..db.crud.api_keys import api_keys
+from ..db.crud.api_keys import api_key_crud
+from ..db.session import get_db
 
 # Set up module logger
 logger = setup_logger('core.auth')
 
-# Initialize Redis cache for rate limiting
-redis_cache = RedisCache()
+# Shared Redis cache for rate limiting
+redis_cache = get_redis_cache()
 
 
 def get_api_key_from_header(request: Request) -> Optional[str]:
@@ -50,6 +52,56 @@ def get_api_key_from_header(request: Request) -> Optional[str]:
     return None
 
 
+def resolve_principal(api_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Resolves an API key to its authenticated principal.
+    
+    Checks the principal cache first and only falls back to the database (and the
+    configured API keys) on a miss, caching the result for subsequent requests.
+    
+    Args:
+        api_key: The API key to resolve
+        
+    Returns:
+        Optional[Dict[str, Any]]: Principal with client_id and rate_limit, or None if the key is invalid
+    """
+    digest = compute_api_key_digest(api_key)
+    principal = principal_cache.get(digest)
+    if principal is not None:
+        logger.debug("API key resolved from principal cache")
+        return principal
+    
+    api_key_record = None
+    try:
+        with get_db() as db:
+            api_key_record = api_key_crud.get_by_key(db, api_key)
+            if api_key_record is not None:
+                principal = principal_from_api_key(api_key_record)
+    except Exception as e:
+        logger.error(f"Error loading API key from database: {str(e)}")
+    
+    if principal is None:
+        # Fall back to API keys defined in configuration
+        from ..config.settings import get_settings
+        api_key_config = get_settings().get_api_key_config(api_key)
+        if api_key_config is None:
+            return None
+        principal = {
+            "client_id": api_key_config.get("client_id"),
+            "key_id": None,
+            "rate_limit": api_key_config.get("rate_limit"),
+            "expires_at": None,
+            "active": True
+        }
+    
+    if not is_principal_usable(principal):
+        logger.warning("API key is inactive or expired")
+        return None
+    
+    principal_cache.set(digest, principal)
+    return principal
+
+
 def authenticate_request(api_key: str, client_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Authenticates a request using the provided API key and checks rate limits.
@@ -65,20 +117,21 @@ def authenticate_request(api_key: str, client_id: Optional[str] = None) -> Dict[
         AuthenticationException: If the API key is invalid
         RateLimitExceededException: If the client has exceeded their rate limit
     """
-    # Verify the API key
-    if not verify_api_key(api_key):
+    # Resolve the API key to its principal
+    principal = resolve_principal(api_key)
+    if principal is None:
         logger.warning("Authentication failed: Invalid API key")
         raise AuthenticationException("Invalid API key", ErrorCodes.UNAUTHORIZED)
     
     # Get the client ID associated with the API key if not provided
     if not client_id:
-        client_id = get_client_for_api_key(api_key)
+        client_id = principal.get("client_id")
         if not client_id:
             logger.error("Authentication anomaly: Valid API key but no client_id")
             raise AuthenticationException("Invalid API key", ErrorCodes.UNAUTHORIZED)
     
     # Check rate limits for the client
-    rate_limit_info = check_rate_limit(client_id)
+    rate_limit_info = check_rate_limit(client_id, principal.get("rate_limit"))
     
     # If remaining requests is 0, rate limit has been exceeded
     if rate_limit_info.get("remaining", 0) <= 0:
@@ -101,12 +154,13 @@ def authenticate_request(api_key: str, client_id: Optional[str] = None) -> Dict[
     }
 
 
-def check_rate_limit(client_id: str) -> Dict[str, Any]:
+def check_rate_limit(client_id: str, rate_limit: Optional[int] = None) -> Dict[str, Any]:
     """
     Checks if a client has exceeded their API rate limit.
     
     Args:
         client_id: The client's unique identifier
+        rate_limit: Optional rate limit if already known, looked up otherwise
         
     Returns:
         Dict[str, Any]: Rate limit information including limit, remaining, and reset time
@@ -115,7 +169,8 @@ def check_rate_limit(client_id: str) -> Dict[str, Any]:
         RateLimitExceededException: If the client has exceeded their rate limit
     """
     # Get the rate limit for the client
-    rate_limit = get_rate_limit_for_client(client_id)
+    if not rate_limit:
+        rate_limit = get_rate_limit_for_client(client_id)
     
     # Calculate the current time window (minute-based)
     current_window = int(time.time() / 60)
@@ -199,10 +254,11 @@ def get_rate_limit_for_client(client_id: str) -> int:
     """
     try:
         # Query the database for client-specific rate limit
-        api_key_record = api_keys.get_by_client_id(client_id)
-        if api_key_record:
-            # Get the rate limit from the first active API key for this client
-            rate_limit = api_key_record.rate_limit
+        with get_db() as db:
+            api_key_records = api_key_crud.get_by_client_id(db, client_id)
+            rate_limit = api_key_records[0].rate_limit if api_key_records else None
+        if rate_limit:
+            # Use the rate limit from the first active API key for this client
             logger.debug(f"Using database rate limit for client {client_id}: {rate_limit}")
             return rate_limit
         
@@ -421,20 +477,20 @@ class APIKeyAuthenticator:
             AuthenticationException: If the API key is invalid
             RateLimitExceededException: If the client has exceeded their rate limit
         """
-        # Validate the API key using database
-        api_key_record = api_keys.authenticate(api_key)
-        if not api_key_record:
+        # Resolve the API key through the principal cache
+        principal = resolve_principal(api_key)
+        if not principal:
             logger.warning("Authentication failed: Invalid API key")
             raise AuthenticationException("Invalid API key", ErrorCodes.UNAUTHORIZED)
         
         # Get the client ID associated with the API key
-        client_id = api_key_record.get("client_id")
+        client_id = principal.get("client_id")
         if not client_id:
             logger.error("Authentication anomaly: Valid API key record but no client_id")
             raise AuthenticationException("Invalid API key configuration", ErrorCodes.UNAUTHORIZED)
         
         # Get rate limit for the client
-        rate_limit = api_key_record.get("rate_limit", get_rate_limit_for_client(client_id))
+        rate_limit = principal.get("rate_limit") or get_rate_limit_for_client(client_id)
         
         # Check rate limits for the client
         rate_limit_info = self._rate_limiter.check_rate_limit(client_id, rate_limit)
@@ -201,9 +201,11 @@ class StructuredLogAdapter(logging.LoggerAdapter):
         if 'extra' not in kwargs:
             kwargs['extra'] = {}
         
-        # Add correlation ID if not present
+        # Add correlation ID if present in context; CorrelationIdFilter fills in the rest
         if 'correlation_id' not in kwargs['extra']:
-            kwargs['extra']['correlation_id'] = get_correlation_id()
+            correlation_id = correlation_id_var.get()
+            if correlation_id is not None:
+                kwargs['extra']['correlation_id'] = correlation_id
             
         # Add any extra context from adapter initialization
         for key, value in self.extra.items():
@@ -221,6 +223,8 @@ class StructuredLogAdapter(logging.LoggerAdapter):
             msg: The log message
             data: Structured data to include in the log
         """
+        if not self.isEnabledFor(level):
+            return
         if data is not None:
             self.log(level, msg, extra=data)
         else:
@@ -243,6 +247,9 @@ def log_api_request(logger: logging.Logger, method: str, path: str,
     """
     set_correlation_id(correlation_id)
     
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     log_data = {
         "method": method,
         "path": path,
@@ -251,7 +258,7 @@ def log_api_request(logger: logging.Logger, method: str, path: str,
         "correlation_id": correlation_id
     }
     
-    logger.info(f"API Request: {method} {path}", extra=log_data)
+    logger.info("API Request: %s %s", method, path, extra=log_data)
 
 
 def log_api_response(logger: logging.Logger, method: str, path: str, 
@@ -270,6 +277,9 @@ def log_api_response(logger: logging.Logger, method: str, path: str,
     """
     set_correlation_id(correlation_id)
     
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     log_data = {
         "method": method,
         "path": path,
@@ -278,8 +288,8 @@ def log_api_response(logger: logging.Logger, method: str, path: str,
         "correlation_id": correlation_id
     }
     
-    logger.info(f"API Response: {method} {path} - Status: {status_code} - Duration: {log_data['duration_ms']}ms", 
-                extra=log_data)
+    logger.info("API Response: %s %s - Status: %s - Duration: %sms",
+                method, path, status_code, log_data['duration_ms'], extra=log_data)
 
 
 def log_error(logger: logging.Logger, error: Exception, message: str, 
@@ -11,12 +11,14 @@ from fastapi.middleware.cors import CORSMiddleware  # fastapi 0.103.0
 from fastapi.middleware.gzip import GZipMiddleware  # fastapi 0.103.0
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware  # fastapi 0.103.0
 from fastapi.middleware.trustedhost import TrustedHostMiddleware  # fastapi 0.103.0
+from starlette.middleware.base import BaseHTTPMiddleware  # starlette 0.27.0+
 
 from ..middleware.authentication import AuthenticationMiddleware
 from ..middleware.logging import LoggingMiddleware
 from ..middleware.error_handling import ErrorHandlingMiddleware
 from ..middleware.rate_limiting import RateLimitingMiddleware
 from ..middleware.tracing import TracingMiddleware
+from ..middleware.pipeline import FusedRequestMiddleware
 
 from ..config.settings import get_settings
 from ..utils.logging import setup_logger
@@ -70,36 +72,50 @@ def setup_middleware(app: FastAPI) -> FastAPI:
     # Get exempt paths
     exempt_paths = get_exempt_paths()
     
+    # Instrument outgoing calls; server spans come from our own middleware only
+    TracingMiddleware().instrument_clients()
+    
+    if getattr(settings, 'middleware_mode', 'stacked') == 'fused':
+        # Single pure-ASGI layer for tracing, errors, auth, rate limiting and logging
+        app.add_middleware(FusedRequestMiddleware, exempt_paths=exempt_paths)
+        logger.info("Fused request middleware added")
+    else:
+        setup_stacked_middleware(app, exempt_paths)
+    
+    logger.info("All middleware components configured successfully")
+    return app
+
+
+def setup_stacked_middleware(app: FastAPI, exempt_paths: list) -> None:
+    """
+    Add the tracing, error handling, authentication, rate limiting and logging
+    middleware as separate layers.
+    
+    Args:
+        app: The FastAPI application to configure
+        exempt_paths: Path prefixes exempt from middleware processing
+    """
     # Add custom middleware in specific order
     
     # Add tracing middleware (first, to capture entire request flow)
-    app.add_middleware(TracingMiddleware, exempt_paths=exempt_paths)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=TracingMiddleware(exempt_paths=exempt_paths))
     logger.info("Tracing middleware added")
     
     # Add error handling middleware (next, to catch errors from other middleware)
-    app.add_middleware(ErrorHandlingMiddleware)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=ErrorHandlingMiddleware())
     logger.info("Error handling middleware added")
     
     # Add authentication middleware
-    app.add_middleware(AuthenticationMiddleware, exempt_paths=exempt_paths)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=AuthenticationMiddleware(exempt_paths=exempt_paths))
     logger.info("Authentication middleware added")
     
     # Add rate limiting middleware
-    app.add_middleware(RateLimitingMiddleware, exempt_paths=exempt_paths)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=RateLimitingMiddleware(exempt_paths=exempt_paths))
     logger.info("Rate limiting middleware added")
     
     # Add logging middleware
-    app.add_middleware(LoggingMiddleware, exempt_paths=exempt_paths)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=LoggingMiddleware(exempt_paths=exempt_paths))
     logger.info("Logging middleware added")
-    
-    # Instrument the app with OpenTelemetry if tracing is enabled
-    if getattr(settings, 'tracing_enabled', True):
-        tracing_middleware = TracingMiddleware()
-        tracing_middleware.instrument_app(app)
-        logger.info("App instrumented with OpenTelemetry")
-    
-    logger.info("All middleware components configured successfully")
-    return app
 
 
 def get_exempt_paths() -> list:
@@ -0,0 +1,266 @@
+"""
+Authenticated-principal cache for the Borrow Rate & Locate Fee Pricing Engine.
+
+This module caches the outcome of API key authentication (client, rate limit, expiry and
+active flag) in process memory (L1) and Redis (L2), keyed by the HMAC digest of the
+presented key, so the request hot path skips the database and bcrypt. Revocations fan out
+over Redis pub/sub: deactivating a key, changing its rate limit or expiring it replaces the
+Redis entry with a short-lived tombstone and tells every process to drop its L1 entry.
+The L1 layer is only consulted while the invalidation subscriber is connected, so a lost
+subscription can never keep a revoked key alive in memory.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import redis  # redis 4.5.0+
+
+from ..utils.logging import setup_logger
+
+# Set up module logger
+logger = setup_logger('core.principal_cache')
+
+# Maximum lifetime of a cached principal, in seconds
+PRINCIPAL_CACHE_TTL = 30
+
+# Upper bound on L1 entries per process
+PRINCIPAL_L1_MAX_ENTRIES = 10000
+
+# Redis key prefix and pub/sub channel for principals
+PRINCIPAL_CACHE_PREFIX = "auth:principal:"
+PRINCIPAL_INVALIDATION_CHANNEL = "auth:principal:invalidate"
+
+# Seconds to wait before resubscribing after a pub/sub failure
+SUBSCRIBER_RETRY_DELAY = 5
+
+
+def principal_from_api_key(api_key_record: Any) -> Dict[str, Any]:
+    """
+    Build a cacheable principal from an APIKey record.
+    
+    Args:
+        api_key_record: APIKey model instance
+    
+    Returns:
+        Dict[str, Any]: Principal with client_id, key_id, rate_limit, expires_at (epoch seconds or None) and active
+    """
+    expires_at = api_key_record.expires_at
+    return {
+        "client_id": api_key_record.client_id,
+        "key_id": api_key_record.key_id,
+        "rate_limit": api_key_record.rate_limit,
+        "expires_at": expires_at.timestamp() if expires_at is not None else None,
+        "active": bool(api_key_record.active),
+    }
+
+
+def is_principal_usable(principal: Dict[str, Any]) -> bool:
+    """
+    Check that a cached principal is active, unexpired and not a revocation tombstone.
+    
+    Args:
+        principal: Cached principal
+    
+    Returns:
+        bool: True if the principal may authenticate a request
+    """
+    if principal.get("revoked") or not principal.get("active"):
+        return False
+    expires_at = principal.get("expires_at")
+    return expires_at is None or expires_at > time.time()
+
+
+def _is_tombstone(value: Any) -> bool:
+    return isinstance(value, dict) and bool(value.get("revoked"))
+
+
+class PrincipalCache:
+    """
+    Two-level cache of authenticated principals with pub/sub invalidation.
+    """
+    
+    def __init__(self, redis_cache=None, ttl: int = PRINCIPAL_CACHE_TTL,
+                 max_entries: int = PRINCIPAL_L1_MAX_ENTRIES):
+        """
+        Initialize the principal cache.
+        
+        Args:
+            redis_cache: Optional RedisCache instance, uses the shared instance if not provided
+            ttl: Maximum lifetime of a cached principal in seconds
+            max_entries: Maximum number of L1 entries
+        """
+        self._redis_cache = redis_cache
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: Dict[str, tuple] = {}  # digest -> (monotonic expiry, principal)
+        self._revoked: Dict[str, float] = {}  # digest -> monotonic time until which L1 stores are refused
+        self._lock = threading.Lock()
+        self._subscribed = threading.Event()
+        self._subscriber: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+    
+    @property
+    def redis_cache(self):
+        """Shared RedisCache instance, created on first use."""
+        if self._redis_cache is None:
+            from ..services.cache import get_redis_cache
+            self._redis_cache = get_redis_cache()
+        return self._redis_cache
+    
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a usable cached principal for a key digest.
+        
+        Args:
+            digest: HMAC digest of the presented API key
+        
+        Returns:
+            Optional[Dict[str, Any]]: Principal, or None on miss or if the key is no longer usable
+        """
+        self.ensure_subscriber()
+        
+        if self._subscribed.is_set():
+            with self._lock:
+                entry = self._entries.get(digest)
+            if entry is not None and entry[0] > time.monotonic() and is_principal_usable(entry[1]):
+                return entry[1]
+        
+        try:
+            principal = self.redis_cache.get(PRINCIPAL_CACHE_PREFIX + digest)
+        except redis.RedisError as e:
+            logger.warning(f"Principal cache lookup failed: {str(e)}")
+            return None
+        
+        if principal is None or not is_principal_usable(principal):
+            return None
+        
+        self._store_local(digest, principal, self._ttl_for(principal))
+        return principal
+    
+    def set(self, digest: str, principal: Dict[str, Any]) -> None:
+        """
+        Cache a freshly authenticated principal.
+        
+        Args:
+            digest: HMAC digest of the presented API key
+            principal: Principal to cache
+        """
+        ttl = self._ttl_for(principal)
+        if ttl <= 0 or not is_principal_usable(principal):
+            return
+        
+        key = PRINCIPAL_CACHE_PREFIX + digest
+        try:
+            # Never overwrite a revocation tombstone, including one written during this store
+            stored = self.redis_cache.set_unless(key, principal, ttl, _is_tombstone)
+            if not stored:
+                return
+        except redis.RedisError as e:
+            logger.warning(f"Principal cache store failed: {str(e)}")
+            return
+        
+        self._store_local(digest, principal, ttl)
+    
+    def invalidate(self, digest: str) -> None:
+        """
+        Revoke a cached principal in this process, in Redis and in every subscribed process.
+        
+        Args:
+            digest: HMAC digest of the API key
+        """
+        self._evict_local(digest)
+        try:
+            self.redis_cache.set(PRINCIPAL_CACHE_PREFIX + digest, {"revoked": True}, self._ttl)
+            self.redis_cache.publish(PRINCIPAL_INVALIDATION_CHANNEL, digest)
+        except redis.RedisError as e:
+            logger.error(f"Failed to propagate principal invalidation: {str(e)}")
+    
+    def clear_local(self) -> None:
+        """Drop all L1 entries in this process."""
+        with self._lock:
+            self._entries.clear()
+            self._revoked.clear()
+    
+    def ensure_subscriber(self) -> None:
+        """Start the invalidation subscriber thread if it is not running."""
+        if self._subscriber is not None and self._subscriber.is_alive():
+            return
+        with self._lock:
+            if self._subscriber is not None and self._subscriber.is_alive():
+                return
+            self._stopping.clear()
+            self._subscriber = threading.Thread(
+                target=self._listen, name="principal-cache-invalidation", daemon=True
+            )
+            self._subscriber.start()
+    
+    def stop(self) -> None:
+        """Stop the invalidation subscriber and drop all L1 entries."""
+        self._stopping.set()
+        self._subscribed.clear()
+        self.clear_local()
+    
+    def _listen(self) -> None:
+        while not self._stopping.is_set():
+            pubsub = None
+            try:
+                pubsub = self.redis_cache.subscribe(PRINCIPAL_INVALIDATION_CHANNEL)
+                self._subscribed.set()
+                logger.info("Principal cache invalidation subscriber connected")
+                while not self._stopping.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._evict_local(message["data"])
+            except (redis.RedisError, OSError) as e:
+                logger.warning(f"Principal cache invalidation subscriber disconnected: {str(e)}")
+            finally:
+                # Without a subscription L1 could miss revocations, so drop it
+                self._subscribed.clear()
+                self.clear_local()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except (redis.RedisError, OSError):
+                        pass
+            self._stopping.wait(SUBSCRIBER_RETRY_DELAY)
+    
+    def _store_local(self, digest: str, principal: Dict[str, Any], ttl: float) -> None:
+        if not self._subscribed.is_set() or ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self._revoked.get(digest, 0) > now:
+                return
+            if len(self._entries) >= self._max_entries:
+                self._entries.clear()
+            self._entries[digest] = (now + ttl, principal)
+    
+    def _evict_local(self, digest: str) -> None:
+        with self._lock:
+            self._entries.pop(digest, None)
+            self._revoked[digest] = time.monotonic() + self._ttl
+            if len(self._revoked) > self._max_entries:
+                now = time.monotonic()
+                self._revoked = {d: until for d, until in self._revoked.items() if until > now}
+    
+    def _ttl_for(self, principal: Dict[str, Any]) -> int:
+        expires_at = principal.get("expires_at")
+        if expires_at is None:
+            return self._ttl
+        return int(min(self._ttl, expires_at - time.time()))
+
+
+# Shared instance used by authentication and API key CRUD operations
+principal_cache = PrincipalCache()
+
+
+def invalidate_principal(digest: Optional[str]) -> None:
+    """
+    Revoke the cached principal for an API key digest everywhere.
+    
+    Args:
+        digest: HMAC digest of the API key, ignored if None
+    """
+    if digest:
+        principal_cache.invalidate(digest)
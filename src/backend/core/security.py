@@ -10,6 +10,8 @@ import jwt  # pyjwt 2.6.0+
 from passlib.context import CryptContext  # passlib 1.7.4+
 from cryptography.fernet import Fernet  # cryptography 40.0.0+
 import secrets
+import hashlib
+import hmac
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 
@@ -151,6 +153,23 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def compute_api_key_digest(api_key: str) -> str:
+    """
+    Computes the keyed HMAC-SHA256 digest used to look up a stored API key.
+    
+    The digest is deterministic, so it can be stored in an indexed column and
+    matched with a single query; the bcrypt hash remains the verifier.
+    
+    Args:
+        api_key: The plaintext API key
+        
+    Returns:
+        str: Hex-encoded HMAC-SHA256 digest (64 characters)
+    """
+    secret = get_settings().api_key_hmac_secret
+    return hmac.new(secret.encode(), api_key.encode(), hashlib.sha256).hexdigest()
+
+
 def generate_api_key(length: int = 32) -> str:
     """
     Generates a new cryptographically secure API key.
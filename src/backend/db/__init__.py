@@ -8,6 +8,7 @@ from .base import (
     Stock,
     Broker,
     Volatility,
+    VolatilityRollup,
     APIKey,
     AuditLog
 )
@@ -15,8 +16,10 @@ from .base import (
 # Re-export session management functionality
 from .session import (
     get_db,
+    get_read_db,
     init_db,
-    get_engine
+    get_engine,
+    replica_ok
 )
 
 # Use DatabaseSessionManager as DatabaseSession for compatibility
@@ -27,17 +30,21 @@ from .utils import (
     get_or_create,
     execute_with_retry,
     update_or_create,
-    bulk_insert
+    bulk_insert,
+    bulk_upsert
 )
 
 # Use TransactionManager as TransactionContext for compatibility
 from .utils import TransactionManager as TransactionContext
 
-# Define bulk_insert_or_update to combine bulk_insert and update_or_create functionality
+# Define bulk_insert_or_update on top of the set-based bulk_upsert path
 def bulk_insert_or_update(session, objects, key_fields=None, batch_size=1000):
     """
     Efficiently insert or update multiple database records.
     
+    Objects are grouped by model and written with batched INSERT ... ON CONFLICT
+    DO UPDATE statements rather than a SELECT followed by an INSERT or UPDATE per row.
+    
     Args:
         session: SQLAlchemy session
         objects: List of objects to insert or update
@@ -54,35 +61,26 @@ def bulk_insert_or_update(session, objects, key_fields=None, batch_size=1000):
     if not key_fields:
         return bulk_insert(session, objects, batch_size)
     
-    # Process in batches for better performance
-    for i in range(0, len(objects), batch_size):
-        batch = objects[i:i+batch_size]
-        
-        # Handle each object in the batch
-        for obj in batch:
-            # Extract filter criteria based on key fields
-            filters = {field: getattr(obj, field) for field in key_fields if hasattr(obj, field)}
-            
-            # If we couldn't extract all key fields, skip this object
-            if len(filters) != len(key_fields):
-                continue
-            
-            # Get the model class
-            model_cls = type(obj)
-            
-            # Extract values from the object's table columns
-            values = {}
-            if hasattr(model_cls, '__table__'):
-                for column in model_cls.__table__.columns:
-                    column_name = column.name
-                    if column_name not in key_fields and hasattr(obj, column_name):
-                        values[column_name] = getattr(obj, column_name)
-            
-            # Use update_or_create to either update or create the object
-            update_or_create(session, model_cls, filters, values)
-        
-        # Flush after each batch to apply changes
-        session.flush()
+    # Group column values by model so each model gets its own upsert statements
+    rows_by_model = {}
+    for obj in objects:
+        model_cls = type(obj)
+        if not hasattr(model_cls, '__table__'):
+            continue
+        
+        # Unset columns are left out so server defaults still apply
+        row = {}
+        for column in model_cls.__table__.columns:
+            value = getattr(obj, column.name, None)
+            if value is not None:
+                row[column.name] = value
+        rows_by_model.setdefault(model_cls, []).append(row)
+    
+    for model_cls, rows in rows_by_model.items():
+        bulk_upsert(session, model_cls, rows, key_fields=list(key_fields), batch_size=batch_size)
+    
+    # Flush so the changes are visible to subsequent queries in the session
+    session.flush()
 
 
 # Implement QueryBuilder class
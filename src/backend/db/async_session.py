@@ -0,0 +1,225 @@
+"""
+Async database session management for the Borrow Rate & Locate Fee Pricing Engine.
+
+This module provides an asyncpg-backed AsyncEngine and AsyncSession stack for request
+handlers, so database I/O inside async endpoints does not block the event loop. The
+synchronous stack in session.py remains the path for scripts, migrations and other
+blocking callers.
+"""
+
+import logging
+import contextlib
+from typing import AsyncGenerator
+
+from sqlalchemy import exc, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from ..config.settings import get_settings
+from ..utils.logging import setup_logger, log_exceptions
+from ..utils.metrics import instrument_engine
+
+# Configure module logger
+logger = setup_logger("db.async_session", logging.INFO)
+
+# Global variables for async engine and session factory
+async_engine = None
+AsyncSessionLocal = None
+
+# Async drivers to use for each database backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Converts a synchronous database URL to its async driver equivalent.
+    
+    For example postgresql://... and postgresql+psycopg2://... become
+    postgresql+asyncpg://...
+    
+    Args:
+        database_url: Database connection URL
+    
+    Returns:
+        str: Database URL using the async driver
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None or url.get_driver_name() == driver:
+        return database_url
+    return url.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+@log_exceptions(logger)
+def get_async_engine() -> AsyncEngine:
+    """
+    Creates or returns an existing async SQLAlchemy engine with connection pooling.
+    
+    Pool sizes follow the same environment-specific settings as the sync engine.
+    
+    Returns:
+        AsyncEngine: SQLAlchemy async engine instance
+    """
+    global async_engine
+    
+    # Return existing engine if already created
+    if async_engine is not None:
+        return async_engine
+    
+    settings = get_settings()
+    database_url = get_async_database_url(settings.database_url)
+    
+    # Determine environment-specific pool settings
+    if settings.is_production():
+        pool_size = 20
+        max_overflow = 30
+        pool_timeout = 30
+    elif settings.is_staging():
+        pool_size = 10
+        max_overflow = 20
+        pool_timeout = 30
+    else:  # Development
+        pool_size = 5
+        max_overflow = 10
+        pool_timeout = 30
+    
+    engine_kwargs = {
+        "pool_pre_ping": True,  # Check connection before using it
+        "pool_recycle": 3600,   # Recycle connections after 1 hour
+    }
+    if make_url(database_url).get_backend_name() == "postgresql":
+        engine_kwargs.update(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            connect_args={"timeout": 10}  # 10 second connection timeout (asyncpg)
+        )
+    
+    async_engine = create_async_engine(database_url, **engine_kwargs)
+    instrument_engine(async_engine.sync_engine, "async", pool_size + max_overflow)
+    
+    logger.info(f"Async database engine created with pool_size={pool_size}, max_overflow={max_overflow}")
+    return async_engine
+
+
+@log_exceptions(logger)
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    Creates or returns a factory for async database sessions.
+    
+    Returns:
+        async_sessionmaker: SQLAlchemy async session factory
+    """
+    global AsyncSessionLocal
+    
+    # Return existing session factory if already created
+    if AsyncSessionLocal is not None:
+        return AsyncSessionLocal
+    
+    AsyncSessionLocal = async_sessionmaker(
+        bind=get_async_engine(),
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False  # Don't expire objects, lazy reloads are not possible in async code
+    )
+    
+    logger.info("Async database session factory created")
+    return AsyncSessionLocal
+
+
+@contextlib.asynccontextmanager
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager that provides a database session and handles cleanup.
+    
+    Commits on success, rolls back on error and always closes the session.
+    
+    Yields:
+        AsyncSession: Async database session
+    """
+    session_factory = get_async_session_factory()
+    session = session_factory()
+    
+    try:
+        logger.debug("Async database session started")
+        yield session
+        await session.commit()
+        logger.debug("Async database session committed")
+    except Exception as e:
+        logger.error(f"Async database session error: {str(e)}")
+        await session.rollback()
+        logger.debug("Async database session rolled back")
+        raise
+    finally:
+        await session.close()
+        logger.debug("Async database session closed")
+
+
+async def close_async_engine() -> None:
+    """
+    Closes the async database engine and connection pool.
+    
+    This function should be called during application shutdown.
+    
+    Returns:
+        None: Closes connections as a side effect
+    """
+    global async_engine, AsyncSessionLocal
+    if async_engine is not None:
+        await async_engine.dispose()
+        async_engine = None
+        AsyncSessionLocal = None
+        logger.info("Async database engine and connection pool closed")
+
+
+async def ping_database_async() -> bool:
+    """
+    Checks database connectivity through the async engine.
+    
+    Returns:
+        bool: True if database is accessible, False otherwise
+    """
+    try:
+        engine = get_async_engine()
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        return True
+    except (exc.DBAPIError, OSError) as e:
+        logger.error(f"Async database connectivity check failed: {str(e)}")
+        return False
+
+
+class AsyncDatabaseSessionManager:
+    """
+    Manages async database sessions for dependency injection.
+    
+    The engine and session factory are created lazily on first use so the
+    manager can be instantiated at import time.
+    """
+    
+    def get_session(self):
+        """
+        Async context manager that provides a database session.
+        
+        Returns:
+            contextlib._AsyncGeneratorContextManager: Context manager yielding a session
+        """
+        return get_async_db()
+    
+    async def close(self):
+        """
+        Closes the async engine and releases all connections.
+        
+        Returns:
+            None: Closes connections as a side effect
+        """
+        await close_async_engine()
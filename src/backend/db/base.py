@@ -17,5 +17,6 @@ from .models.base import Base, BaseModel
 from .models.stock import Stock, idx_stocks_ticker, idx_stocks_lender_id
 from .models.broker import Broker
 from .models.volatility import Volatility, idx_volatility_stock, idx_volatility_time, idx_volatility_stock_time
+from .models.volatility_rollup import VolatilityRollup
 from .models.api_key import APIKey
 from .models.audit import AuditLog
\ No newline at end of file
@@ -5,30 +5,36 @@ This file exports all CRUD classes and their singleton instances to provide a cl
 for database operations throughout the application.
 """
 
-# Base CRUD class
+# Base CRUD classes
 from .base import CRUDBase
+from .async_base import AsyncCRUDBase
 
 # Stock CRUD operations
-from .stocks import CRUDStock, stock
+from .stocks import CRUDStock, stock, AsyncCRUDStock, async_stock
 
 # Broker CRUD operations
-from .brokers import CRUDBroker, broker_crud as broker
+from .brokers import CRUDBroker, broker_crud as broker, AsyncCRUDBroker, async_broker_crud as async_broker
 
 # Volatility CRUD operations
 from .volatility import CRUDVolatility, volatility
+from .volatility_rollup import CRUDVolatilityRollup, volatility_rollup
 
 # API Key CRUD operations
 from .api_keys import CRUDAPIKey, api_key_crud as api_keys
 
 # Audit CRUD operations
-from .audit import CRUDAudit, audit
+from .audit import CRUDAudit, audit, AsyncCRUDAudit, async_audit
 
 # Export all CRUD classes and instances
 __all__ = [
-    "CRUDBase",
+    "CRUDBase", "AsyncCRUDBase",
     "CRUDStock", "stock",
+    "AsyncCRUDStock", "async_stock",
     "CRUDBroker", "broker",
+    "AsyncCRUDBroker", "async_broker",
     "CRUDVolatility", "volatility", 
+    "CRUDVolatilityRollup", "volatility_rollup",
     "CRUDAPIKey", "api_keys",
-    "CRUDAudit", "audit"
+    "CRUDAudit", "audit",
+    "AsyncCRUDAudit", "async_audit"
 ]
\ No newline at end of file
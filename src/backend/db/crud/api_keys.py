@@ -5,17 +5,20 @@ This module extends the base CRUD class to provide specialized database operatio
 including creation with secure hashing, validation, retrieval, updates, and deactivation.
 """
 
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterable
 
-from sqlalchemy import select
+from sqlalchemy import select, func, or_
 from sqlalchemy.orm import Session
 
 from .base import CRUDBase
 from ...db.models.api_key import APIKey
 from ...schemas.api_key import ApiKeyCreate, ApiKeyUpdate
 from ...core.exceptions import ClientNotFoundException, AuthenticationException
-from ...core.security import generate_api_key, hash_password, verify_password
+from ...core.security import generate_api_key, hash_password, verify_password, compute_api_key_digest
+from ...config.settings import get_settings
 from ...utils.logging import setup_logger
 
 # Set up logger
@@ -24,6 +27,55 @@ logger = setup_logger('db.crud.api_keys')
 # Length of generated API keys
 API_KEY_LENGTH = 48
 
+# Token bucket shared by legacy scans in this process: [tokens, last refill]
+_legacy_scan_bucket: List[float] = []
+_legacy_scan_lock = threading.Lock()
+
+# Last key_id verified by a bounded legacy scan in this process; the next scan
+# continues after it so successive scans rotate through every legacy row
+_legacy_scan_cursor: List[str] = []
+
+
+def _take_legacy_scan_token(rate: float) -> bool:
+    """
+    Take one legacy scan from the per-process budget.
+    
+    Unknown keys cost a bcrypt verify per legacy row, so scans are limited to
+    rate per second (up to one second's worth at once) whatever the caller.
+    
+    Args:
+        rate: Scans admitted per second
+        
+    Returns:
+        bool: True if a scan may run
+    """
+    now = time.monotonic()
+    burst = max(rate, 1.0)
+    with _legacy_scan_lock:
+        if not _legacy_scan_bucket:
+            _legacy_scan_bucket.extend([burst, now])
+        else:
+            _legacy_scan_bucket[0] = min(burst, _legacy_scan_bucket[0] + (now - _legacy_scan_bucket[1]) * rate)
+            _legacy_scan_bucket[1] = now
+        
+        if _legacy_scan_bucket[0] < 1:
+            return False
+        _legacy_scan_bucket[0] -= 1
+        return True
+
+
+def _invalidate_principal(db_obj: APIKey) -> None:
+    """
+    Revoke the cached authenticated principal for an API key after it changes.
+    
+    Args:
+        db_obj: Updated API key
+    """
+    if db_obj.key_digest:
+        # Imported lazily to avoid a circular import through core.auth
+        from ...core.principal_cache import invalidate_principal
+        invalidate_principal(db_obj.key_digest)
+
 
 class CRUDAPIKey(CRUDBase[APIKey, ApiKeyCreate, ApiKeyUpdate]):
     """CRUD operations for API keys"""
@@ -61,7 +113,8 @@ class CRUDAPIKey(CRUDBase[APIKey, ApiKeyCreate, ApiKeyUpdate]):
             "rate_limit": obj_in.rate_limit,
             "expires_at": expires_at,
             "active": True,
-            "hashed_key": hashed_key
+            "hashed_key": hashed_key,
+            "key_digest": compute_api_key_digest(plaintext_key)
         }
         
         # Create the API key in the database
@@ -76,6 +129,11 @@ class CRUDAPIKey(CRUDBase[APIKey, ApiKeyCreate, ApiKeyUpdate]):
         """
         Get API key by the plaintext key
         
+        Looks the key up by its HMAC digest with a single indexed query and then
+        runs one bcrypt verify. Keys created before digests existed are found by
+        scanning the valid rows without a digest, and are migrated on first match;
+        that scan is bounded and rate limited (see legacy_api_key_lookup settings).
+        
         Args:
             db: Database session
             api_key: Plaintext API key
@@ -83,24 +141,188 @@ class CRUDAPIKey(CRUDBase[APIKey, ApiKeyCreate, ApiKeyUpdate]):
         Returns:
             Optional[APIKey]: API key if found and valid, None otherwise
         """
-        # Get all API keys
-        stmt = select(APIKey)
-        results = db.execute(stmt).scalars().all()
+        digest = compute_api_key_digest(api_key)
+        stmt = select(APIKey).where(APIKey.key_digest == digest)
+        db_key = db.execute(stmt).scalars().first()
+        
+        if db_key is None:
+            db_key = self._find_legacy_key(db, api_key, digest)
+        elif not verify_password(api_key, db_key.hashed_key):
+            # Digest collision or tampered row - never trust the digest alone
+            logger.warning(f"API key {db_key.key_id} digest matched but hash verification failed")
+            return None
+        
+        if db_key is None:
+            logger.warning("API key verification failed: key not found")
+            return None
+        
+        if not db_key.is_valid():
+            logger.warning(f"Found API key {db_key.key_id} but it's not valid (expired or inactive)")
+            return None
+        
+        logger.debug(f"Found valid API key: {db_key.key_id}")
+        return db_key
+    
+    def _find_legacy_key(self, db: Session, api_key: str, digest: str) -> Optional[APIKey]:
+        """
+        Run the legacy scan for an unknown key if it is enabled and within budget
+        
+        Args:
+            db: Database session
+            api_key: Plaintext API key
+            digest: HMAC digest of the plaintext key
+            
+        Returns:
+            Optional[APIKey]: Matching API key, None if not found or not scanned
+        """
+        lookup = get_settings().legacy_api_key_lookup
+        if not lookup["enabled"]:
+            return None
+        
+        if not _take_legacy_scan_token(lookup["rate"]):
+            logger.warning("Legacy API key scan skipped: rate limit exceeded")
+            return None
+        
+        return self._get_legacy_key(db, api_key, digest, max_rows=lookup["max_rows"])
+    
+    def _get_legacy_key(self, db: Session, api_key: str, digest: str, max_rows: Optional[int] = None) -> Optional[APIKey]:
+        """
+        Find a valid key that has no digest yet and store its digest on match
+        
+        A bounded scan verifies the next max_rows legacy rows after the previous
+        scan's last row, wrapping around, so no legacy key is permanently out of reach.
+        
+        Args:
+            db: Database session
+            api_key: Plaintext API key
+            digest: HMAC digest of the plaintext key
+            max_rows: Maximum number of legacy rows to verify, None for all
+            
+        Returns:
+            Optional[APIKey]: Matching API key, None if no legacy key matches
+        """
+        stmt = (
+            select(APIKey)
+            .where(
+                APIKey.key_digest.is_(None),
+                APIKey.active.is_(True),
+                or_(APIKey.expires_at.is_(None), APIKey.expires_at > datetime.now())
+            )
+            .order_by(APIKey.key_id)
+        )
         
-        # Check each key to find a match
-        for db_key in results:
+        if max_rows is None:
+            db_keys = list(db.execute(stmt).scalars())
+        else:
+            with _legacy_scan_lock:
+                cursor = _legacy_scan_cursor[0] if _legacy_scan_cursor else None
+            db_keys = list(db.execute(
+                (stmt if cursor is None else stmt.where(APIKey.key_id > cursor)).limit(max_rows)
+            ).scalars())
+            if cursor is not None and len(db_keys) < max_rows:
+                # Wrap around to the rows before the cursor
+                db_keys += db.execute(
+                    stmt.where(APIKey.key_id <= cursor).limit(max_rows - len(db_keys))
+                ).scalars().all()
+            if db_keys:
+                with _legacy_scan_lock:
+                    _legacy_scan_cursor[:] = [db_keys[-1].key_id]
+        
+        for db_key in db_keys:
             if verify_password(api_key, db_key.hashed_key):
-                # Found matching key, check if it's valid
-                if db_key.is_valid():
-                    logger.debug(f"Found valid API key: {db_key.key_id}")
-                    return db_key
-                else:
-                    logger.warning(f"Found API key {db_key.key_id} but it's not valid (expired or inactive)")
-                    return None
-        
-        logger.warning("API key verification failed: key not found")
+                db_key.key_digest = digest
+                db.add(db_key)
+                db.commit()
+                logger.info(f"Migrated API key {db_key.key_id} to digest lookup")
+                return db_key
+        
+        if max_rows is not None and len(db_keys) >= max_rows:
+            logger.warning(
+                f"Legacy API key scan covered {max_rows} rows only; "
+                "backfill or rotate legacy keys with scripts/migrate_api_keys.py"
+            )
         return None
     
+    def count_legacy_keys(self, db: Session) -> int:
+        """
+        Count valid API keys that still lack a lookup digest
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            int: Number of keys that would fall back to the bcrypt scan
+        """
+        stmt = select(func.count()).select_from(APIKey).where(
+            APIKey.key_digest.is_(None),
+            APIKey.active.is_(True),
+            or_(APIKey.expires_at.is_(None), APIKey.expires_at > datetime.now())
+        )
+        return db.execute(stmt).scalar_one()
+    
+    def migrate_legacy_keys(self, db: Session, plaintext_keys: Iterable[str]) -> int:
+        """
+        Backfill lookup digests for legacy keys whose plaintext is known
+        
+        Useful for keys provisioned from configuration (API_KEY_* variables);
+        other legacy keys are migrated lazily on their first authentication.
+        
+        Args:
+            db: Database session
+            plaintext_keys: Plaintext API keys to match against legacy rows
+            
+        Returns:
+            int: Number of keys migrated
+        """
+        migrated = 0
+        for api_key in plaintext_keys:
+            if self._get_legacy_key(db, api_key, compute_api_key_digest(api_key)) is not None:
+                migrated += 1
+        
+        if migrated > 0:
+            logger.info(f"Backfilled lookup digests for {migrated} API keys")
+        
+        return migrated
+    
+    def rotate_legacy_keys(self, db: Session) -> List[Tuple[APIKey, str]]:
+        """
+        Replace every valid key that still lacks a lookup digest
+        
+        Each legacy key gets a replacement with the same client, rate limit and
+        expiry, and is then deactivated. Use this for legacy keys whose plaintext is
+        not known to the operator, after which the legacy scan can be disabled.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            List[Tuple[APIKey, str]]: Replacement API key models and plaintext keys
+        """
+        stmt = select(APIKey).where(
+            APIKey.key_digest.is_(None),
+            APIKey.active.is_(True),
+            or_(APIKey.expires_at.is_(None), APIKey.expires_at > datetime.now())
+        ).order_by(APIKey.key_id)
+        legacy_keys = list(db.execute(stmt).scalars())
+        
+        replacements = []
+        for legacy_key in legacy_keys:
+            plaintext_key = generate_api_key(API_KEY_LENGTH)
+            db_obj = super().create(db, {
+                "key_id": generate_api_key(16),
+                "client_id": legacy_key.client_id,
+                "rate_limit": legacy_key.rate_limit,
+                "expires_at": legacy_key.expires_at,
+                "active": True,
+                "hashed_key": hash_password(plaintext_key),
+                "key_digest": compute_api_key_digest(plaintext_key)
+            })
+            self.update(db, legacy_key, {"active": False})
+            replacements.append((db_obj, plaintext_key))
+            logger.info(f"Rotated legacy API key {legacy_key.key_id} to {db_obj.key_id} for client {legacy_key.client_id}")
+        
+        return replacements
+    
     def verify_key(self, db: Session, api_key: str) -> bool:
         """
         Verify if a plaintext API key is valid
@@ -157,6 +379,7 @@ class CRUDAPIKey(CRUDBase[APIKey, ApiKeyCreate, ApiKeyUpdate]):
         # Create update object with active=False
         update_data = {"active": False}
         updated_key = self.update(db, db_obj, update_data)
+        _invalidate_principal(updated_key)
         
         logger.info(f"Deactivated API key {key_id}")
         return updated_key
@@ -186,6 +409,7 @@ class CRUDAPIKey(CRUDBase[APIKey, ApiKeyCreate, ApiKeyUpdate]):
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        _invalidate_principal(db_obj)
         
         logger.info(f"Extended expiration of API key {key_id} by {days} days")
         return db_obj
@@ -211,6 +435,7 @@ class CRUDAPIKey(CRUDBase[APIKey, ApiKeyCreate, ApiKeyUpdate]):
         # Create update object with the new rate_limit
         update_data = {"rate_limit": rate_limit}
         updated_key = self.update(db, db_obj, update_data)
+        _invalidate_principal(updated_key)
         
         logger.info(f"Updated rate limit for API key {key_id} to {rate_limit}")
         return updated_key
@@ -0,0 +1,169 @@
+"""
+Async base CRUD module for the Borrow Rate & Locate Fee Pricing Engine.
+
+This module mirrors CRUDBase for AsyncSession so request handlers can run database
+operations without blocking the event loop. Model-specific async CRUD classes extend
+it alongside their synchronous counterparts.
+"""
+
+from typing import Generic, Type, Optional, Any, Dict, List, Union
+from sqlalchemy import select  # sqlalchemy v2.0.0+
+from sqlalchemy.ext.asyncio import AsyncSession  # sqlalchemy v2.0.0+
+
+from .base import ModelType, CreateSchemaType, UpdateSchemaType
+from ..utils import get_or_404, execute_async_with_retry
+from ...core.exceptions import BaseAPIException
+
+
+class AsyncCRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    Generic base class for async CRUD operations on database models.
+
+    Attributes:
+        model (Type[ModelType]): The SQLAlchemy model class this CRUD handles
+    """
+
+    def __init__(self, model: Type[ModelType]):
+        """
+        Initialize the async CRUD base class with a model.
+
+        Args:
+            model: The SQLAlchemy model class this CRUD will operate on
+        """
+        self.model = model
+
+    async def get(self, db: AsyncSession, id: Any, id_field: str = "id") -> Optional[ModelType]:
+        """
+        Get a single record by ID or another field.
+
+        Args:
+            db: Async database session
+            id: Value to search for
+            id_field: Field name to search by (defaults to "id")
+
+        Returns:
+            Model instance if found, None otherwise
+        """
+        query = select(self.model).where(getattr(self.model, id_field) == id)
+        result = await execute_async_with_retry(lambda: db.scalars(query))
+        return result.first()
+
+    async def get_or_404(
+        self,
+        db: AsyncSession,
+        id: Any,
+        id_field: str = "id",
+        exception_class: Type[BaseAPIException] = BaseAPIException,
+        error_message: str = "Record not found"
+    ) -> ModelType:
+        """
+        Get a record by ID or raise a not found exception.
+
+        Args:
+            db: Async database session
+            id: Value to search for
+            id_field: Field name to search by (defaults to "id")
+            exception_class: Exception class to raise if not found
+            error_message: Error message if record not found
+
+        Returns:
+            Model instance if found
+
+        Raises:
+            exception_class: If record is not found
+        """
+        result = await self.get(db=db, id=id, id_field=id_field)
+        return get_or_404(result, exception_class, error_message)
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        skip: Optional[int] = 0,
+        limit: Optional[int] = 100
+    ) -> List[ModelType]:
+        """
+        Get multiple records with optional pagination.
+
+        Args:
+            db: Async database session
+            skip: Number of records to skip (for pagination)
+            limit: Maximum number of records to return
+
+        Returns:
+            List of model instances
+        """
+        query = select(self.model)
+
+        if skip is not None:
+            query = query.offset(skip)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        results = await execute_async_with_retry(lambda: db.scalars(query))
+        return list(results.all())
+
+    async def create(self, db: AsyncSession, obj_in: Union[CreateSchemaType, Dict[str, Any]]) -> ModelType:
+        """
+        Create a new record.
+
+        Args:
+            db: Async database session
+            obj_in: Input data, either as a Pydantic schema or dictionary
+
+        Returns:
+            Created model instance
+        """
+        # Convert input to dictionary if it's not already
+        if not isinstance(obj_in, dict):
+            obj_in_data = obj_in.dict() if hasattr(obj_in, 'dict') else dict(obj_in)
+        else:
+            obj_in_data = obj_in
+
+        # Create model instance
+        db_obj = self.model(**obj_in_data)
+
+        # Add to database and commit
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+
+        return db_obj
+
+    async def update(
+        self,
+        db: AsyncSession,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        """
+        Update an existing record.
+
+        Args:
+            db: Async database session
+            db_obj: Existing model instance to update
+            obj_in: Update data, either as a Pydantic schema or dictionary
+
+        Returns:
+            Updated model instance
+        """
+        # Convert input to dictionary if it's not already
+        if not isinstance(obj_in, dict):
+            obj_in_data = obj_in.dict(exclude_unset=True) if hasattr(obj_in, 'dict') else dict(obj_in)
+        else:
+            obj_in_data = obj_in
+
+        # Get current data as dictionary
+        db_obj_data = db_obj.to_dict()
+
+        # Update the dictionary with new values
+        for field in db_obj_data:
+            if field in obj_in_data:
+                setattr(db_obj, field, obj_in_data[field])
+
+        # Add to database and commit
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+
+        return db_obj
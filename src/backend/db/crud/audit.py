@@ -6,17 +6,48 @@ that track all fee calculations, data source usage, and system events to ensure
 and support troubleshooting.
 """
 
-from sqlalchemy import select, and_, or_, func
+import asyncio
+
+from sqlalchemy import select, and_, or_, func, cast, BigInteger
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, date, time, timedelta
 from decimal import Decimal
 from typing import Dict, List, Optional, Any, Union
 
+import numpy as np  # numpy 1.24.0+
+
 from .base import CRUDBase
+from .async_base import AsyncCRUDBase
+from ..utils import execute_async_with_retry
+from ..session import replica_ok
 from ..models.audit import AuditLog
 from ...schemas.audit import AuditLogSchema, AuditLogFilterSchema, AuditLogResponseSchema
 
+# Fixed-point scales used when loading monetary columns into integer arrays.
+# position_value/total_fee are NUMERIC(15, 2) and borrow_rate_used is NUMERIC(5, 4),
+# so scaling to integers keeps aggregates exact without per-row Decimal arithmetic.
+AMOUNT_SCALE = 100
+RATE_SCALE = 10000
+
+# data_sources maps source names to source entries, so a calculation used a fallback
+# when any entry in the object carries is_fallback: true
+FALLBACK_SOURCE_PATH = '$.* ? (@.is_fallback == true)'
+
+
+def _notify_audit_written(client_id: str, ticker: str) -> None:
+    """
+    Drop cached activity analyses that a new audit record makes stale.
+    
+    Args:
+        client_id: Client identifier of the written record
+        ticker: Stock symbol of the written record
+    """
+    # Imported lazily to avoid a circular import through services.audit
+    from ...services.audit.transactions import invalidate_activity_cache
+    invalidate_activity_cache(client_id=client_id, ticker=ticker)
+
 
 class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
     """CRUD operations for audit logs"""
@@ -38,6 +69,7 @@ class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
         """
         audit_log_data = audit_log.dict() if hasattr(audit_log, 'dict') else dict(audit_log)
         db_audit_log = self.create(db, obj_in=audit_log_data)
+        _notify_audit_written(db_audit_log.client_id, db_audit_log.ticker)
         return db_audit_log
     
     def get_audit_log(self, db: Session, audit_id: UUID) -> Optional[AuditLog]:
@@ -101,7 +133,7 @@ class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
         
         # Get total count
         count_query = select(func.count()).select_from(query.subquery())
-        total = db.execute(count_query).scalar_one()
+        total = db.execute(replica_ok(count_query)).scalar_one()
         
         # Apply pagination
         page = filters.page or 1
@@ -111,7 +143,7 @@ class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
         query = query.offset(offset).limit(page_size)
         
         # Execute query
-        results = db.execute(query).scalars().all()
+        results = db.execute(replica_ok(query)).scalars().all()
         
         # Calculate total pages
         total_pages = (total + page_size - 1) // page_size
@@ -146,7 +178,7 @@ class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
         if limit is not None:
             query = query.limit(limit)
         
-        results = db.execute(query).scalars().all()
+        results = db.execute(replica_ok(query)).scalars().all()
         return list(results)
     
     def get_audit_logs_by_ticker(self, db: Session, ticker: str, skip: Optional[int] = 0, limit: Optional[int] = 100) -> List[AuditLog]:
@@ -170,7 +202,7 @@ class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
         if limit is not None:
             query = query.limit(limit)
         
-        results = db.execute(query).scalars().all()
+        results = db.execute(replica_ok(query)).scalars().all()
         return list(results)
     
     def get_audit_logs_by_date_range(self, db: Session, start_date: datetime, end_date: datetime, skip: Optional[int] = 0, limit: Optional[int] = 100) -> List[AuditLog]:
@@ -200,7 +232,7 @@ class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
         if limit is not None:
             query = query.limit(limit)
         
-        results = db.execute(query).scalars().all()
+        results = db.execute(replica_ok(query)).scalars().all()
         return list(results)
     
     def get_audit_logs_with_fallback(self, db: Session, skip: Optional[int] = 0, limit: Optional[int] = 100) -> List[AuditLog]:
@@ -217,7 +249,7 @@ class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
         """
         # For PostgreSQL JSONB data_sources field, find logs where any source has is_fallback=true
         query = select(AuditLog).where(
-            AuditLog.data_sources.contains({"is_fallback": True})
+            AuditLog.data_sources.path_exists(FALLBACK_SOURCE_PATH)
         )
         
         if skip is not None:
@@ -226,12 +258,77 @@ class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
         if limit is not None:
             query = query.limit(limit)
         
-        results = db.execute(query).scalars().all()
+        results = db.execute(replica_ok(query)).scalars().all()
         
         # As a fallback, filter results again using the model method in case the JSONB query
         # doesn't work as expected with the specific structure of data_sources
         return [result for result in results if result.has_fallback_source()]
     
+    def get_activity_columns(
+        self,
+        db: Session,
+        client_id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Load the columns needed for activity analytics as typed NumPy arrays
+        
+        Runs a single query that selects only the analysed columns, with monetary
+        values scaled to integers (see AMOUNT_SCALE and RATE_SCALE) and the fallback
+        flag evaluated by the database, instead of materialising full AuditLog objects.
+        
+        Args:
+            db: Database session
+            client_id: Optional client identifier to filter by
+            ticker: Optional stock symbol to filter by
+            start_date: Optional first day of the period (inclusive)
+            end_date: Optional last day of the period (inclusive)
+            
+        Returns:
+            Dict[str, np.ndarray]: Column name to array mapping with keys client_id, ticker,
+                timestamp (datetime64[us]), position_value and total_fee (int64, AMOUNT_SCALE),
+                borrow_rate (int64, RATE_SCALE), loan_days (int64) and has_fallback (bool)
+        """
+        query = select(
+            AuditLog.client_id,
+            AuditLog.ticker,
+            AuditLog.timestamp,
+            cast(func.round(AuditLog.position_value * AMOUNT_SCALE), BigInteger),
+            cast(func.round(AuditLog.total_fee * AMOUNT_SCALE), BigInteger),
+            cast(func.round(AuditLog.borrow_rate_used * RATE_SCALE), BigInteger),
+            AuditLog.loan_days,
+            AuditLog.data_sources.path_exists(FALLBACK_SOURCE_PATH)
+        )
+        
+        conditions = []
+        if client_id:
+            conditions.append(AuditLog.client_id == client_id)
+        if ticker:
+            conditions.append(AuditLog.ticker == ticker)
+        if start_date:
+            conditions.append(AuditLog.timestamp >= datetime.combine(start_date, time.min))
+        if end_date:
+            conditions.append(AuditLog.timestamp < datetime.combine(end_date + timedelta(days=1), time.min))
+        
+        if conditions:
+            query = query.where(and_(*conditions))
+        
+        rows = db.execute(replica_ok(query)).all()
+        columns = list(zip(*rows)) if rows else [()] * 8
+        
+        return {
+            "client_id": np.array(columns[0], dtype=str),
+            "ticker": np.array(columns[1], dtype=str),
+            "timestamp": np.array(columns[2], dtype="datetime64[us]"),
+            "position_value": np.array(columns[3], dtype=np.int64),
+            "total_fee": np.array(columns[4], dtype=np.int64),
+            "borrow_rate": np.array(columns[5], dtype=np.int64),
+            "loan_days": np.array(columns[6], dtype=np.int64),
+            "has_fallback": np.array(columns[7], dtype=bool),
+        }
+    
     def count_audit_logs(self, db: Session) -> int:
         """
         Count the total number of audit logs
@@ -243,8 +340,101 @@ class CRUDAudit(CRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
             int: Total count of audit logs
         """
         query = select(func.count()).select_from(AuditLog)
-        return db.execute(query).scalar_one()
+        return db.execute(replica_ok(query)).scalar_one()
+
+
+class AsyncCRUDAudit(AsyncCRUDBase[AuditLog, AuditLogSchema, AuditLogSchema]):
+    """Async CRUD operations for audit logs used by request handlers"""
+    
+    def __init__(self):
+        """Initialize the async CRUD operations for AuditLog model"""
+        super().__init__(AuditLog)
+    
+    async def create_audit_log(self, db: AsyncSession, audit_log: AuditLogSchema) -> AuditLog:
+        """
+        Create a new audit log entry
+        
+        Args:
+            db: Async database session
+            audit_log: Audit log data to create
+            
+        Returns:
+            AuditLog: Created audit log record
+        """
+        audit_log_data = audit_log.dict() if hasattr(audit_log, 'dict') else dict(audit_log)
+        db_audit_log = await self.create(db, obj_in=audit_log_data)
+        await asyncio.to_thread(_notify_audit_written, db_audit_log.client_id, db_audit_log.ticker)
+        return db_audit_log
+    
+    async def get_audit_log(self, db: AsyncSession, audit_id: UUID) -> Optional[AuditLog]:
+        """
+        Get a specific audit log by ID
+        
+        Args:
+            db: Async database session
+            audit_id: Unique identifier of the audit log
+            
+        Returns:
+            Optional[AuditLog]: Found audit log or None
+        """
+        return await self.get(db, id=audit_id, id_field="audit_id")
+    
+    async def get_audit_logs_by_client(self, db: AsyncSession, client_id: str, skip: Optional[int] = 0, limit: Optional[int] = 100) -> List[AuditLog]:
+        """
+        Get audit logs for a specific client
+        
+        Args:
+            db: Async database session
+            client_id: Client identifier
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            List[AuditLog]: List of audit logs for the client
+        """
+        return await self._get_audit_logs_where(db, AuditLog.client_id == client_id, skip, limit)
+    
+    async def get_audit_logs_by_ticker(self, db: AsyncSession, ticker: str, skip: Optional[int] = 0, limit: Optional[int] = 100) -> List[AuditLog]:
+        """
+        Get audit logs for a specific ticker
+        
+        Args:
+            db: Async database session
+            ticker: Stock symbol
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            List[AuditLog]: List of audit logs for the ticker
+        """
+        return await self._get_audit_logs_where(db, AuditLog.ticker == ticker, skip, limit)
+    
+    async def count_audit_logs(self, db: AsyncSession) -> int:
+        """
+        Count the total number of audit logs
+        
+        Args:
+            db: Async database session
+            
+        Returns:
+            int: Total count of audit logs
+        """
+        query = select(func.count()).select_from(AuditLog)
+        return await execute_async_with_retry(lambda: db.scalar(query))
+    
+    async def _get_audit_logs_where(self, db: AsyncSession, condition, skip: Optional[int], limit: Optional[int]) -> List[AuditLog]:
+        query = select(AuditLog).where(condition)
+        
+        if skip is not None:
+            query = query.offset(skip)
+        
+        if limit is not None:
+            query = query.limit(limit)
+        
+        results = await execute_async_with_retry(lambda: db.scalars(query))
+        return list(results.all())
 
 
 # Create singleton instance
-audit = CRUDAudit()
\ No newline at end of file
+audit = CRUDAudit()
+async_audit = AsyncCRUDAudit()
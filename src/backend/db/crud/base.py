@@ -12,7 +12,8 @@ from sqlalchemy import select, update, delete  # sqlalchemy v2.0.0+
 from sqlalchemy.orm import Session  # sqlalchemy v2.0.0+
 
 from ..models.base import BaseModel
-from ..utils import get_or_404, execute_with_retry
+from ..utils import get_or_404, execute_with_retry, bulk_upsert
+from ..session import replica_ok
 from ...core.exceptions import BaseAPIException
 
 # Define type variables for generic typing
@@ -110,7 +111,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if limit is not None:
             query = query.limit(limit)
         
-        results = execute_with_retry(lambda: db.execute(query).scalars().all())
+        results = execute_with_retry(lambda: db.execute(replica_ok(query)).scalars().all())
         return list(results)
     
     def create(self, db: Session, obj_in: Union[CreateSchemaType, Dict[str, Any]]) -> ModelType:
@@ -178,6 +179,48 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         
         return db_obj
     
+    def upsert_multi(
+        self,
+        db: Session,
+        objs_in: List[Union[CreateSchemaType, Dict[str, Any]]],
+        key_fields: List[str],
+        update_fields: Optional[List[str]] = None,
+        batch_size: int = 1000
+    ) -> List[ModelType]:
+        """
+        Insert or update multiple records using batched INSERT ... ON CONFLICT statements.
+        
+        Args:
+            db: Database session
+            objs_in: Input data, either as Pydantic schemas or dictionaries
+            key_fields: Fields identifying an existing record (conflict target)
+            update_fields: Fields to overwrite on conflict (defaults to all supplied non-key fields)
+            batch_size: Number of records sent per statement
+            
+        Returns:
+            List of inserted or updated model instances
+        """
+        rows = []
+        for obj_in in objs_in:
+            if not isinstance(obj_in, dict):
+                obj_in_data = obj_in.dict() if hasattr(obj_in, 'dict') else dict(obj_in)
+            else:
+                obj_in_data = dict(obj_in)
+            rows.append(obj_in_data)
+        
+        db_objs = bulk_upsert(
+            db,
+            self.model,
+            rows,
+            key_fields=key_fields,
+            update_fields=update_fields,
+            batch_size=batch_size,
+            returning=True
+        )
+        db.commit()
+        
+        return db_objs
+    
     def remove(self, db: Session, id: Any, id_field: str = "id") -> Optional[ModelType]:
         """
         Remove a record by ID or another field.
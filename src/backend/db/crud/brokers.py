@@ -6,12 +6,15 @@ This module extends the generic CRUDBase class to provide broker-specific databa
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict, Any
 
 from .base import CRUDBase
+from .async_base import AsyncCRUDBase
 from ..models.broker import Broker
 from ...schemas.broker import BrokerCreate, BrokerUpdate
-from ..utils import get_or_404, execute_with_retry
+from ..utils import get_or_404, execute_with_retry, execute_async_with_retry
+from ..session import replica_ok
 from ...core.exceptions import ClientNotFoundException
 from ...utils.logging import setup_logger
 
@@ -81,7 +84,7 @@ class CRUDBroker(CRUDBase[Broker, BrokerCreate, BrokerUpdate]):
         if limit is not None:
             query = query.limit(limit)
         
-        results = execute_with_retry(lambda: db.execute(query).scalars().all())
+        results = execute_with_retry(lambda: db.execute(replica_ok(query)).scalars().all())
         return list(results)
     
     def create_broker(self, db: Session, broker_in: BrokerCreate) -> Broker:
@@ -183,5 +186,72 @@ class CRUDBroker(CRUDBase[Broker, BrokerCreate, BrokerUpdate]):
         result = execute_with_retry(lambda: db.execute(query).first())
         return result is not None
 
+
+class AsyncCRUDBroker(AsyncCRUDBase[Broker, BrokerCreate, BrokerUpdate]):
+    """Async CRUD operations for broker data used by request handlers"""
+    
+    def __init__(self):
+        """Initialize the async broker CRUD operations"""
+        super().__init__(Broker)
+    
+    async def get_by_client_id(self, db: AsyncSession, client_id: str) -> Optional[Broker]:
+        """
+        Get a broker by client ID
+        
+        Args:
+            db: Async database session
+            client_id: Client ID to search for
+            
+        Returns:
+            Broker instance if found, None otherwise
+        """
+        return await self.get(db=db, id=client_id, id_field="client_id")
+    
+    async def get_by_client_id_or_404(self, db: AsyncSession, client_id: str) -> Broker:
+        """
+        Get a broker by client ID or raise a not found exception
+        
+        Args:
+            db: Async database session
+            client_id: Client ID to search for
+            
+        Returns:
+            Broker instance if found
+            
+        Raises:
+            ClientNotFoundException: If broker is not found
+        """
+        broker = await self.get_by_client_id(db, client_id)
+        if broker is None:
+            raise ClientNotFoundException(client_id)
+        return broker
+    
+    async def get_active_brokers(
+        self, db: AsyncSession, skip: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[Broker]:
+        """
+        Get all active brokers
+        
+        Args:
+            db: Async database session
+            skip: Number of records to skip (for pagination)
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of active broker instances
+        """
+        query = select(self.model).where(self.model.active == True)
+        
+        if skip is not None:
+            query = query.offset(skip)
+        
+        if limit is not None:
+            query = query.limit(limit)
+        
+        results = await execute_async_with_retry(lambda: db.scalars(query))
+        return list(results.all())
+
+
 # Create a singleton instance for application-wide use
-broker_crud = CRUDBroker()
\ No newline at end of file
+broker_crud = CRUDBroker()
+async_broker_crud = AsyncCRUDBroker()
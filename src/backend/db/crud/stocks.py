@@ -5,21 +5,41 @@ This module extends the generic CRUDBase class to provide stock-specific databas
 including querying by ticker symbol, updating borrow rates, and handling stock metadata.
 """
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Iterable
 
 from sqlalchemy import select  # sqlalchemy v2.0.0+
 from sqlalchemy.orm import Session  # sqlalchemy v2.0.0+
+from sqlalchemy.ext.asyncio import AsyncSession  # sqlalchemy v2.0.0+
 
 from .base import CRUDBase
+from .async_base import AsyncCRUDBase
 from ..models.stock import Stock
 from ...schemas.stock import StockCreate, StockUpdate
-from ..utils import get_or_404, execute_with_retry, QueryBuilder
+from ..utils import get_or_404, execute_with_retry, execute_async_with_retry, QueryBuilder
 from ...core.exceptions import TickerNotFoundException
 from ...utils.logging import setup_logger
 
 # Set up logger
 logger = setup_logger('db.crud.stocks')
 
+
+def _notify_stocks_changed(tickers: Iterable[str]) -> None:
+    """
+    Make stock writes visible to the ticker filter and reference snapshots.
+    
+    Written tickers are accepted by this process's ticker filter at once, and
+    every process is told to reload its reference snapshot.
+    
+    Args:
+        tickers: Tickers of the created or updated stocks
+    """
+    # Imported lazily to avoid a circular import through services.data.reference
+    from ...services.cache import get_ticker_filter
+    from ...services.data.reference import reference_data
+    get_ticker_filter().add(tickers)
+    reference_data.notify_changed()
+
+
 class CRUDStock(CRUDBase[Stock, StockCreate, StockUpdate]):
     """CRUD operations for Stock model"""
     
@@ -117,7 +137,9 @@ class CRUDStock(CRUDBase[Stock, StockCreate, StockUpdate]):
         if not stock:
             return None
             
-        return self.update(db, stock, {"min_borrow_rate": min_borrow_rate})
+        stock = self.update(db, stock, {"min_borrow_rate": min_borrow_rate})
+        _notify_stocks_changed([stock.ticker])
+        return stock
     
     def update_borrow_status(
         self, 
@@ -140,7 +162,9 @@ class CRUDStock(CRUDBase[Stock, StockCreate, StockUpdate]):
         if not stock:
             return None
             
-        return self.update(db, stock, {"borrow_status": borrow_status})
+        stock = self.update(db, stock, {"borrow_status": borrow_status})
+        _notify_stocks_changed([stock.ticker])
+        return stock
     
     def create_with_ticker(
         self, 
@@ -163,7 +187,9 @@ class CRUDStock(CRUDBase[Stock, StockCreate, StockUpdate]):
             attributes = {}
         
         attributes["ticker"] = ticker
-        return self.create(db, attributes)
+        stock = self.create(db, attributes)
+        _notify_stocks_changed([stock.ticker])
+        return stock
     
     def upsert(
         self, 
@@ -174,6 +200,9 @@ class CRUDStock(CRUDBase[Stock, StockCreate, StockUpdate]):
         """
         Create a stock if it doesn't exist, or update it if it does
         
+        Uses a single INSERT ... ON CONFLICT (ticker) DO UPDATE statement instead
+        of a lookup followed by a separate insert or update.
+        
         Args:
             db: Database session
             ticker: Stock ticker symbol
@@ -182,13 +211,33 @@ class CRUDStock(CRUDBase[Stock, StockCreate, StockUpdate]):
         Returns:
             Created or updated stock instance
         """
-        stock = self.get_by_ticker(db, ticker)
+        values = dict(attributes)
+        values["ticker"] = ticker
+        stock = self.upsert_multi(db, [values], key_fields=["ticker"])[0]
+        _notify_stocks_changed([stock.ticker])
+        return stock
+    
+    def bulk_upsert(
+        self, 
+        db: Session, 
+        stocks_in: List[Union[StockCreate, Dict[str, Any]]],
+        batch_size: int = 1000
+    ) -> List[Stock]:
+        """
+        Create or update multiple stocks keyed by ticker in batched statements
         
-        if stock:
-            return self.update(db, stock, attributes)
-        else:
-            attributes["ticker"] = ticker
-            return self.create(db, attributes)
+        Args:
+            db: Database session
+            stocks_in: Stock data, each entry including its ticker
+            batch_size: Number of stocks sent per statement
+            
+        Returns:
+            List of created or updated stock instances
+        """
+        stocks = self.upsert_multi(db, stocks_in, key_fields=["ticker"], batch_size=batch_size)
+        if stocks:
+            _notify_stocks_changed([stock.ticker for stock in stocks])
+        return stocks
     
     def remove_by_ticker(self, db: Session, ticker: str) -> Optional[Stock]:
         """
@@ -201,7 +250,12 @@ class CRUDStock(CRUDBase[Stock, StockCreate, StockUpdate]):
         Returns:
             Removed stock instance if found, None otherwise
         """
-        return self.remove(db, ticker, id_field="ticker")
+        stock = self.remove(db, ticker, id_field="ticker")
+        if stock is not None:
+            # Imported lazily to avoid a circular import through services.data.reference
+            from ...services.data.reference import reference_data
+            reference_data.notify_changed()
+        return stock
     
     def exists_by_ticker(self, db: Session, ticker: str) -> bool:
         """
@@ -218,5 +272,87 @@ class CRUDStock(CRUDBase[Stock, StockCreate, StockUpdate]):
         result = execute_with_retry(lambda: db.execute(query).first())
         return result is not None
 
+class AsyncCRUDStock(AsyncCRUDBase[Stock, StockCreate, StockUpdate]):
+    """Async CRUD operations for Stock model used by request handlers"""
+    
+    def __init__(self):
+        """Initialize the async CRUD operations for Stock model"""
+        super().__init__(Stock)
+    
+    async def get_by_ticker(self, db: AsyncSession, ticker: str) -> Optional[Stock]:
+        """
+        Get a stock by ticker symbol
+        
+        Args:
+            db: Async database session
+            ticker: Stock ticker symbol
+            
+        Returns:
+            Stock instance if found, None otherwise
+        """
+        return await self.get(db=db, id=ticker, id_field="ticker")
+    
+    async def get_by_ticker_or_404(self, db: AsyncSession, ticker: str) -> Stock:
+        """
+        Get a stock by ticker symbol or raise TickerNotFoundException
+        
+        Args:
+            db: Async database session
+            ticker: Stock ticker symbol
+            
+        Returns:
+            Stock instance if found
+            
+        Raises:
+            TickerNotFoundException: If stock not found
+        """
+        stock = await self.get_by_ticker(db, ticker)
+        return get_or_404(stock, TickerNotFoundException, ticker)
+    
+    async def get_by_lender_api_id(self, db: AsyncSession, lender_api_id: str) -> Optional[Stock]:
+        """
+        Get a stock by lender API ID
+        
+        Args:
+            db: Async database session
+            lender_api_id: External lender API identifier
+            
+        Returns:
+            Stock instance if found, None otherwise
+        """
+        return await self.get(db=db, id=lender_api_id, id_field="lender_api_id")
+    
+    async def get_stocks_by_borrow_status(
+        self, 
+        db: AsyncSession, 
+        borrow_status: str, 
+        skip: Optional[int] = None, 
+        limit: Optional[int] = None
+    ) -> List[Stock]:
+        """
+        Get stocks filtered by borrow status
+        
+        Args:
+            db: Async database session
+            borrow_status: Status to filter by
+            skip: Number of records to skip (pagination)
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of stocks with the specified borrow status
+        """
+        query = select(Stock).where(Stock.borrow_status == borrow_status)
+        
+        if skip is not None:
+            query = query.offset(skip)
+        
+        if limit is not None:
+            query = query.limit(limit)
+        
+        results = await execute_async_with_retry(lambda: db.scalars(query))
+        return list(results.all())
+
+
 # Create a singleton instance
-stock = CRUDStock()
\ No newline at end of file
+stock = CRUDStock()
+async_stock = AsyncCRUDStock()
@@ -11,9 +11,11 @@ from typing import List, Optional, Dict, Any, Union, Tuple
 from datetime import datetime
 
 from .base import CRUDBase
+from .volatility_rollup import volatility_rollup
 from ..models.volatility import Volatility
 from ...schemas.volatility import VolatilityCreate, VolatilityUpdate
-from ..utils import get_or_404, execute_with_retry, QueryBuilder
+from ..utils import get_or_404, execute_with_retry, QueryBuilder, bulk_upsert
+from ..session import replica_ok
 from ...core.exceptions import TickerNotFoundException
 from ...utils.logging import setup_logger
 
@@ -165,7 +167,21 @@ class CRUDVolatility(CRUDBase[Volatility, VolatilityCreate, VolatilityUpdate]):
         Returns:
             Created Volatility instance
         """
-        return self.create(db=db, obj_in=obj_in)
+        if not isinstance(obj_in, dict):
+            obj_in_data = obj_in.dict() if hasattr(obj_in, 'dict') else dict(obj_in)
+        else:
+            obj_in_data = dict(obj_in)
+        if obj_in_data.get("timestamp") is None:
+            obj_in_data["timestamp"] = datetime.utcnow()
+        
+        # Write the point and its rollup buckets in one transaction
+        db_obj = self.model(**obj_in_data)
+        db.add(db_obj)
+        db.flush()
+        volatility_rollup.refresh_rollups(db, db_obj.stock_id, db_obj.timestamp, db_obj.timestamp)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
     
     def update_volatility(
         self, 
@@ -184,7 +200,24 @@ class CRUDVolatility(CRUDBase[Volatility, VolatilityCreate, VolatilityUpdate]):
         Returns:
             Updated Volatility instance
         """
-        return self.update(db=db, db_obj=db_obj, obj_in=obj_in)
+        if not isinstance(obj_in, dict):
+            obj_in_data = obj_in.dict(exclude_unset=True) if hasattr(obj_in, 'dict') else dict(obj_in)
+        else:
+            obj_in_data = obj_in
+        previous_timestamp = db_obj.timestamp
+        for field in db_obj.to_dict():
+            if field in obj_in_data:
+                setattr(db_obj, field, obj_in_data[field])
+        
+        # Write the point and its rollup buckets, before and after a timestamp change, in one transaction
+        db.add(db_obj)
+        db.flush()
+        volatility_rollup.refresh_rollups(db, db_obj.stock_id, previous_timestamp, previous_timestamp)
+        if db_obj.timestamp != previous_timestamp:
+            volatility_rollup.refresh_rollups(db, db_obj.stock_id, db_obj.timestamp, db_obj.timestamp)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
     
     def remove_by_stock_and_timestamp(
         self, db: Session, stock_id: str, timestamp: datetime
@@ -205,6 +238,8 @@ class CRUDVolatility(CRUDBase[Volatility, VolatilityCreate, VolatilityUpdate]):
             return None
         
         db.delete(obj)
+        db.flush()
+        volatility_rollup.refresh_rollups(db, stock_id, timestamp, timestamp)
         db.commit()
         
         return obj
@@ -238,7 +273,7 @@ class CRUDVolatility(CRUDBase[Volatility, VolatilityCreate, VolatilityUpdate]):
         if end_date:
             query = query.where(Volatility.timestamp <= end_date)
         
-        result = execute_with_retry(lambda: db.execute(query).scalar())
+        result = execute_with_retry(lambda: db.execute(replica_ok(query)).scalar())
         return result
     
     def get_max_event_risk(
@@ -270,7 +305,7 @@ class CRUDVolatility(CRUDBase[Volatility, VolatilityCreate, VolatilityUpdate]):
         if end_date:
             query = query.where(Volatility.timestamp <= end_date)
         
-        result = execute_with_retry(lambda: db.execute(query).scalar())
+        result = execute_with_retry(lambda: db.execute(replica_ok(query)).scalar())
         return result
     
     def bulk_create_volatility(
@@ -279,6 +314,10 @@ class CRUDVolatility(CRUDBase[Volatility, VolatilityCreate, VolatilityUpdate]):
         """
         Create multiple volatility records in a single transaction
         
+        Records are written with batched INSERT ... ON CONFLICT (stock_id, timestamp)
+        DO UPDATE statements, so reloading an overlapping time range updates the
+        existing points instead of failing on the primary key.
+        
         Args:
             db: Database session
             objs_in: List of volatility data for creation
@@ -286,22 +325,29 @@ class CRUDVolatility(CRUDBase[Volatility, VolatilityCreate, VolatilityUpdate]):
         Returns:
             List of created Volatility instances
         """
-        db_objs = []
-        
+        # The timestamp is part of the conflict key, so stamp records that lack one
+        # up front rather than relying on the server default
+        now = datetime.utcnow()
+        rows = []
         for obj_in in objs_in:
             if not isinstance(obj_in, dict):
                 obj_in_data = obj_in.dict() if hasattr(obj_in, 'dict') else dict(obj_in)
             else:
-                obj_in_data = obj_in
-            
-            db_obj = Volatility(**obj_in_data)
-            db_objs.append(db_obj)
+                obj_in_data = dict(obj_in)
+            if obj_in_data.get("timestamp") is None:
+                obj_in_data["timestamp"] = now
+            rows.append(obj_in_data)
         
-        db.add_all(db_objs)
-        db.commit()
+        db_objs = bulk_upsert(db, Volatility, rows, key_fields=["stock_id", "timestamp"], returning=True)
         
-        for db_obj in db_objs:
-            db.refresh(db_obj)
+        # Keep the downsampled history in step with the raw points
+        time_ranges: Dict[str, Tuple[datetime, datetime]] = {}
+        for row in rows:
+            first, last = time_ranges.get(row["stock_id"], (row["timestamp"], row["timestamp"]))
+            time_ranges[row["stock_id"]] = (min(first, row["timestamp"]), max(last, row["timestamp"]))
+        for stock_id, (first, last) in time_ranges.items():
+            volatility_rollup.refresh_rollups(db, stock_id, first, last)
+        db.commit()
         
         return db_objs
     
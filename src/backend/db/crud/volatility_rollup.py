@@ -0,0 +1,494 @@
+"""
+Implements the volatility time-series layer for the Borrow Rate & Locate Fee Pricing Engine.
+
+This module maintains downsampled 1m/1h/1d rollups of the raw volatility table and serves
+history queries at the coarsest resolution needed to fit a caller's point budget, so long
+ranges never return unbounded row sets. Range statistics are computed in a single query.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List, Optional, Dict, Any, Tuple
+
+from sqlalchemy import select, and_, func  # sqlalchemy v2.0.0+
+from sqlalchemy.orm import Session  # sqlalchemy v2.0.0+
+
+from .base import CRUDBase
+from ..models.volatility import Volatility
+from ..models.volatility_rollup import VolatilityRollup, ROLLUP_RESOLUTIONS
+from ..utils import execute_with_retry, bulk_upsert
+from ..session import replica_ok
+from ...utils.logging import setup_logger
+
+# Set up logger
+logger = setup_logger('db.crud.volatility_rollup')
+
+# Name used for the un-aggregated volatility table in series responses
+RAW_RESOLUTION = 'raw'
+
+# Default maximum number of points returned by a history query
+DEFAULT_POINT_BUDGET = 1000
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def floor_to_bucket(timestamp: datetime, resolution: str) -> datetime:
+    """
+    Truncate a timestamp to the start of its bucket for a rollup resolution.
+    
+    Args:
+        timestamp: Timestamp to truncate (naive UTC)
+        resolution: Rollup resolution key ('1m', '1h' or '1d')
+    
+    Returns:
+        Start of the bucket containing the timestamp
+    """
+    size = ROLLUP_RESOLUTIONS[resolution]
+    seconds = int((timestamp - EPOCH).total_seconds())
+    return EPOCH + timedelta(seconds=seconds - seconds % size)
+
+
+def aggregate_points(
+    points: List[Tuple[datetime, Decimal, int]], resolution: str
+) -> Dict[datetime, Dict[str, Any]]:
+    """
+    Aggregate time-ordered raw points into buckets for one resolution.
+    
+    Args:
+        points: (timestamp, vol_index, event_risk_factor) tuples sorted by timestamp
+        resolution: Rollup resolution key
+    
+    Returns:
+        Mapping of bucket start to aggregate column values
+    """
+    buckets: Dict[datetime, Dict[str, Any]] = {}
+    
+    for timestamp, vol_index, event_risk in points:
+        bucket_start = floor_to_bucket(timestamp, resolution)
+        bucket = buckets.get(bucket_start)
+        
+        if bucket is None:
+            buckets[bucket_start] = {
+                "vol_min": vol_index,
+                "vol_max": vol_index,
+                "vol_sum": vol_index,
+                "sample_count": 1,
+                "vol_last": vol_index,
+                "last_timestamp": timestamp,
+                "event_risk_max": event_risk or 0,
+            }
+            continue
+        
+        bucket["vol_min"] = min(bucket["vol_min"], vol_index)
+        bucket["vol_max"] = max(bucket["vol_max"], vol_index)
+        bucket["vol_sum"] += vol_index
+        bucket["sample_count"] += 1
+        bucket["vol_last"] = vol_index
+        bucket["last_timestamp"] = timestamp
+        bucket["event_risk_max"] = max(bucket["event_risk_max"], event_risk or 0)
+    
+    for bucket in buckets.values():
+        bucket["vol_avg"] = (Decimal(bucket["vol_sum"]) / bucket["sample_count"]).quantize(Decimal("0.01"))
+    
+    return buckets
+
+
+def merge_buckets(rollups: List[Any], resolution: str) -> Dict[datetime, Dict[str, Any]]:
+    """
+    Combine time-ordered finer rollup buckets into buckets of a coarser resolution.
+    
+    Args:
+        rollups: Rollup rows (with the VolatilityRollup column attributes) of one finer resolution sorted by bucket_start
+        resolution: Coarser rollup resolution key
+    
+    Returns:
+        Mapping of bucket start to aggregate column values
+    """
+    buckets: Dict[datetime, Dict[str, Any]] = {}
+    
+    for rollup in rollups:
+        bucket_start = floor_to_bucket(rollup.bucket_start, resolution)
+        bucket = buckets.get(bucket_start)
+        
+        if bucket is None:
+            buckets[bucket_start] = {
+                "vol_min": rollup.vol_min,
+                "vol_max": rollup.vol_max,
+                "vol_sum": rollup.vol_sum,
+                "sample_count": rollup.sample_count,
+                "vol_last": rollup.vol_last,
+                "last_timestamp": rollup.last_timestamp,
+                "event_risk_max": rollup.event_risk_max,
+            }
+            continue
+        
+        bucket["vol_min"] = min(bucket["vol_min"], rollup.vol_min)
+        bucket["vol_max"] = max(bucket["vol_max"], rollup.vol_max)
+        bucket["vol_sum"] += rollup.vol_sum
+        bucket["sample_count"] += rollup.sample_count
+        bucket["vol_last"] = rollup.vol_last
+        bucket["last_timestamp"] = rollup.last_timestamp
+        bucket["event_risk_max"] = max(bucket["event_risk_max"], rollup.event_risk_max)
+    
+    for bucket in buckets.values():
+        bucket["vol_avg"] = (Decimal(bucket["vol_sum"]) / bucket["sample_count"]).quantize(Decimal("0.01"))
+    
+    return buckets
+
+
+def choose_resolution(start_date: datetime, end_date: datetime, max_points: int) -> str:
+    """
+    Pick the finest rollup resolution whose bucket count for a range fits a point budget.
+    
+    Args:
+        start_date: Start of the range
+        end_date: End of the range
+        max_points: Maximum number of points the caller wants back
+    
+    Returns:
+        Rollup resolution key; the coarsest one if nothing fits
+    """
+    range_seconds = max((end_date - start_date).total_seconds(), 0)
+    
+    for resolution, size in ROLLUP_RESOLUTIONS.items():
+        if range_seconds / size + 1 <= max_points:
+            return resolution
+    
+    return list(ROLLUP_RESOLUTIONS)[-1]
+
+
+class CRUDVolatilityRollup(CRUDBase[VolatilityRollup, Dict[str, Any], Dict[str, Any]]):
+    """
+    CRUD and query operations for downsampled volatility history
+    """
+    
+    def __init__(self):
+        """
+        Initialize the CRUD operations for VolatilityRollup model
+        """
+        super().__init__(VolatilityRollup)
+    
+    def refresh_rollups(
+        self, db: Session, stock_id: str, start_date: datetime, end_date: datetime
+    ) -> int:
+        """
+        Recompute the rollup buckets containing a changed time range
+        
+        Only the buckets that contain the range are rewritten: the 1m buckets from
+        the raw points, then each coarser bucket from the finer buckets it spans, so
+        a single point reads one minute of raw data and at most 60 + 24 rollup rows.
+        Recomputing from the layer below keeps the rollups exact when points are
+        inserted, updated, overwritten or removed.
+        
+        The writes join the caller's transaction; the caller commits them together
+        with the raw point changes.
+        
+        Args:
+            db: Database session
+            stock_id: Stock ticker symbol
+            start_date: Earliest changed timestamp
+            end_date: Latest changed timestamp
+        
+        Returns:
+            Number of buckets written
+        """
+        resolutions = list(ROLLUP_RESOLUTIONS)
+        
+        finest = resolutions[0]
+        span_start, span_end = self._bucket_span(start_date, end_date, finest)
+        query = select(
+            Volatility.timestamp, Volatility.vol_index, Volatility.event_risk_factor
+        ).where(
+            and_(
+                Volatility.stock_id == stock_id,
+                Volatility.timestamp >= span_start,
+                Volatility.timestamp < span_end
+            )
+        ).order_by(Volatility.timestamp)
+        points = execute_with_retry(lambda: db.execute(query).all())
+        written = self._replace_buckets(
+            db, stock_id, finest, span_start, span_end, aggregate_points(points, finest)
+        )
+        
+        for finer, resolution in zip(resolutions, resolutions[1:]):
+            span_start, span_end = self._bucket_span(start_date, end_date, resolution)
+            # Plain columns, so rows upserted above are never read from stale identity-map objects
+            query = select(
+                VolatilityRollup.bucket_start, VolatilityRollup.vol_min, VolatilityRollup.vol_max,
+                VolatilityRollup.vol_sum, VolatilityRollup.sample_count, VolatilityRollup.vol_last,
+                VolatilityRollup.last_timestamp, VolatilityRollup.event_risk_max
+            ).where(
+                and_(
+                    VolatilityRollup.stock_id == stock_id,
+                    VolatilityRollup.resolution == finer,
+                    VolatilityRollup.bucket_start >= span_start,
+                    VolatilityRollup.bucket_start < span_end
+                )
+            ).order_by(VolatilityRollup.bucket_start)
+            rollups = execute_with_retry(lambda: db.execute(query).all())
+            written += self._replace_buckets(
+                db, stock_id, resolution, span_start, span_end, merge_buckets(rollups, resolution)
+            )
+        
+        logger.debug(f"Refreshed {written} volatility rollup buckets for {stock_id}")
+        return written
+    
+    def _bucket_span(self, start_date: datetime, end_date: datetime, resolution: str) -> Tuple[datetime, datetime]:
+        # Start of the first and end of the last bucket containing the range
+        return (
+            floor_to_bucket(start_date, resolution),
+            floor_to_bucket(end_date, resolution) + timedelta(seconds=ROLLUP_RESOLUTIONS[resolution])
+        )
+    
+    def _replace_buckets(
+        self,
+        db: Session,
+        stock_id: str,
+        resolution: str,
+        span_start: datetime,
+        span_end: datetime,
+        buckets: Dict[datetime, Dict[str, Any]]
+    ) -> int:
+        # Buckets whose points were all removed must not linger
+        db.execute(
+            VolatilityRollup.__table__.delete().where(
+                and_(
+                    VolatilityRollup.stock_id == stock_id,
+                    VolatilityRollup.resolution == resolution,
+                    VolatilityRollup.bucket_start >= span_start,
+                    VolatilityRollup.bucket_start < span_end
+                )
+            )
+        )
+        rows = [
+            {"stock_id": stock_id, "resolution": resolution, "bucket_start": bucket_start, **values}
+            for bucket_start, values in buckets.items()
+        ]
+        if rows:
+            bulk_upsert(db, VolatilityRollup, rows, key_fields=["stock_id", "resolution", "bucket_start"])
+        return len(rows)
+    
+    def rebuild_for_stock(self, db: Session, stock_id: str) -> int:
+        """
+        Rebuild all rollups for a stock from its full raw history
+        
+        Works one coarsest bucket (day) at a time, skipping days without raw points,
+        and commits each day, so a long history is never loaded or locked at once.
+        
+        Args:
+            db: Database session
+            stock_id: Stock ticker symbol
+        
+        Returns:
+            Number of buckets written
+        """
+        coarsest = list(ROLLUP_RESOLUTIONS)[-1]
+        chunk = timedelta(seconds=ROLLUP_RESOLUTIONS[coarsest])
+        
+        written = 0
+        point = self._first_point_from(db, stock_id, None)
+        while point is not None:
+            chunk_start = floor_to_bucket(point, coarsest)
+            # refresh_rollups takes an inclusive range: the whole day up to the next one
+            written += self.refresh_rollups(db, stock_id, chunk_start, chunk_start + chunk - timedelta(microseconds=1))
+            db.commit()
+            point = self._first_point_from(db, stock_id, chunk_start + chunk)
+        
+        logger.info(f"Rebuilt {written} volatility rollup buckets for {stock_id}")
+        return written
+    
+    def _first_point_from(self, db: Session, stock_id: str, start: Optional[datetime]) -> Optional[datetime]:
+        # Timestamp of the stock's first raw point at or after start
+        conditions = [Volatility.stock_id == stock_id]
+        if start is not None:
+            conditions.append(Volatility.timestamp >= start)
+        query = select(func.min(Volatility.timestamp)).where(and_(*conditions))
+        return execute_with_retry(lambda: db.execute(query).scalar())
+    
+    def get_stock_ids(self, db: Session) -> List[str]:
+        """
+        Get the stocks that have raw volatility history
+        
+        Args:
+            db: Database session
+        
+        Returns:
+            Stock ticker symbols in alphabetical order
+        """
+        query = select(Volatility.stock_id).distinct().order_by(Volatility.stock_id)
+        return list(execute_with_retry(lambda: db.execute(query).scalars().all()))
+    
+    def get_series(
+        self,
+        db: Session,
+        stock_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        max_points: int = DEFAULT_POINT_BUDGET
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Get volatility history for a range at the coarsest resolution the point budget requires
+        
+        Raw points are returned when the range holds no more than max_points of them;
+        otherwise the finest rollup whose bucket count fits the budget is used.
+        
+        Args:
+            db: Database session
+            stock_id: Stock ticker symbol
+            start_date: Optional start of the range (inclusive)
+            end_date: Optional end of the range (inclusive)
+            max_points: Maximum number of points to return
+        
+        Returns:
+            Tuple of (resolution, points) where each point has timestamp, vol_min,
+            vol_max, vol_avg, vol_last, event_risk_max and sample_count, newest first
+        """
+        raw_conditions = [Volatility.stock_id == stock_id]
+        if start_date:
+            raw_conditions.append(Volatility.timestamp >= start_date)
+        if end_date:
+            raw_conditions.append(Volatility.timestamp <= end_date)
+        
+        # Bounded probe: never counts more than max_points + 1 rows
+        probe = select(func.count()).select_from(
+            select(Volatility.timestamp).where(and_(*raw_conditions)).limit(max_points + 1).subquery()
+        )
+        raw_count = execute_with_retry(lambda: db.execute(replica_ok(probe)).scalar_one())
+        
+        if raw_count <= max_points:
+            query = select(
+                Volatility.timestamp, Volatility.vol_index, Volatility.event_risk_factor
+            ).where(and_(*raw_conditions)).order_by(Volatility.timestamp.desc())
+            rows = execute_with_retry(lambda: db.execute(replica_ok(query)).all())
+            
+            return RAW_RESOLUTION, [
+                {
+                    "timestamp": timestamp,
+                    "vol_min": vol_index,
+                    "vol_max": vol_index,
+                    "vol_avg": vol_index,
+                    "vol_last": vol_index,
+                    "event_risk_max": event_risk,
+                    "sample_count": 1,
+                }
+                for timestamp, vol_index, event_risk in rows
+            ]
+        
+        # Resolve open-ended ranges from the daily rollups (one row per day)
+        if start_date is None or end_date is None:
+            bounds = select(
+                func.min(VolatilityRollup.bucket_start), func.max(VolatilityRollup.bucket_start)
+            ).where(
+                and_(VolatilityRollup.stock_id == stock_id, VolatilityRollup.resolution == '1d')
+            )
+            first, last = execute_with_retry(lambda: db.execute(replica_ok(bounds)).one())
+            start_date = start_date or first or datetime.utcnow()
+            end_date = end_date or (last + timedelta(days=1) if last else datetime.utcnow())
+        
+        resolution = choose_resolution(start_date, end_date, max_points)
+        query = select(VolatilityRollup).where(
+            and_(
+                VolatilityRollup.stock_id == stock_id,
+                VolatilityRollup.resolution == resolution,
+                VolatilityRollup.bucket_start >= floor_to_bucket(start_date, resolution),
+                VolatilityRollup.bucket_start <= end_date
+            )
+        ).order_by(VolatilityRollup.bucket_start.desc()).limit(max_points)
+        buckets = execute_with_retry(lambda: db.execute(replica_ok(query)).scalars().all())
+        
+        return resolution, [
+            {
+                "timestamp": bucket.bucket_start,
+                "vol_min": bucket.vol_min,
+                "vol_max": bucket.vol_max,
+                "vol_avg": bucket.vol_avg,
+                "vol_last": bucket.vol_last,
+                "event_risk_max": bucket.event_risk_max,
+                "sample_count": bucket.sample_count,
+            }
+            for bucket in buckets
+        ]
+    
+    def get_range_stats(
+        self,
+        db: Session,
+        stock_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Get volatility statistics for a range in a single query
+        
+        Open-ended ranges whose start is aligned to a rollup bucket are answered from
+        the coarsest aligned rollup; any other range aggregates the raw table once.
+        Rollups that hold no samples for the range (for instance history written before
+        rollups existed and not yet backfilled with rebuild_for_stock) fall back to the
+        raw aggregate.
+        
+        Args:
+            db: Database session
+            stock_id: Stock ticker symbol
+            start_date: Optional start of the range (inclusive)
+            end_date: Optional end of the range (inclusive)
+        
+        Returns:
+            Dictionary with average_volatility, min_volatility, max_volatility,
+            max_event_risk and sample_count (None values when there is no data)
+        """
+        resolution = None
+        if end_date is None:
+            for candidate in reversed(list(ROLLUP_RESOLUTIONS)):
+                if start_date is None or floor_to_bucket(start_date, candidate) == start_date:
+                    resolution = candidate
+                    break
+        
+        sample_count = 0
+        if resolution is not None:
+            conditions = [
+                VolatilityRollup.stock_id == stock_id,
+                VolatilityRollup.resolution == resolution
+            ]
+            if start_date:
+                conditions.append(VolatilityRollup.bucket_start >= start_date)
+            
+            query = select(
+                func.sum(VolatilityRollup.vol_sum),
+                func.min(VolatilityRollup.vol_min),
+                func.max(VolatilityRollup.vol_max),
+                func.max(VolatilityRollup.event_risk_max),
+                func.sum(VolatilityRollup.sample_count)
+            ).where(and_(*conditions))
+            vol_sum, vol_min, vol_max, max_event_risk, sample_count = execute_with_retry(
+                lambda: db.execute(replica_ok(query)).one()
+            )
+            average = (Decimal(vol_sum) / sample_count) if sample_count else None
+        
+        if not sample_count:
+            conditions = [Volatility.stock_id == stock_id]
+            if start_date:
+                conditions.append(Volatility.timestamp >= start_date)
+            if end_date:
+                conditions.append(Volatility.timestamp <= end_date)
+            
+            query = select(
+                func.avg(Volatility.vol_index),
+                func.min(Volatility.vol_index),
+                func.max(Volatility.vol_index),
+                func.max(Volatility.event_risk_factor),
+                func.count()
+            ).where(and_(*conditions))
+            average, vol_min, vol_max, max_event_risk, sample_count = execute_with_retry(
+                lambda: db.execute(replica_ok(query)).one()
+            )
+        
+        return {
+            "average_volatility": average,
+            "min_volatility": vol_min,
+            "max_volatility": vol_max,
+            "max_event_risk": max_event_risk,
+            "sample_count": int(sample_count or 0),
+        }
+
+
+# Create a singleton instance for application-wide use
+volatility_rollup = CRUDVolatilityRollup()
@@ -0,0 +1,129 @@
+"""
+Baseline schema: the tables defined by the models before migrations existed.
+
+The DDL is frozen here rather than generated from the live models, so later
+model changes only reach existing databases through their own revisions.
+Databases initialized with init_db before migrations existed already have
+these tables and only need to be stamped with this revision
+(alembic stamp 0000_baseline) before upgrading; ones created by init_db from
+the current models are stamped with head instead.
+
+Revision ID: 0000_baseline
+Revises:
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers used by Alembic
+revision = "0000_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamp_columns():
+    # Creation and update timestamps carried by BaseModel tables
+    return [
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    ]
+
+
+def upgrade():
+    """Create the baseline tables and indexes."""
+    op.create_table(
+        "stocks",
+        *_timestamp_columns(),
+        sa.Column("ticker", sa.String(10), nullable=False),
+        sa.Column("borrow_status", sa.Enum("EASY", "MEDIUM", "HARD", name="borrowstatus"), nullable=False),
+        sa.Column("lender_api_id", sa.String(50), nullable=True),
+        sa.Column("min_borrow_rate", sa.Numeric(5, 2), nullable=False),
+        sa.Column("last_updated", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("ticker"),
+    )
+    op.create_index("ix_stocks_ticker", "stocks", ["ticker"])
+    op.create_index("ix_stocks_lender_api_id", "stocks", ["lender_api_id"], unique=True)
+
+    op.create_table(
+        "broker",
+        sa.Column("id", sa.Integer(), nullable=True),
+        *_timestamp_columns(),
+        sa.Column("client_id", sa.String(50), nullable=False),
+        sa.Column("markup_percentage", sa.Numeric(5, 2), nullable=False),
+        sa.Column("transaction_fee_type", sa.Enum("FLAT", "PERCENTAGE", name="transactionfeetype"), nullable=False),
+        sa.Column("transaction_amount", sa.Numeric(10, 2), nullable=False),
+        sa.Column("active", sa.Boolean(), nullable=False),
+        sa.Column("last_updated", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("client_id"),
+    )
+    op.create_index("ix_broker_id", "broker", ["id"])
+    op.create_index("ix_broker_client_id", "broker", ["client_id"])
+    op.create_index("idx_broker_active", "broker", ["active"])
+
+    op.create_table(
+        "apikey",
+        sa.Column("id", sa.Integer(), nullable=True),
+        *_timestamp_columns(),
+        sa.Column("key_id", sa.String(64), nullable=False),
+        sa.Column("client_id", sa.String(50), nullable=False),
+        sa.Column("rate_limit", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=True),
+        sa.Column("active", sa.Boolean(), nullable=False),
+        sa.Column("hashed_key", sa.String(128), nullable=False),
+        sa.ForeignKeyConstraint(["client_id"], ["broker.client_id"]),
+        sa.PrimaryKeyConstraint("key_id"),
+    )
+    op.create_index("ix_apikey_id", "apikey", ["id"])
+    op.create_index("ix_apikey_key_id", "apikey", ["key_id"])
+    op.create_index("ix_apikey_client_id", "apikey", ["client_id"])
+    op.create_index("ix_api_key_client_id", "apikey", ["client_id"])
+    op.create_index("ix_api_key_active", "apikey", ["active"])
+
+    op.create_table(
+        "volatility",
+        sa.Column("stock_id", sa.String(10), nullable=False),
+        sa.Column("vol_index", sa.Numeric(5, 2), nullable=False),
+        sa.Column("event_risk_factor", sa.Integer(), nullable=False),
+        sa.Column("timestamp", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["stock_id"], ["stocks.ticker"]),
+        sa.PrimaryKeyConstraint("stock_id", "timestamp"),
+    )
+    op.create_index("ix_volatility_stock_id", "volatility", ["stock_id"])
+    op.create_index("ix_volatility_timestamp", "volatility", ["timestamp"])
+
+    op.create_table(
+        "auditlog",
+        sa.Column("audit_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("client_id", sa.String(50), nullable=False),
+        sa.Column("ticker", sa.String(10), nullable=False),
+        sa.Column("position_value", sa.Numeric(15, 2), nullable=False),
+        sa.Column("loan_days", sa.Integer(), nullable=False),
+        sa.Column("borrow_rate_used", sa.Numeric(5, 4), nullable=False),
+        sa.Column("total_fee", sa.Numeric(15, 2), nullable=False),
+        sa.Column("data_sources", postgresql.JSONB(), nullable=False),
+        sa.Column("calculation_breakdown", postgresql.JSONB(), nullable=False),
+        sa.Column("request_id", sa.String(50), nullable=True),
+        sa.Column("user_agent", sa.String(255), nullable=True),
+        sa.Column("ip_address", sa.String(50), nullable=True),
+        sa.PrimaryKeyConstraint("audit_id"),
+    )
+    op.create_index("ix_auditlog_timestamp", "auditlog", ["timestamp"])
+    op.create_index("ix_auditlog_client_id", "auditlog", ["client_id"])
+    op.create_index("ix_auditlog_ticker", "auditlog", ["ticker"])
+    op.create_index("ix_auditlog_client_timestamp", "auditlog", ["client_id", "timestamp"])
+    op.create_index("ix_auditlog_ticker_timestamp", "auditlog", ["ticker", "timestamp"])
+
+
+def downgrade():
+    """Drop the baseline tables."""
+    op.drop_table("auditlog")
+    op.drop_table("volatility")
+    op.drop_table("apikey")
+    op.drop_table("broker")
+    op.drop_table("stocks")
+    sa.Enum(name="transactionfeetype").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="borrowstatus").drop(op.get_bind(), checkfirst=True)
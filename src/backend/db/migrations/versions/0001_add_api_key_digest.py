@@ -0,0 +1,38 @@
+"""
+Add indexed HMAC digest column to API keys.
+
+Existing keys keep a NULL digest and are migrated on their first successful
+authentication (see CRUDAPIKey.get_by_key), or eagerly via
+CRUDAPIKey.migrate_legacy_keys for keys whose plaintext is known. Digests are
+keyed by API_KEY_HMAC_SECRET and need the plaintext, so they cannot be
+backfilled here.
+
+Revision ID: 0001_add_api_key_digest
+Revises: 0000_baseline
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers used by Alembic
+revision = "0001_add_api_key_digest"
+down_revision = "0000_baseline"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "apikey"
+COLUMN_NAME = "key_digest"
+INDEX_NAME = "ix_apikey_key_digest"
+
+
+def upgrade():
+    """Add the nullable digest column with a unique index."""
+    op.add_column(TABLE_NAME, sa.Column(COLUMN_NAME, sa.String(64), nullable=True))
+    op.create_index(INDEX_NAME, TABLE_NAME, [COLUMN_NAME], unique=True)
+
+
+def downgrade():
+    """Drop the digest index and column."""
+    op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+    op.drop_column(TABLE_NAME, COLUMN_NAME)
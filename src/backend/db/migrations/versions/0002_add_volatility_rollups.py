@@ -0,0 +1,48 @@
+"""
+Add downsampled volatility rollups and BRIN indexes for time-range scans.
+
+The rollup table starts empty. Writes through the volatility CRUD layer keep it
+up to date; existing history is backfilled with
+scripts/rebuild_volatility_rollups.py, and range statistics fall back to the
+raw table until then.
+
+Revision ID: 0002_add_volatility_rollups
+Revises: 0001_add_api_key_digest
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers used by Alembic
+revision = "0002_add_volatility_rollups"
+down_revision = "0001_add_api_key_digest"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the rollup table and the BRIN indexes on the rollup and raw timestamps."""
+    op.create_table(
+        "volatility_rollup",
+        sa.Column("stock_id", sa.String(10), nullable=False),
+        sa.Column("resolution", sa.String(4), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("vol_min", sa.Numeric(5, 2), nullable=False),
+        sa.Column("vol_max", sa.Numeric(5, 2), nullable=False),
+        sa.Column("vol_avg", sa.Numeric(5, 2), nullable=False),
+        sa.Column("vol_last", sa.Numeric(5, 2), nullable=False),
+        sa.Column("vol_sum", sa.Numeric(14, 2), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False),
+        sa.Column("event_risk_max", sa.Integer(), nullable=False),
+        sa.Column("last_timestamp", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("stock_id", "resolution", "bucket_start"),
+    )
+    op.create_index("brin_volatility_rollup_bucket", "volatility_rollup", ["bucket_start"], postgresql_using="brin")
+    op.create_index("brin_volatility_timestamp", "volatility", ["timestamp"], postgresql_using="brin")
+
+
+def downgrade():
+    """Drop the BRIN index on the raw table and the rollup table."""
+    op.drop_index("brin_volatility_timestamp", table_name="volatility")
+    op.drop_table("volatility_rollup")
@@ -13,6 +13,7 @@ from .base import Base, BaseModel
 from .stock import Stock
 from .broker import Broker
 from .volatility import Volatility, idx_volatility_stock, idx_volatility_date
+from .volatility_rollup import VolatilityRollup, ROLLUP_RESOLUTIONS
 from .api_key import APIKey
 from .audit import AuditLog
 
@@ -45,6 +46,7 @@ __all__ = [
     'Stock', 
     'Broker', 
     'Volatility', 
+    'VolatilityRollup',
     'APIKey', 
     'AuditLog',
     
@@ -57,4 +59,5 @@ __all__ = [
     
     # Utilities
     'generate_uuid',
+    'ROLLUP_RESOLUTIONS',
 ]
\ No newline at end of file
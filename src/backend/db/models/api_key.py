@@ -41,6 +41,10 @@ class APIKey(BaseModel):
     # Securely stored hash of the actual API key
     hashed_key = Column(String(128), nullable=False)
     
+    # Keyed HMAC-SHA256 digest of the key for indexed lookup (NULL for keys created
+    # before digests existed; filled in on their first successful authentication)
+    key_digest = Column(String(64), nullable=True, unique=True, index=True)
+    
     # Relationship to the Broker model
     broker = relationship('Broker', back_populates='api_keys')
     
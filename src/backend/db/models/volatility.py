@@ -40,6 +40,12 @@ class Volatility(Base):
     # Relationship to the Stock model
     stock = relationship('Stock', back_populates='volatility_data')
     
+    __table_args__ = (
+        # Points arrive in time order, so a BRIN index serves long range scans
+        # at a fraction of the size of a B-tree on the timestamp
+        Index('brin_volatility_timestamp', 'timestamp', postgresql_using='brin'),
+    )
+    
     def __init__(self, **kwargs):
         """
         Default constructor for the Volatility model.
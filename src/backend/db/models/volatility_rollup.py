@@ -0,0 +1,95 @@
+"""
+Volatility rollup model for the Borrow Rate & Locate Fee Pricing Engine.
+
+This module defines the SQLAlchemy ORM model for downsampled volatility history.
+Raw volatility points are aggregated into fixed-size time buckets (1 minute, 1 hour
+and 1 day) holding min/max/average/last values, so long history ranges and range
+statistics can be served from a bounded number of rows.
+"""
+
+from sqlalchemy import Column, String, Integer, Numeric, DateTime, Index  # sqlalchemy v2.0.0+
+from .base import Base
+
+# Bucket sizes in seconds for each supported rollup resolution, finest first
+ROLLUP_RESOLUTIONS = {
+    '1m': 60,
+    '1h': 3600,
+    '1d': 86400,
+}
+
+
+class VolatilityRollup(Base):
+    """
+    SQLAlchemy ORM model representing one downsampled volatility bucket for a stock.
+    
+    Each row aggregates all raw volatility points for a stock whose timestamp falls in
+    [bucket_start, bucket_start + resolution). The sum and count are stored alongside
+    the average so buckets can be recombined exactly into coarser ranges.
+    """
+    __tablename__ = 'volatility_rollup'
+    
+    # Composite primary key: stock, resolution and bucket start
+    stock_id = Column(String(10), primary_key=True)
+    resolution = Column(String(4), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    
+    # Volatility index aggregates over the bucket
+    vol_min = Column(Numeric(5, 2), nullable=False)
+    vol_max = Column(Numeric(5, 2), nullable=False)
+    vol_avg = Column(Numeric(5, 2), nullable=False)
+    vol_last = Column(Numeric(5, 2), nullable=False)
+    vol_sum = Column(Numeric(14, 2), nullable=False)
+    sample_count = Column(Integer, nullable=False)
+    
+    # Highest event risk factor seen in the bucket
+    event_risk_max = Column(Integer, nullable=False, default=0)
+    
+    # Timestamp of the raw point that supplied vol_last
+    last_timestamp = Column(DateTime, nullable=False)
+    
+    __table_args__ = (
+        # Buckets are appended in time order, so a BRIN index stays tiny
+        Index('brin_volatility_rollup_bucket', 'bucket_start', postgresql_using='brin'),
+    )
+    
+    def __init__(self, **kwargs):
+        """
+        Default constructor for the VolatilityRollup model.
+        
+        Args:
+            **kwargs: Any model attributes to set
+        """
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+    
+    def __repr__(self):
+        """
+        String representation of the VolatilityRollup instance.
+        
+        Returns:
+            str: String representation with stock_id, resolution and bucket_start
+        """
+        return (
+            f"VolatilityRollup(stock_id={self.stock_id}, resolution={self.resolution}, "
+            f"bucket_start={self.bucket_start}, vol_avg={self.vol_avg})"
+        )
+    
+    def to_dict(self):
+        """
+        Convert the model to a dictionary.
+        
+        Returns:
+            dict: Dictionary representation of the model.
+        """
+        from datetime import datetime
+        
+        result = {}
+        for column in self.__table__.columns:
+            value = getattr(self, column.name)
+            
+            # Handle datetime conversion for JSON serialization
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            
+            result[column.name] = value
+        return result
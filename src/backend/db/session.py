@@ -9,15 +9,20 @@ based on the application settings.
 
 import logging
 import time
+import threading
+import itertools
 import contextlib
-from typing import Generator, Optional, Dict, Any
+import contextvars
+from typing import Generator, Optional, Dict, Any, List
 
 from sqlalchemy import create_engine, Engine, event, exc, text
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
+from sqlalchemy.sql import Select
 
 from ..config.settings import get_settings
 from .models.base import Base
 from ..utils.logging import setup_logger, log_exceptions
+from ..utils.metrics import instrument_engine
 from ..core.exceptions import ExternalAPIException
 
 # Configure module logger
@@ -26,28 +31,40 @@ logger = setup_logger("db.session", logging.INFO)
 # Global variables for engine and session factory
 engine = None
 SessionLocal = None
+replica_router = None
 
+# Execution option that marks a statement as safe to serve from a read replica
+REPLICA_EXECUTION_OPTION = "use_replica"
 
-@log_exceptions(logger)
-def get_engine() -> Engine:
+# Session.info keys used by the routing session
+READ_ONLY_SESSION_KEY = "read_only"
+SESSION_WRITES_KEY = "has_writes"
+
+# Query used to measure replay lag on a PostgreSQL streaming replica
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+# Monotonic time of the last primary commit that wrote data in this context,
+# used to keep read-your-writes consistency while replicas catch up
+_last_primary_write: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "last_primary_write", default=None
+)
+
+
+def _create_pooled_engine(database_url: str, label: str) -> Engine:
     """
-    Creates or returns an existing SQLAlchemy engine with appropriate connection pooling.
-    
-    The engine is configured based on the current environment (development, staging, production)
-    with appropriate connection pool settings for optimal performance and reliability.
+    Creates an SQLAlchemy engine with environment-specific connection pooling.
     
+    Args:
+        database_url: Database connection URL
+        label: Name used in log messages (e.g. 'primary', 'replica-0')
+        
     Returns:
         Engine: SQLAlchemy engine instance
     """
-    global engine
-    
-    # Return existing engine if already created
-    if engine is not None:
-        return engine
-    
-    # Get database configuration from settings
     settings = get_settings()
-    database_url = settings.database_url
     
     # Determine environment-specific pool settings
     if settings.is_production():
@@ -64,7 +81,7 @@ def get_engine() -> Engine:
         pool_timeout = 30
     
     # Create engine with connection pooling
-    engine = create_engine(
+    new_engine = create_engine(
         database_url,
         pool_size=pool_size,
         max_overflow=max_overflow,
@@ -75,22 +92,286 @@ def get_engine() -> Engine:
     )
     
     # Set up event listeners for connection monitoring
-    @event.listens_for(engine, "connect")
+    @event.listens_for(new_engine, "connect")
     def connect(dbapi_connection, connection_record):
-        logger.debug("Database connection established")
+        logger.debug(f"Database connection established ({label})")
     
-    @event.listens_for(engine, "checkout")
+    @event.listens_for(new_engine, "checkout")
     def checkout(dbapi_connection, connection_record, connection_proxy):
-        logger.debug("Database connection checked out")
+        logger.debug(f"Database connection checked out ({label})")
     
-    @event.listens_for(engine, "checkin")
+    @event.listens_for(new_engine, "checkin")
     def checkin(dbapi_connection, connection_record):
-        logger.debug("Database connection checked in")
+        logger.debug(f"Database connection checked in ({label})")
+    
+    # Export pool saturation and query latency
+    instrument_engine(new_engine, label, pool_size + max_overflow)
+    
+    logger.info(f"Database engine ({label}) created with pool_size={pool_size}, max_overflow={max_overflow}")
+    return new_engine
+
+
+@log_exceptions(logger)
+def get_engine() -> Engine:
+    """
+    Creates or returns an existing SQLAlchemy engine with appropriate connection pooling.
+    
+    The engine is configured based on the current environment (development, staging, production)
+    with appropriate connection pool settings for optimal performance and reliability.
+    
+    Returns:
+        Engine: SQLAlchemy engine instance
+    """
+    global engine
+    
+    # Return existing engine if already created
+    if engine is not None:
+        return engine
     
-    logger.info(f"Database engine created with pool_size={pool_size}, max_overflow={max_overflow}")
+    engine = _create_pooled_engine(get_settings().database_url, "primary")
     return engine
 
 
+def replica_ok(statement):
+    """
+    Marks a SELECT statement as eligible to run on a read replica.
+    
+    Only use this for queries that tolerate a few seconds of staleness, such as
+    analytics, audit reports and historical series.
+    
+    Args:
+        statement: SQLAlchemy select statement
+        
+    Returns:
+        The statement with the replica execution option set
+    """
+    return statement.execution_options(**{REPLICA_EXECUTION_OPTION: True})
+
+
+def mark_primary_write() -> None:
+    """
+    Records that the current context just committed a write to the primary.
+    
+    Replica-eligible reads in the same context are pinned to the primary until
+    the configured maximum replica lag has elapsed.
+    
+    Returns:
+        None
+    """
+    _last_primary_write.set(time.monotonic())
+
+
+def in_read_your_writes_window(max_lag: float) -> bool:
+    """
+    Checks whether the current context wrote to the primary within the lag window.
+    
+    Args:
+        max_lag: Maximum tolerated replica lag in seconds
+        
+    Returns:
+        bool: True if reads must stay on the primary
+    """
+    last_write = _last_primary_write.get()
+    return last_write is not None and time.monotonic() - last_write < max_lag
+
+
+class ReplicaRouter:
+    """
+    Selects a healthy read replica using round-robin and cached lag checks.
+    
+    Replica lag is measured at most once per check interval. Replicas whose lag
+    exceeds the configured maximum, or whose lag check fails, are skipped until
+    the next check.
+    """
+    
+    def __init__(self, engines: List[Engine], max_lag: float, check_interval: float):
+        """
+        Initializes the router.
+        
+        Args:
+            engines: Replica engines to route to
+            max_lag: Maximum tolerated replay lag in seconds
+            check_interval: Seconds between lag checks per replica
+        """
+        self.engines = engines
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lag: Dict[int, Optional[float]] = {}
+        self._checked_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+    
+    def measure_lag(self, index: int) -> Optional[float]:
+        """
+        Measures replay lag for a replica.
+        
+        Args:
+            index: Index of the replica engine
+            
+        Returns:
+            Optional[float]: Lag in seconds, or None if the replica is unreachable
+        """
+        try:
+            with self.engines[index].connect() as connection:
+                lag = connection.execute(REPLICA_LAG_QUERY).scalar()
+            return float(lag or 0)
+        except exc.SQLAlchemyError as e:
+            logger.warning(f"Replica {index} lag check failed: {str(e)}")
+            return None
+    
+    def get_lag(self, index: int) -> Optional[float]:
+        """
+        Returns the cached lag for a replica, refreshing it when stale.
+        
+        Args:
+            index: Index of the replica engine
+            
+        Returns:
+            Optional[float]: Lag in seconds, or None if the replica is unreachable
+        """
+        now = time.monotonic()
+        with self._lock:
+            checked_at = self._checked_at.get(index)
+            if checked_at is not None and now - checked_at < self.check_interval:
+                return self._lag.get(index)
+            # Claim the check so concurrent callers reuse the previous value
+            self._checked_at[index] = now
+        
+        lag = self.measure_lag(index)
+        with self._lock:
+            self._lag[index] = lag
+        
+        if lag is not None and lag > self.max_lag:
+            logger.warning(f"Replica {index} lag {lag:.1f}s exceeds {self.max_lag}s, routing reads to primary")
+        return lag
+    
+    def is_healthy(self, index: int) -> bool:
+        """
+        Checks whether a replica is reachable and within the lag threshold.
+        
+        Args:
+            index: Index of the replica engine
+            
+        Returns:
+            bool: True if the replica can serve reads
+        """
+        lag = self.get_lag(index)
+        return lag is not None and lag <= self.max_lag
+    
+    def choose(self) -> Optional[Engine]:
+        """
+        Selects the next healthy replica in round-robin order.
+        
+        Returns:
+            Optional[Engine]: Replica engine, or None to fall back to the primary
+        """
+        count = len(self.engines)
+        start = next(self._counter)
+        for offset in range(count):
+            index = (start + offset) % count
+            if self.is_healthy(index):
+                return self.engines[index]
+        return None
+    
+    def dispose(self) -> None:
+        """
+        Disposes all replica connection pools.
+        
+        Returns:
+            None
+        """
+        for replica in self.engines:
+            replica.dispose()
+
+
+@log_exceptions(logger)
+def get_replica_router() -> Optional[ReplicaRouter]:
+    """
+    Creates or returns the read replica router.
+    
+    Returns:
+        Optional[ReplicaRouter]: Router, or None when no replicas are configured
+    """
+    global replica_router
+    
+    if replica_router is not None:
+        return replica_router
+    
+    settings = get_settings()
+    replica_urls = getattr(settings, "database_replica_urls", None) or []
+    if not replica_urls:
+        return None
+    
+    engines = [
+        _create_pooled_engine(url, f"replica-{index}")
+        for index, url in enumerate(replica_urls)
+    ]
+    replica_router = ReplicaRouter(
+        engines,
+        max_lag=settings.database_replica_max_lag,
+        check_interval=settings.database_replica_lag_check_interval,
+    )
+    logger.info(f"Read replica routing enabled with {len(engines)} replica(s)")
+    return replica_router
+
+
+class RoutingSession(Session):
+    """
+    Session that sends replica-eligible reads to a read replica.
+    
+    A SELECT goes to a replica when it carries the replica execution option (see
+    replica_ok) or the session was opened read-only (see get_read_db), and none of
+    the following apply: the session is flushing or has written data (by flush
+    or by executing any non-SELECT statement), or the current context committed
+    a write within the replica lag window. Everything
+    else, and every read when no healthy replica is available, uses the primary.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if clause is not None and self._can_use_replica(clause):
+            router = get_replica_router()
+            if router is not None:
+                replica = router.choose()
+                if replica is not None:
+                    return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+    
+    def _can_use_replica(self, clause) -> bool:
+        if self._flushing or self.info.get(SESSION_WRITES_KEY):
+            return False
+        if not isinstance(clause, Select):
+            return False
+        if not (
+            self.info.get(READ_ONLY_SESSION_KEY)
+            or clause.get_execution_options().get(REPLICA_EXECUTION_OPTION, False)
+        ):
+            return False
+        return not in_read_your_writes_window(get_settings().database_replica_max_lag)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _record_session_write(session, flush_context):
+    session.info[SESSION_WRITES_KEY] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _record_statement_write(orm_execute_state):
+    # Statement-level DML (bulk upserts, rollup refreshes, text SQL) never flushes
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[SESSION_WRITES_KEY] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _record_primary_commit(session):
+    if session.info.pop(SESSION_WRITES_KEY, False):
+        mark_primary_write()
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _reset_session_writes(session):
+    session.info.pop(SESSION_WRITES_KEY, None)
+
+
 @log_exceptions(logger)
 def get_session_factory() -> sessionmaker:
     """
@@ -111,6 +392,7 @@ def get_session_factory() -> sessionmaker:
     # Create session factory
     engine = get_engine()
     SessionLocal = sessionmaker(
+        class_=RoutingSession,
         autocommit=False,
         autoflush=False,
         bind=engine,
@@ -151,6 +433,31 @@ def get_db() -> Generator[Session, None, None]:
         logger.debug("Database session closed")
 
 
+@contextlib.contextmanager
+@log_exceptions(logger)
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Context manager that provides a read-only session routed to read replicas.
+    
+    Every SELECT in the session is eligible for a replica, so use it only for
+    reporting and analytics work that tolerates replica lag. Falls back to the
+    primary when no healthy replica is available.
+    
+    Yields:
+        Session: Database session for read-only operations
+    """
+    session_factory = get_session_factory()
+    session = session_factory(info={READ_ONLY_SESSION_KEY: True})
+    
+    try:
+        logger.debug("Read-only database session started")
+        yield session
+        session.rollback()  # Nothing to persist, release connections cleanly
+    finally:
+        session.close()
+        logger.debug("Read-only database session closed")
+
+
 @log_exceptions(logger)
 def create_scoped_session() -> scoped_session:
     """
@@ -193,11 +500,15 @@ def close_engine() -> None:
     Returns:
         None: Closes connections as a side effect
     """
-    global engine
+    global engine, replica_router
     if engine is not None:
         engine.dispose()
         engine = None
         logger.info("Database engine and connection pool closed")
+    if replica_router is not None:
+        replica_router.dispose()
+        replica_router = None
+        logger.info("Read replica connection pools closed")
 
 
 @log_exceptions(logger)
@@ -230,14 +541,18 @@ class DatabaseSessionManager:
     management, which can be useful in dependency injection scenarios.
     """
     
-    def __init__(self):
+    def __init__(self, read_only: bool = False):
         """
         Initializes the session manager.
         
         Gets the database engine and session factory for later use.
+        
+        Args:
+            read_only: If True, sessions are routed to read replicas when available
         """
         self._engine = get_engine()
         self._session_factory = get_session_factory()
+        self._read_only = read_only
     
     def get_session(self):
         """
@@ -246,6 +561,8 @@ class DatabaseSessionManager:
         Returns:
             contextlib._GeneratorContextManager: Context manager yielding a session
         """
+        if self._read_only:
+            return get_read_db()
         return get_db()
     
     def close(self):
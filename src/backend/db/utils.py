@@ -8,6 +8,7 @@ and helper functions for common database tasks.
 
 import sqlalchemy  # sqlalchemy 2.0.0+
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
 import contextlib
 import typing
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
@@ -22,6 +23,10 @@ logger = setup_logger('db.utils')
 # Default retry parameters
 DEFAULT_RETRY_COUNT = 3
 DEFAULT_BACKOFF_FACTOR = 2.0
+# Default number of rows sent per multi-row INSERT ... ON CONFLICT statement
+DEFAULT_UPSERT_BATCH_SIZE = 1000
+# Dialects whose INSERT construct supports ON CONFLICT DO UPDATE
+UPSERT_DIALECTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
 # Database exceptions that should trigger a retry
 DATABASE_EXCEPTIONS = (sqlalchemy.exc.OperationalError, sqlalchemy.exc.DatabaseError)
 
@@ -227,6 +232,100 @@ def update_or_create(session: sqlalchemy.orm.Session, model: Type[T], filters: D
             logger.error(f"Error creating {model.__name__} instance: {str(e)}")
             raise
 
+def bulk_upsert(session: sqlalchemy.orm.Session, model: Type[T], rows: List[Dict[str, Any]],
+                key_fields: List[str], update_fields: Optional[List[str]] = None,
+                batch_size: int = DEFAULT_UPSERT_BATCH_SIZE, returning: bool = False) -> List[T]:
+    """
+    Insert or update many records using set-based INSERT ... ON CONFLICT DO UPDATE statements.
+    
+    Rows are sent in batches, each batch being a single multi-row INSERT, so loading N rows
+    costs roughly N / batch_size round trips instead of the 2N of a SELECT-then-write loop.
+    Dialects without ON CONFLICT support fall back to update_or_create per row.
+    
+    Args:
+        session: SQLAlchemy session
+        model: The model class
+        rows: List of dicts of column values; each must contain all key_fields
+        key_fields: Columns of the unique constraint or primary key used as conflict target
+        update_fields: Columns to overwrite on conflict (defaults to all non-key columns supplied)
+        batch_size: Number of rows sent per statement
+        returning: Whether to return the inserted or updated instances
+        
+    Returns:
+        List[sqlalchemy.orm.DeclarativeBase]: Upserted instances if returning is set, otherwise empty list
+    """
+    if not rows:
+        logger.debug("No rows to bulk upsert")
+        return []
+    
+    # Rows missing a conflict key cannot be matched against existing records
+    valid_rows = [row for row in rows if all(row.get(field) is not None for field in key_fields)]
+    if len(valid_rows) != len(rows):
+        logger.warning(f"Skipping {len(rows) - len(valid_rows)} {model.__name__} rows missing key fields {key_fields}")
+    
+    # A single statement may not touch the same row twice, so keep the last value per key
+    deduplicated = {tuple(row[field] for field in key_fields): row for row in valid_rows}
+    valid_rows = list(deduplicated.values())
+    
+    dialect_name = session.get_bind().dialect.name
+    insert_factory = UPSERT_DIALECTS.get(dialect_name)
+    
+    if insert_factory is None:
+        logger.debug(f"Dialect {dialect_name} has no ON CONFLICT support, upserting {model.__name__} row by row")
+        instances = []
+        for row in valid_rows:
+            filters = {field: row[field] for field in key_fields}
+            values = {key: value for key, value in row.items() if key not in key_fields}
+            instance, _ = update_or_create(session, model, filters, values)
+            instances.append(instance)
+        return instances if returning else []
+    
+    # Multi-row VALUES require every row in a statement to share the same columns
+    row_groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in valid_rows:
+        row_groups.setdefault(tuple(sorted(row.keys())), []).append(row)
+    
+    table = model.__table__
+    instances = []
+    num_batches = 0
+    
+    for columns, group in row_groups.items():
+        fields = update_fields if update_fields is not None else [c for c in columns if c not in key_fields]
+        
+        stmt = insert_factory(model)
+        set_ = {field: stmt.excluded[field] for field in fields}
+        # Mirror ORM onupdate behaviour (e.g. last_updated = now()) for columns not supplied
+        for column in table.columns:
+            if column.onupdate is not None and column.name not in set_ and column.name not in key_fields:
+                if column.onupdate.is_clause_element:
+                    set_[column.name] = column.onupdate.arg
+        
+        if set_:
+            stmt = stmt.on_conflict_do_update(index_elements=key_fields, set_=set_)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=key_fields)
+        
+        for i in range(0, len(group), batch_size):
+            batch = group[i:i + batch_size]
+            num_batches += 1
+            try:
+                if returning:
+                    result = session.scalars(
+                        stmt.returning(model),
+                        batch,
+                        execution_options={"populate_existing": True}
+                    )
+                    instances.extend(result.all())
+                else:
+                    session.execute(stmt, batch)
+            except sqlalchemy.exc.SQLAlchemyError as e:
+                session.rollback()
+                logger.error(f"Error bulk upserting {model.__name__} batch {num_batches}: {str(e)}")
+                raise
+    
+    logger.info(f"Upserted {len(valid_rows)} {model.__name__} rows in {num_batches} batches")
+    return instances
+
 def execute_raw_sql(session: sqlalchemy.orm.Session, sql: str, params: Optional[Dict[str, Any]] = None) -> sqlalchemy.engine.Result:
     """
     Execute a raw SQL query with parameters.
@@ -0,0 +1,43 @@
+"""
+Gunicorn server hooks for the Borrow Rate & Locate Fee Pricing Engine.
+
+Prepares the Prometheus multiprocess directory so /metrics merges the samples of all
+workers, and drops the live gauges of workers that exit. Kept free of application
+imports so the arbiter does not load the service.
+"""
+
+import os
+import shutil
+
+try:
+    from prometheus_client import multiprocess  # prometheus-client 0.17.0+
+except ImportError:
+    multiprocess = None
+
+# Must match utils.metrics.MULTIPROC_DIR_ENV
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def on_starting(server):
+    """
+    Start every server run with an empty metrics directory.
+    
+    Args:
+        server: Gunicorn arbiter
+    """
+    multiproc_dir = os.environ.get(MULTIPROC_DIR_ENV)
+    if multiproc_dir:
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """
+    Remove the live gauge files of an exited worker.
+    
+    Args:
+        server: Gunicorn arbiter
+        worker: Exited worker
+    """
+    if multiprocess is not None and os.environ.get(MULTIPROC_DIR_ENV):
+        multiprocess.mark_process_dead(worker.pid)
@@ -18,7 +18,12 @@ from .api.v1.api import api_router  # Import the configured API router for versi
 from .config.settings import get_settings  # Import settings accessor function for application configuration
 from .core.middleware import setup_middleware  # Import middleware setup function for configuring all middleware components
 from .db.session import init_db, get_db, close_engine, ping_database  # Import database initialization function for creating tables
+from .db.async_session import close_async_engine  # Async engine used by request handlers
+from .api.v1.endpoints.health import get_health_monitor  # Background health probes
+from .services.calculation.borrow_rate import get_shared_rate_refresher  # Shared-memory rate table writer
+from .services.data.reference import reference_data  # In-memory stock and broker snapshot
 from .utils.logging import setup_logger  # Import logger setup function for application logging
+from .utils.metrics import generate_metrics  # Prometheus exposition, merged across workers
 
 # Initialize logger for this module
 logger = setup_logger('main')
@@ -41,6 +46,14 @@ async def startup_event():
         logger.info("Database initialized successfully")
     else:
         logger.error("Database initialization failed")
+    get_health_monitor().start()  # Start background health probes
+    reference_settings = get_settings().reference_data
+    if reference_settings["enabled"]:
+        reference_data.poll_interval = reference_settings["poll_interval"]
+        reference_data.start()  # Load and keep refreshing the stock and broker snapshot
+    shared_rate_refresher = get_shared_rate_refresher()
+    if shared_rate_refresher is not None:
+        shared_rate_refresher.start()  # Compete to become the shared rate table writer
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -48,7 +61,13 @@ async def shutdown_event():
     Application shutdown event handler that closes database connections
     """
     logger.info("Application shutting down...")
+    await get_health_monitor().stop()  # Stop background health probes
+    reference_data.stop()  # Stop refreshing the stock and broker snapshot
+    shared_rate_refresher = get_shared_rate_refresher()
+    if shared_rate_refresher is not None:
+        await shared_rate_refresher.stop()  # Hand the writer lock to another worker
     close_engine()  # Close database connections
+    await close_async_engine()  # Close async database connections
     logger.info("Database connections closed successfully")
 
 @app.get("/health", status_code=status.HTTP_200_OK)
@@ -59,11 +78,25 @@ async def health_check():
     Returns:
         dict: Health status information
     """
-    db_status = "OK" if ping_database() else "Unreachable"  # Check database connectivity
+    database = get_health_monitor().snapshot["components"].get("database")
+    db_status = "OK" if database == "connected" else "Unreachable"  # Latest background database probe
     if db_status == "Unreachable":
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Database Unavailable")
     return {"api_status": "OK", "database_status": db_status}  # Return health status
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """
+    Prometheus metrics endpoint covering every worker process
+
+    Returns:
+        Response: Metrics in the Prometheus text exposition format
+    """
+    if not get_settings().metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Metrics disabled")
+    content, content_type = generate_metrics()
+    return Response(content=content, media_type=content_type)
+
 def configure_app(app: FastAPI) -> FastAPI:
     """
     Configure the FastAPI application with middleware and routes
@@ -10,6 +10,7 @@ Middleware components:
 - ErrorHandlingMiddleware: Converts exceptions to standardized error responses
 - RateLimitingMiddleware: Enforces rate limits for API clients
 - TracingMiddleware: Adds distributed tracing for request flows using OpenTelemetry
+- FusedRequestMiddleware: Pure ASGI middleware running all of the above in a single pass
 """
 
 from .authentication import AuthenticationMiddleware
@@ -17,6 +18,7 @@ from .logging import LoggingMiddleware
 from .error_handling import ErrorHandlingMiddleware
 from .rate_limiting import RateLimitingMiddleware
 from .tracing import TracingMiddleware
+from .pipeline import FusedRequestMiddleware, ExemptPathMatcher
 
 __all__ = [
     'AuthenticationMiddleware',
@@ -24,4 +26,6 @@ __all__ = [
     'ErrorHandlingMiddleware',
     'RateLimitingMiddleware',
     'TracingMiddleware',
+    'FusedRequestMiddleware',
+    'ExemptPathMatcher',
 ]
\ No newline at end of file
@@ -124,25 +124,38 @@ class ErrorHandlingMiddleware:
             # Try to process the request
             return await call_next(request)
         
-        except BaseAPIException as exc:
+        except Exception as exc:
+            return self.handle_exception(exc, request)
+    
+    def handle_exception(self, exc: Exception, request: Request) -> Response:
+        """
+        Convert any exception into a standardized error response.
+        
+        Args:
+            exc: The exception that was raised
+            request: FastAPI Request object
+            
+        Returns:
+            JSONResponse with appropriate error details
+        """
+        if isinstance(exc, BaseAPIException):
             # Handle application-specific exceptions
             return self.handle_api_exception(exc, request)
         
-        except RequestValidationError as exc:
+        if isinstance(exc, RequestValidationError):
             # Handle FastAPI request validation errors
             return self.handle_validation_error(exc, request)
         
-        except ValidationError as exc:
+        if isinstance(exc, ValidationError):
             # Handle Pydantic validation errors
             return self.handle_pydantic_error(exc, request)
         
-        except HTTPException as exc:
+        if isinstance(exc, HTTPException):
             # Handle FastAPI HTTP exceptions
             return self.handle_http_exception(exc, request)
         
-        except Exception as exc:
-            # Handle unexpected exceptions
-            return self.handle_unexpected_error(exc, request)
+        # Handle unexpected exceptions
+        return self.handle_unexpected_error(exc, request)
     
     def handle_api_exception(self, exc: BaseAPIException, request: Request) -> Response:
         """
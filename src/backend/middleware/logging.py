@@ -19,6 +19,7 @@ from ..core.logging import (
     get_api_logger
 )
 from ..config.settings import get_settings
+from ..utils.metrics import observe_request, get_route_template
 
 # Get API logger instance
 logger = get_api_logger()
@@ -173,6 +174,9 @@ class LoggingMiddleware:
             correlation_id
         )
         
+        # Record latency per route template
+        observe_request(request.method, get_route_template(request.scope), response.status_code, duration)
+        
         # Add correlation ID to response headers
         response.headers["X-Correlation-ID"] = correlation_id
         
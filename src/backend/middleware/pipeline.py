@@ -0,0 +1,314 @@
+"""
+Fused request pipeline middleware for the Borrow Rate & Locate Fee Pricing Engine API.
+
+This module provides a single pure-ASGI middleware that performs correlation ID handling,
+distributed tracing, authentication, rate limiting, error mapping and access logging in
+one pass. It replaces the stacked TracingMiddleware, ErrorHandlingMiddleware,
+AuthenticationMiddleware, RateLimitingMiddleware and LoggingMiddleware layers when the
+application runs with MIDDLEWARE_MODE=fused: headers are decoded once, the exempt-path
+check runs once against a precompiled matcher, and the response is sent straight through
+without re-wrapping the body stream at every layer.
+"""
+
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from fastapi import Request, status  # fastapi 0.103.0
+from fastapi.responses import JSONResponse  # fastapi 0.103.0
+from starlette.concurrency import run_in_threadpool  # starlette 0.27.0+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send  # starlette 0.27.0+
+from opentelemetry import trace
+from opentelemetry.propagate import extract, inject
+
+from ..core.auth import authenticate_request
+from ..core.constants import ErrorCodes
+from ..core.errors import create_error_response
+from ..core.exceptions import AuthenticationException, RateLimitExceededException
+from ..core.logging import set_correlation_id, log_api_request, log_api_response, get_api_logger
+from ..config.settings import get_settings
+from ..utils.metrics import observe_request, get_route_template
+from ..utils.profiler import bind_request_scope, reset_request_scope
+from .error_handling import ErrorHandlingMiddleware
+
+# Get API logger instance
+logger = get_api_logger()
+
+# Create a tracer for the fused pipeline
+tracer = trace.get_tracer(__name__)
+
+# Paths exempt from authentication, rate limiting and access logging by default
+DEFAULT_EXEMPT_PATHS = ['/health', '/docs', '/redoc', '/openapi.json', '/metrics']
+
+# Headers added to every response
+CORRELATION_ID_HEADER = b"x-correlation-id"
+
+
+class ExemptPathMatcher:
+    """
+    Precompiled prefix matcher for exempt request paths.
+    
+    The prefixes are frozen into a tuple once so each check is a single
+    str.startswith call instead of a Python-level loop per middleware layer.
+    """
+    
+    def __init__(self, prefixes: Iterable[str]):
+        """
+        Initialize the matcher with path prefixes.
+        
+        Args:
+            prefixes: Path prefixes that are exempt
+        """
+        self.prefixes = tuple(sorted(set(prefixes)))
+    
+    def __call__(self, path: str) -> bool:
+        """
+        Check if a request path is exempt.
+        
+        Args:
+            path: Request path
+        
+        Returns:
+            bool: True if the path starts with any exempt prefix
+        """
+        return path.startswith(self.prefixes)
+
+
+def rate_limit_headers(rate_limit_info: Optional[Dict[str, Any]]) -> List[Tuple[bytes, bytes]]:
+    """
+    Build rate limit response headers from rate limit information.
+    
+    Args:
+        rate_limit_info: Rate limit information with limit, remaining and reset
+    
+    Returns:
+        List[Tuple[bytes, bytes]]: Raw ASGI header pairs
+    """
+    if not rate_limit_info:
+        return []
+    return [
+        (b"x-ratelimit-limit", str(rate_limit_info.get("limit", 60)).encode("latin-1")),
+        (b"x-ratelimit-remaining", str(rate_limit_info.get("remaining", 0)).encode("latin-1")),
+        (b"x-ratelimit-reset", str(rate_limit_info.get("reset", 60)).encode("latin-1")),
+    ]
+
+
+class FusedRequestMiddleware:
+    """
+    Pure ASGI middleware running the full request pipeline in a single layer.
+    
+    For each HTTP request it:
+    1. Resolves the correlation ID from X-Correlation-ID or generates one
+    2. Opens one server span with the propagated trace context
+    3. Authenticates the API key and applies the client's rate limit
+    4. Maps exceptions to standardized error responses
+    5. Logs the request and response with timing information
+    """
+    
+    def __init__(self, app: ASGIApp, exempt_paths: Optional[List[str]] = None):
+        """
+        Initialize the fused middleware.
+        
+        Args:
+            app: The ASGI application to wrap
+            exempt_paths: Path prefixes exempt from authentication, rate limiting and access logging
+        """
+        self.app = app
+        self.is_path_exempt = ExemptPathMatcher(exempt_paths or DEFAULT_EXEMPT_PATHS)
+        
+        # Check if tracing is enabled in settings
+        settings = get_settings()
+        self.tracing_enabled = getattr(settings, 'tracing_enabled', True)
+        
+        self._error_handler = ErrorHandlingMiddleware()
+        
+        logger.info(
+            f"Fused request middleware initialized, tracing enabled: {self.tracing_enabled}, "
+            f"exempt paths: {list(self.is_path_exempt.prefixes)}"
+        )
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process an ASGI connection through the fused pipeline.
+        
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Decode headers once for every pipeline stage
+        headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        
+        correlation_id = headers.get("x-correlation-id") or str(uuid.uuid4())
+        set_correlation_id(correlation_id)
+        state = scope.setdefault("state", {})
+        state["correlation_id"] = correlation_id
+        response_headers = [(CORRELATION_ID_HEADER, correlation_id.encode("latin-1"))]
+        
+        if self.is_path_exempt(scope["path"]):
+            await self.app(scope, receive, self._wrap_send(send, response_headers, {}))
+            return
+        
+        if not self.tracing_enabled:
+            await self._process(scope, receive, send, headers, response_headers, correlation_id)
+            return
+        
+        with tracer.start_as_current_span(
+            f"{scope['method']} {scope['path']}",
+            context=extract(headers),
+            kind=trace.SpanKind.SERVER,
+        ) as span:
+            span.set_attribute("http.method", scope["method"])
+            span.set_attribute("http.path", scope["path"])
+            span.set_attribute("http.query_string", scope.get("query_string", b"").decode("latin-1"))
+            client = scope.get("client")
+            span.set_attribute("http.client_ip", client[0] if client else "unknown")
+            span.set_attribute("correlation_id", correlation_id)
+            
+            # Propagate the trace context on the response
+            trace_headers: Dict[str, str] = {}
+            inject(trace_headers)
+            response_headers.extend(
+                (key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in trace_headers.items()
+            )
+            
+            status_code, duration = await self._process(
+                scope, receive, send, headers, response_headers, correlation_id
+            )
+            
+            span.set_attribute("http.status_code", status_code)
+            span.set_attribute("http.duration_ms", duration * 1000)
+    
+    async def _process(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        headers: Dict[str, str],
+        response_headers: List[Tuple[bytes, bytes]],
+        correlation_id: str
+    ) -> Tuple[int, float]:
+        """
+        Authenticate, rate limit, run the application and log the exchange.
+        
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+            headers: Decoded request headers
+            response_headers: Raw headers to add to the response
+            correlation_id: Correlation ID for the request
+        
+        Returns:
+            Tuple[int, float]: Response status code and duration in seconds
+        """
+        method = scope["method"]
+        path = scope["path"]
+        client_id = "unknown"
+        response_state = {"status": status.HTTP_500_INTERNAL_SERVER_ERROR, "started": False}
+        wrapped_send = self._wrap_send(send, response_headers, response_state)
+        start_time = time.perf_counter()
+        
+        # Tag profiler samples with the route and correlation ID of this request
+        profiler_token = bind_request_scope(scope)
+        try:
+            api_key = headers.get("x-api-key")
+            if not api_key:
+                raise AuthenticationException("API key required")
+            
+            # Authentication also applies the client's rate limit; it performs blocking I/O
+            auth_result = await run_in_threadpool(authenticate_request, api_key)
+            client_id = auth_result.get("client_id") or client_id
+            scope["state"]["auth_result"] = auth_result
+            scope["state"]["client_id"] = client_id
+            response_headers.extend(rate_limit_headers(auth_result.get("rate_limit")))
+            
+            log_api_request(
+                logger,
+                method,
+                path,
+                dict(parse_qsl(scope.get("query_string", b"").decode("latin-1"))),
+                client_id,
+                correlation_id
+            )
+            
+            await self.app(scope, receive, wrapped_send)
+        
+        except Exception as exc:
+            if response_state["started"]:
+                # Headers are already on the wire; nothing can be mapped any more
+                raise
+            response = self.build_error_response(exc, scope, client_id)
+            await response(scope, receive, wrapped_send)
+        
+        finally:
+            reset_request_scope(profiler_token)
+        
+        duration = time.perf_counter() - start_time
+        log_api_response(logger, method, path, response_state["status"], duration, correlation_id)
+        observe_request(method, get_route_template(scope), response_state["status"], duration)
+        
+        return response_state["status"], duration
+    
+    def build_error_response(self, exc: Exception, scope: Scope, client_id: str) -> JSONResponse:
+        """
+        Map an exception raised in the pipeline to a standardized error response.
+        
+        Args:
+            exc: The exception that was raised
+            scope: ASGI connection scope
+            client_id: Client identifier, "unknown" if not authenticated
+        
+        Returns:
+            JSONResponse: Error response to send
+        """
+        if isinstance(exc, AuthenticationException):
+            logger.warning(f"Authentication failed: {exc.message}")
+            return JSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content=create_error_response(exc.message, ErrorCodes.UNAUTHORIZED)
+            )
+        
+        if isinstance(exc, RateLimitExceededException):
+            retry_after = exc.params.get("retry_after", 60)
+            logger.warning(f"Rate limit exceeded for client {exc.params.get('client_id', client_id)}")
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content=create_error_response(exc.message, exc.error_code, exc.params)
+            )
+            response.headers["Retry-After"] = str(retry_after)
+            response.headers["X-RateLimit-Remaining"] = "0"
+            return response
+        
+        return self._error_handler.handle_exception(exc, Request(scope))
+    
+    @staticmethod
+    def _wrap_send(
+        send: Send,
+        response_headers: List[Tuple[bytes, bytes]],
+        response_state: Dict[str, Any]
+    ) -> Send:
+        """
+        Wrap the ASGI send channel to add response headers and record the status.
+        
+        Args:
+            send: ASGI send channel
+            response_headers: Raw headers to add to the response start message
+            response_state: Dictionary updated with the status code once the response starts
+        
+        Returns:
+            Send: Wrapped send channel
+        """
+        async def wrapped_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_state["started"] = True
+                response_state["status"] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + response_headers
+            await send(message)
+        
+        return wrapped_send
@@ -13,7 +13,7 @@ from typing import List, Dict, Optional, Any, Callable
 from fastapi import Request, Response, HTTPException, status  # fastapi 0.103.0+
 
 from ..core.auth import RateLimiter
-from ..services.cache.redis import RedisCache
+from ..services.cache import get_redis_cache
 from ..core.exceptions import RateLimitExceededException
 from ..core.constants import ErrorCodes, API_RATE_LIMIT_DEFAULT, API_RATE_LIMIT_PREMIUM
 from ..core.errors import get_error_message, create_error_response
@@ -22,8 +22,8 @@ from ..config.settings import get_settings
 
 # Set up logger
 logger = setup_logger('middleware.rate_limiting')
-# Initialize Redis cache
-redis_cache = RedisCache()
+# Shared Redis cache
+redis_cache = get_redis_cache()
 # Initialize rate limiter
 rate_limiter = RateLimiter(redis_cache)
 
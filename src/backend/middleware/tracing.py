@@ -19,6 +19,7 @@ from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 from ..config.settings import get_settings
 from ..core.logging import get_correlation_id, set_correlation_id
 from ..utils.logging import setup_logger
+from ..utils.profiler import bind_request_scope, reset_request_scope
 
 # Set up logger for tracing middleware
 logger = setup_logger('middleware.tracing')
@@ -84,13 +85,21 @@ class TracingMiddleware:
             
             # Set correlation ID from trace context for log correlation
             current_context = trace.get_current_span(context.get_current()).get_span_context()
-            set_correlation_id(f"trace-{current_context.trace_id:032x}")
+            correlation_id = f"trace-{current_context.trace_id:032x}"
+            set_correlation_id(correlation_id)
+            
+            # Tag profiler samples with the route and correlation ID of this request
+            request.state.correlation_id = correlation_id
+            profiler_token = bind_request_scope(request.scope)
             
             # Start timing the request
             start_time = time.time()
             
             # Execute the next handler
-            response = await call_next(request)
+            try:
+                response = await call_next(request)
+            finally:
+                reset_request_scope(profiler_token)
             
             # Calculate request duration
             duration = time.time() - start_time
@@ -125,6 +134,25 @@ class TracingMiddleware:
         # Instrument FastAPI
         FastAPIInstrumentor.instrument_app(app)
         
+        # Instrument outgoing calls
+        self.instrument_clients()
+        
+        logger.info("Application instrumented with OpenTelemetry")
+    
+    def instrument_clients(self) -> None:
+        """
+        Instrument outgoing HTTPX, Redis and SQLAlchemy calls with OpenTelemetry.
+        
+        Use this instead of instrument_app when server spans are already created by
+        middleware, so each request gets exactly one server span.
+        
+        Returns:
+            None: Instruments client libraries as a side effect
+        """
+        if not self.enabled:
+            logger.info("Tracing is disabled, skipping client instrumentation")
+            return
+        
         # Instrument HTTPX for outgoing requests
         HTTPXInstrumentor().instrument()
         
@@ -134,7 +162,7 @@ class TracingMiddleware:
         # Instrument SQLAlchemy ORM
         SQLAlchemyInstrumentor().instrument()
         
-        logger.info("Application instrumented with OpenTelemetry")
+        logger.info("Outgoing calls instrumented with OpenTelemetry")
     
     def get_trace_context(self, request: Request) -> Dict[str, Any]:
         """
@@ -11,13 +11,15 @@ rather than from individual schema modules.
 from .error import ErrorResponse, ValidationError
 
 # Import request schemas
-from .request import CalculateLocateRequest, GetRateRequest
+from .request import CalculateLocateRequest, GetRateRequest, GetRatesRequest
 
 # Import response schemas
 from .response import (
     BaseResponse,
     CalculateLocateResponse, 
     BorrowRateResponse,
+    TickerRateResult,
+    MultiTickerRateResponse,
     HealthResponse
 )
 
@@ -90,11 +92,14 @@ __all__ = [
     # Request schemas
     "CalculateLocateRequest",
     "GetRateRequest",
+    "GetRatesRequest",
     
     # Response schemas
     "BaseResponse",
     "CalculateLocateResponse",
     "BorrowRateResponse",
+    "TickerRateResult",
+    "MultiTickerRateResponse",
     "HealthResponse",
     
     # Stock schemas
@@ -6,7 +6,7 @@ providing clear error messages when validation fails.
 
 import re
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, validator
 
@@ -17,6 +17,9 @@ from ..core.constants import ErrorCodes
 TICKER_PATTERN = re.compile(r'^[A-Z]{1,5}$')
 CLIENT_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{3,50}$')
 
+# Maximum number of tickers in one multi-ticker rate request
+MAX_RATE_TICKERS = 1000
+
 
 class CalculateLocateRequest(BaseModel):
     """Pydantic model for validating locate fee calculation requests"""
@@ -143,4 +146,36 @@ class RefreshRateRequest(BaseModel):
         if not TICKER_PATTERN.match(v):
             raise ValueError("Invalid ticker format. Must be 1-5 uppercase letters.")
         
-        return v
\ No newline at end of file
+        return v
+
+
+class GetRatesRequest(BaseModel):
+    """Pydantic model for validating multi-ticker borrow rate requests"""
+    tickers: List[str]
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "tickers": ["AAPL", "MSFT", "GME"]
+            }
+        }
+    }
+
+    @validator('tickers')
+    def validate_tickers(cls, v):
+        """Validates the ticker symbols, removing duplicates while keeping their order"""
+        if not v:
+            raise ValueError("At least one ticker symbol is required")
+        
+        tickers = []
+        for ticker in v:
+            ticker = ticker.strip().upper()
+            if not TICKER_PATTERN.match(ticker):
+                raise ValueError(f"Invalid ticker format: {ticker!r}. Must be 1-5 uppercase letters.")
+            tickers.append(ticker)
+        
+        tickers = list(dict.fromkeys(tickers))
+        if len(tickers) > MAX_RATE_TICKERS:
+            raise ValueError(f"At most {MAX_RATE_TICKERS} tickers can be requested at once")
+        
+        return tickers
\ No newline at end of file
@@ -8,7 +8,7 @@ detailed fee breakdowns, and appropriate data validation for financial informati
 
 from datetime import datetime
 from decimal import Decimal  # standard library
-from typing import Dict, Optional  # standard library
+from typing import Any, Dict, List, Optional  # standard library
 
 from pydantic import BaseModel, Field  # version: 2.4.0+
 
@@ -134,6 +134,100 @@ class BorrowRateResponse(BaseResponse):
         }
 
 
+class TickerRateResult(BaseModel):
+    """Borrow rate of one ticker in a multi-ticker rate response."""
+    
+    ticker: str = Field(
+        ...,
+        description="Stock symbol (e.g., 'AAPL')",
+        example="AAPL"
+    )
+    
+    current_rate: Decimal = Field(
+        ...,
+        description="Current borrow rate as a decimal percentage",
+        example=0.05
+    )
+    
+    borrow_status: Optional[str] = Field(
+        None,
+        description="Borrowing difficulty tier (EASY, MEDIUM, HARD), if known",
+        example="EASY"
+    )
+    
+    volatility_index: Optional[Decimal] = Field(
+        None,
+        description="Market volatility index affecting the rate",
+        example=18.5
+    )
+    
+    event_risk_factor: Optional[int] = Field(
+        None,
+        description="Risk factor (0-10) for upcoming corporate events",
+        example=2,
+        ge=0,
+        le=10
+    )
+    
+    last_updated: Optional[datetime] = Field(
+        None,
+        description="Timestamp when rate was last updated, if known",
+        example="2023-10-15T14:30:22Z"
+    )
+    
+    source: str = Field(
+        ...,
+        description="Where the rate came from (cache, live or fallback)",
+        example="cache"
+    )
+
+
+class MultiTickerRateResponse(BaseResponse):
+    """Response model for the multi-ticker borrow rate endpoint."""
+    
+    rates: List[TickerRateResult] = Field(
+        ...,
+        description="Borrow rates in request order"
+    )
+    
+    not_found: List[str] = Field(
+        default_factory=list,
+        description="Requested tickers that do not exist",
+        example=["ZZZZ"]
+    )
+    
+    failed: List[str] = Field(
+        default_factory=list,
+        description="Requested tickers whose rate could not be calculated",
+        example=[]
+    )
+    
+    @classmethod
+    def model_config(cls):
+        """Pydantic model configuration."""
+        return {
+            "extra": "forbid",
+            "json_schema_extra": {
+                "example": {
+                    "status": "success",
+                    "rates": [
+                        {
+                            "ticker": "AAPL",
+                            "current_rate": 0.05,
+                            "borrow_status": "EASY",
+                            "volatility_index": 18.5,
+                            "event_risk_factor": 2,
+                            "last_updated": "2023-10-15T14:30:22Z",
+                            "source": "cache"
+                        }
+                    ],
+                    "not_found": ["ZZZZ"],
+                    "failed": []
+                }
+            }
+        }
+
+
 class HealthResponse(BaseResponse):
     """Response model for health check endpoint."""
     
@@ -143,7 +237,7 @@ class HealthResponse(BaseResponse):
         example="1.0.0"
     )
     
-    components: Dict[str, str] = Field(
+    components: Dict[str, Any] = Field(
         ...,
         description="Status of system components",
         example={
@@ -153,9 +247,17 @@ class HealthResponse(BaseResponse):
         }
     )
     
+    checks: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None,
+        description="Probe latency statistics per component",
+        example={
+            "database": {"samples": 120, "last_latency_ms": 1.8, "p50_latency_ms": 1.6, "p95_latency_ms": 3.2}
+        }
+    )
+    
     timestamp: datetime = Field(
         ...,
-        description="Current server timestamp",
+        description="Time of the health snapshot",
         example="2023-10-16T08:45:12Z"
     )
     
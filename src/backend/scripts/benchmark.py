@@ -9,31 +9,64 @@ different components of the system.
 """
 
 import argparse
+import asyncio
+import os
 import time
 import statistics
 import concurrent.futures
 import logging
+import datetime
 from decimal import Decimal
 import matplotlib.pyplot as plt  # matplotlib 3.7.0+
 import numpy as np  # numpy 1.24.0+
 import pandas as pd  # pandas 2.0.0+
-import requests  # requests 2.28.0+
 
 # Import the Timer utility for precise timing
 from ..utils.timing import Timer
 
+# Import the open-loop load generator and latency histograms
+from .loadgen import (
+    HttpScenario, CallableScenario, run_scenario, save_baseline, load_baseline, compare_to_baseline,
+    print_load_results, print_comparisons, DEFAULT_RATE, DEFAULT_DURATION, DEFAULT_ALPHA, DEFAULT_TOLERANCE
+)
+
 # Import calculation functions to benchmark
 from ..services.calculation.borrow_rate import calculate_borrow_rate
 from ..services.calculation.locate_fee import calculate_locate_fee
 from ..services.calculation.volatility import calculate_volatility_adjustment
 from ..services.calculation.event_risk import calculate_event_risk_adjustment
 
+# Import cache codecs for encode/decode benchmarks
+from ..services.cache.codecs import CacheCodecRegistry, JsonCodec
+from ..services.cache.utils import wrap_cache_value
+
 # Import settings and logging configuration
 from ..config.settings import get_settings
-from ..config.logging_config import configure_logging
+from ..config.logging_config import (
+    configure_logging, JsonFormatter, FastJsonFormatter, CorrelationIdFilter, create_queue_handler
+)
+from ..core.logging import log_api_request, log_api_response
 
 # Import constants
-from ..core.constants import TransactionFeeType
+from ..core.constants import TransactionFeeType, BorrowStatus
+
+# Import database helpers for bulk write benchmarks
+from sqlalchemy.orm import Session
+from ..db.session import get_session_factory, get_engine
+from ..db.utils import update_or_create, bulk_upsert
+from ..db.models.stock import Stock
+from ..db.models.broker import Broker
+from ..db.models.api_key import APIKey
+from ..db.crud.api_keys import api_key_crud
+from ..core.security import generate_api_key, hash_password, compute_api_key_digest
+
+# Import middleware for per-request overhead benchmarks
+from unittest.mock import patch
+import httpx  # httpx 0.25.0+
+from fastapi import FastAPI  # fastapi 0.103.0
+from ..core.middleware import setup_stacked_middleware, get_exempt_paths
+from ..middleware import pipeline, authentication, rate_limiting
+from ..middleware.pipeline import FusedRequestMiddleware
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -42,6 +75,23 @@ logger = logging.getLogger(__name__)
 DEFAULT_ITERATIONS = 1000
 DEFAULT_CONCURRENCY = 10
 DEFAULT_WARMUP_ITERATIONS = 100
+DEFAULT_BULK_ROWS = 10000
+DEFAULT_BULK_BATCH_SIZE = 1000
+DEFAULT_AUTH_KEY_COUNTS = [10, 50, 100]
+DEFAULT_AUTH_ITERATIONS = 5
+MIDDLEWARE_BENCHMARK_PATH = '/api/v1/benchmark'
+DEFAULT_LOG_SAMPLE_RATE = 100
+DEFAULT_API_RATE = 100
+DEFAULT_LOAD_WARMUP_SECONDS = 5.0
+DEFAULT_CODEC_ROWS = 200
+DEFAULT_API_BASE_URL = 'http://localhost:8000'
+
+# Mock external API servers (src/test/mock_servers docker-compose ports)
+MOCK_SERVER_URLS = {
+    'seclend': 'http://localhost:8001',
+    'market': 'http://localhost:8002',
+    'event': 'http://localhost:8003',
+}
 
 # Test data for benchmarks
 TEST_TICKERS = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'TSLA', 'NVDA', 'GME', 'AMC', 'BBBY']
@@ -130,7 +180,7 @@ class BenchmarkResult:
         # Add metadata as columns
         for key, value in self.metadata.items():
             df[key] = value
-            
+        
         return df
     
     def print_summary(self):
@@ -169,9 +219,92 @@ def parse_arguments():
     # Add argument for benchmark type
     parser.add_argument(
         '--type', 
-        choices=['calculation', 'api', 'all'], 
+        choices=['calculation', 'api', 'database', 'auth', 'middleware', 'logging', 'codec', 'load', 'all'], 
         default='all',
-        help='Type of benchmark to run (calculation, api, or all)'
+        help='Type of benchmark to run (calculation, api, database, auth, middleware, logging, codec, load, or all)'
+    )
+    
+    # Add arguments for open-loop load scenarios
+    parser.add_argument(
+        '--scenarios', 
+        nargs='+',
+        help='Load scenarios to run (default: all; see build_load_scenarios)'
+    )
+    
+    parser.add_argument(
+        '--rate', 
+        type=float, 
+        default=DEFAULT_RATE,
+        help=f'Arrival rate in requests per second for load scenarios (default: {DEFAULT_RATE:g})'
+    )
+    
+    parser.add_argument(
+        '--duration', 
+        type=float, 
+        default=DEFAULT_DURATION,
+        help=f'Seconds of measured load per scenario (default: {DEFAULT_DURATION:g})'
+    )
+    
+    parser.add_argument(
+        '--warmup-seconds', 
+        type=float, 
+        default=DEFAULT_LOAD_WARMUP_SECONDS,
+        help=f'Seconds of unmeasured load before each scenario (default: {DEFAULT_LOAD_WARMUP_SECONDS:g})'
+    )
+    
+    parser.add_argument(
+        '--base-url', 
+        default=DEFAULT_API_BASE_URL,
+        help=f'Base URL of the API server for endpoint benchmarks (default: {DEFAULT_API_BASE_URL})'
+    )
+    
+    parser.add_argument(
+        '--api-key', 
+        default=os.environ.get('BENCHMARK_API_KEY'),
+        help='API key for endpoint benchmarks (default: BENCHMARK_API_KEY environment variable)'
+    )
+    
+    parser.add_argument(
+        '--save-baseline', 
+        type=str, 
+        help='Write load results to this baseline file'
+    )
+    
+    parser.add_argument(
+        '--compare', 
+        type=str, 
+        help='Compare load results with this baseline file and exit with 1 on regression'
+    )
+    
+    parser.add_argument(
+        '--alpha', 
+        type=float, 
+        default=DEFAULT_ALPHA,
+        help=f'Significance level for regression detection (default: {DEFAULT_ALPHA})'
+    )
+    
+    parser.add_argument(
+        '--tolerance', 
+        type=float, 
+        default=DEFAULT_TOLERANCE,
+        help=f'Minimum relative p50/p99 increase counted as a regression (default: {DEFAULT_TOLERANCE})'
+    )
+    
+    # Add argument for API key counts in authentication benchmarks
+    parser.add_argument(
+        '--key-counts', 
+        type=int, 
+        nargs='+',
+        default=DEFAULT_AUTH_KEY_COUNTS,
+        help=f'Numbers of stored API keys for auth lookup benchmarks (default: {DEFAULT_AUTH_KEY_COUNTS})'
+    )
+    
+    # Add argument for number of rows in bulk write benchmarks
+    parser.add_argument(
+        '--rows', 
+        type=int, 
+        default=DEFAULT_BULK_ROWS,
+        help=f'Number of rows for bulk upsert benchmarks (default: {DEFAULT_BULK_ROWS})'
     )
     
     # Add argument for number of iterations
@@ -187,7 +320,7 @@ def parse_arguments():
         '--concurrency', 
         type=int, 
         default=DEFAULT_CONCURRENCY,
-        help=f'Level of concurrency for benchmarks (default: {DEFAULT_CONCURRENCY})'
+        help=f'Level of concurrency for benchmarks; maximum requests in flight for API and load benchmarks (default: {DEFAULT_CONCURRENCY})'
     )
     
     # Add argument for warmup iterations
@@ -248,7 +381,7 @@ def benchmark_function(func, params, iterations):
         func: Function to benchmark
         params: Dictionary of parameters to pass to the function
         iterations: Number of iterations to run
-        
+    
     Returns:
         dict: Benchmark results including execution times and statistics
     """
@@ -264,7 +397,7 @@ def benchmark_function(func, params, iterations):
         result = func(**params)
         timer.stop()
         execution_times.append(timer.elapsed_ms())
-        
+    
     # Create BenchmarkResult object to calculate statistics
     benchmark_result = BenchmarkResult(
         name=func.__name__,
@@ -288,7 +421,7 @@ def benchmark_concurrent(func, param_sets, concurrency, iterations_per_set):
         param_sets: List of parameter dictionaries for different function calls
         concurrency: Maximum number of concurrent executions
         iterations_per_set: Number of iterations for each parameter set
-        
+    
     Returns:
         dict: Benchmark results including execution times and throughput
     """
@@ -362,7 +495,7 @@ def benchmark_borrow_rate_calculation(iterations, concurrency):
     Args:
         iterations: Number of iterations for each parameter set
         concurrency: Level of concurrency for the benchmark
-        
+    
     Returns:
         dict: Benchmark results for borrow rate calculation
     """
@@ -396,7 +529,7 @@ def benchmark_locate_fee_calculation(iterations, concurrency):
     Args:
         iterations: Number of iterations for each parameter set
         concurrency: Level of concurrency for the benchmark
-        
+    
     Returns:
         dict: Benchmark results for locate fee calculation
     """
@@ -451,7 +584,7 @@ def benchmark_volatility_adjustment(iterations, concurrency):
     Args:
         iterations: Number of iterations for each parameter set
         concurrency: Level of concurrency for the benchmark
-        
+    
     Returns:
         dict: Benchmark results for volatility adjustment calculation
     """
@@ -490,7 +623,7 @@ def benchmark_event_risk_adjustment(iterations, concurrency):
     Args:
         iterations: Number of iterations for each parameter set
         concurrency: Level of concurrency for the benchmark
-        
+    
     Returns:
         dict: Benchmark results for event risk adjustment calculation
     """
@@ -522,151 +655,716 @@ def benchmark_event_risk_adjustment(iterations, concurrency):
     return result
 
 
-def benchmark_api_endpoint(endpoint, params, method='get', iterations=100, concurrency=10):
+def build_api_headers(api_key=None):
     """
-    Benchmarks a specific API endpoint.
+    Builds the headers sent with every benchmark API request.
     
     Args:
-        endpoint: API endpoint URL
-        params: Parameters to include in the request
-        method: HTTP method to use (get or post)
-        iterations: Number of iterations to run
-        concurrency: Level of concurrency for the benchmark
-        
+        api_key: API key for the X-API-Key header, if any
+    
     Returns:
-        dict: Benchmark results for API endpoint
+        dict: Request headers
     """
-    logger.info(f"Starting benchmark for API endpoint: {endpoint}")
+    headers = {'Content-Type': 'application/json'}
+    if api_key:
+        headers['X-API-Key'] = api_key
+    return headers
+
+
+def benchmark_api_endpoint(endpoint, params, method='get', iterations=100, concurrency=10,
+                           rate=DEFAULT_API_RATE, base_url=DEFAULT_API_BASE_URL, api_key=None):
+    """
+    Benchmarks a specific API endpoint with open-loop load at a constant arrival rate.
     
-    # Create a session for connection reuse
-    session = requests.Session()
+    Latencies are measured from the scheduled send time of each request, so a server
+    stall is charged to every request queued behind it (see scripts/loadgen.py).
     
-    # Get base URL from settings
-    settings = get_settings()
-    base_url = f"http://localhost:8000"  # Default for local development
+    Args:
+        endpoint: API endpoint path, or a list of paths used round-robin
+        params: Query parameters (get) or JSON body (post), or a list of them used round-robin
+        method: HTTP method to use (get or post)
+        iterations: Number of measured requests
+        concurrency: Maximum number of requests in flight
+        rate: Arrival rate in requests per second
+        base_url: Base URL of the API server
+        api_key: API key sent in the X-API-Key header
     
-    # Function to make an API request
-    def make_request(request_params):
-        url = f"{base_url}{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        
-        try:
-            if method.lower() == 'get':
-                return session.get(url, params=request_params, headers=headers)
-            elif method.lower() == 'post':
-                return session.post(url, json=request_params, headers=headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-        except Exception as e:
-            logger.error(f"Error making API request: {str(e)}")
-            raise
+    Returns:
+        BenchmarkResult: Benchmark results for API endpoint
+    """
+    logger.info(f"Starting benchmark for API endpoint: {endpoint}")
     
-    # Create parameter sets for the benchmark
-    param_sets = []
-    if isinstance(params, list):
-        param_sets = params
-    else:
-        param_sets = [params]
+    if method.lower() not in ('get', 'post'):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    paths = endpoint if isinstance(endpoint, list) else [endpoint]
+    param_sets = params if isinstance(params, list) else [params]
+    scenario = HttpScenario(
+        name=paths[0],
+        base_url=base_url,
+        method=method,
+        paths=paths,
+        payloads=param_sets,
+        headers=build_api_headers(api_key)
+    )
     
-    # Define a wrapper function for the benchmark
-    def api_request_function(request_params):
-        response = make_request(request_params)
-        if response.status_code != 200:
-            logger.warning(f"API request failed: {response.status_code} - {response.text}")
-        return response
+    # Run the measured load after a short unmeasured warmup
+    warmup = min(DEFAULT_WARMUP_ITERATIONS, 10) / rate
+    load_result = asyncio.run(run_scenario(scenario, rate, iterations / rate, concurrency, warmup))
     
-    # Perform warmup iterations
-    logger.info(f"Performing {min(DEFAULT_WARMUP_ITERATIONS, 10)} warmup iterations")
-    for params in param_sets[:min(len(param_sets), 3)]:
-        for _ in range(min(DEFAULT_WARMUP_ITERATIONS, 10) // min(len(param_sets), 3)):
-            try:
-                api_request_function(params)
-            except Exception:
-                logger.warning("Warmup request failed, continuing with benchmark")
+    if load_result.errors:
+        logger.warning(f"{load_result.errors} of {load_result.sent} requests to {endpoint} failed")
     
-    # Run the benchmark
-    result = benchmark_concurrent(
-        api_request_function,
-        param_sets,
-        concurrency,
-        iterations // len(param_sets)
+    result = BenchmarkResult(
+        name=f"api_{method.lower()}_{paths[0]}",
+        execution_times=list(load_result.latency.iter_values_ms()),
+        metadata={
+            'target_rate': rate,
+            'achieved_rate': round(load_result.achieved_rate, 2),
+            'max_in_flight': concurrency,
+            'errors': load_result.errors,
+            'service_time_p99_ms': load_result.service_time.summary()['p99_ms'],
+        }
     )
     
     logger.info(f"API endpoint benchmark complete for {endpoint}")
     return result
 
 
-def benchmark_calculate_endpoint(iterations, concurrency):
+def calculate_endpoint_params():
     """
-    Benchmarks the calculate-locate API endpoint.
+    Builds request bodies for the calculate-locate endpoint.
     
-    Args:
-        iterations: Number of iterations for each parameter set
-        concurrency: Level of concurrency for the benchmark
-        
     Returns:
-        dict: Benchmark results for calculate-locate endpoint
+        list: Request parameter dictionaries
     """
-    logger.info("Starting calculate-locate endpoint benchmark")
-    
-    # Create parameter sets with different combinations
     param_sets = []
     for ticker in TEST_TICKERS[:3]:
         for position_value in TEST_POSITION_VALUES[:2]:
             for loan_days in TEST_LOAN_DAYS[:2]:
-                params = {
+                param_sets.append({
                     'ticker': ticker,
                     'position_value': float(position_value),
                     'loan_days': loan_days,
                     'client_id': 'benchmark_client'
-                }
-                param_sets.append(params)
+                })
+    return param_sets
+
+
+def benchmark_calculate_endpoint(iterations, concurrency, base_url=DEFAULT_API_BASE_URL, api_key=None):
+    """
+    Benchmarks the calculate-locate API endpoint.
+    
+    Args:
+        iterations: Number of measured requests
+        concurrency: Maximum number of requests in flight
+        base_url: Base URL of the API server
+        api_key: API key sent in the X-API-Key header
+    
+    Returns:
+        BenchmarkResult: Benchmark results for calculate-locate endpoint
+    """
+    logger.info("Starting calculate-locate endpoint benchmark")
     
     # Run the benchmark
     result = benchmark_api_endpoint(
         endpoint='/api/v1/calculate-locate',
-        params=param_sets,
+        params=calculate_endpoint_params(),
         method='post',
         iterations=iterations,
-        concurrency=concurrency
+        concurrency=concurrency,
+        base_url=base_url,
+        api_key=api_key
     )
     
     logger.info("Calculate-locate endpoint benchmark complete")
     return result
 
 
-def benchmark_rates_endpoint(iterations, concurrency):
+def benchmark_rates_endpoint(iterations, concurrency, base_url=DEFAULT_API_BASE_URL, api_key=None):
     """
     Benchmarks the rates API endpoint.
     
     Args:
-        iterations: Number of iterations for each parameter set
-        concurrency: Level of concurrency for the benchmark
-        
+        iterations: Number of measured requests
+        concurrency: Maximum number of requests in flight
+        base_url: Base URL of the API server
+        api_key: API key sent in the X-API-Key header
+    
     Returns:
-        dict: Benchmark results for rates endpoint
+        BenchmarkResult: Benchmark results for rates endpoint
     """
     logger.info("Starting rates endpoint benchmark")
     
-    # Create parameter sets with different tickers
-    param_sets = []
-    for ticker in TEST_TICKERS:
-        endpoint = f"/api/v1/rates/{ticker}"
-        param_sets.append({})
-    
-    # Run the benchmark
+    # Run the benchmark, cycling through the test tickers
     result = benchmark_api_endpoint(
-        endpoint=f"/api/v1/rates/{TEST_TICKERS[0]}",  # This will be overridden
-        params=param_sets,
+        endpoint=[f"/api/v1/rates/{ticker}" for ticker in TEST_TICKERS],
+        params={},
         method='get',
         iterations=iterations,
-        concurrency=concurrency
+        concurrency=concurrency,
+        base_url=base_url,
+        api_key=api_key
     )
     
     logger.info("Rates endpoint benchmark complete")
     return result
 
 
+def build_load_scenarios(base_url=DEFAULT_API_BASE_URL, api_key=None, mock_urls=None):
+    """
+    Builds the open-loop load scenarios.
+    
+    Scenarios come in three groups:
+    - endpoint_*: API endpoints of a running server at base_url
+    - mock_*: the mock external servers in src/test/mock_servers, as a floor for the stages
+    - stage_*: calculation stages called in-process; the external API base URLs
+      (SECLEND_API_BASE_URL, MARKET_API_BASE_URL, EVENT_API_BASE_URL) should point at the
+      mock servers so that results are reproducible
+    
+    Args:
+        base_url: Base URL of the API server
+        api_key: API key sent in the X-API-Key header
+        mock_urls: Base URLs of the mock servers keyed by service (defaults to MOCK_SERVER_URLS)
+    
+    Returns:
+        dict: Scenarios keyed by name
+    """
+    mock_urls = mock_urls or MOCK_SERVER_URLS
+    headers = build_api_headers(api_key)
+    
+    ticker_params = [{'ticker': ticker} for ticker in TEST_TICKERS]
+    locate_fee_params = [
+        {
+            'ticker': ticker,
+            'position_value': position_value,
+            'loan_days': loan_days,
+            'markup_percentage': TEST_MARKUP_PERCENTAGES[0],
+            'fee_type': TransactionFeeType.FLAT,
+            'fee_amount': TEST_FEE_AMOUNTS[1],
+            'use_cache': False
+        }
+        for ticker in TEST_TICKERS[:3]
+        for position_value in TEST_POSITION_VALUES[:2]
+        for loan_days in TEST_LOAN_DAYS[:2]
+    ]
+    
+    from ..services.external.seclend_api import get_borrow_rate
+    from ..services.external.market_api import get_stock_volatility
+    from ..services.external.event_api import get_event_risk_factor
+    
+    scenarios = [
+        HttpScenario('endpoint_rates', base_url, 'get', [f"/api/v1/rates/{t}" for t in TEST_TICKERS], headers=headers),
+        HttpScenario('endpoint_calculate', base_url, 'post', ['/api/v1/calculate-locate'],
+                     payloads=calculate_endpoint_params(), headers=headers),
+        HttpScenario('endpoint_health', base_url, 'get', ['/health']),
+        HttpScenario('mock_seclend', mock_urls['seclend'], 'get', [f"/api/borrows/{t}" for t in TEST_TICKERS]),
+        HttpScenario('mock_market', mock_urls['market'], 'get',
+                     [f"/api/market/volatility/{t}" for t in TEST_TICKERS]),
+        HttpScenario('mock_event', mock_urls['event'], 'get', [f"/api/events/{t}" for t in TEST_TICKERS]),
+        CallableScenario('stage_seclend', get_borrow_rate, ticker_params),
+        CallableScenario('stage_market', get_stock_volatility, [dict(p, use_cache=False) for p in ticker_params]),
+        CallableScenario('stage_event', get_event_risk_factor, ticker_params),
+        CallableScenario('stage_borrow_rate', calculate_borrow_rate, [dict(p, use_cache=False) for p in ticker_params]),
+        CallableScenario('stage_locate_fee', calculate_locate_fee, locate_fee_params),
+    ]
+    return {scenario.name: scenario for scenario in scenarios}
+
+
+def benchmark_load(scenario_names, rate, duration, concurrency, warmup, base_url=DEFAULT_API_BASE_URL, api_key=None):
+    """
+    Runs open-loop load scenarios one after another.
+    
+    Args:
+        scenario_names: Names of the scenarios to run, or None for all
+        rate: Arrival rate in requests per second
+        duration: Seconds of measured load per scenario
+        concurrency: Maximum number of requests in flight
+        warmup: Seconds of unmeasured load per scenario
+        base_url: Base URL of the API server
+        api_key: API key sent in the X-API-Key header
+    
+    Returns:
+        dict: LoadResult per scenario name
+    """
+    scenarios = build_load_scenarios(base_url, api_key)
+    unknown = set(scenario_names or []) - set(scenarios)
+    if unknown:
+        raise ValueError(f"Unknown load scenarios: {', '.join(sorted(unknown))}")
+    
+    results = {}
+    for name in scenario_names or scenarios:
+        results[name] = asyncio.run(run_scenario(scenarios[name], rate, duration, concurrency, warmup))
+        if results[name].errors == results[name].sent:
+            logger.warning(f"Every request of {name} failed; is the target running?")
+    return results
+
+
+def generate_bulk_stock_rows(rows):
+    """
+    Generates synthetic stock rows for bulk write benchmarks.
+    
+    Args:
+        rows: Number of rows to generate
+    
+    Returns:
+        list: List of stock column dictionaries
+    """
+    statuses = [BorrowStatus.EASY, BorrowStatus.MEDIUM, BorrowStatus.HARD]
+    return [
+        {
+            'ticker': f"BM{i:06d}",
+            'borrow_status': statuses[i % len(statuses)],
+            'min_borrow_rate': Decimal('0.05') + Decimal(i % 100) / Decimal('100'),
+        }
+        for i in range(rows)
+    ]
+
+
+def benchmark_bulk_upsert(rows, batch_size=DEFAULT_BULK_BATCH_SIZE):
+    """
+    Benchmarks bulk stock upserts, comparing the row-by-row update_or_create
+    path with the set-based INSERT ... ON CONFLICT path.
+    
+    Each strategy runs twice over the same rows (an insert pass and an update
+    pass) inside a transaction that is rolled back, so the database is unchanged.
+    
+    Args:
+        rows: Number of rows to upsert
+        batch_size: Number of rows per batch
+    
+    Returns:
+        dict: Benchmark results keyed by strategy name
+    """
+    logger.info(f"Starting bulk upsert benchmark with {rows} rows")
+    
+    stock_rows = generate_bulk_stock_rows(rows)
+    session_factory = get_session_factory()
+    
+    def row_by_row(session, batch):
+        for row in batch:
+            values = {key: value for key, value in row.items() if key != 'ticker'}
+            update_or_create(session, Stock, {'ticker': row['ticker']}, values)
+        session.flush()
+    
+    def set_based(session, batch):
+        bulk_upsert(session, Stock, batch, key_fields=['ticker'], batch_size=batch_size)
+    
+    results = {}
+    for name, strategy in [('bulk_upsert_row_by_row', row_by_row), ('bulk_upsert_set_based', set_based)]:
+        session = session_factory()
+        execution_times = []
+        total_timer = Timer()
+        total_timer.start()
+        
+        try:
+            # Insert pass followed by update pass over the same keys
+            for _ in range(2):
+                for i in range(0, rows, batch_size):
+                    timer = Timer()
+                    timer.start()
+                    strategy(session, stock_rows[i:i + batch_size])
+                    timer.stop()
+                    execution_times.append(timer.elapsed_ms())
+        finally:
+            total_elapsed = total_timer.stop()
+            session.rollback()
+            session.close()
+        
+        rows_per_second = (2 * rows) / total_elapsed if total_elapsed > 0 else 0
+        results[name] = BenchmarkResult(
+            name=name,
+            execution_times=execution_times,
+            metadata={
+                'rows': rows,
+                'batch_size': batch_size,
+                'total_elapsed_seconds': total_elapsed,
+                'rows_per_second': rows_per_second
+            }
+        )
+        logger.info(f"{name}: {rows_per_second:.0f} rows/sec")
+    
+    return results
+
+
+def benchmark_api_key_lookup(key_counts, iterations=DEFAULT_AUTH_ITERATIONS):
+    """
+    Benchmarks API key authentication latency against the number of stored keys,
+    comparing the legacy bcrypt scan with the indexed digest lookup.
+    
+    For each key count the keys are inserted in an outer transaction that is
+    rolled back; the session commits (including the lazy digest migration) only
+    release savepoints. The key being authenticated is stored last, which is the
+    worst case for the scan. Legacy rows are modelled by a NULL key_digest.
+    
+    Args:
+        key_counts: Numbers of stored keys to benchmark
+        iterations: Authentications per strategy and key count
+    
+    Returns:
+        dict: Benchmark results keyed by strategy and key count
+    """
+    logger.info(f"Starting API key lookup benchmark with key counts {key_counts}")
+    
+    engine = get_engine()
+    client_id = 'benchmark_auth_client'
+    # Hash once and share it across filler rows; every filler still costs one bcrypt verify
+    filler_hash = hash_password(generate_api_key(48))
+    
+    results = {}
+    for key_count in key_counts:
+        for name, with_digest in [('auth_bcrypt_scan', False), ('auth_digest_lookup', True)]:
+            connection = engine.connect()
+            transaction = connection.begin()
+            session = Session(bind=connection, join_transaction_mode="create_savepoint")
+            try:
+                session.add(Broker(
+                    client_id=client_id,
+                    markup_percentage=Decimal('5.0'),
+                    transaction_fee_type=TransactionFeeType.FLAT,
+                    transaction_amount=Decimal('25.0'),
+                    active=True
+                ))
+                for i in range(key_count - 1):
+                    filler_key = generate_api_key(48)
+                    session.add(APIKey(
+                        key_id=f"bm{i:08d}",
+                        client_id=client_id,
+                        hashed_key=filler_hash,
+                        key_digest=compute_api_key_digest(filler_key) if with_digest else None
+                    ))
+                plaintext_key = generate_api_key(48)
+                session.add(APIKey(
+                    key_id='bm_target',
+                    client_id=client_id,
+                    hashed_key=hash_password(plaintext_key),
+                    key_digest=compute_api_key_digest(plaintext_key) if with_digest else None
+                ))
+                session.flush()
+                
+                execution_times = []
+                for _ in range(iterations):
+                    if not with_digest:
+                        # Undo the lazy migration from the previous iteration
+                        session.execute(APIKey.__table__.update().values(key_digest=None))
+                        session.expire_all()
+                    timer = Timer()
+                    timer.start()
+                    found = api_key_crud.get_by_key(session, plaintext_key)
+                    timer.stop()
+                    execution_times.append(timer.elapsed_ms())
+                    if found is None:
+                        raise RuntimeError("Benchmark API key was not found")
+            finally:
+                session.close()
+                transaction.rollback()
+                connection.close()
+            
+            result_name = f"{name}_{key_count}"
+            results[result_name] = BenchmarkResult(
+                name=result_name,
+                execution_times=execution_times,
+                metadata={'key_count': key_count, 'iterations': iterations}
+            )
+            logger.info(f"{result_name}: mean {statistics.mean(execution_times):.1f} ms")
+    
+    return results
+
+
+def build_middleware_benchmark_app(mode):
+    """
+    Builds a FastAPI app with a trivial endpoint behind the requested middleware mode.
+    
+    Args:
+        mode: 'none', 'stacked' or 'fused'
+    
+    Returns:
+        FastAPI: Application to benchmark
+    """
+    app = FastAPI()
+    
+    @app.get(MIDDLEWARE_BENCHMARK_PATH)
+    async def benchmark_endpoint():
+        return {"status": "success"}
+    
+    exempt_paths = get_exempt_paths()
+    if mode == 'stacked':
+        setup_stacked_middleware(app, exempt_paths)
+    elif mode == 'fused':
+        app.add_middleware(FusedRequestMiddleware, exempt_paths=exempt_paths)
+    
+    return app
+
+
+def benchmark_middleware_overhead(iterations):
+    """
+    Benchmarks per-request middleware overhead of the stacked and fused pipelines.
+    
+    Requests are sent in-process through httpx's ASGI transport to an endpoint that
+    does no work. API key resolution and the Redis rate limit counter are replaced by
+    constant-time stand-ins in both modes, so the difference to the bare app is the
+    cost of the middleware itself.
+    
+    Args:
+        iterations: Number of requests per mode
+    
+    Returns:
+        dict: Benchmark results keyed by middleware mode
+    """
+    logger.info(f"Starting middleware overhead benchmark with {iterations} requests per mode")
+    
+    rate_limit_info = {"limit": 1000, "remaining": 999, "reset": 60, "exceeded": False}
+    auth_result = {"client_id": "benchmark_client", "rate_limit": rate_limit_info}
+    
+    async def run_requests(app):
+        execution_times = []
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            headers = {"X-API-Key": "benchmark-key"}
+            for _ in range(min(DEFAULT_WARMUP_ITERATIONS, iterations)):
+                await client.get(MIDDLEWARE_BENCHMARK_PATH, headers=headers)
+            for _ in range(iterations):
+                timer = Timer()
+                timer.start()
+                response = await client.get(MIDDLEWARE_BENCHMARK_PATH, headers=headers)
+                timer.stop()
+                if response.status_code != 200:
+                    raise RuntimeError(f"Benchmark request failed: {response.status_code}")
+                execution_times.append(timer.elapsed_ms())
+        return execution_times
+    
+    results = {}
+    with patch.object(authentication, 'authenticate_request', return_value=auth_result), \
+            patch.object(pipeline, 'authenticate_request', return_value=auth_result), \
+            patch.object(rate_limiting.RateLimitingMiddleware, 'check_rate_limit', return_value=rate_limit_info), \
+            patch.object(rate_limiting.rate_limiter, 'increment_counter', return_value=1):
+        for mode in ['none', 'stacked', 'fused']:
+            execution_times = asyncio.run(run_requests(build_middleware_benchmark_app(mode)))
+            results[f"middleware_{mode}"] = BenchmarkResult(
+                name=f"middleware_{mode}",
+                execution_times=execution_times,
+                metadata={'mode': mode, 'iterations': iterations}
+            )
+    
+    baseline = statistics.mean(results['middleware_none'].execution_times)
+    for mode in ['stacked', 'fused']:
+        overhead = statistics.mean(results[f"middleware_{mode}"].execution_times) - baseline
+        results[f"middleware_{mode}"].metadata['overhead_ms'] = overhead
+        logger.info(f"middleware_{mode}: {overhead:.3f} ms per request over the bare app")
+    
+    return results
+
+
+def benchmark_logging_overhead(iterations):
+    """
+    Benchmarks the caller-side cost of the log records emitted for one request.
+    
+    Each iteration emits what a calculate request logs (API request and response
+    records plus the calculation INFO and DEBUG lines) to os.devnull through three
+    pipelines: synchronous JSON formatting, the background queue with the fast JSON
+    formatter, and the queue with per-logger INFO sampling. The measured time is what
+    the request thread pays; queued records are drained after timing stops.
+    
+    Args:
+        iterations: Number of simulated requests per pipeline
+    
+    Returns:
+        dict: Benchmark results keyed by logging pipeline
+    """
+    logger.info(f"Starting logging overhead benchmark with {iterations} requests per pipeline")
+    
+    def emit_request_logs(api_logger, calc_logger, index):
+        ticker = TEST_TICKERS[index % len(TEST_TICKERS)]
+        log_api_request(api_logger, 'GET', '/api/v1/calculate-locate', {'ticker': ticker}, 'benchmark_client',
+                        f'benchmark-{index}')
+        calc_logger.info("Calculating locate fee for ticker: %s, position_value: %s, loan_days: %s",
+                         ticker, TEST_POSITION_VALUES[0], TEST_LOAN_DAYS[2])
+        calc_logger.info("Calculating borrow rate for %s", ticker)
+        calc_logger.debug("Base borrow cost calculated: %s", Decimal('12.34'))
+        calc_logger.info("Borrow rate calculated for %s: %s", ticker, Decimal('0.05'))
+        calc_logger.info("Locate fee calculation completed for %s: %s", ticker, Decimal('123.45'))
+        log_api_response(api_logger, 'GET', '/api/v1/calculate-locate', 200, 0.004, f'benchmark-{index}')
+    
+    results = {}
+    for mode in ['sync', 'async', 'async_sampled']:
+        with open(os.devnull, 'w') as devnull:
+            handler = logging.StreamHandler(devnull)
+            handler.setFormatter(JsonFormatter() if mode == 'sync' else FastJsonFormatter())
+            listener = None
+            if mode == 'sync':
+                handler.addFilter(CorrelationIdFilter())
+                pipeline_handler = handler
+            else:
+                sample_rate = DEFAULT_LOG_SAMPLE_RATE if mode == 'async_sampled' else 0
+                pipeline_handler, listener = create_queue_handler([handler], sample_rate)
+                listener.start()
+            
+            api_logger = logging.getLogger(f'benchmark.logging.{mode}.api')
+            calc_logger = logging.getLogger(f'benchmark.logging.{mode}.calculation')
+            for bench_logger in (api_logger, calc_logger):
+                bench_logger.handlers = [pipeline_handler]
+                bench_logger.setLevel(logging.INFO)
+                bench_logger.propagate = False
+            
+            try:
+                for index in range(min(DEFAULT_WARMUP_ITERATIONS, iterations)):
+                    emit_request_logs(api_logger, calc_logger, index)
+                
+                execution_times = []
+                for index in range(iterations):
+                    timer = Timer()
+                    timer.start()
+                    emit_request_logs(api_logger, calc_logger, index)
+                    timer.stop()
+                    execution_times.append(timer.elapsed_ms())
+            finally:
+                if listener is not None:
+                    listener.stop()
+                for bench_logger in (api_logger, calc_logger):
+                    bench_logger.handlers = []
+        
+        results[f"logging_{mode}"] = BenchmarkResult(
+            name=f"logging_{mode}",
+            execution_times=execution_times,
+            metadata={'mode': mode, 'iterations': iterations}
+        )
+        logger.info(f"logging_{mode}: {statistics.mean(execution_times) * 1000:.1f} us per request")
+    
+    return results
+
+
+def build_codec_payloads(rows=DEFAULT_CODEC_ROWS):
+    """
+    Builds representative cache values for codec benchmarks.
+    
+    Args:
+        rows: Number of rows in the bulk payload
+    
+    Returns:
+        dict: Wrapped cache values keyed by payload name
+    """
+    as_of = datetime.datetime(2024, 3, 1, 12, 30, tzinfo=datetime.timezone.utc)
+    
+    def rate_row(index):
+        return {
+            'ticker': TEST_TICKERS[index % len(TEST_TICKERS)],
+            'current_rate': Decimal('0.0525') + Decimal(index) / Decimal('10000'),
+            'borrow_status': BorrowStatus.EASY,
+            'volatility_index': Decimal('18.75'),
+            'event_risk_factor': index % 10,
+            'last_updated': as_of,
+        }
+    
+    return {
+        'borrow_rate': wrap_cache_value(Decimal('0.0525')),
+        'rate_response': wrap_cache_value(rate_row(0)),
+        'locate_fee': wrap_cache_value({
+            'ticker': 'GME',
+            'position_value': TEST_POSITION_VALUES[2],
+            'loan_days': TEST_LOAN_DAYS[2],
+            'borrow_rate_used': Decimal('0.1875'),
+            'total_fee': Decimal('1565.33'),
+            'breakdown': {
+                'borrow_cost': Decimal('1541.10'),
+                'markup': Decimal('15.41'),
+                'transaction_fees': Decimal('8.82'),
+            },
+        }),
+        f'rates_{rows}': wrap_cache_value([rate_row(index) for index in range(rows)]),
+    }
+
+
+def to_json_compatible(value):
+    """
+    Converts a value the way callers prepare it for the JSON codec.
+    
+    Decimals, enums and datetimes are stored as strings, as the calculation
+    path does today (see cache_borrow_rate).
+    
+    Args:
+        value: Value to convert
+    
+    Returns:
+        JSON serializable value
+    """
+    if isinstance(value, dict):
+        return {key: to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_compatible(item) for item in value]
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (TransactionFeeType, BorrowStatus)):
+        return value.value
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+def benchmark_cache_codecs(iterations):
+    """
+    Benchmarks encode and decode cost and payload size of the cache codecs.
+    
+    The JSON codec encodes values prepared as callers store them today (Decimals
+    as strings); the msgpack codec encodes the values with their native types.
+    Payload bytes are recorded in each result's metadata.
+    
+    Args:
+        iterations: Number of encode and decode calls per codec and payload
+    
+    Returns:
+        dict: Benchmark results keyed by codec, payload and operation
+    """
+    logger.info(f"Starting cache codec benchmark with {iterations} iterations")
+    
+    key = 'calculation:benchmark'
+    results = {}
+    for codec_name in ['json', 'msgpack']:
+        registry = CacheCodecRegistry(default=codec_name)
+        if codec_name != 'json' and isinstance(registry.get_codec(key), JsonCodec):
+            logger.warning(f"Cache codec {codec_name} unavailable, skipping")
+            continue
+        
+        for payload_name, value in build_codec_payloads().items():
+            if codec_name == 'json':
+                value = to_json_compatible(value)
+            payload = registry.encode(key, value)
+            size = len(payload.encode('utf-8') if isinstance(payload, str) else payload)
+            
+            for _ in range(min(DEFAULT_WARMUP_ITERATIONS, iterations)):
+                registry.decode(registry.encode(key, value))
+            
+            encode_times = []
+            decode_times = []
+            for _ in range(iterations):
+                timer = Timer()
+                timer.start()
+                registry.encode(key, value)
+                timer.stop()
+                encode_times.append(timer.elapsed_ms())
+                
+                timer = Timer()
+                timer.start()
+                registry.decode(payload)
+                timer.stop()
+                decode_times.append(timer.elapsed_ms())
+            
+            for operation, execution_times in (('encode', encode_times), ('decode', decode_times)):
+                name = f"codec_{codec_name}_{payload_name}_{operation}"
+                results[name] = BenchmarkResult(
+                    name=name,
+                    execution_times=execution_times,
+                    metadata={'codec': codec_name, 'payload': payload_name, 'operation': operation,
+                              'payload_bytes': size, 'iterations': iterations}
+                )
+            logger.info(
+                f"codec_{codec_name}_{payload_name}: {size} bytes, "
+                f"encode {statistics.mean(encode_times) * 1000:.1f} us, "
+                f"decode {statistics.mean(decode_times) * 1000:.1f} us"
+            )
+    
+    return results
+
+
 def visualize_results(results, output_path):
     """
     Creates visualizations of benchmark results.
@@ -786,7 +1484,7 @@ def run_all_benchmarks(iterations, concurrency):
     Args:
         iterations: Number of iterations for each benchmark
         concurrency: Level of concurrency for benchmarks
-        
+    
     Returns:
         dict: Combined results from all benchmarks
     """
@@ -839,12 +1537,58 @@ def main():
     if args.type == 'api' or args.type == 'all':
         # Run API benchmarks
         try:
-            results['calculate_endpoint'] = benchmark_calculate_endpoint(args.iterations, args.concurrency)
-            results['rates_endpoint'] = benchmark_rates_endpoint(args.iterations, args.concurrency)
+            results['calculate_endpoint'] = benchmark_calculate_endpoint(
+                args.iterations, args.concurrency, args.base_url, args.api_key
+            )
+            results['rates_endpoint'] = benchmark_rates_endpoint(
+                args.iterations, args.concurrency, args.base_url, args.api_key
+            )
         except Exception as e:
             logger.error(f"Error running API benchmarks: {str(e)}")
             logger.warning("API benchmarks skipped. Make sure the API server is running.")
     
+    if args.type == 'database':
+        # Run bulk write benchmarks (requires a reachable database)
+        results.update(benchmark_bulk_upsert(args.rows))
+    
+    if args.type == 'auth':
+        # Run API key lookup benchmarks (requires a reachable database)
+        results.update(benchmark_api_key_lookup(args.key_counts))
+    
+    if args.type == 'middleware':
+        # Run per-request middleware overhead benchmarks (in-process, no server needed)
+        results.update(benchmark_middleware_overhead(args.iterations))
+    
+    if args.type == 'logging':
+        # Run per-request logging cost benchmarks (in-process, writes to os.devnull)
+        results.update(benchmark_logging_overhead(args.iterations))
+    
+    if args.type == 'codec':
+        # Run cache codec encode/decode and payload size benchmarks (in-process)
+        results.update(benchmark_cache_codecs(args.iterations))
+    
+    if args.type == 'load':
+        # Run open-loop load scenarios, optionally saving or gating against a baseline
+        load_results = benchmark_load(
+            args.scenarios, args.rate, args.duration, args.concurrency, args.warmup_seconds,
+            args.base_url, args.api_key
+        )
+        print_load_results(load_results)
+        
+        if args.save_baseline:
+            save_baseline(load_results, args.save_baseline, {'rate': args.rate, 'duration': args.duration})
+        
+        if args.compare:
+            comparisons = compare_to_baseline(load_results, load_baseline(args.compare), args.alpha, args.tolerance)
+            print_comparisons(comparisons)
+            regressions = [c['scenario'] for c in comparisons if c['regression']]
+            if regressions:
+                logger.error(f"Performance regression detected in: {', '.join(regressions)}")
+                return 1
+        
+        logger.info("Benchmark complete")
+        return 0
+    
     # Export the results
     if args.output == 'console':
         export_results(results, 'console', None)
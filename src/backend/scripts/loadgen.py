@@ -0,0 +1,700 @@
+"""
+Open-loop load generation and latency analysis for the Borrow Rate & Locate Fee Pricing Engine benchmarks.
+
+This module provides the measurement core of the benchmark suite:
+
+- LatencyHistogram: an HDR-style log-linear histogram with a fixed relative precision,
+  constant memory regardless of the number of samples, and exact merging.
+- run_open_loop: an asyncio load generator issuing requests at a constant arrival rate.
+  Each latency is measured from the time the request was *scheduled* to be sent, so
+  queueing behind a slow request is charged to the requests that waited instead of
+  silently lowering the send rate (coordinated omission).
+- Baseline files and compare_to_baseline: machine-readable results and a one-sided
+  Mann-Whitney U test on the recorded histograms to flag statistically significant
+  latency regressions.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import platform
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx  # httpx 0.25.0+
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Version of the baseline file layout
+BASELINE_FORMAT_VERSION = 1
+
+# Histogram configuration: microsecond resolution, 3 significant digits, up to 10 minutes
+DEFAULT_SIGNIFICANT_FIGURES = 3
+HIGHEST_TRACKABLE_US = 600_000_000
+
+# Default load parameters
+DEFAULT_RATE = 50.0
+DEFAULT_DURATION = 30.0
+DEFAULT_MAX_IN_FLIGHT = 256
+DEFAULT_REQUEST_TIMEOUT = 30.0
+
+# Default regression gate: significance level and minimum relative latency increase
+DEFAULT_ALPHA = 0.01
+DEFAULT_TOLERANCE = 0.10
+ERROR_RATE_TOLERANCE = 0.01
+
+# Percentiles reported in summaries and compared against baselines
+SUMMARY_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+GATED_PERCENTILES = (50.0, 99.0)
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+    
+    Values are recorded as integer microseconds. Every value is kept with a relative
+    error below 10^-significant_figures, counts are stored sparsely by bucket index,
+    and two histograms with the same configuration merge by adding counts.
+    """
+    
+    def __init__(self, significant_figures: int = DEFAULT_SIGNIFICANT_FIGURES,
+                 highest_trackable_us: int = HIGHEST_TRACKABLE_US):
+        """
+        Initialize an empty histogram.
+        
+        Args:
+            significant_figures: Decimal digits of precision kept for every value (1-5)
+            highest_trackable_us: Values above this are clamped and counted as saturated
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+        self.significant_figures = significant_figures
+        self.highest_trackable_us = highest_trackable_us
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._sub_bucket_half_count = 1 << (self._sub_bucket_bits - 1)
+        self.counts: Dict[int, int] = {}
+        self.total_count = 0
+        self.saturated = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+        self._sum_us = 0
+        self._sorted_indexes: Optional[List[int]] = None
+    
+    def _index(self, value: int) -> int:
+        bucket = max(0, value.bit_length() - self._sub_bucket_bits)
+        return bucket * self._sub_bucket_half_count + (value >> bucket)
+    
+    def _bucket_bounds(self, index: int) -> Tuple[int, int]:
+        if index < 2 * self._sub_bucket_half_count:
+            return index, 1
+        bucket = index // self._sub_bucket_half_count - 1
+        sub_bucket = index - bucket * self._sub_bucket_half_count
+        return sub_bucket << bucket, 1 << bucket
+    
+    def lowest_equivalent(self, index: int) -> int:
+        """Smallest value counted in a bucket."""
+        return self._bucket_bounds(index)[0]
+    
+    def highest_equivalent(self, index: int) -> int:
+        """Largest value counted in a bucket."""
+        lowest, width = self._bucket_bounds(index)
+        return lowest + width - 1
+    
+    def median_equivalent(self, index: int) -> int:
+        """Representative value of a bucket."""
+        lowest, width = self._bucket_bounds(index)
+        return lowest + width // 2
+    
+    def record(self, value_us: float, count: int = 1) -> None:
+        """
+        Record a latency.
+        
+        Args:
+            value_us: Latency in microseconds (negative values are recorded as 0)
+            count: Number of occurrences to record
+        """
+        value = max(0, int(value_us))
+        if value > self.highest_trackable_us:
+            self.saturated += count
+            value = self.highest_trackable_us
+        index = self._index(value)
+        if index not in self.counts:
+            self._sorted_indexes = None
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += count
+        self._sum_us += value * count
+        if self.min_us is None or value < self.min_us:
+            self.min_us = value
+        if value > self.max_us:
+            self.max_us = value
+    
+    def record_corrected(self, value_us: float, expected_interval_us: float) -> None:
+        """
+        Record a latency from a closed-loop measurement, correcting for coordinated omission.
+        
+        A closed-loop client waiting on a slow response does not send the requests it
+        would have sent in the meantime. Those requests are back-filled with the
+        latencies they would have seen (value - interval, value - 2 * interval, ...).
+        Open-loop measurements from run_open_loop must use record() instead.
+        
+        Args:
+            value_us: Measured latency in microseconds
+            expected_interval_us: Expected interval between requests in microseconds
+        """
+        self.record(value_us)
+        if expected_interval_us <= 0:
+            return
+        missing = value_us - expected_interval_us
+        while missing >= expected_interval_us:
+            self.record(missing)
+            missing -= expected_interval_us
+    
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """
+        Add the counts of another histogram to this one.
+        
+        Args:
+            other: Histogram with the same configuration
+        
+        Returns:
+            LatencyHistogram: This histogram
+        
+        Raises:
+            ValueError: If the histograms have different precision
+        """
+        if other.significant_figures != self.significant_figures:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other.counts.items():
+            if index not in self.counts:
+                self._sorted_indexes = None
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += other.total_count
+        self.saturated += other.saturated
+        self._sum_us += other._sum_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+        return self
+    
+    def sorted_indexes(self) -> List[int]:
+        """Bucket indexes holding samples, in ascending value order."""
+        if self._sorted_indexes is None:
+            self._sorted_indexes = sorted(self.counts)
+        return self._sorted_indexes
+    
+    def percentile(self, percentile: float) -> int:
+        """
+        Get the value at a percentile.
+        
+        Args:
+            percentile: Percentile between 0 and 100
+        
+        Returns:
+            int: Highest value equivalent to the percentile's bucket, in microseconds
+        """
+        if self.total_count == 0:
+            return 0
+        if percentile <= 0:
+            return self.min_us
+        # Round first so that e.g. 99.9% of 20000 is 19980, not 19981
+        target = max(1, math.ceil(round(percentile / 100.0 * self.total_count, 9)))
+        cumulative = 0
+        for index in self.sorted_indexes():
+            cumulative += self.counts[index]
+            if cumulative >= target:
+                return min(self.highest_equivalent(index), self.max_us)
+        return self.max_us
+    
+    def mean(self) -> float:
+        """Mean recorded value in microseconds."""
+        return self._sum_us / self.total_count if self.total_count else 0.0
+    
+    def iter_values_ms(self) -> Iterator[float]:
+        """
+        Iterate over the recorded samples as representative values in milliseconds.
+        
+        Yields:
+            float: One value per recorded sample, in ascending order
+        """
+        for index in self.sorted_indexes():
+            value_ms = self.median_equivalent(index) / 1000.0
+            for _ in range(self.counts[index]):
+                yield value_ms
+    
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the distribution in milliseconds.
+        
+        Returns:
+            Dict[str, float]: Sample count, min, mean, percentiles and max
+        """
+        result = {
+            "count": self.total_count,
+            "min_ms": (self.min_us or 0) / 1000.0,
+            "mean_ms": round(self.mean() / 1000.0, 3),
+        }
+        for percentile in SUMMARY_PERCENTILES:
+            result[f"p{percentile:g}_ms"] = self.percentile(percentile) / 1000.0
+        result["max_ms"] = self.max_us / 1000.0
+        return result
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the histogram for a baseline file.
+        
+        Returns:
+            Dict[str, Any]: Configuration, sparse bucket counts and exact aggregates
+        """
+        return {
+            "significant_figures": self.significant_figures,
+            "highest_trackable_us": self.highest_trackable_us,
+            "counts": {str(index): self.counts[index] for index in self.sorted_indexes()},
+            "total_count": self.total_count,
+            "saturated": self.saturated,
+            "sum_us": self._sum_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """
+        Rebuild a histogram serialized with to_dict.
+        
+        Args:
+            data: Serialized histogram
+        
+        Returns:
+            LatencyHistogram: Histogram with the stored counts
+        """
+        histogram = cls(data["significant_figures"], data["highest_trackable_us"])
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.total_count = data["total_count"]
+        histogram.saturated = data.get("saturated", 0)
+        histogram._sum_us = data["sum_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
+
+
+class LoadResult:
+    """Outcome of one open-loop run of a scenario."""
+    
+    def __init__(self, name: str, target_rate: float, duration: float, latency: LatencyHistogram,
+                 service_time: LatencyHistogram, sent: int, errors: int):
+        """
+        Initialize a load result.
+        
+        Args:
+            name: Scenario name
+            target_rate: Requested arrival rate in requests per second
+            duration: Measured wall-clock duration in seconds
+            latency: Latencies measured from the intended send time
+            service_time: Latencies measured from the actual send time
+            sent: Number of measured requests issued
+            errors: Number of measured requests that failed
+        """
+        self.name = name
+        self.target_rate = target_rate
+        self.duration = duration
+        self.latency = latency
+        self.service_time = service_time
+        self.sent = sent
+        self.errors = errors
+    
+    @property
+    def achieved_rate(self) -> float:
+        """Completed requests per second."""
+        return self.sent / self.duration if self.duration > 0 else 0.0
+    
+    @property
+    def error_rate(self) -> float:
+        """Fraction of measured requests that failed."""
+        return self.errors / self.sent if self.sent else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result to its baseline representation.
+        
+        Returns:
+            Dict[str, Any]: Load parameters, summaries and the latency histogram
+        """
+        return {
+            "target_rate": self.target_rate,
+            "achieved_rate": round(self.achieved_rate, 3),
+            "duration": round(self.duration, 3),
+            "sent": self.sent,
+            "errors": self.errors,
+            "latency": self.latency.summary(),
+            "service_time": self.service_time.summary(),
+            "histogram": self.latency.to_dict(),
+        }
+
+
+class HttpScenario:
+    """Load scenario issuing HTTP requests through a shared httpx.AsyncClient."""
+    
+    def __init__(self, name: str, base_url: str, method: str, paths: List[str],
+                 payloads: Optional[List[Dict[str, Any]]] = None, headers: Optional[Dict[str, str]] = None,
+                 timeout: float = DEFAULT_REQUEST_TIMEOUT):
+        """
+        Initialize the scenario.
+        
+        Args:
+            name: Scenario name
+            base_url: Base URL of the target server
+            method: HTTP method
+            paths: Request paths, used round-robin
+            payloads: Query parameters (GET) or JSON bodies (other methods), used round-robin
+            headers: Headers sent with every request
+            timeout: Request timeout in seconds
+        """
+        self.name = name
+        self.base_url = base_url
+        self.method = method.upper()
+        self.paths = paths
+        self.payloads = payloads or [{}]
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self) -> "HttpScenario":
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=DEFAULT_MAX_IN_FLIGHT, max_keepalive_connections=DEFAULT_MAX_IN_FLIGHT),
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.client.aclose()
+        self.client = None
+    
+    async def call(self, index: int) -> None:
+        """
+        Issue the request for an arrival.
+        
+        Args:
+            index: Sequence number of the arrival
+        
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        path = self.paths[index % len(self.paths)]
+        payload = self.payloads[index % len(self.payloads)]
+        if self.method == "GET":
+            response = await self.client.get(path, params=payload)
+        else:
+            response = await self.client.request(self.method, path, json=payload)
+        response.raise_for_status()
+
+
+class CallableScenario:
+    """Load scenario calling an in-process function, blocking functions in worker threads."""
+    
+    def __init__(self, name: str, func: Callable[..., Any], param_sets: List[Dict[str, Any]]):
+        """
+        Initialize the scenario.
+        
+        Args:
+            name: Scenario name
+            func: Function or coroutine function to call
+            param_sets: Keyword arguments, used round-robin
+        """
+        self.name = name
+        self.func = func
+        self.param_sets = param_sets or [{}]
+        self._is_coroutine = asyncio.iscoroutinefunction(func)
+    
+    async def __aenter__(self) -> "CallableScenario":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+    
+    async def call(self, index: int) -> None:
+        """
+        Call the function for an arrival.
+        
+        Args:
+            index: Sequence number of the arrival
+        """
+        params = self.param_sets[index % len(self.param_sets)]
+        if self._is_coroutine:
+            await self.func(**params)
+        else:
+            await asyncio.to_thread(self.func, **params)
+
+
+async def run_open_loop(
+    name: str,
+    operation: Callable[[int], Awaitable[Any]],
+    rate: float,
+    duration: float,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    warmup: float = 0.0
+) -> LoadResult:
+    """
+    Drive an operation at a constant arrival rate.
+    
+    Arrivals are scheduled at fixed times (start + i / rate) regardless of how long
+    earlier requests take. At most max_in_flight requests run at once; arrivals beyond
+    that wait for a slot, and the wait counts towards their latency because latency is
+    measured from the scheduled time. The service_time histogram records the time from
+    the actual start of the call, to show how much of the latency is queueing.
+    
+    Args:
+        name: Scenario name
+        operation: Coroutine function called with the arrival index
+        rate: Arrival rate in requests per second
+        duration: Seconds of measured load
+        max_in_flight: Maximum concurrent operations
+        warmup: Seconds of load issued first and not measured
+    
+    Returns:
+        LoadResult: Latency histograms and counters for the measured arrivals
+    """
+    if rate <= 0 or duration <= 0:
+        raise ValueError("rate and duration must be positive")
+    
+    latency = LatencyHistogram()
+    service_time = LatencyHistogram()
+    slots = asyncio.Semaphore(max_in_flight)
+    interval = 1.0 / rate
+    warmup_count = int(warmup * rate)
+    total = warmup_count + max(1, int(duration * rate))
+    counters = {"sent": 0, "errors": 0}
+    pending = set()
+    
+    async def issue(index: int, intended: float) -> None:
+        async with slots:
+            started = time.perf_counter()
+            try:
+                await operation(index)
+                failed = False
+            except Exception as e:
+                logger.debug("Request %d of %s failed: %s", index, name, e)
+                failed = True
+            finished = time.perf_counter()
+        if index < warmup_count:
+            return
+        counters["sent"] += 1
+        if failed:
+            counters["errors"] += 1
+        else:
+            latency.record((finished - intended) * 1_000_000)
+            service_time.record((finished - started) * 1_000_000)
+    
+    logger.info(f"Running {name} at {rate:g} req/s for {duration:g}s (warmup {warmup:g}s)")
+    start = time.perf_counter()
+    for index in range(total):
+        intended = start + index * interval
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        elif index % 64 == 0:
+            # Behind schedule: still let issued requests make progress
+            await asyncio.sleep(0)
+        task = asyncio.ensure_future(issue(index, intended))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+    
+    await asyncio.gather(*list(pending))
+    elapsed = time.perf_counter() - (start + warmup_count * interval)
+    
+    result = LoadResult(name, rate, elapsed, latency, service_time, counters["sent"], counters["errors"])
+    if result.achieved_rate < rate * 0.9:
+        logger.warning(f"{name}: achieved {result.achieved_rate:.1f} req/s of {rate:g} req/s; the target is saturated")
+    return result
+
+
+async def run_scenario(scenario: Any, rate: float, duration: float,
+                       max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, warmup: float = 0.0) -> LoadResult:
+    """
+    Set up a scenario and drive it with run_open_loop.
+    
+    Args:
+        scenario: HttpScenario or CallableScenario
+        rate: Arrival rate in requests per second
+        duration: Seconds of measured load
+        max_in_flight: Maximum concurrent operations
+        warmup: Seconds of unmeasured load issued first
+    
+    Returns:
+        LoadResult: Result of the run
+    """
+    async with scenario:
+        return await run_open_loop(scenario.name, scenario.call, rate, duration, max_in_flight, warmup)
+
+
+def save_baseline(results: Dict[str, LoadResult], path: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Write load results as a baseline file.
+    
+    Args:
+        results: Load results keyed by scenario name
+        path: Output file path
+        metadata: Extra information stored with the baseline (e.g. git revision)
+    """
+    baseline = {
+        "version": BASELINE_FORMAT_VERSION,
+        "created_at": datetime.utcnow().isoformat() + "Z",
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "metadata": metadata or {},
+        "scenarios": {name: result.to_dict() for name, result in results.items()},
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+    logger.info(f"Baseline with {len(results)} scenarios saved to {path}")
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """
+    Read a baseline file.
+    
+    Args:
+        path: Baseline file path
+    
+    Returns:
+        Dict[str, Any]: Baseline contents
+    
+    Raises:
+        ValueError: If the file has an unsupported format version
+    """
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported baseline format version: {baseline.get('version')}")
+    return baseline
+
+
+def mann_whitney_greater(current: LatencyHistogram, baseline: LatencyHistogram) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test that current latencies are larger than baseline latencies.
+    
+    Works directly on histogram buckets: samples in the same bucket are treated as ties,
+    which the tie-corrected normal approximation accounts for.
+    
+    Args:
+        current: Latencies of the run under test
+        baseline: Latencies of the baseline run
+    
+    Returns:
+        Tuple[float, float]: Probability that a current sample exceeds a baseline sample
+        (0.5 means no difference), and the p-value
+    """
+    n1, n2 = current.total_count, baseline.total_count
+    if n1 == 0 or n2 == 0:
+        return 0.5, 1.0
+    
+    u_statistic = 0.0
+    baseline_below = 0
+    tie_term = 0
+    for index in sorted(set(current.counts) | set(baseline.counts)):
+        current_count = current.counts.get(index, 0)
+        baseline_count = baseline.counts.get(index, 0)
+        u_statistic += current_count * (baseline_below + 0.5 * baseline_count)
+        baseline_below += baseline_count
+        tied = current_count + baseline_count
+        tie_term += tied ** 3 - tied
+    
+    n = n1 + n2
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u_statistic / (n1 * n2), 1.0
+    z_score = (u_statistic - n1 * n2 / 2.0) / math.sqrt(variance)
+    return u_statistic / (n1 * n2), 0.5 * math.erfc(z_score / math.sqrt(2))
+
+
+def compare_to_baseline(results: Dict[str, LoadResult], baseline: Dict[str, Any], alpha: float = DEFAULT_ALPHA,
+                        tolerance: float = DEFAULT_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    Compare load results with a baseline.
+    
+    A scenario regresses when its latencies are significantly larger than the baseline's
+    (one-sided Mann-Whitney p-value below alpha) and the median or p99 grew by more than
+    the tolerance, or when its error rate grew by more than one percentage point. Both
+    conditions are needed for latency because with thousands of samples tiny, harmless
+    shifts are significant, while large shifts in short noisy runs may not be.
+    
+    Args:
+        results: Load results keyed by scenario name
+        baseline: Baseline loaded with load_baseline
+        alpha: Significance level
+        tolerance: Minimum relative increase of p50 or p99 to count as a regression
+    
+    Returns:
+        List[Dict[str, Any]]: One comparison per scenario present in both, with a 'regression' flag
+    """
+    comparisons = []
+    for name, result in results.items():
+        reference = baseline["scenarios"].get(name)
+        if reference is None:
+            logger.warning(f"Scenario {name} is not in the baseline; skipping comparison")
+            continue
+        
+        baseline_histogram = LatencyHistogram.from_dict(reference["histogram"])
+        effect, p_value = mann_whitney_greater(result.latency, baseline_histogram)
+        
+        changes = {}
+        for percentile in GATED_PERCENTILES:
+            before = baseline_histogram.percentile(percentile)
+            after = result.latency.percentile(percentile)
+            changes[f"p{percentile:g}"] = (after - before) / before if before else 0.0
+        
+        baseline_error_rate = reference["errors"] / reference["sent"] if reference["sent"] else 0.0
+        latency_regression = p_value < alpha and any(change > tolerance for change in changes.values())
+        error_regression = result.error_rate > baseline_error_rate + ERROR_RATE_TOLERANCE
+        
+        comparisons.append({
+            "scenario": name,
+            "p_value": p_value,
+            "effect_size": round(effect, 4),
+            "changes": {key: round(value, 4) for key, value in changes.items()},
+            "error_rate": round(result.error_rate, 4),
+            "baseline_error_rate": round(baseline_error_rate, 4),
+            "regression": latency_regression or error_regression,
+        })
+    return comparisons
+
+
+def print_load_results(results: Dict[str, LoadResult]) -> None:
+    """
+    Print a latency summary table for load results.
+    
+    Args:
+        results: Load results keyed by scenario name
+    """
+    print(f"\n{'scenario':<24}{'rate':>9}{'errors':>8}{'p50':>10}{'p90':>10}{'p99':>10}{'p99.9':>10}{'max':>10}")
+    for name, result in results.items():
+        summary = result.latency.summary()
+        print(
+            f"{name:<24}{result.achieved_rate:>9.1f}{result.errors:>8}"
+            f"{summary['p50_ms']:>10.2f}{summary['p90_ms']:>10.2f}{summary['p99_ms']:>10.2f}"
+            f"{summary['p99.9_ms']:>10.2f}{summary['max_ms']:>10.2f}"
+        )
+    print("(latencies in ms from intended send time)")
+
+
+def print_comparisons(comparisons: List[Dict[str, Any]]) -> None:
+    """
+    Print baseline comparisons.
+    
+    Args:
+        comparisons: Result of compare_to_baseline
+    """
+    print(f"\n{'scenario':<24}{'p50 change':>12}{'p99 change':>12}{'p-value':>12}{'errors':>10}  verdict")
+    for comparison in comparisons:
+        print(
+            f"{comparison['scenario']:<24}{comparison['changes']['p50']:>+12.1%}{comparison['changes']['p99']:>+12.1%}"
+            f"{comparison['p_value']:>12.2g}{comparison['error_rate']:>10.2%}  "
+            f"{'REGRESSION' if comparison['regression'] else 'ok'}"
+        )
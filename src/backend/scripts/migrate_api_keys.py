@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Command-line script for migrating legacy API keys in the Borrow Rate & Locate Fee Pricing Engine.
+
+Keys created before lookup digests existed are only found by a bounded, rate-limited
+bcrypt scan. This script backfills their digests from known plaintext keys and can
+rotate the remaining ones, after which LEGACY_API_KEY_LOOKUP_ENABLED can be set to false.
+"""
+
+import argparse
+import sys
+import logging
+from typing import List
+
+from ..db.crud.api_keys import api_key_crud
+from ..db.session import get_db, init_db
+from ..config.settings import get_settings
+from ..utils.logging import setup_logger
+
+# Set up logger
+logger = setup_logger('scripts.migrate_api_keys', logging.INFO)
+
+def parse_arguments():
+    """
+    Parse command-line arguments for legacy API key migration.
+    
+    Returns:
+        argparse.Namespace: Parsed command-line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Backfill lookup digests for legacy API keys, or rotate the ones whose plaintext is unknown."
+    )
+    
+    parser.add_argument(
+        "--keys-file",
+        type=str,
+        help="File with one known plaintext API key per line"
+    )
+    
+    parser.add_argument(
+        "--from-env",
+        action="store_true",
+        help="Also use the API keys configured through API_KEY_* environment variables"
+    )
+    
+    parser.add_argument(
+        "--rotate",
+        action="store_true",
+        help="Replace and deactivate the legacy keys that remain after the backfill"
+    )
+    
+    return parser.parse_args()
+
+def load_plaintext_keys(keys_file: str, from_env: bool) -> List[str]:
+    """
+    Collect the known plaintext API keys.
+    
+    Args:
+        keys_file: Path of a file with one key per line, or None
+        from_env: Whether to include keys configured in the environment
+    
+    Returns:
+        List[str]: Plaintext API keys
+    """
+    plaintext_keys = []
+    
+    if keys_file:
+        with open(keys_file) as f:
+            plaintext_keys.extend(line.strip() for line in f if line.strip())
+    
+    if from_env:
+        plaintext_keys.extend(get_settings().api_keys)
+    
+    return plaintext_keys
+
+def main():
+    """
+    Main function to execute the script.
+    
+    Returns:
+        int: Exit code (0 for success, 1 for error)
+    """
+    try:
+        # Parse command-line arguments
+        args = parse_arguments()
+        
+        # Initialize database connection
+        init_db()
+        
+        with get_db() as db:
+            print(f"Legacy API keys: {api_key_crud.count_legacy_keys(db)}")
+            
+            # Backfill digests for keys whose plaintext is known
+            plaintext_keys = load_plaintext_keys(args.keys_file, args.from_env)
+            if plaintext_keys:
+                migrated = api_key_crud.migrate_legacy_keys(db, plaintext_keys)
+                print(f"Backfilled digests for {migrated} API keys")
+            
+            # Replace the rest; their clients must be sent the new keys
+            if args.rotate:
+                replacements = api_key_crud.rotate_legacy_keys(db)
+                for db_obj, plaintext_key in replacements:
+                    print(f"Client: {db_obj.client_id}  Key ID: {db_obj.key_id}  API Key: {plaintext_key}")
+                print(f"Rotated {len(replacements)} legacy API keys")
+                
+                if replacements:
+                    print("\nIMPORTANT: Send each client its new API key. The keys cannot be retrieved later.")
+            
+            remaining = api_key_crud.count_legacy_keys(db)
+            print(f"Legacy API keys remaining: {remaining}")
+            if remaining == 0:
+                print("LEGACY_API_KEY_LOOKUP_ENABLED can now be set to false.")
+        
+        return 0
+    
+    except Exception as e:
+        logger.exception(f"Unexpected error: {str(e)}")
+        print(f"Error: {str(e)}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
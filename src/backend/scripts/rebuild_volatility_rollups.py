@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Command-line script for rebuilding volatility rollups in the Borrow Rate & Locate Fee Pricing Engine.
+
+Rollups are kept up to date as volatility points are written, but history written
+before the rollup table existed (or loaded around the CRUD layer) has none. This
+script backfills them from the raw volatility table, one stock and one day at a time.
+Until it has run, range statistics fall back to aggregating the raw table.
+"""
+
+import argparse
+import sys
+import logging
+
+from ..db.crud.volatility_rollup import volatility_rollup
+from ..db.session import get_db, init_db
+from ..utils.logging import setup_logger
+
+# Set up logger
+logger = setup_logger('scripts.rebuild_volatility_rollups', logging.INFO)
+
+def parse_arguments():
+    """
+    Parse command-line arguments for the rollup rebuild.
+    
+    Returns:
+        argparse.Namespace: Parsed command-line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Rebuild the 1m/1h/1d volatility rollups from the raw volatility history."
+    )
+    
+    parser.add_argument(
+        "--ticker",
+        action="append",
+        dest="tickers",
+        help="Stock to rebuild (repeatable; default: every stock with volatility history)"
+    )
+    
+    return parser.parse_args()
+
+def main():
+    """
+    Main function to execute the script.
+    
+    Returns:
+        int: Exit code (0 for success, 1 for error)
+    """
+    try:
+        # Parse command-line arguments
+        args = parse_arguments()
+        
+        # Initialize database connection
+        init_db()
+        
+        with get_db() as db:
+            tickers = [ticker.upper() for ticker in args.tickers] if args.tickers else volatility_rollup.get_stock_ids(db)
+            
+            total = 0
+            for ticker in tickers:
+                written = volatility_rollup.rebuild_for_stock(db, ticker)
+                print(f"{ticker}: {written} rollup buckets")
+                total += written
+            
+            print(f"Rebuilt {total} rollup buckets for {len(tickers)} stocks")
+        
+        return 0
+    
+    except Exception as e:
+        logger.exception(f"Unexpected error: {str(e)}")
+        print(f"Error: {str(e)}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
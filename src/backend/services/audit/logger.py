@@ -10,12 +10,13 @@ import logging
 from datetime import datetime
 import uuid
 from decimal import Decimal
-from typing import List, Dict, Optional, Any, Union
+from typing import List, Dict, Optional, Any, Union, Tuple
 
 from sqlalchemy.orm import Session  # sqlalchemy 2.0.0+
+from sqlalchemy.ext.asyncio import AsyncSession  # sqlalchemy 2.0.0+
 
 # Import from internal modules
-from ...db.crud.audit import audit
+from ...db.crud.audit import audit, async_audit
 from ...schemas.audit import AuditLogSchema, AuditLogFilterSchema, AuditLogResponseSchema
 from .utils import (
     format_decimal_for_audit,
@@ -26,6 +27,7 @@ from .utils import (
     get_data_source_names
 )
 from ...core.logging import get_audit_logger, log_calculation, log_fallback_usage, log_error
+from ...utils.timing import timed, async_timed
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -81,17 +83,18 @@ def format_calculation_for_audit(
 class AuditLogger:
     """Service for logging audit events and storing them in the database."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Optional[Session] = None):
         """
         Initialize the audit logger with a database session.
         
         Args:
-            db: Database session for storing audit logs
+            db: Database session for storing audit logs, None if only the async methods are used
         """
         self._db = db
         self._logger = get_audit_logger()
         self._logger.info("Audit service initialized")
     
+    @timed(stage='audit_write')
     def log_calculation(
         self,
         ticker: str,
@@ -125,6 +128,99 @@ class AuditLogger:
         Returns:
             AuditLogSchema: Created audit log record
         """
+        audit_log, formatted_calc, source_names = self._build_calculation_audit_log(
+            ticker, position_value, loan_days, client_id, borrow_rate, total_fee,
+            breakdown, data_sources, request_id, user_agent, ip_address
+        )
+        
+        # Create audit log record in database
+        try:
+            audit.create_audit_log(self._db, audit_log)
+        except Exception as e:
+            self._logger.error(
+                f"Failed to create audit log record: {str(e)}",
+                exc_info=True,
+                extra={"ticker": ticker, "client_id": client_id}
+            )
+            # Still return the audit log even if database storage failed
+            return audit_log
+        
+        self._log_calculation_event(ticker, loan_days, client_id, formatted_calc, source_names, data_sources)
+        return audit_log
+    
+    @async_timed(stage='audit_write')
+    async def log_calculation_async(
+        self,
+        async_db: AsyncSession,
+        ticker: str,
+        position_value: Union[Decimal, float],
+        loan_days: int,
+        client_id: str,
+        borrow_rate: Union[Decimal, float],
+        total_fee: Union[Decimal, float],
+        breakdown: Dict[str, Any],
+        data_sources: List[Dict[str, Any]],
+        request_id: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None
+    ) -> AuditLogSchema:
+        """
+        Log a fee calculation through an async database session.
+        
+        Same behaviour as log_calculation, for use from async request handlers
+        so storing the audit record does not block the event loop.
+        
+        Args:
+            async_db: Async database session used to store the record
+            ticker: Stock symbol
+            position_value: Position value in USD
+            loan_days: Loan duration in days
+            client_id: Client identifier
+            borrow_rate: Applied borrow rate
+            total_fee: Total calculated fee
+            breakdown: Detailed fee breakdown
+            data_sources: Sources of data used in calculation
+            request_id: Identifier for the API request
+            user_agent: User agent of the client making the request
+            ip_address: IP address of the client
+            
+        Returns:
+            AuditLogSchema: Created audit log record
+        """
+        audit_log, formatted_calc, source_names = self._build_calculation_audit_log(
+            ticker, position_value, loan_days, client_id, borrow_rate, total_fee,
+            breakdown, data_sources, request_id, user_agent, ip_address
+        )
+        
+        # Create audit log record in database
+        try:
+            await async_audit.create_audit_log(async_db, audit_log)
+        except Exception as e:
+            self._logger.error(
+                f"Failed to create audit log record: {str(e)}",
+                exc_info=True,
+                extra={"ticker": ticker, "client_id": client_id}
+            )
+            # Still return the audit log even if database storage failed
+            return audit_log
+        
+        self._log_calculation_event(ticker, loan_days, client_id, formatted_calc, source_names, data_sources)
+        return audit_log
+    
+    def _build_calculation_audit_log(
+        self,
+        ticker: str,
+        position_value: Union[Decimal, float],
+        loan_days: int,
+        client_id: str,
+        borrow_rate: Union[Decimal, float],
+        total_fee: Union[Decimal, float],
+        breakdown: Dict[str, Any],
+        data_sources: List[Dict[str, Any]],
+        request_id: Optional[str],
+        user_agent: Optional[str],
+        ip_address: Optional[str]
+    ) -> Tuple[AuditLogSchema, Dict[str, Any], Dict[str, str]]:
         # Format calculation data with consistent precision
         formatted_calc = format_calculation_for_audit(
             position_value, borrow_rate, total_fee, breakdown
@@ -155,18 +251,17 @@ class AuditLogger:
         if ip_address:
             audit_log.ip_address = ip_address
         
-        # Create audit log record in database
-        try:
-            db_audit_log = audit.create_audit_log(self._db, audit_log)
-        except Exception as e:
-            self._logger.error(
-                f"Failed to create audit log record: {str(e)}",
-                exc_info=True,
-                extra={"ticker": ticker, "client_id": client_id}
-            )
-            # Still return the audit log even if database storage failed
-            return audit_log
-        
+        return audit_log, formatted_calc, source_names
+    
+    def _log_calculation_event(
+        self,
+        ticker: str,
+        loan_days: int,
+        client_id: str,
+        formatted_calc: Dict[str, Any],
+        source_names: Dict[str, str],
+        data_sources: List[Dict[str, Any]]
+    ) -> None:
         # Log the calculation event
         log_calculation(
             self._logger,
@@ -186,8 +281,6 @@ class AuditLogger:
                 f"Fallback mechanisms were used in calculation for {ticker} - Client: {client_id}",
                 extra={"ticker": ticker, "client_id": client_id}
             )
-        
-        return audit_log
     
     def log_fallback_event(
         self,
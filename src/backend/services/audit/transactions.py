@@ -6,8 +6,11 @@ fee calculation transactions to support regulatory compliance, business intellig
 and troubleshooting.
 """
 
+import copy
 import logging
 import datetime
+import threading
+import time
 import uuid
 from decimal import Decimal
 from typing import List, Dict, Optional, Any, Union, Tuple
@@ -16,7 +19,7 @@ import pandas as pd
 import numpy as np
 from sqlalchemy.orm import Session
 
-from ...db.crud.audit import audit
+from ...db.crud.audit import audit, AMOUNT_SCALE, RATE_SCALE
 from ...schemas.audit import (
     AuditLogSchema,
     AuditLogFilterSchema, 
@@ -27,11 +30,33 @@ from .utils import (
     has_fallback_source,
     get_data_source_names
 )
+from ..cache import get_redis_cache
+from ..cache.utils import generate_cache_key
 from ...core.logging import get_audit_logger
 
 # Set up module logger
 logger = logging.getLogger(__name__)
 
+# Day names indexed by numpy weekday number (0 = Monday)
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Percentiles reported for position value distributions
+ACTIVITY_PERCENTILES = [50, 90, 95, 99]
+
+# Seconds an activity analysis stays cached for a given (entity, period)
+ACTIVITY_CACHE_TTL = 300
+
+# Seconds an invalidation token stays in Redis; longer than any entry it guards
+ACTIVITY_TOKEN_TTL = 2 * ACTIVITY_CACHE_TTL
+
+# Key type of the shared invalidation tokens of activity analyses
+ACTIVITY_TOKEN_PREFIX = 'activity_token'
+
+# Process-local cache of activity analyses keyed by (kind, entity, start_date, end_date),
+# holding (cached_at, invalidation token, analysis)
+_activity_cache: Dict[Tuple, Tuple[float, str, Dict[str, Any]]] = {}
+_activity_cache_lock = threading.Lock()
+
 
 def calculate_fee_statistics(audit_logs: List[AuditLogSchema]) -> Dict[str, Any]:
     """
@@ -514,6 +539,179 @@ def compare_report_data(current_report: Dict[str, Any], previous_report: Dict[st
     return comparison
 
 
+def get_activity_token(cache_key: Tuple) -> str:
+    """
+    Get the shared invalidation token of an activity analysis's client or ticker.
+    
+    Every process sees the same token, and invalidate_activity_cache replaces it, so
+    analyses cached by other processes become stale once their token changes. Read
+    it before loading the data to be cached.
+    
+    Args:
+        cache_key: Tuple of (kind, entity, start_date, end_date)
+        
+    Returns:
+        Current token, or an empty string if none is set or Redis is unavailable
+    """
+    try:
+        return get_redis_cache().get(generate_cache_key(ACTIVITY_TOKEN_PREFIX, *cache_key[:2])) or ""
+    except Exception as e:
+        logger.warning(f"Failed to read activity invalidation token: {str(e)}")
+        return ""
+
+
+def get_cached_activity(cache_key: Tuple, token: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Get a cached activity analysis if it is still fresh and not invalidated.
+    
+    Args:
+        cache_key: Tuple of (kind, entity, start_date, end_date)
+        token: Current invalidation token from get_activity_token (default: read it)
+        
+    Returns:
+        Copy of the cached analysis, or None if missing, expired or invalidated
+    """
+    with _activity_cache_lock:
+        entry = _activity_cache.get(cache_key)
+    if entry is None:
+        return None
+    
+    if token is None:
+        token = get_activity_token(cache_key)
+    
+    cached_at, cached_token, analysis = entry
+    if time.monotonic() - cached_at > ACTIVITY_CACHE_TTL or cached_token != token:
+        with _activity_cache_lock:
+            if _activity_cache.get(cache_key) is entry:
+                del _activity_cache[cache_key]
+        return None
+    
+    return copy.deepcopy(analysis)
+
+
+def cache_activity(cache_key: Tuple, analysis: Dict[str, Any], token: Optional[str] = None) -> None:
+    """
+    Store an activity analysis for a given (kind, entity, period) key.
+    
+    Args:
+        cache_key: Tuple of (kind, entity, start_date, end_date)
+        analysis: Analysis result to cache
+        token: Invalidation token read before the analysed data was loaded (default: the current one)
+    """
+    if token is None:
+        token = get_activity_token(cache_key)
+    with _activity_cache_lock:
+        _activity_cache[cache_key] = (time.monotonic(), token, copy.deepcopy(analysis))
+
+
+def invalidate_activity_cache(client_id: Optional[str] = None, ticker: Optional[str] = None) -> None:
+    """
+    Remove cached activity analyses for a client and a ticker across all periods.
+    
+    Drops this process's entries and replaces the shared invalidation tokens, so
+    the entries of every other process are dropped on their next read.
+    
+    Args:
+        client_id: Client whose analyses should be dropped
+        ticker: Ticker whose analyses should be dropped
+    """
+    stale = {(kind, entity) for kind, entity in [("client", client_id), ("ticker", ticker)] if entity is not None}
+    with _activity_cache_lock:
+        for cache_key in [key for key in _activity_cache if key[:2] in stale]:
+            del _activity_cache[cache_key]
+    
+    tokens = {generate_cache_key(ACTIVITY_TOKEN_PREFIX, kind, entity): uuid.uuid4().hex for kind, entity in stale}
+    if not tokens:
+        return
+    try:
+        get_redis_cache().set_many(tokens, ACTIVITY_TOKEN_TTL)
+    except Exception as e:
+        logger.warning(f"Failed to publish activity invalidation: {str(e)}")
+
+
+def clear_activity_cache() -> None:
+    """Remove all cached activity analyses."""
+    with _activity_cache_lock:
+        _activity_cache.clear()
+
+
+def scaled_to_decimal(value: Union[int, np.integer], scale: int) -> Decimal:
+    """
+    Convert an integer fixed-point aggregate back to a Decimal.
+    
+    Args:
+        value: Scaled integer value
+        scale: Scale the value was multiplied by
+        
+    Returns:
+        Decimal value
+    """
+    return Decimal(int(value)) / Decimal(scale)
+
+
+def group_sums(keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized group-by computing counts and exact integer sums per key.
+    
+    Args:
+        keys: Array of group keys
+        values: Array of int64 values aligned with keys
+        
+    Returns:
+        Tuple of (unique keys, counts per key, sums per key)
+    """
+    unique_keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    sums = np.zeros(len(unique_keys), dtype=np.int64)
+    np.add.at(sums, inverse, values)
+    return unique_keys, counts, sums
+
+
+def calculate_time_histograms(timestamps: np.ndarray) -> Dict[str, Dict[Any, int]]:
+    """
+    Build day-of-week and hour-of-day histograms from a datetime64 array.
+    
+    Args:
+        timestamps: Array of datetime64 timestamps
+        
+    Returns:
+        Dictionary with day_distribution (day name -> count) and hour_distribution (hour -> count)
+    """
+    days = timestamps.astype("datetime64[D]")
+    # 1970-01-01 was a Thursday, so shift by 3 to make Monday 0
+    weekdays = (days.astype(np.int64) + 3) % 7
+    hours = (timestamps.astype("datetime64[h]") - days).astype(np.int64)
+    
+    day_counts = np.bincount(weekdays, minlength=7)
+    hour_counts = np.bincount(hours, minlength=24)
+    
+    return {
+        "day_distribution": {
+            WEEKDAY_NAMES[day]: int(day_counts[day]) for day in np.flatnonzero(day_counts)
+        },
+        "hour_distribution": {
+            int(hour): int(hour_counts[hour]) for hour in np.flatnonzero(hour_counts)
+        }
+    }
+
+
+def calculate_percentiles(values: np.ndarray, scale: int) -> Dict[str, Decimal]:
+    """
+    Compute ACTIVITY_PERCENTILES of a scaled integer array in one vectorized pass.
+    
+    Args:
+        values: Array of scaled integer values
+        scale: Scale the values were multiplied by
+        
+    Returns:
+        Dictionary mapping percentile labels (p50, p90, ...) to values
+    """
+    points = np.percentile(values, ACTIVITY_PERCENTILES)
+    return {
+        f"p{percentile}": format_decimal_for_audit(Decimal(str(point)) / Decimal(scale))
+        for percentile, point in zip(ACTIVITY_PERCENTILES, points)
+    }
+
+
 class TransactionAuditor:
     """Service for auditing, analyzing, and reporting on fee calculation transactions."""
     
@@ -805,6 +1003,10 @@ class TransactionAuditor:
         """
         Analyze transaction patterns for a specific client.
         
+        Loads the client's transactions as typed columns in a single query and computes
+        all aggregates with vectorized NumPy operations. Results are cached per
+        (client, period) for ACTIVITY_CACHE_TTL seconds.
+        
         Args:
             client_id: Client identifier
             start_date: Start date for analysis period
@@ -813,10 +1015,19 @@ class TransactionAuditor:
         Returns:
             Analysis of client transaction patterns
         """
-        # Get client transactions
-        transactions = self.get_client_transactions(client_id, start_date, end_date)
+        cache_key = ("client", client_id, start_date, end_date)
+        token = get_activity_token(cache_key)
+        cached = get_cached_activity(cache_key, token)
+        if cached is not None:
+            return cached
         
-        if not transactions:
+        # Load the analysed columns as arrays
+        columns = audit.get_activity_columns(
+            self._db, client_id=client_id, start_date=start_date, end_date=end_date
+        )
+        transaction_count = len(columns["timestamp"])
+        
+        if not transaction_count:
             return {
                 "client_id": client_id,
                 "transaction_count": 0,
@@ -824,50 +1035,33 @@ class TransactionAuditor:
                 "has_activity": False
             }
         
-        # Convert to DataFrame for analysis
-        df = pd.DataFrame([
-            {
-                "ticker": t.ticker,
-                "timestamp": t.timestamp,
-                "position_value": t.position_value,
-                "loan_days": t.loan_days,
-                "borrow_rate": t.borrow_rate_used,
-                "total_fee": t.total_fee,
-                "day_of_week": t.timestamp.strftime("%A"),
-                "hour_of_day": t.timestamp.hour
-            }
-            for t in transactions
-        ])
+        positions = columns["position_value"]
+        rates = columns["borrow_rate"]
+        loan_days = columns["loan_days"]
         
-        # Calculate overall metrics
-        transaction_count = len(transactions)
-        transaction_volume = format_decimal_for_audit(sum(t.position_value for t in transactions))
+        # Calculate overall metrics from exact integer sums
+        transaction_volume = format_decimal_for_audit(scaled_to_decimal(positions.sum(), AMOUNT_SCALE))
         avg_transaction_size = format_decimal_for_audit(transaction_volume / transaction_count)
-        avg_borrow_rate = format_decimal_for_audit(sum(t.borrow_rate_used for t in transactions) / transaction_count)
+        avg_borrow_rate = format_decimal_for_audit(scaled_to_decimal(rates.sum(), RATE_SCALE) / transaction_count)
         
         # Identify frequently traded tickers
-        ticker_counts = df["ticker"].value_counts().to_dict()
-        ticker_volumes = df.groupby("ticker")["position_value"].sum().to_dict()
-        ticker_rates = df.groupby("ticker")["borrow_rate"].mean().to_dict()
+        tickers, ticker_counts, ticker_volumes = group_sums(columns["ticker"], positions)
+        _, _, ticker_rate_sums = group_sums(columns["ticker"], rates)
         
         top_tickers = [
             {
-                "ticker": ticker,
-                "count": count,
-                "volume": format_decimal_for_audit(ticker_volumes.get(ticker, Decimal('0'))),
-                "average_rate": format_decimal_for_audit(ticker_rates.get(ticker, Decimal('0')))
+                "ticker": str(tickers[i]),
+                "count": int(ticker_counts[i]),
+                "volume": format_decimal_for_audit(scaled_to_decimal(ticker_volumes[i], AMOUNT_SCALE)),
+                "average_rate": format_decimal_for_audit(
+                    scaled_to_decimal(ticker_rate_sums[i], RATE_SCALE) / int(ticker_counts[i])
+                )
             }
-            for ticker, count in sorted(ticker_counts.items(), key=lambda x: x[1], reverse=True)
-        ][:10]  # Top 10 tickers
-        
-        # Analyze time patterns
-        day_distribution = df["day_of_week"].value_counts().to_dict()
-        hour_distribution = df["hour_of_day"].value_counts().to_dict()
+            for i in np.argsort(-ticker_counts, kind="stable")[:10]  # Top 10 tickers
+        ]
         
         # Calculate loan duration patterns
-        loan_days_avg = format_decimal_for_audit(df["loan_days"].mean())
-        loan_days_median = int(df["loan_days"].median())
-        loan_days_distribution = df["loan_days"].value_counts().to_dict()
+        loan_day_values, loan_day_counts = np.unique(loan_days, return_counts=True)
         
         # Compile analysis
         analysis = {
@@ -878,17 +1072,18 @@ class TransactionAuditor:
             "average_transaction_size": avg_transaction_size,
             "average_borrow_rate": avg_borrow_rate,
             "top_tickers": top_tickers,
-            "time_patterns": {
-                "day_distribution": day_distribution,
-                "hour_distribution": hour_distribution
-            },
+            "time_patterns": calculate_time_histograms(columns["timestamp"]),
+            "position_percentiles": calculate_percentiles(positions, AMOUNT_SCALE),
             "loan_duration": {
-                "average_days": loan_days_avg,
-                "median_days": loan_days_median,
-                "distribution": loan_days_distribution
+                "average_days": format_decimal_for_audit(loan_days.mean()),
+                "median_days": int(np.median(loan_days)),
+                "distribution": {
+                    int(days): int(count) for days, count in zip(loan_day_values, loan_day_counts)
+                }
             }
         }
         
+        cache_activity(cache_key, analysis, token)
         return analysis
     
     def analyze_ticker_activity(self, ticker: str, start_date: Optional[datetime.date] = None,
@@ -896,6 +1091,10 @@ class TransactionAuditor:
         """
         Analyze transaction patterns for a specific ticker.
         
+        Loads the ticker's transactions as typed columns in a single query and computes
+        all aggregates with vectorized NumPy operations. Results are cached per
+        (ticker, period) for ACTIVITY_CACHE_TTL seconds.
+        
         Args:
             ticker: Stock symbol
             start_date: Start date for analysis period
@@ -904,10 +1103,19 @@ class TransactionAuditor:
         Returns:
             Analysis of ticker transaction patterns
         """
-        # Get ticker transactions
-        transactions = self.get_ticker_transactions(ticker, start_date, end_date)
+        cache_key = ("ticker", ticker, start_date, end_date)
+        token = get_activity_token(cache_key)
+        cached = get_cached_activity(cache_key, token)
+        if cached is not None:
+            return cached
+        
+        # Load the analysed columns as arrays
+        columns = audit.get_activity_columns(
+            self._db, ticker=ticker, start_date=start_date, end_date=end_date
+        )
+        transaction_count = len(columns["timestamp"])
         
-        if not transactions:
+        if not transaction_count:
             return {
                 "ticker": ticker,
                 "transaction_count": 0,
@@ -915,62 +1123,48 @@ class TransactionAuditor:
                 "has_activity": False
             }
         
-        # Convert to DataFrame for analysis
-        df = pd.DataFrame([
-            {
-                "client_id": t.client_id,
-                "timestamp": t.timestamp,
-                "position_value": t.position_value,
-                "loan_days": t.loan_days,
-                "borrow_rate": t.borrow_rate_used,
-                "total_fee": t.total_fee,
-                "date": t.timestamp.date(),
-                "has_fallback": has_fallback_source(t.data_sources)
-            }
-            for t in transactions
-        ])
+        positions = columns["position_value"]
+        rates = columns["borrow_rate"]
+        has_fallback = columns["has_fallback"]
         
-        # Calculate overall metrics
-        transaction_count = len(transactions)
-        transaction_volume = format_decimal_for_audit(sum(t.position_value for t in transactions))
+        # Calculate overall metrics from exact integer sums
+        transaction_volume = format_decimal_for_audit(scaled_to_decimal(positions.sum(), AMOUNT_SCALE))
         avg_transaction_size = format_decimal_for_audit(transaction_volume / transaction_count)
-        avg_borrow_rate = format_decimal_for_audit(sum(t.borrow_rate_used for t in transactions) / transaction_count)
+        avg_borrow_rate = format_decimal_for_audit(scaled_to_decimal(rates.sum(), RATE_SCALE) / transaction_count)
         
         # Identify clients trading this ticker
-        client_counts = df["client_id"].value_counts().to_dict()
-        client_volumes = df.groupby("client_id")["position_value"].sum().to_dict()
+        clients, client_counts, client_volumes = group_sums(columns["client_id"], positions)
         
         top_clients = [
             {
-                "client_id": client_id,
-                "count": count,
-                "volume": format_decimal_for_audit(client_volumes.get(client_id, Decimal('0')))
+                "client_id": str(clients[i]),
+                "count": int(client_counts[i]),
+                "volume": format_decimal_for_audit(scaled_to_decimal(client_volumes[i], AMOUNT_SCALE))
             }
-            for client_id, count in sorted(client_counts.items(), key=lambda x: x[1], reverse=True)
-        ][:10]  # Top 10 clients
-        
-        # Analyze borrow rate trends over time
-        rate_trend = []
-        if len(df) > 0:
-            date_rates = df.groupby("date")["borrow_rate"].mean().to_dict()
-            rate_trend = [
-                {
-                    "date": date.isoformat(),
-                    "rate": format_decimal_for_audit(rate)
-                }
-                for date, rate in sorted(date_rates.items())
-            ]
+            for i in np.argsort(-client_counts, kind="stable")[:10]  # Top 10 clients
+        ]
+        
+        # Analyze borrow rate trends over time (unique dates come back sorted)
+        dates, date_counts, date_rate_sums = group_sums(columns["timestamp"].astype("datetime64[D]"), rates)
+        rate_trend = [
+            {
+                "date": str(day),
+                "rate": format_decimal_for_audit(scaled_to_decimal(rate_sum, RATE_SCALE) / int(count))
+            }
+            for day, count, rate_sum in zip(dates, date_counts, date_rate_sums)
+        ]
         
         # Analyze fallback usage
-        fallback_count = df["has_fallback"].sum()
-        fallback_percentage = format_decimal_for_audit((fallback_count / transaction_count) * 100)
+        fallback_count = int(has_fallback.sum())
+        fallback_percentage = format_decimal_for_audit(Decimal(fallback_count * 100) / transaction_count)
         
         if fallback_count > 0:
-            fallback_rates = df[df["has_fallback"]]["borrow_rate"].tolist()
-            normal_rates = df[~df["has_fallback"]]["borrow_rate"].tolist()
-            
-            avg_fallback_rate = (sum(fallback_rates) / len(fallback_rates)) if fallback_rates else Decimal('0')
-            avg_normal_rate = (sum(normal_rates) / len(normal_rates)) if normal_rates else Decimal('0')
+            normal_count = transaction_count - fallback_count
+            avg_fallback_rate = scaled_to_decimal(rates[has_fallback].sum(), RATE_SCALE) / fallback_count
+            avg_normal_rate = (
+                scaled_to_decimal(rates[~has_fallback].sum(), RATE_SCALE) / normal_count
+                if normal_count else Decimal('0')
+            )
             
             rate_difference = format_decimal_for_audit(avg_fallback_rate - avg_normal_rate)
         else:
@@ -986,11 +1180,13 @@ class TransactionAuditor:
             "average_borrow_rate": avg_borrow_rate,
             "top_clients": top_clients,
             "rate_trend": rate_trend,
+            "position_percentiles": calculate_percentiles(positions, AMOUNT_SCALE),
             "fallback_analysis": {
-                "fallback_count": int(fallback_count),
+                "fallback_count": fallback_count,
                 "fallback_percentage": fallback_percentage,
                 "rate_difference": rate_difference
             }
         }
         
-        return analysis
\ No newline at end of file
+        cache_activity(cache_key, analysis, token)
+        return analysis
@@ -5,6 +5,7 @@ This module exports cache implementations, strategies, and utility functions to
 of frequently accessed data such as borrow rates, volatility metrics, and broker configurations.
 """
 
+import time
 from typing import Any, Optional
 
 # Import utility functions
@@ -14,18 +15,39 @@ from .utils import (
     get_volatility_key,
     get_event_risk_key,
     get_broker_config_key,
-    get_ttl_for_data_type
+    get_ttl_for_data_type,
+    get_cache_namespace,
+    get_ticker_tag,
+    CACHE_NAMESPACES
+)
+
+# Import cache value codecs
+from .codecs import (
+    CacheCodec,
+    CacheCodecRegistry,
+    JsonCodec,
+    MsgpackCodec,
+    register_enum,
+    DEFAULT_CODEC,
+    DEFAULT_COMPRESSION_THRESHOLD
 )
 
 # Import cache implementations
 from .redis import RedisCache
 from .local import LocalCache
 
+# Import the shared-memory rate table
+from .shared_rates import SharedRateTable, SharedRateRefresher
+
+# Import the ticker universe filter
+from .ticker_filter import TickerUniverseFilter
+
 # Import cache strategies
 from .strategies import (
     CacheStrategy,
     SingleCacheStrategy,
     TieredCacheStrategy,
+    NearCacheStrategy,
     NullCacheStrategy,
     get_ttl_for_key_type
 )
@@ -37,10 +59,30 @@ from ...core.logging import get_logger
 # Initialize logger
 logger = get_logger(__name__)
 
+# Seconds between Redis probes while running on the local-only strategy
+REDIS_REPROBE_SECONDS = 30
+
 # Singleton instances
 _redis_cache = None
 _local_cache = None
 _cache_strategy = None
+_redis_probed_at = None
+_shared_rate_table = None
+_ticker_filter = None
+
+def get_cache_codecs() -> CacheCodecRegistry:
+    """
+    Creates the cache codec registry configured in application settings.
+    
+    Returns:
+        CacheCodecRegistry: Codec selection per key type
+    """
+    codec_settings = get_settings().cache_codecs
+    return CacheCodecRegistry(
+        default=codec_settings.get("default", DEFAULT_CODEC),
+        codecs_by_type=codec_settings.get("types"),
+        compression_threshold=codec_settings.get("compression_threshold", DEFAULT_COMPRESSION_THRESHOLD)
+    )
 
 def get_redis_cache() -> RedisCache:
     """
@@ -78,7 +120,8 @@ def get_redis_cache() -> RedisCache:
                 host=host,
                 port=port,
                 password=password,
-                db=db
+                db=db,
+                codecs=get_cache_codecs()
             )
             
             logger.info(f"Initialized Redis cache connection to {host}:{port} (db: {db})")
@@ -88,7 +131,8 @@ def get_redis_cache() -> RedisCache:
                 host="localhost",
                 port=6379,
                 password=None,
-                db=0
+                db=0,
+                codecs=get_cache_codecs()
             )
     
     return _redis_cache
@@ -111,10 +155,20 @@ def get_cache_strategy() -> CacheStrategy:
     """
     Returns the configured cache strategy based on application settings.
     
+    If Redis was unavailable when the strategy was created, Redis is probed again every
+    REDIS_REPROBE_SECONDS and the strategy is rebuilt once it is reachable.
+    
     Returns:
         CacheStrategy: Configured cache strategy instance
     """
-    global _cache_strategy
+    global _cache_strategy, _redis_probed_at
+    
+    if _redis_probed_at is not None and time.monotonic() - _redis_probed_at >= REDIS_REPROBE_SECONDS:
+        # Running degraded; switch back to Redis as soon as it answers
+        _redis_probed_at = time.monotonic()
+        if get_redis_cache().is_connected():
+            logger.info("Redis available again, recreating cache strategy")
+            _cache_strategy = None
     
     if _cache_strategy is None:
         # Get settings to determine cache configuration
@@ -128,16 +182,31 @@ def get_cache_strategy() -> CacheStrategy:
         redis_connected = redis_cache.is_connected()
         
         if redis_connected:
+            _redis_probed_at = None
+            
             # Use tiered strategy with Redis as primary and local as secondary
             logger.info("Using TieredCacheStrategy with Redis and local cache")
             _cache_strategy = TieredCacheStrategy(
                 primary_cache=redis_cache,
                 secondary_cache=local_cache
             )
+            
+            near_cache_settings = settings.near_cache
+            if near_cache_settings.get("enabled"):
+                # Serve hot key types from process memory, kept coherent over pub/sub
+                logger.info("Wrapping cache strategy in NearCacheStrategy")
+                _cache_strategy = NearCacheStrategy(
+                    inner=_cache_strategy,
+                    redis_cache=redis_cache,
+                    key_types=near_cache_settings["key_types"],
+                    max_ttl=near_cache_settings["max_ttl"],
+                    max_entries=near_cache_settings["max_entries"]
+                )
         else:
             # Redis not available, use local cache only
             logger.warning("Redis not available, using SingleCacheStrategy with local cache")
             _cache_strategy = SingleCacheStrategy(cache=local_cache)
+            _redis_probed_at = time.monotonic()
     
     return _cache_strategy
 
@@ -148,10 +217,69 @@ def reset_cache_strategy() -> None:
     Returns:
         None: No return value
     """
-    global _cache_strategy
+    global _cache_strategy, _redis_probed_at
+    if isinstance(_cache_strategy, NearCacheStrategy):
+        _cache_strategy.stop()
     _cache_strategy = None
+    _redis_probed_at = None
     logger.info("Cache strategy reset, will be recreated on next access")
 
+def get_shared_rate_table() -> Optional[SharedRateTable]:
+    """
+    Returns a singleton handle to the shared-memory rate table, if enabled in settings.
+    
+    Returns:
+        Optional[SharedRateTable]: Shared rate table, or None when disabled
+    """
+    global _shared_rate_table
+    
+    if _shared_rate_table is None:
+        table_settings = get_settings().shared_rate_table
+        if not table_settings.get("enabled"):
+            return None
+        _shared_rate_table = SharedRateTable(
+            path=table_settings.get("path"),
+            capacity=table_settings["capacity"],
+            max_age=table_settings["max_age"]
+        )
+        # Follow cache writes and invalidations made by every process
+        _shared_rate_table.listen(get_redis_cache())
+    
+    return _shared_rate_table
+
+def get_ticker_filter() -> TickerUniverseFilter:
+    """
+    Returns a singleton instance of the ticker universe filter.
+    
+    Returns:
+        TickerUniverseFilter: Process-wide ticker membership filter
+    """
+    global _ticker_filter
+    
+    if _ticker_filter is None:
+        _ticker_filter = TickerUniverseFilter()
+    
+    return _ticker_filter
+
+def invalidate_ticker_cache(ticker: str) -> bool:
+    """
+    Invalidates all cached data tagged with a ticker in every cache level.
+    
+    The ticker's record in the shared rate table is no longer served by any process
+    until the refresher writes it again.
+    
+    Args:
+        ticker: Stock symbol
+        
+    Returns:
+        bool: True if the ticker's cache entries were invalidated
+    """
+    success = get_cache_strategy().invalidate_tag(get_ticker_tag(ticker))
+    shared_rate_table = get_shared_rate_table()
+    if shared_rate_table is not None:
+        shared_rate_table.mark_changed([ticker])
+    return success
+
 # Export all required components
 __all__ = [
     # Cache implementations
@@ -162,13 +290,32 @@ __all__ = [
     'CacheStrategy',
     'SingleCacheStrategy',
     'TieredCacheStrategy',
+    'NearCacheStrategy',
     'NullCacheStrategy',
     
+    # Shared-memory rate table
+    'SharedRateTable',
+    'SharedRateRefresher',
+    
+    # Ticker universe filter
+    'TickerUniverseFilter',
+    
+    # Cache value codecs
+    'CacheCodec',
+    'CacheCodecRegistry',
+    'JsonCodec',
+    'MsgpackCodec',
+    'register_enum',
+    
     # Singleton accessors
+    'get_cache_codecs',
     'get_redis_cache',
     'get_local_cache',
     'get_cache_strategy',
     'reset_cache_strategy',
+    'get_shared_rate_table',
+    'get_ticker_filter',
+    'invalidate_ticker_cache',
     
     # Utility functions
     'generate_cache_key',
@@ -177,5 +324,8 @@ __all__ = [
     'get_event_risk_key',
     'get_broker_config_key',
     'get_ttl_for_data_type',
-    'get_ttl_for_key_type'
+    'get_ttl_for_key_type',
+    'get_cache_namespace',
+    'get_ticker_tag',
+    'CACHE_NAMESPACES'
 ]
\ No newline at end of file
@@ -0,0 +1,409 @@
+"""
+Cache value codecs for the Borrow Rate & Locate Fee Pricing Engine.
+
+This module provides the pluggable encoding layer used for values stored in Redis.
+The JSON codec writes the same payloads as serialize_cache_value and stays the default,
+so existing entries and older workers keep working. The msgpack codec writes a compact
+binary frame that preserves Decimal, datetime, date and Enum values (timezone-aware
+datetimes are restored in UTC):
+
+    byte 0  FRAME_MARKER (0xC1, never valid as the first byte of UTF-8 or JSON)
+    byte 1  schema version (CODEC_SCHEMA_VERSION)
+    byte 2  codec id in the low 7 bits, COMPRESSED_FLAG if the body is zlib-compressed
+    byte 3+ body
+
+Readers detect the format from the first byte, so payloads of both codecs can be read
+regardless of which codec is configured for writing. A frame with a newer schema
+version than the reader supports decodes as a cache miss instead of a wrong value,
+which keeps mixed-version deployments safe during a rolling deploy. The codec is
+selected per key type (cache namespace).
+"""
+
+import abc
+import datetime
+import enum
+import zlib
+from decimal import Decimal
+from typing import Any, Dict, Optional, Type, Union
+
+try:
+    import msgpack  # msgpack 1.0.0+
+except ImportError:  # pragma: no cover - the binary codec is optional
+    msgpack = None
+
+from .utils import serialize_cache_value, deserialize_cache_value, get_cache_namespace
+from ...core.constants import ErrorCodes, TransactionFeeType, BorrowStatus
+from ...core.logging import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# First byte of every binary frame
+FRAME_MARKER = 0xC1
+
+# Version of the binary frame layout and extension types written by this module
+CODEC_SCHEMA_VERSION = 1
+
+# Flag in the codec byte marking a zlib-compressed body
+COMPRESSED_FLAG = 0x80
+
+# Binary bodies at least this large are compressed; 0 disables compression
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+# zlib level favouring speed, cached payloads are small and latency sensitive
+COMPRESSION_LEVEL = 1
+
+# Codec used for key types without an explicit choice
+DEFAULT_CODEC = 'json'
+
+# Codec ids stored in binary frames; never reuse an id for a different format
+CODEC_ID_MSGPACK = 1
+
+# msgpack extension type codes
+EXT_DECIMAL = 1
+EXT_DATETIME = 2
+EXT_DATE = 3
+EXT_ENUM = 4
+
+# Frame marker as seen in a string decoded with errors="surrogateescape"
+_FRAME_MARKER_CHAR = bytes([FRAME_MARKER]).decode('utf-8', 'surrogateescape')
+
+# Enum classes restored by the binary codec, by class name
+_enum_types: Dict[str, Type[enum.Enum]] = {}
+
+# Encoded extension of each Enum member seen, members are singletons
+_enum_extensions: Dict[enum.Enum, Any] = {}
+
+
+def register_enum(enum_type: Type[enum.Enum]) -> Type[enum.Enum]:
+    """
+    Registers an Enum class so the binary codec restores its members on decode.
+    
+    Members of unregistered Enum classes are encoded and decode to their plain value.
+    Can be used as a class decorator.
+    
+    Args:
+        enum_type: Enum class to register
+    
+    Returns:
+        The Enum class, unchanged
+    """
+    _enum_types[enum_type.__name__] = enum_type
+    return enum_type
+
+
+for _enum_type in (ErrorCodes, TransactionFeeType, BorrowStatus):
+    register_enum(_enum_type)
+
+
+class CacheCodec(abc.ABC):
+    """
+    Abstract base class for cache value codecs.
+    """
+    
+    # Name used to select the codec in configuration
+    name: str = ''
+    
+    # Whether encode returns a binary frame body
+    binary: bool = False
+    
+    # Id stored in binary frames
+    codec_id: int = 0
+    
+    @abc.abstractmethod
+    def encode(self, value: Any) -> Union[str, bytes]:
+        """
+        Encodes a value.
+        
+        Args:
+            value: Value to encode
+        
+        Returns:
+            Encoded value
+        """
+        pass
+    
+    @abc.abstractmethod
+    def decode(self, data: Union[str, bytes]) -> Any:
+        """
+        Decodes a value produced by encode.
+        
+        Args:
+            data: Encoded value
+        
+        Returns:
+            Decoded value
+        """
+        pass
+
+
+class JsonCodec(CacheCodec):
+    """
+    JSON codec writing the same payloads as serialize_cache_value.
+    
+    Decimals are stored as floats, other unsupported types as their string form.
+    """
+    
+    name = 'json'
+    
+    def encode(self, value: Any) -> str:
+        """
+        Encodes a value as a JSON string.
+        
+        Args:
+            value: Value to encode
+        
+        Returns:
+            JSON string
+        """
+        return serialize_cache_value(value)
+    
+    def decode(self, data: Union[str, bytes]) -> Any:
+        """
+        Decodes a JSON payload.
+        
+        Args:
+            data: JSON string or UTF-8 bytes
+        
+        Returns:
+            Decoded value, None if the payload is invalid
+        """
+        return deserialize_cache_value(data)
+
+
+class MsgpackCodec(CacheCodec):
+    """
+    Compact binary codec based on msgpack with exact Decimal, datetime, date and Enum support.
+    """
+    
+    name = 'msgpack'
+    binary = True
+    codec_id = CODEC_ID_MSGPACK
+    
+    def __init__(self):
+        """
+        Initialize the codec.
+        
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required for the msgpack cache codec")
+    
+    def encode(self, value: Any) -> bytes:
+        """
+        Encodes a value with msgpack.
+        
+        Args:
+            value: Value to encode
+        
+        Returns:
+            msgpack bytes
+        
+        Raises:
+            TypeError: If the value contains an unsupported type
+        """
+        return msgpack.packb(value, default=_encode_extension, use_bin_type=True, datetime=True)
+    
+    def decode(self, data: bytes) -> Any:
+        """
+        Decodes msgpack bytes.
+        
+        Args:
+            data: msgpack bytes
+        
+        Returns:
+            Decoded value
+        """
+        return msgpack.unpackb(data, ext_hook=_decode_extension, raw=False, strict_map_key=False, timestamp=3)
+
+
+def _encode_extension(value: Any) -> Any:
+    # Called for every value msgpack cannot pack natively; most common types first
+    if isinstance(value, Decimal):
+        return msgpack.ExtType(EXT_DECIMAL, str(value).encode('ascii'))
+    if isinstance(value, enum.Enum):
+        extension = _enum_extensions.get(value)
+        if extension is None:
+            extension = _enum_extensions[value] = msgpack.ExtType(
+                EXT_ENUM, msgpack.packb([type(value).__name__, value.value], use_bin_type=True)
+            )
+        return extension
+    # Timezone-aware datetimes are packed natively as msgpack timestamps
+    if isinstance(value, datetime.datetime):
+        return msgpack.ExtType(EXT_DATETIME, value.isoformat().encode('ascii'))
+    if isinstance(value, datetime.date):
+        return msgpack.ExtType(EXT_DATE, value.isoformat().encode('ascii'))
+    if hasattr(value, 'to_dict') and callable(getattr(value, 'to_dict')):
+        return value.to_dict()
+    raise TypeError(f"Cannot encode value of type {type(value).__name__}")
+
+
+def _decode_extension(code: int, data: bytes) -> Any:
+    if code == EXT_DECIMAL:
+        return Decimal(data.decode('ascii'))
+    if code == EXT_DATETIME:
+        return datetime.datetime.fromisoformat(data.decode('ascii'))
+    if code == EXT_DATE:
+        return datetime.date.fromisoformat(data.decode('ascii'))
+    if code == EXT_ENUM:
+        type_name, value = msgpack.unpackb(data, raw=False)
+        enum_type = _enum_types.get(type_name)
+        return enum_type(value) if enum_type is not None else value
+    return msgpack.ExtType(code, data)
+
+
+# Available codec classes by name
+CODECS: Dict[str, Type[CacheCodec]] = {
+    JsonCodec.name: JsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+class CacheCodecRegistry:
+    """
+    Selects the codec for each cache key and frames binary payloads.
+    """
+    
+    def __init__(
+        self,
+        default: str = DEFAULT_CODEC,
+        codecs_by_type: Optional[Dict[str, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    ):
+        """
+        Initialize the registry.
+        
+        Codecs that cannot be created (e.g. msgpack is not installed) fall back to
+        JSON with a warning.
+        
+        Args:
+            default: Codec name for key types without an explicit choice
+            codecs_by_type: Codec name by key type (cache namespace), e.g. {"borrow_rate": "msgpack"}
+            compression_threshold: Minimum binary body size in bytes to compress, 0 to disable
+        """
+        self._json = JsonCodec()
+        self._codecs_by_id: Dict[int, CacheCodec] = {}
+        self.default = self._create(default)
+        self.codecs_by_type = {
+            data_type: self._create(name) for data_type, name in (codecs_by_type or {}).items()
+        }
+        self.compression_threshold = compression_threshold
+    
+    def _create(self, name: str) -> CacheCodec:
+        if name == JsonCodec.name:
+            return self._json
+        try:
+            codec = CODECS[name]()
+        except KeyError:
+            logger.warning(f"Unknown cache codec {name}, using json")
+            return self._json
+        except ImportError as e:
+            logger.warning(f"Cache codec {name} unavailable, using json: {e}")
+            return self._json
+        self._codecs_by_id[codec.codec_id] = codec
+        return codec
+    
+    def _get_decoder(self, codec_id: int) -> Optional[CacheCodec]:
+        codec = self._codecs_by_id.get(codec_id)
+        if codec is None:
+            # Payloads may have been written by a process configured differently
+            for codec_type in CODECS.values():
+                if codec_type.binary and codec_type.codec_id == codec_id:
+                    try:
+                        codec = self._codecs_by_id[codec_id] = codec_type()
+                    except ImportError as e:
+                        logger.warning(f"Cannot decode cache payload of codec {codec_type.name}: {e}")
+                    break
+        return codec
+    
+    def get_codec(self, key: str) -> CacheCodec:
+        """
+        Gets the codec used to write values of a cache key.
+        
+        Args:
+            key: Cache key without prefix
+        
+        Returns:
+            CacheCodec: Codec configured for the key's type, or the default codec
+        """
+        data_type = get_cache_namespace(key) or key.split(':', 1)[0]
+        return self.codecs_by_type.get(data_type, self.default)
+    
+    def encode(self, key: str, value: Any) -> Union[str, bytes]:
+        """
+        Encodes a value with the codec configured for its key.
+        
+        Values a binary codec cannot represent are written as JSON.
+        
+        Args:
+            key: Cache key without prefix
+            value: Value to encode
+        
+        Returns:
+            JSON string, or binary frame for binary codecs
+        """
+        codec = self.get_codec(key)
+        if not codec.binary:
+            return codec.encode(value)
+        
+        try:
+            body = codec.encode(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            logger.warning(f"Failed to encode cache value for {key} with {codec.name}, using json: {e}")
+            return self._json.encode(value)
+        
+        flags = codec.codec_id
+        if self.compression_threshold and len(body) >= self.compression_threshold:
+            compressed = zlib.compress(body, COMPRESSION_LEVEL)
+            if len(compressed) < len(body):
+                body = compressed
+                flags |= COMPRESSED_FLAG
+        
+        return bytes((FRAME_MARKER, CODEC_SCHEMA_VERSION, flags)) + body
+    
+    def decode(self, payload: Optional[Union[str, bytes]]) -> Any:
+        """
+        Decodes a payload written by any codec.
+        
+        Strings read by a Redis client decoding with errors="surrogateescape" are
+        accepted for binary frames.
+        
+        Args:
+            payload: Encoded value
+        
+        Returns:
+            Decoded value, None if the payload is missing, invalid or of a newer schema version
+        """
+        if payload is None:
+            return None
+        
+        if isinstance(payload, str):
+            if not payload.startswith(_FRAME_MARKER_CHAR):
+                return self._json.decode(payload)
+            payload = payload.encode('utf-8', 'surrogateescape')
+        elif payload[:1] != bytes((FRAME_MARKER,)):
+            return self._json.decode(payload)
+        
+        if len(payload) < 3:
+            logger.warning("Failed to decode cache payload: truncated frame")
+            return None
+        
+        version, flags = payload[1], payload[2]
+        if version > CODEC_SCHEMA_VERSION:
+            # Written by a newer release; treat as a miss rather than guess
+            logger.debug(f"Skipping cache payload with schema version {version}")
+            return None
+        
+        codec = self._get_decoder(flags & ~COMPRESSED_FLAG)
+        if codec is None:
+            return None
+        
+        try:
+            body = payload[3:]
+            if flags & COMPRESSED_FLAG:
+                body = zlib.decompress(body)
+            return codec.decode(body)
+        except Exception as e:
+            logger.warning(f"Failed to decode cache payload with {codec.name}: {e}")
+            return None
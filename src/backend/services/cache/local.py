@@ -17,6 +17,7 @@ from .utils import (
     is_cache_stale, log_cache_operation
 )
 from ...core.logging import get_logger
+from ...utils.metrics import record_cache_access
 from ...core.constants import (
     CACHE_TTL_BORROW_RATE, CACHE_TTL_VOLATILITY, CACHE_TTL_EVENT_RISK,
     CACHE_TTL_BROKER_CONFIG, CACHE_TTL_CALCULATION
@@ -37,6 +38,7 @@ class LocalCache:
     def __init__(self):
         """Initialize the local cache with an empty dictionary and thread lock."""
         self._cache = {}  # Dictionary to store cache entries
+        self._tags: typing.Dict[str, typing.Set[str]] = {}  # Keys stored with each invalidation tag
         self._lock = threading.Lock()  # Lock for thread safety
         logger.info("Initialized LocalCache")
     
@@ -55,6 +57,7 @@ class LocalCache:
             # Check if key exists in cache
             if key not in self._cache:
                 log_cache_operation("get", key, False, "Key not found")
+                record_cache_access("local", key, False)
                 return None
             
             # Get wrapped value from cache
@@ -68,6 +71,7 @@ class LocalCache:
                 # Remove stale value
                 del self._cache[key]
                 log_cache_operation("get", key, False, "Value expired")
+                record_cache_access("local", key, False)
                 return None
             
             # Extract serialized value from wrapped value
@@ -77,9 +81,11 @@ class LocalCache:
             value = deserialize_cache_value(serialized_value, value_type)
             
             log_cache_operation("get", key, True)
+            record_cache_access("local", key, True)
             return value
     
-    def set(self, key: str, value: typing.Any, ttl: typing.Optional[int] = None) -> bool:
+    def set(self, key: str, value: typing.Any, ttl: typing.Optional[int] = None,
+            tags: typing.Optional[typing.Iterable[str]] = None) -> bool:
         """
         Store a value in the local cache with the specified key and TTL.
         
@@ -87,6 +93,7 @@ class LocalCache:
             key: The cache key
             value: The value to store
             ttl: Time-to-live in seconds (optional)
+            tags: Invalidation tags for the entry (optional)
             
         Returns:
             True if the value was successfully cached
@@ -104,6 +111,8 @@ class LocalCache:
             
             # Store in cache
             self._cache[key] = wrapped_value
+            for tag in tags or ():
+                self._tags.setdefault(tag, set()).add(key)
             
             log_cache_operation("set", key, True)
             return True
@@ -127,6 +136,91 @@ class LocalCache:
                 log_cache_operation("delete", key, False, "Key not found")
                 return False
     
+    def get_many(self, keys: typing.Iterable[str],
+                 value_type: typing.Optional[str] = None) -> typing.Dict[str, typing.Any]:
+        """
+        Retrieve several values from the local cache under a single lock acquisition.
+        
+        Args:
+            keys: The cache keys to retrieve
+            value_type: Optional type hint for deserialization
+            
+        Returns:
+            Dictionary of cached values by key; keys not found or expired are omitted
+        """
+        keys = list(dict.fromkeys(keys))
+        serialized_values = {}
+        with self._lock:  # Ensure thread safety during the operation
+            for key in keys:
+                wrapped_value = self._cache.get(key)
+                if wrapped_value is None:
+                    continue
+                
+                # Remove stale values
+                if is_cache_stale(wrapped_value, self._get_ttl_for_key(key, wrapped_value)):
+                    del self._cache[key]
+                    continue
+                
+                serialized_values[key] = unwrap_cache_value(wrapped_value)
+        
+        # Deserialize outside the lock
+        values = {key: deserialize_cache_value(serialized_value, value_type)
+                  for key, serialized_value in serialized_values.items()}
+        
+        for key in keys:
+            record_cache_access("local", key, key in values)
+        log_cache_operation("get_many", f"{len(keys)} keys", True, f"{len(values)} hits")
+        return values
+    
+    def set_many(self, items: typing.Mapping[str, typing.Any], ttl: typing.Optional[int] = None,
+                 ttls: typing.Optional[typing.Mapping[str, int]] = None) -> bool:
+        """
+        Store several values in the local cache under a single lock acquisition.
+        
+        Args:
+            items: The values to store by cache key
+            ttl: Time-to-live in seconds for all items (optional)
+            ttls: Per-key time-to-live in seconds, overriding ttl (optional)
+            
+        Returns:
+            True if the values were successfully cached
+        """
+        ttls = ttls or {}
+        
+        # Serialize and wrap outside the lock
+        wrapped_values = {}
+        for key, value in items.items():
+            wrapped_value = wrap_cache_value(serialize_cache_value(value))
+            key_ttl = ttls.get(key, ttl)
+            if key_ttl is not None:
+                wrapped_value['custom_ttl'] = key_ttl
+            wrapped_values[key] = wrapped_value
+        
+        with self._lock:  # Ensure thread safety during the operation
+            self._cache.update(wrapped_values)
+        
+        log_cache_operation("set_many", f"{len(wrapped_values)} keys", True)
+        return True
+    
+    def delete_many(self, keys: typing.Iterable[str]) -> int:
+        """
+        Remove several values from the local cache under a single lock acquisition.
+        
+        Args:
+            keys: The cache keys to remove
+            
+        Returns:
+            Number of keys found and deleted
+        """
+        with self._lock:  # Ensure thread safety during the operation
+            deleted_count = 0
+            for key in dict.fromkeys(keys):
+                if self._cache.pop(key, None) is not None:
+                    deleted_count += 1
+        
+        log_cache_operation("delete_many", "multiple", True, f"Deleted {deleted_count} keys")
+        return deleted_count
+    
     def exists(self, key: str) -> bool:
         """
         Check if a key exists in the local cache and is not expired.
@@ -164,9 +258,48 @@ class LocalCache:
         """
         with self._lock:  # Ensure thread safety during the operation
             self._cache.clear()
+            self._tags.clear()
             log_cache_operation("flush", "all", True)
             return True
     
+    def invalidate_namespace(self, namespace: str) -> int:
+        """
+        Remove all values of a cache namespace (data type).
+        
+        Args:
+            namespace: Namespace whose keys start with "<namespace>:"
+            
+        Returns:
+            Number of items removed
+        """
+        prefix = f"{namespace}:"
+        with self._lock:  # Ensure thread safety during the operation
+            keys = [key for key in self._cache if key.startswith(prefix)]
+            for key in keys:
+                del self._cache[key]
+            
+            log_cache_operation("invalidate_namespace", namespace, True, f"Removed {len(keys)} items")
+            return len(keys)
+    
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        Remove all values stored with an invalidation tag.
+        
+        Args:
+            tag: Invalidation tag
+            
+        Returns:
+            Number of items removed
+        """
+        with self._lock:  # Ensure thread safety during the operation
+            removed_count = 0
+            for key in self._tags.pop(tag, ()):
+                if self._cache.pop(key, None) is not None:
+                    removed_count += 1
+            
+            log_cache_operation("invalidate_tag", tag, True, f"Removed {removed_count} items")
+            return removed_count
+    
     def get_stats(self) -> dict:
         """
         Get statistics about the local cache.
@@ -214,6 +347,12 @@ class LocalCache:
                 del self._cache[key]
                 removed_count += 1
             
+            # Drop tag memberships of keys no longer cached
+            for tag in list(self._tags):
+                self._tags[tag].intersection_update(self._cache)
+                if not self._tags[tag]:
+                    del self._tags[tag]
+            
             if removed_count > 0:
                 log_cache_operation("cleanup", "expired", True, f"Removed {removed_count} items")
             
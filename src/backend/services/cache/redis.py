@@ -9,21 +9,24 @@ error handling, and fallback mechanisms.
 """
 
 import redis  # redis 4.5.0+
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 import backoff  # backoff 2.2.0+
 
 from .utils import (
-    serialize_cache_value,
-    deserialize_cache_value,
     wrap_cache_value,
     unwrap_cache_value,
     is_cache_stale,
     log_cache_operation,
-    get_ttl_for_data_type
+    get_ttl_for_data_type,
+    get_cache_namespace,
+    CACHE_NAMESPACES
 )
+from .codecs import CacheCodecRegistry
 from ...config.settings import get_settings
 from ...core.logging import get_logger
+from ...utils.metrics import record_cache_access
 from ...core.constants import (
     CACHE_TTL_BORROW_RATE,
     CACHE_TTL_VOLATILITY,
@@ -35,9 +38,30 @@ from ...core.constants import (
 # Initialize logger
 logger = get_logger(__name__)
 
+# Seconds a process trusts its copy of the namespace generations before re-reading them
+GENERATION_REFRESH_SECONDS = 1.0
+
+# Key segment holding namespace generation counters; these are never deleted
+GENERATION_KEY_SEGMENT = "__generation__"
+
+# Key segment holding tag sets (physical keys sharing an invalidation tag)
+TAG_KEY_SEGMENT = "__tag__"
+
+# Keys requested per SCAN call and unlinked per UNLINK call
+SCAN_BATCH_SIZE = 500
+
 
 class RedisCache:
-    """Redis-based cache implementation for storing and retrieving cached data."""
+    """
+    Redis-based cache implementation for storing and retrieving cached data.
+    
+    Keys of the cached data types (borrow_rate, volatility, event_risk, broker_config,
+    calculation) are versioned: the physical key embeds the current generation of its
+    namespace, so invalidating a whole namespace is a single INCR and the orphaned
+    entries expire by TTL or are reclaimed in the background. Entries can also carry
+    tags, which invalidate every tagged key at a cost proportional to the keys affected.
+    Other keys, such as rate limit counters, are stored unversioned.
+    """
     
     def __init__(
         self,
@@ -48,7 +72,9 @@ class RedisCache:
         prefix: Optional[str] = None,
         socket_timeout: Optional[int] = 5,
         socket_connect_timeout: Optional[int] = 2,
-        max_connection_retries: Optional[int] = 3
+        max_connection_retries: Optional[int] = 3,
+        generation_refresh_seconds: Optional[float] = GENERATION_REFRESH_SECONDS,
+        codecs: Optional[CacheCodecRegistry] = None
     ):
         """
         Initialize the Redis cache with connection parameters.
@@ -62,6 +88,9 @@ class RedisCache:
             socket_timeout: Socket operation timeout in seconds
             socket_connect_timeout: Socket connection timeout in seconds
             max_connection_retries: Maximum number of connection retry attempts
+            generation_refresh_seconds: How long namespace generations read from Redis are reused;
+                invalidations made by other processes become visible after at most this long
+            codecs: Codec selection per key type, JSON for every key type if not provided
         """
         # Initialize Redis client with connection parameters
         self._client = redis.Redis(
@@ -71,7 +100,9 @@ class RedisCache:
             db=db,
             socket_timeout=socket_timeout,
             socket_connect_timeout=socket_connect_timeout,
-            decode_responses=True
+            decode_responses=True,
+            # Binary cache payloads round-trip through str without a second client
+            encoding_errors="surrogateescape"
         )
         
         # Set default key prefix if not provided
@@ -82,6 +113,15 @@ class RedisCache:
         self._connection_retry_count = 0
         self._max_connection_retries = max_connection_retries
         
+        # Codecs used to encode values by key type
+        self._codecs = codecs or CacheCodecRegistry()
+        
+        # Process-local copy of the namespace generations
+        self._generations: Dict[str, int] = {}
+        self._generations_loaded_at = float("-inf")
+        self._generation_refresh_seconds = generation_refresh_seconds
+        self._generation_lock = threading.Lock()
+        
         # Try to establish connection
         try:
             self.connect()
@@ -108,6 +148,16 @@ class RedisCache:
             logger.error(f"Failed to connect to Redis server: {e}")
             return False
     
+    @property
+    def connected(self) -> bool:
+        """
+        Connection state found by the last connection check, without a round trip.
+        
+        Returns:
+            bool: True if Redis was reachable at the last check
+        """
+        return self._connected
+    
     def is_connected(self) -> bool:
         """
         Check if Redis client is connected to server.
@@ -127,13 +177,85 @@ class RedisCache:
         """
         Generate a full Redis key with prefix.
         
+        Keys in a versioned namespace get the namespace's current generation inserted
+        after the namespace, e.g. "borrow_rate:AAPL" becomes "<prefix>borrow_rate:v3:AAPL".
+        
         Args:
             key: Base key without prefix
             
         Returns:
             str: Full key with prefix
         """
-        return f"{self._prefix}{key}"
+        namespace = get_cache_namespace(key)
+        if namespace is None:
+            return f"{self._prefix}{key}"
+        
+        remainder = key[len(namespace) + 1:]
+        return f"{self._prefix}{namespace}:v{self.get_generation(namespace)}:{remainder}"
+    
+    def _get_generation_key(self, namespace: str) -> str:
+        return f"{self._prefix}{GENERATION_KEY_SEGMENT}:{namespace}"
+    
+    def _get_tag_key(self, tag: str) -> str:
+        return f"{self._prefix}{TAG_KEY_SEGMENT}:{tag}"
+    
+    def _is_internal_key(self, full_key: str) -> bool:
+        return full_key.startswith((
+            f"{self._prefix}{GENERATION_KEY_SEGMENT}:",
+            f"{self._prefix}{TAG_KEY_SEGMENT}:"
+        ))
+    
+    def _get_default_ttl(self, key: str) -> int:
+        """
+        Determine the TTL for a key from its data type.
+        
+        Args:
+            key: Cache key without prefix
+            
+        Returns:
+            int: TTL in seconds
+        """
+        # Extract data type from the key
+        if key.startswith("borrow_rate:"):
+            return CACHE_TTL_BORROW_RATE
+        elif key.startswith("volatility:"):
+            return CACHE_TTL_VOLATILITY
+        elif key.startswith("event_risk:"):
+            return CACHE_TTL_EVENT_RISK
+        elif key.startswith("broker_config:"):
+            return CACHE_TTL_BROKER_CONFIG
+        else:
+            # Use default calculation TTL for calculations and unknown types
+            return CACHE_TTL_CALCULATION
+    
+    def get_generation(self, namespace: str) -> int:
+        """
+        Get the current generation of a cache namespace.
+        
+        Generations are read for all namespaces at once and reused for
+        generation_refresh_seconds. If Redis cannot be reached the last known
+        generations are kept.
+        
+        Args:
+            namespace: Cache namespace (data type)
+            
+        Returns:
+            int: Current generation, 0 if the namespace was never invalidated
+        """
+        now = time.monotonic()
+        if now - self._generations_loaded_at >= self._generation_refresh_seconds:
+            with self._generation_lock:
+                if now - self._generations_loaded_at >= self._generation_refresh_seconds:
+                    try:
+                        values = self._client.mget([self._get_generation_key(ns) for ns in CACHE_NAMESPACES])
+                        self._generations = {
+                            ns: int(value) for ns, value in zip(CACHE_NAMESPACES, values) if value is not None
+                        }
+                    except redis.RedisError as e:
+                        logger.warning(f"Failed to read cache namespace generations: {e}")
+                    self._generations_loaded_at = now
+        
+        return self._generations.get(namespace, 0)
     
     @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
     def get(self, key: str, value_type: Optional[str] = None) -> Optional[Any]:
@@ -150,6 +272,7 @@ class RedisCache:
         # Check connection status
         if not self._connected and not self.is_connected():
             log_cache_operation("get", key, False, "Redis not connected")
+            record_cache_access("redis", key, False)
             return None
         
         full_key = self._get_full_key(key)
@@ -161,20 +284,23 @@ class RedisCache:
             # Return None if key not found
             if serialized_value is None:
                 log_cache_operation("get", key, False, "Cache miss")
+                record_cache_access("redis", key, False)
                 return None
             
             # Deserialize the value
-            wrapped_value = deserialize_cache_value(serialized_value)
+            wrapped_value = self._codecs.decode(serialized_value)
             
             # Ensure we got a valid value
             if wrapped_value is None:
                 log_cache_operation("get", key, False, "Deserialization failed")
+                record_cache_access("redis", key, False)
                 return None
             
             # Unwrap the value to get the actual data
             value = unwrap_cache_value(wrapped_value)
             
             log_cache_operation("get", key, True, "Cache hit")
+            record_cache_access("redis", key, True)
             return value
             
         except redis.RedisError as e:
@@ -183,7 +309,7 @@ class RedisCache:
             raise
     
     @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None) -> bool:
         """
         Store a value in Redis with the specified key and TTL.
         
@@ -191,6 +317,7 @@ class RedisCache:
             key: Cache key without prefix
             value: Value to cache
             ttl: Time-to-live in seconds, if None will use appropriate default
+            tags: Invalidation tags for the entry, see invalidate_tag
             
         Returns:
             bool: True if the value was successfully cached, False otherwise
@@ -202,20 +329,7 @@ class RedisCache:
         
         # Determine TTL based on key pattern if not specified
         if ttl is None:
-            # Extract data type from the key
-            if key.startswith("borrow_rate:"):
-                ttl = CACHE_TTL_BORROW_RATE
-            elif key.startswith("volatility:"):
-                ttl = CACHE_TTL_VOLATILITY
-            elif key.startswith("event_risk:"):
-                ttl = CACHE_TTL_EVENT_RISK
-            elif key.startswith("broker_config:"):
-                ttl = CACHE_TTL_BROKER_CONFIG
-            elif key.startswith("calculation:"):
-                ttl = CACHE_TTL_CALCULATION
-            else:
-                # Use default calculation TTL for unknown types
-                ttl = CACHE_TTL_CALCULATION
+            ttl = self._get_default_ttl(key)
         
         full_key = self._get_full_key(key)
         
@@ -224,10 +338,22 @@ class RedisCache:
             wrapped_value = wrap_cache_value(value)
             
             # Serialize the wrapped value
-            serialized_value = serialize_cache_value(wrapped_value)
+            serialized_value = self._codecs.encode(key, wrapped_value)
             
             # Store in Redis with TTL
-            self._client.setex(full_key, ttl, serialized_value)
+            if not tags:
+                self._client.setex(full_key, ttl, serialized_value)
+            else:
+                # Record the physical key in each tag set, in the same round trip;
+                # tag sets live as long as their longest-lived member
+                pipeline = self._client.pipeline(transaction=False)
+                pipeline.setex(full_key, ttl, serialized_value)
+                for tag in tags:
+                    tag_key = self._get_tag_key(tag)
+                    pipeline.sadd(tag_key, full_key)
+                    pipeline.expire(tag_key, ttl, nx=True)
+                    pipeline.expire(tag_key, ttl, gt=True)
+                pipeline.execute()
             
             log_cache_operation("set", key, True, f"TTL: {ttl}s")
             return True
@@ -237,6 +363,57 @@ class RedisCache:
             # Let backoff handle retry or raise exception
             raise
     
+    @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
+    def set_unless(self, key: str, value: Any, ttl: int, skip_if: Callable[[Any], bool]) -> bool:
+        """
+        Store a value unless the current value matches a predicate, atomically.
+        
+        The key is watched while its current value is checked, so a write by another
+        client between the check and the store aborts the store instead of being
+        overwritten.
+        
+        Args:
+            key: Cache key without prefix
+            value: Value to cache
+            ttl: Time-to-live in seconds
+            skip_if: Called with the current value (None if absent); True leaves it in place
+            
+        Returns:
+            bool: True if the value was stored, False if skipped or the key changed concurrently
+        """
+        # Check connection status
+        if not self._connected and not self.is_connected():
+            log_cache_operation("set_unless", key, False, "Redis not connected")
+            return False
+        
+        full_key = self._get_full_key(key)
+        serialized_value = self._codecs.encode(key, wrap_cache_value(value))
+        
+        try:
+            with self._client.pipeline(transaction=True) as pipeline:
+                pipeline.watch(full_key)
+                current = pipeline.get(full_key)
+                if current is not None:
+                    current = self._codecs.decode(current)
+                    current = unwrap_cache_value(current) if current is not None else None
+                if skip_if(current):
+                    log_cache_operation("set_unless", key, False, "Skipped by current value")
+                    return False
+                pipeline.multi()
+                pipeline.setex(full_key, ttl, serialized_value)
+                pipeline.execute()
+            
+            log_cache_operation("set_unless", key, True, f"TTL: {ttl}s")
+            return True
+            
+        except redis.WatchError:
+            log_cache_operation("set_unless", key, False, "Key changed concurrently")
+            return False
+        except redis.RedisError as e:
+            log_cache_operation("set_unless", key, False, f"Redis error: {str(e)}")
+            # Let backoff handle retry or raise exception
+            raise
+    
     @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
     def delete(self, key: str) -> bool:
         """
@@ -297,11 +474,297 @@ class RedisCache:
             # Let backoff handle retry or raise exception
             raise
     
+    @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
+    def get_many(self, keys: Iterable[str], value_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieve several values from Redis in a single MGET round trip.
+        
+        Args:
+            keys: Cache keys without prefix
+            value_type: Optional type hint for deserialization
+            
+        Returns:
+            Dict[str, Any]: Cached values by key; keys not found or expired are omitted
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        
+        # Check connection status
+        if not self._connected and not self.is_connected():
+            log_cache_operation("get_many", f"{len(keys)} keys", False, "Redis not connected")
+            for key in keys:
+                record_cache_access("redis", key, False)
+            return {}
+        
+        try:
+            serialized_values = self._client.mget([self._get_full_key(key) for key in keys])
+        except redis.RedisError as e:
+            log_cache_operation("get_many", f"{len(keys)} keys", False, f"Redis error: {str(e)}")
+            # Let backoff handle retry or raise exception
+            raise
+        
+        values = {}
+        for key, serialized_value in zip(keys, serialized_values):
+            wrapped_value = self._codecs.decode(serialized_value)
+            if wrapped_value is not None:
+                values[key] = unwrap_cache_value(wrapped_value)
+            record_cache_access("redis", key, wrapped_value is not None)
+        
+        log_cache_operation("get_many", f"{len(keys)} keys", True, f"{len(values)} hits")
+        return values
+    
+    @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Mapping[str, int]] = None
+    ) -> bool:
+        """
+        Store several values in Redis in a single pipelined round trip.
+        
+        Args:
+            items: Values to cache by key without prefix
+            ttl: Time-to-live in seconds for all items, if None will use appropriate defaults
+            ttls: Per-key time-to-live in seconds, overriding ttl
+            
+        Returns:
+            bool: True if the values were successfully cached, False otherwise
+        """
+        if not items:
+            return True
+        
+        # Check connection status
+        if not self._connected and not self.is_connected():
+            log_cache_operation("set_many", f"{len(items)} keys", False, "Redis not connected")
+            return False
+        
+        ttls = ttls or {}
+        
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            for key, value in items.items():
+                key_ttl = ttls.get(key, ttl)
+                if key_ttl is None:
+                    key_ttl = self._get_default_ttl(key)
+                pipeline.setex(self._get_full_key(key), key_ttl, self._codecs.encode(key, wrap_cache_value(value)))
+            pipeline.execute()
+            
+            log_cache_operation("set_many", f"{len(items)} keys", True)
+            return True
+            
+        except redis.RedisError as e:
+            log_cache_operation("set_many", f"{len(items)} keys", False, f"Redis error: {str(e)}")
+            # Let backoff handle retry or raise exception
+            raise
+    
+    @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Remove several values from Redis in a single DEL round trip.
+        
+        Args:
+            keys: Cache keys without prefix
+            
+        Returns:
+            int: Number of keys found and deleted
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return 0
+        
+        # Check connection status
+        if not self._connected and not self.is_connected():
+            log_cache_operation("delete_many", f"{len(keys)} keys", False, "Redis not connected")
+            return 0
+        
+        try:
+            deleted = self._client.delete(*[self._get_full_key(key) for key in keys])
+            
+            log_cache_operation("delete_many", f"{len(keys)} keys", True, f"Deleted {deleted} keys")
+            return deleted
+            
+        except redis.RedisError as e:
+            log_cache_operation("delete_many", f"{len(keys)} keys", False, f"Redis error: {str(e)}")
+            # Let backoff handle retry or raise exception
+            raise
+    
+    @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
+    def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message on a prefixed Redis pub/sub channel.
+        
+        Args:
+            channel: Channel name without prefix
+            message: Message payload
+            
+        Returns:
+            int: Number of subscribers that received the message
+        """
+        # Check connection status
+        if not self._connected and not self.is_connected():
+            log_cache_operation("publish", channel, False, "Redis not connected")
+            return 0
+        
+        try:
+            return self._client.publish(self._get_full_key(channel), message)
+        except redis.RedisError as e:
+            log_cache_operation("publish", channel, False, f"Redis error: {str(e)}")
+            # Let backoff handle retry or raise exception
+            raise
+    
+    def subscribe(self, channel: str) -> redis.client.PubSub:
+        """
+        Subscribe to a prefixed Redis pub/sub channel.
+        
+        The returned PubSub object uses its own connection; callers own it and
+        should close it when done.
+        
+        Args:
+            channel: Channel name without prefix
+            
+        Returns:
+            redis.client.PubSub: Subscribed PubSub object (subscribe confirmations are skipped)
+        """
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self._get_full_key(channel))
+        return pubsub
+    
+    @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
+    def invalidate_namespace(self, namespace: str, reclaim: bool = False) -> int:
+        """
+        Invalidate every cached entry of a namespace with a single INCR.
+        
+        Entries of older generations are no longer addressable and expire by TTL;
+        with reclaim=True they are also unlinked by a background SCAN.
+        
+        Args:
+            namespace: Cache namespace (data type) to invalidate
+            reclaim: Unlink the orphaned entries in a background thread
+            
+        Returns:
+            int: New generation of the namespace, 0 if Redis is not connected
+            
+        Raises:
+            ValueError: If the namespace is not a versioned cache namespace
+        """
+        if namespace not in CACHE_NAMESPACES:
+            raise ValueError(f"Unknown cache namespace: {namespace}")
+        
+        # Check connection status
+        if not self._connected and not self.is_connected():
+            log_cache_operation("invalidate_namespace", namespace, False, "Redis not connected")
+            return 0
+        
+        try:
+            generation = self._client.incr(self._get_generation_key(namespace))
+            with self._generation_lock:
+                self._generations[namespace] = generation
+            
+            log_cache_operation("invalidate_namespace", namespace, True, f"Generation: {generation}")
+            
+            if reclaim:
+                threading.Thread(
+                    target=self.reclaim_namespace,
+                    args=(namespace, generation),
+                    name=f"cache-reclaim-{namespace}",
+                    daemon=True
+                ).start()
+            
+            return generation
+            
+        except redis.RedisError as e:
+            log_cache_operation("invalidate_namespace", namespace, False, f"Redis error: {str(e)}")
+            # Let backoff handle retry or raise exception
+            raise
+    
+    @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        Remove every entry stored with a tag.
+        
+        Only the tagged keys are touched, so the cost is proportional to the
+        number of entries affected rather than to the size of the keyspace.
+        
+        Args:
+            tag: Invalidation tag, e.g. from get_ticker_tag
+            
+        Returns:
+            int: Number of entries removed
+        """
+        # Check connection status
+        if not self._connected and not self.is_connected():
+            log_cache_operation("invalidate_tag", tag, False, "Redis not connected")
+            return 0
+        
+        tag_key = self._get_tag_key(tag)
+        
+        try:
+            keys = list(self._client.smembers(tag_key))
+            removed = self._unlink(keys)
+            self._client.unlink(tag_key)
+            
+            log_cache_operation("invalidate_tag", tag, True, f"Removed {removed} keys")
+            return removed
+            
+        except redis.RedisError as e:
+            log_cache_operation("invalidate_tag", tag, False, f"Redis error: {str(e)}")
+            # Let backoff handle retry or raise exception
+            raise
+    
+    def reclaim_namespace(self, namespace: str, generation: Optional[int] = None) -> int:
+        """
+        Unlink entries of a namespace left behind by earlier generations.
+        
+        Uses incremental SCAN, so Redis keeps serving other clients while it runs.
+        Orphaned entries expire by TTL anyway; this only frees memory sooner.
+        
+        Args:
+            namespace: Cache namespace (data type) to reclaim
+            generation: Current generation, read from Redis if not given
+            
+        Returns:
+            int: Number of entries removed
+        """
+        if generation is None:
+            generation = int(self._client.get(self._get_generation_key(namespace)) or 0)
+        
+        current_prefix = f"{self._prefix}{namespace}:v{generation}:"
+        removed = 0
+        batch: List[str] = []
+        
+        try:
+            for full_key in self._client.scan_iter(match=f"{self._prefix}{namespace}:v*", count=SCAN_BATCH_SIZE):
+                if full_key.startswith(current_prefix):
+                    continue
+                batch.append(full_key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    removed += self._unlink(batch)
+                    batch = []
+            removed += self._unlink(batch)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to reclaim cache namespace {namespace}: {e}")
+        
+        logger.info(f"Reclaimed {removed} keys from cache namespace {namespace} (generation {generation})")
+        return removed
+    
+    def _unlink(self, keys: List[str]) -> int:
+        removed = 0
+        for start in range(0, len(keys), SCAN_BATCH_SIZE):
+            removed += self._client.unlink(*keys[start:start + SCAN_BATCH_SIZE])
+        return removed
+    
     @backoff.on_exception(backoff.expo, redis.RedisError, max_tries=3)
     def flush(self) -> bool:
         """
         Clear all values from Redis with the configured prefix.
         
+        Every cache namespace is invalidated first, which takes effect immediately;
+        the remaining keys are then unlinked with incremental SCAN instead of a
+        blocking KEYS call. Generation counters are kept so that entries of old
+        generations can never become visible again.
+        
         Returns:
             bool: True if the cache was successfully cleared, False otherwise
         """
@@ -311,18 +774,27 @@ class RedisCache:
             return False
         
         try:
-            # Find all keys with our prefix
-            pattern = f"{self._prefix}*"
-            keys = self._client.keys(pattern)
-            
-            if not keys:
-                logger.info("No keys to flush")
-                return True
-            
-            # Delete all matching keys
-            self._client.delete(*keys)
-            
-            logger.info(f"Flushed {len(keys)} keys from Redis cache")
+            # Invalidate every namespace in one round trip
+            pipeline = self._client.pipeline(transaction=False)
+            for namespace in CACHE_NAMESPACES:
+                pipeline.incr(self._get_generation_key(namespace))
+            generations = pipeline.execute()
+            with self._generation_lock:
+                self._generations.update(zip(CACHE_NAMESPACES, generations))
+            
+            # Unlink everything else with our prefix without blocking the server
+            flushed = 0
+            batch: List[str] = []
+            for full_key in self._client.scan_iter(match=f"{self._prefix}*", count=SCAN_BATCH_SIZE):
+                if full_key.startswith(f"{self._prefix}{GENERATION_KEY_SEGMENT}:"):
+                    continue
+                batch.append(full_key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    flushed += self._unlink(batch)
+                    batch = []
+            flushed += self._unlink(batch)
+            
+            logger.info(f"Flushed {flushed} keys from Redis cache")
             return True
             
         except redis.RedisError as e:
@@ -352,9 +824,12 @@ class RedisCache:
             # Get general Redis info
             info = self._client.info()
             
-            # Get all keys with our prefix
+            # Get all cache keys with our prefix, skipping generation counters and tag sets
             pattern = f"{self._prefix}*"
-            all_keys = self._client.keys(pattern)
+            all_keys = [
+                key for key in self._client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE)
+                if not self._is_internal_key(key)
+            ]
             
             # Count keys by category
             categories = {
@@ -389,7 +864,8 @@ class RedisCache:
                 "keys_count": len(all_keys),
                 "memory_used": info.get("used_memory_human", "unknown"),
                 "uptime": info.get("uptime_in_seconds", 0),
-                "categories": categories
+                "categories": categories,
+                "generations": {namespace: self.get_generation(namespace) for namespace in CACHE_NAMESPACES}
             }
             
             return stats
@@ -0,0 +1,674 @@
+"""
+Implements a shared-memory rate table for the Borrow Rate & Locate Fee Pricing Engine.
+
+Every worker process otherwise keeps its own local cache and makes its own Redis round
+trips for the same few thousand tickers. This module maps one file into all workers
+(preferably on /dev/shm) holding fixed-width records of ticker, borrow rate, volatility,
+event risk factor, borrow status and update time. A single refresher process, elected
+with an exclusive file lock, copies the latest cached values into the table; every
+other process reads records straight from the mapping without locks or system calls.
+
+Each record is guarded by a seqlock: the writer makes the sequence number odd while it
+updates a record and even again when done, and readers retry when they observe an odd
+or changed sequence number, so a reader never sees a half-written record.
+
+Only the writer can change records, so writes and invalidations made through the
+cache are announced over Redis pub/sub instead: every process stops serving a
+ticker's record until the refresher writes a newer one.
+"""
+
+import asyncio
+import fcntl
+import json
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+import redis  # redis 4.5.0+
+
+from ...core.constants import BorrowStatus
+from ...core.logging import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# File header: magic, layout version, record size, capacity, generation
+TABLE_MAGIC = b"BRRT"
+TABLE_LAYOUT_VERSION = 1
+HEADER = struct.Struct("<4sHHIQ")
+HEADER_SIZE = 64
+
+# Record: seqlock sequence, then ticker, flags, borrow status, event risk factor,
+# borrow rate, volatility and update time, padded to keep sequences 8-byte aligned
+SEQUENCE = struct.Struct("<Q")
+RECORD_BODY = struct.Struct("<10sBBhddd6x")
+RECORD = struct.Struct("<Q10sBBhddd6x")
+RECORD_SIZE = RECORD.size
+
+# Leading part of a record body holding its values, without the update time
+RECORD_CONTENT_SIZE = struct.calcsize("<10sBBhdd")
+
+# Maximum ticker length, matching the stocks table
+MAX_TICKER_LENGTH = 10
+
+# Record flag marking a record whose values may be served
+FLAG_VALID = 0x01
+
+# Sentinels for values that are not known
+NO_EVENT_RISK_FACTOR = -1
+NO_BORROW_STATUS = 0
+
+# Borrow status codes stored in records, 0 means unknown
+BORROW_STATUS_CODES = {status: index + 1 for index, status in enumerate(BorrowStatus)}
+BORROW_STATUS_BY_CODE = {code: status for status, code in BORROW_STATUS_CODES.items()}
+
+# Defaults for the table and its refresher
+DEFAULT_TABLE_CAPACITY = 8192
+DEFAULT_REFRESH_INTERVAL = 5.0
+DEFAULT_MAX_AGE = 30.0
+
+# Readers give up on a record that keeps changing under them
+SEQLOCK_MAX_RETRIES = 8
+
+# Seconds between checks for a missing or replaced table file
+ATTACH_CHECK_INTERVAL = 5.0
+
+# New tickers are refused above this fill ratio to keep probe sequences short
+MAX_LOAD_FACTOR = 0.75
+
+# Redis pub/sub channel announcing tickers whose cached rate changed
+SHARED_RATE_CHANGE_CHANNEL = "shared_rates:changed"
+
+# Seconds to wait before resubscribing after the change subscriber disconnects
+SUBSCRIBER_RETRY_DELAY = 5
+
+# Changed tickers remembered per process before expired entries are pruned
+MAX_CHANGED_TICKERS = 10000
+
+
+def get_default_table_path() -> str:
+    """
+    Returns the default location of the shared rate table file.
+    
+    Returns:
+        str: Path under /dev/shm when available, otherwise under the temp directory
+    """
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, "borrow_rate_table")
+
+
+class SharedRateTable:
+    """
+    Fixed-width ticker rate table in a memory-mapped file shared by all worker processes.
+    
+    Records are placed by open addressing on the CRC32 of the ticker and are never moved
+    within a file, so readers can probe the table without coordination. Slots of tickers
+    that are no longer written are reclaimed by rebuild, which swaps in a new file holding
+    only the current records. Only the process holding the writer lock may call the
+    write methods.
+    
+    Each process also remembers when tickers last changed in the cache and does not
+    serve records written before that. Once listen has been called, records are only
+    served while the change subscriber is connected, so a lost subscription can never
+    hide a change.
+    """
+    
+    def __init__(self, path: Optional[str] = None, capacity: int = DEFAULT_TABLE_CAPACITY,
+                 max_age: float = DEFAULT_MAX_AGE):
+        """
+        Initialize the table handle; the file is mapped on first use.
+        
+        Args:
+            path: Path of the table file (defaults to get_default_table_path())
+            capacity: Number of record slots, used when the writer creates the file
+            max_age: Seconds after which a record is no longer served
+        """
+        self.path = path or get_default_table_path()
+        self.capacity = capacity
+        self.max_age = max_age
+        self._buffer: Optional[mmap.mmap] = None
+        self._inode: Optional[int] = None
+        self._next_attach_check = 0.0
+        self._lock_fd: Optional[int] = None
+        self._slots: Dict[str, int] = {}  # Writer only: ticker -> record offset
+        self._changed: Dict[str, float] = {}  # ticker -> epoch time of the last known change
+        self._changed_lock = threading.Lock()
+        self._all_changed_at = 0.0  # Records written before this are not served
+        self._redis_cache = None
+        self._subscribed = threading.Event()
+        self._subscriber: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+    
+    @property
+    def is_writer(self) -> bool:
+        """True if this process holds the writer lock."""
+        return self._lock_fd is not None
+    
+    @property
+    def generation(self) -> Optional[int]:
+        """Counter bumped by every batch of writes that changed a record, or None if the table is unavailable."""
+        buffer = self._attach()
+        if buffer is None:
+            return None
+        return HEADER.unpack_from(buffer, 0)[4]
+    
+    def get(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the record of a ticker without locking.
+        
+        Args:
+            ticker: Stock symbol
+            
+        Returns:
+            Optional[Dict[str, Any]]: Record with ticker, borrow_rate, volatility,
+            event_risk_factor, borrow_status, updated_at and version, or None if the
+            ticker is absent, invalidated, older than max_age or its last change, or the
+            table is unavailable
+        """
+        if self._redis_cache is not None and not self._subscribed.is_set():
+            return None
+        buffer = self._attach()
+        if buffer is None:
+            return None
+        
+        name = ticker.upper().encode("ascii", "ignore")
+        capacity = (len(buffer) - HEADER_SIZE) // RECORD_SIZE
+        if not name or len(name) > MAX_TICKER_LENGTH or capacity <= 0:
+            return None
+        
+        slot = zlib.crc32(name) % capacity
+        for _ in range(capacity):
+            offset = HEADER_SIZE + slot * RECORD_SIZE
+            record = self._read_record(buffer, offset)
+            if record is None:
+                # Record kept changing under us; treat as a miss rather than spin
+                return None
+            sequence, stored_name, flags, status, event_factor, rate, volatility, updated_at = record
+            stored_name = stored_name.rstrip(b"\0")
+            if not stored_name:
+                return None
+            if stored_name == name:
+                if not flags & FLAG_VALID or time.time() - updated_at > self.max_age:
+                    return None
+                if updated_at <= max(self._changed.get(ticker.upper(), 0.0), self._all_changed_at):
+                    return None
+                return {
+                    "ticker": stored_name.decode("ascii"),
+                    "borrow_rate": Decimal(repr(rate)),
+                    "volatility": None if math.isnan(volatility) else Decimal(repr(volatility)),
+                    "event_risk_factor": None if event_factor == NO_EVENT_RISK_FACTOR else event_factor,
+                    "borrow_status": BORROW_STATUS_BY_CODE.get(status),
+                    "updated_at": updated_at,
+                    "version": sequence // 2
+                }
+            slot = (slot + 1) % capacity
+        return None
+    
+    def try_acquire_writer(self) -> bool:
+        """
+        Try to become the single writer of the table, creating the file if needed.
+        
+        The lock is released by the operating system when the process exits, so another
+        worker takes over on its next attempt.
+        
+        Returns:
+            bool: True if this process holds the writer lock
+        """
+        if self._lock_fd is not None:
+            return True
+        
+        lock_fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(lock_fd)
+            return False
+        
+        self._lock_fd = lock_fd
+        self._open_for_writing()
+        logger.info(f"Acquired shared rate table writer lock for {self.path}")
+        return True
+    
+    def release_writer(self) -> None:
+        """Release the writer lock so another process can take over."""
+        if self._lock_fd is None:
+            return
+        fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        os.close(self._lock_fd)
+        self._lock_fd = None
+        self._slots = {}
+        logger.info(f"Released shared rate table writer lock for {self.path}")
+    
+    def put_many(self, records: Mapping[str, Mapping[str, Any]], updated_at: Optional[float] = None) -> int:
+        """
+        Write records for several tickers; writer only.
+        
+        Args:
+            records: Values by ticker with borrow_rate and optional volatility,
+                event_risk_factor and borrow_status
+            updated_at: Update time in epoch seconds (defaults to now)
+            
+        Returns:
+            int: Number of records written
+        """
+        if not self.is_writer:
+            raise RuntimeError("Shared rate table writes require the writer lock")
+        
+        updated_at = time.time() if updated_at is None else updated_at
+        written = 0
+        changed = False
+        for ticker, values in records.items():
+            offset = self._slot_for(ticker)
+            if offset is None:
+                continue
+            volatility = values.get("volatility")
+            event_factor = values.get("event_risk_factor")
+            changed |= self._write_record(
+                offset,
+                ticker,
+                FLAG_VALID,
+                BORROW_STATUS_CODES.get(values.get("borrow_status"), NO_BORROW_STATUS),
+                NO_EVENT_RISK_FACTOR if event_factor is None else int(event_factor),
+                float(values["borrow_rate"]),
+                math.nan if volatility is None else float(volatility),
+                updated_at
+            )
+            written += 1
+        
+        # Bump the table generation once per batch that changed a value, not for time updates
+        if changed:
+            self._bump_generation()
+        return written
+    
+    def invalidate_many(self, tickers: List[str]) -> int:
+        """
+        Mark the records of several tickers as not servable; writer only.
+        
+        Args:
+            tickers: Stock symbols
+            
+        Returns:
+            int: Number of records invalidated
+        """
+        if not self.is_writer:
+            raise RuntimeError("Shared rate table writes require the writer lock")
+        
+        invalidated = 0
+        changed = False
+        for ticker in tickers:
+            offset = self._slots.get(ticker.upper())
+            if offset is not None:
+                changed |= self._write_record(
+                    offset, ticker, 0, NO_BORROW_STATUS, NO_EVENT_RISK_FACTOR, 0.0, math.nan, 0.0
+                )
+                invalidated += 1
+        if changed:
+            self._bump_generation()
+        return invalidated
+    
+    def rebuild(self, records: Mapping[str, Mapping[str, Any]], updated_at: Optional[float] = None) -> int:
+        """
+        Replace the table with a new file holding only the given records; writer only.
+        
+        The new file is filled before it is swapped in, so readers go straight from the
+        old records to the new ones when they next check the file, and the old mapping
+        is unmapped once nothing in this process reads it anymore.
+        
+        Args:
+            records: Values by ticker, as for put_many
+            updated_at: Update time in epoch seconds (defaults to now)
+            
+        Returns:
+            int: Number of records written
+        """
+        if not self.is_writer:
+            raise RuntimeError("Shared rate table writes require the writer lock")
+        
+        old_buffer, old_slots = self._buffer, self._slots
+        temp_path, buffer = self._new_table(HEADER.unpack_from(old_buffer, 0)[4] + 1)
+        self._buffer, self._slots = buffer, {}
+        try:
+            written = self.put_many(records, updated_at)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            self._buffer, self._slots = old_buffer, old_slots
+            buffer.close()
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        self._inode = os.stat(self.path).st_ino
+        logger.info(f"Rebuilt shared rate table {self.path} with {len(self._slots)} of {len(old_slots)} tickers")
+        return written
+    
+    def mark_changed(self, tickers: Iterable[str], announce: bool = True) -> None:
+        """
+        Stop serving the current records of tickers whose cached values changed.
+        
+        Records are served again once the refresher writes values loaded after the change.
+        
+        Args:
+            tickers: Stock symbols
+            announce: Also tell every other process over pub/sub
+        """
+        tickers = [ticker.upper() for ticker in tickers]
+        if not tickers:
+            return
+        now = time.time()
+        with self._changed_lock:
+            if len(self._changed) + len(tickers) > MAX_CHANGED_TICKERS:
+                # Records older than max_age are not served anyway
+                self._changed = {
+                    ticker: changed_at for ticker, changed_at in self._changed.items()
+                    if now - changed_at <= self.max_age
+                }
+            changed = dict(self._changed)
+            changed.update((ticker, now) for ticker in tickers)
+            self._changed = changed
+        
+        if announce and self._redis_cache is not None:
+            try:
+                self._redis_cache.publish(SHARED_RATE_CHANGE_CHANNEL, json.dumps(tickers))
+            except Exception as e:
+                logger.error(f"Failed to announce shared rate table changes: {str(e)}")
+    
+    def listen(self, redis_cache: Any) -> None:
+        """
+        Follow change announcements from other processes; records are only served while subscribed.
+        
+        Args:
+            redis_cache: RedisCache used to publish and subscribe to changes
+        """
+        self._redis_cache = redis_cache
+        if self._subscriber is not None and self._subscriber.is_alive():
+            return
+        self._stopping.clear()
+        self._subscriber = threading.Thread(target=self._listen, name="shared-rate-changes", daemon=True)
+        self._subscriber.start()
+    
+    @property
+    def max_tickers(self) -> int:
+        """Number of slots that can be taken before new tickers are refused."""
+        return math.ceil(self.capacity * MAX_LOAD_FACTOR)
+    
+    def tickers(self) -> List[str]:
+        """
+        List the tickers that have a record in the table; writer only.
+        
+        Returns:
+            List[str]: Stock symbols
+        """
+        return list(self._slots)
+    
+    def close(self) -> None:
+        """Stop following changes, release the writer lock and unmap the table."""
+        self._stopping.set()
+        self.release_writer()
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+            self._inode = None
+    
+    def _listen(self) -> None:
+        while not self._stopping.is_set():
+            pubsub = None
+            try:
+                pubsub = self._redis_cache.subscribe(SHARED_RATE_CHANGE_CHANNEL)
+                # Changes missed while disconnected are unknown, so distrust every current record
+                self._all_changed_at = time.time()
+                self._subscribed.set()
+                logger.info("Shared rate table change subscriber connected")
+                while not self._stopping.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle_message(message["data"])
+            except (redis.RedisError, OSError) as e:
+                logger.warning(f"Shared rate table change subscriber disconnected: {str(e)}")
+            finally:
+                self._subscribed.clear()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except (redis.RedisError, OSError):
+                        pass
+            self._stopping.wait(SUBSCRIBER_RETRY_DELAY)
+    
+    def _handle_message(self, data: str) -> None:
+        try:
+            tickers = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed shared rate table change: {data!r}")
+            return
+        if isinstance(tickers, list):
+            self.mark_changed([ticker for ticker in tickers if isinstance(ticker, str)], announce=False)
+    
+    def _attach(self) -> Optional[mmap.mmap]:
+        # Readers remap when the file appears or is replaced by a new writer
+        if self.is_writer:
+            return self._buffer
+        now = time.monotonic()
+        if now < self._next_attach_check:
+            return self._buffer
+        self._next_attach_check = now + ATTACH_CHECK_INTERVAL
+        
+        try:
+            inode = os.stat(self.path).st_ino
+            if self._buffer is not None and inode == self._inode:
+                return self._buffer
+            fd = os.open(self.path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                if size < HEADER_SIZE:
+                    return self._buffer
+                buffer = mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_READ)
+            finally:
+                os.close(fd)
+        except OSError:
+            return self._buffer
+        
+        magic, version, record_size, capacity, _ = HEADER.unpack_from(buffer, 0)
+        if (magic != TABLE_MAGIC or version != TABLE_LAYOUT_VERSION or record_size != RECORD_SIZE
+                or len(buffer) != HEADER_SIZE + capacity * RECORD_SIZE):
+            logger.warning(f"Ignoring shared rate table {self.path} with an incompatible layout")
+            buffer.close()
+            return self._buffer
+        
+        if self._buffer is not None:
+            self._buffer.close()
+        self._buffer = buffer
+        self._inode = inode
+        logger.info(f"Attached shared rate table {self.path} ({capacity} slots)")
+        return buffer
+    
+    def _open_for_writing(self) -> None:
+        size = HEADER_SIZE + self.capacity * RECORD_SIZE
+        try:
+            fd = os.open(self.path, os.O_RDWR)
+        except FileNotFoundError:
+            fd = None
+        
+        if fd is not None:
+            try:
+                buffer = mmap.mmap(fd, 0) if os.fstat(fd).st_size >= HEADER_SIZE else None
+            finally:
+                os.close(fd)
+            # Keep the records of a compatible table so a new writer starts warm
+            if buffer is not None and len(buffer) == size and HEADER.unpack_from(buffer, 0)[:4] == (
+                    TABLE_MAGIC, TABLE_LAYOUT_VERSION, RECORD_SIZE, self.capacity):
+                self._map_for_writing(buffer)
+                return
+            if buffer is not None:
+                buffer.close()
+        
+        # Build a new table next to the old one and swap it in atomically
+        temp_path, buffer = self._new_table(0)
+        os.replace(temp_path, self.path)
+        logger.info(f"Created shared rate table {self.path} ({self.capacity} slots, {size} bytes)")
+        self._map_for_writing(buffer)
+    
+    def _new_table(self, generation: int) -> tuple:
+        # Returns the path and mapping of an empty table file that is not yet in place
+        size = HEADER_SIZE + self.capacity * RECORD_SIZE
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            buffer = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        HEADER.pack_into(buffer, 0, TABLE_MAGIC, TABLE_LAYOUT_VERSION, RECORD_SIZE, self.capacity, generation)
+        return temp_path, buffer
+    
+    def _map_for_writing(self, buffer: mmap.mmap) -> None:
+        if self._buffer is not None:
+            self._buffer.close()
+        self._buffer = buffer
+        self._inode = os.stat(self.path).st_ino
+        self._slots = {}
+        for slot in range(self.capacity):
+            offset = HEADER_SIZE + slot * RECORD_SIZE
+            name = RECORD.unpack_from(buffer, offset)[1].rstrip(b"\0")
+            if name:
+                self._slots[name.decode("ascii")] = offset
+    
+    def _bump_generation(self) -> None:
+        generation = HEADER.unpack_from(self._buffer, 0)[4]
+        HEADER.pack_into(self._buffer, 0, TABLE_MAGIC, TABLE_LAYOUT_VERSION, RECORD_SIZE, self.capacity, generation + 1)
+    
+    def _slot_for(self, ticker: str) -> Optional[int]:
+        ticker = ticker.upper()
+        offset = self._slots.get(ticker)
+        if offset is not None:
+            return offset
+        
+        if not ticker or not ticker.isascii() or len(ticker) > MAX_TICKER_LENGTH:
+            logger.warning(f"Ticker {ticker!r} cannot be stored in the shared rate table")
+            return None
+        if len(self._slots) >= self.max_tickers:
+            logger.warning(f"Shared rate table is full, not storing {ticker}")
+            return None
+        
+        # Claim the first empty slot on the probe sequence; readers stop at empty slots
+        slot = zlib.crc32(ticker.encode("ascii")) % self.capacity
+        while True:
+            offset = HEADER_SIZE + slot * RECORD_SIZE
+            if not RECORD.unpack_from(self._buffer, offset)[1].rstrip(b"\0"):
+                self._slots[ticker] = offset
+                return offset
+            slot = (slot + 1) % self.capacity
+    
+    def _write_record(self, offset: int, ticker: str, flags: int, status: int, event_factor: int,
+                      rate: float, volatility: float, updated_at: float) -> bool:
+        # Returns whether any value other than the update time changed
+        buffer = self._buffer
+        body = RECORD_BODY.pack(ticker.upper().encode("ascii"), flags, status, event_factor, rate, volatility, updated_at)
+        start = offset + SEQUENCE.size
+        changed = buffer[start:start + RECORD_CONTENT_SIZE] != body[:RECORD_CONTENT_SIZE]
+        
+        sequence = SEQUENCE.unpack_from(buffer, offset)[0]
+        SEQUENCE.pack_into(buffer, offset, sequence + 1)
+        buffer[start:start + RECORD_BODY.size] = body
+        SEQUENCE.pack_into(buffer, offset, sequence + 2)
+        return changed
+    
+    @staticmethod
+    def _read_record(buffer: mmap.mmap, offset: int) -> Optional[tuple]:
+        for _ in range(SEQLOCK_MAX_RETRIES):
+            record = RECORD.unpack_from(buffer, offset)
+            if record[0] & 1:
+                continue
+            if SEQUENCE.unpack_from(buffer, offset)[0] == record[0]:
+                return record
+        return None
+
+
+class SharedRateRefresher:
+    """
+    Background task that keeps the shared rate table filled while this process is the writer.
+    
+    Every worker runs a refresher, but only the one holding the writer lock loads and
+    writes records; the others retry the lock on each interval and take over if the
+    writer exits.
+    """
+    
+    def __init__(self, table: SharedRateTable, load: Callable[[], Dict[str, Dict[str, Any]]],
+                 interval: float = DEFAULT_REFRESH_INTERVAL):
+        """
+        Initialize the refresher.
+        
+        Args:
+            table: Shared rate table to fill
+            load: Blocking function returning the current values by ticker
+            interval: Seconds between refreshes
+        """
+        self.table = table
+        self.load = load
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        """True while the refresh task is scheduled."""
+        return self._task is not None and not self._task.done()
+    
+    def refresh(self) -> int:
+        """
+        Load the current values and write them to the table if this process is the writer.
+        
+        Tickers that are in the table but no longer loaded are invalidated, so readers
+        fall back to the cache instead of serving values that have expired there. Their
+        slots stay taken until the loaded tickers no longer fit next to them; the table
+        is then rebuilt from the loaded records alone.
+        
+        Returns:
+            int: Number of records written, 0 if this process is not the writer
+        """
+        if not self.table.try_acquire_writer():
+            return 0
+        
+        # Stamp records with the load start so changes made during the load stay hidden
+        loaded_at = time.time()
+        records = self.load()
+        loaded = {ticker.upper() for ticker in records}
+        current = self.table.tickers()
+        removed = [ticker for ticker in current if ticker not in loaded]
+        if removed and len(loaded.union(current)) > self.table.max_tickers:
+            written = self.table.rebuild(records, updated_at=loaded_at)
+            invalidated = len(removed)
+        else:
+            written = self.table.put_many(records, updated_at=loaded_at)
+            invalidated = self.table.invalidate_many(removed)
+        logger.debug(f"Refreshed shared rate table: {written} written, {invalidated} invalidated")
+        return written
+    
+    def start(self) -> None:
+        """Start the background refresh task on the running event loop."""
+        if self.running:
+            return
+        self._task = asyncio.ensure_future(self._run())
+        logger.info(f"Shared rate table refresher started (interval={self.interval}s)")
+    
+    async def stop(self) -> None:
+        """Cancel the refresh task and release the writer lock."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.table.release_writer()
+        logger.info("Shared rate table refresher stopped")
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                logger.error(f"Shared rate table refresh failed: {str(e)}")
+            await asyncio.sleep(self.interval)
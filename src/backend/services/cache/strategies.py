@@ -8,9 +8,15 @@ with appropriate fallback mechanisms when primary caches are unavailable.
 """
 
 import abc
-from typing import Any, Optional
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, Mapping, Optional
 
-from .utils import get_ttl_for_data_type
+import redis  # redis 4.5.0+
+
+from .utils import get_ttl_for_data_type, get_cache_namespace
 from ...core.constants import (
     CACHE_TTL_BORROW_RATE,
     CACHE_TTL_VOLATILITY,
@@ -23,6 +29,21 @@ from ...core.logging import get_logger
 # Initialize logger
 logger = get_logger(__name__)
 
+# Key types held in the process-local near cache by default
+NEAR_CACHE_KEY_TYPES = ('borrow_rate', 'broker_config')
+
+# Upper bound on the lifetime of a near cache entry, in seconds
+NEAR_CACHE_MAX_TTL = 60
+
+# Upper bound on near cache entries per process
+NEAR_CACHE_MAX_ENTRIES = 10000
+
+# Redis pub/sub channel for near cache invalidations
+NEAR_CACHE_INVALIDATION_CHANNEL = "cache:near:invalidate"
+
+# Seconds to wait before resubscribing after a pub/sub failure
+SUBSCRIBER_RETRY_DELAY = 5
+
 
 def get_ttl_for_key_type(key: str) -> int:
     """
@@ -51,6 +72,30 @@ def get_ttl_for_key_type(key: str) -> int:
         return CACHE_TTL_CALCULATION
 
 
+def resolve_ttls(
+    items: Mapping[str, Any],
+    ttl: Optional[int] = None,
+    ttls: Optional[Mapping[str, int]] = None
+) -> Dict[str, int]:
+    """
+    Determines the TTL of every key in a batch.
+    
+    Args:
+        items: Values to store by cache key
+        ttl: TTL in seconds for all keys (optional)
+        ttls: Per-key TTL in seconds, overriding ttl (optional)
+        
+    Returns:
+        TTL in seconds by key, defaulting to the TTL of the key type
+    """
+    ttls = ttls or {}
+    resolved = {}
+    for key in items:
+        key_ttl = ttls.get(key, ttl)
+        resolved[key] = key_ttl if key_ttl is not None else get_ttl_for_key_type(key)
+    return resolved
+
+
 class CacheStrategy(abc.ABC):
     """
     Abstract base class defining the interface for all cache strategies.
@@ -71,7 +116,7 @@ class CacheStrategy(abc.ABC):
         pass
     
     @abc.abstractmethod
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None) -> bool:
         """
         Store a value in cache with the specified key and TTL.
         
@@ -79,6 +124,7 @@ class CacheStrategy(abc.ABC):
             key: Cache key
             value: Value to store
             ttl: Time-to-live in seconds (optional)
+            tags: Invalidation tags for the entry (optional)
             
         Returns:
             True if the value was successfully cached
@@ -98,6 +144,53 @@ class CacheStrategy(abc.ABC):
         """
         pass
     
+    @abc.abstractmethod
+    def get_many(self, keys: Iterable[str], value_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieve several values from cache in one batch.
+        
+        Args:
+            keys: Cache keys
+            value_type: Optional type hint for conversion
+            
+        Returns:
+            Cached values by key; keys not found are omitted
+        """
+        pass
+    
+    @abc.abstractmethod
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Mapping[str, int]] = None
+    ) -> bool:
+        """
+        Store several values in cache in one batch.
+        
+        Args:
+            items: Values to store by cache key
+            ttl: Time-to-live in seconds for all items (optional)
+            ttls: Per-key time-to-live in seconds, overriding ttl (optional)
+            
+        Returns:
+            True if the values were successfully cached
+        """
+        pass
+    
+    @abc.abstractmethod
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Remove several values from cache in one batch.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Number of keys found and deleted
+        """
+        pass
+    
     @abc.abstractmethod
     def exists(self, key: str) -> bool:
         """
@@ -120,6 +213,77 @@ class CacheStrategy(abc.ABC):
             True if the cache was successfully cleared
         """
         pass
+    
+    @abc.abstractmethod
+    def invalidate_namespace(self, namespace: str) -> bool:
+        """
+        Invalidate all values of a cache namespace (data type).
+        
+        Args:
+            namespace: Cache namespace, e.g. "volatility"
+            
+        Returns:
+            True if the namespace was invalidated
+        """
+        pass
+    
+    @abc.abstractmethod
+    def invalidate_tag(self, tag: str) -> bool:
+        """
+        Invalidate all values stored with an invalidation tag.
+        
+        Args:
+            tag: Invalidation tag, e.g. from get_ticker_tag
+            
+        Returns:
+            True if the tag was invalidated
+        """
+        pass
+
+
+    async def get_many_async(self, keys: Iterable[str], value_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Asynchronous version of get_many that runs the blocking cache I/O in a worker thread.
+        
+        Args:
+            keys: Cache keys
+            value_type: Optional type hint for conversion
+            
+        Returns:
+            Cached values by key; keys not found are omitted
+        """
+        return await asyncio.to_thread(self.get_many, list(keys), value_type)
+    
+    async def set_many_async(
+        self,
+        items: Mapping[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Mapping[str, int]] = None
+    ) -> bool:
+        """
+        Asynchronous version of set_many that runs the blocking cache I/O in a worker thread.
+        
+        Args:
+            items: Values to store by cache key
+            ttl: Time-to-live in seconds for all items (optional)
+            ttls: Per-key time-to-live in seconds, overriding ttl (optional)
+            
+        Returns:
+            True if the values were successfully cached
+        """
+        return await asyncio.to_thread(self.set_many, items, ttl, ttls)
+    
+    async def delete_many_async(self, keys: Iterable[str]) -> int:
+        """
+        Asynchronous version of delete_many that runs the blocking cache I/O in a worker thread.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Number of keys found and deleted
+        """
+        return await asyncio.to_thread(self.delete_many, list(keys))
 
 
 class SingleCacheStrategy(CacheStrategy):
@@ -150,7 +314,7 @@ class SingleCacheStrategy(CacheStrategy):
         """
         return self._cache.get(key, value_type)
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None) -> bool:
         """
         Store a value in the cache with the specified key and TTL.
         
@@ -158,6 +322,7 @@ class SingleCacheStrategy(CacheStrategy):
             key: Cache key
             value: Value to store
             ttl: Time-to-live in seconds (optional)
+            tags: Invalidation tags for the entry (optional)
             
         Returns:
             True if the value was successfully cached
@@ -166,6 +331,8 @@ class SingleCacheStrategy(CacheStrategy):
         if ttl is None:
             ttl = get_ttl_for_key_type(key)
         
+        if tags:
+            return self._cache.set(key, value, ttl, tags=tags)
         return self._cache.set(key, value, ttl)
     
     def delete(self, key: str) -> bool:
@@ -180,6 +347,50 @@ class SingleCacheStrategy(CacheStrategy):
         """
         return self._cache.delete(key)
     
+    def get_many(self, keys: Iterable[str], value_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieve several values from the cache in one batch.
+        
+        Args:
+            keys: Cache keys
+            value_type: Optional type hint for conversion
+            
+        Returns:
+            Cached values by key; keys not found are omitted
+        """
+        return self._cache.get_many(keys, value_type)
+    
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Mapping[str, int]] = None
+    ) -> bool:
+        """
+        Store several values in the cache in one batch.
+        
+        Args:
+            items: Values to store by cache key
+            ttl: Time-to-live in seconds for all items (optional)
+            ttls: Per-key time-to-live in seconds, overriding ttl (optional)
+            
+        Returns:
+            True if the values were successfully cached
+        """
+        return self._cache.set_many(items, ttls=resolve_ttls(items, ttl, ttls))
+    
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Remove several values from the cache in one batch.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Number of keys found and deleted
+        """
+        return self._cache.delete_many(keys)
+    
     def exists(self, key: str) -> bool:
         """
         Check if a key exists in the cache.
@@ -200,6 +411,32 @@ class SingleCacheStrategy(CacheStrategy):
             True if the cache was successfully cleared
         """
         return self._cache.flush()
+    
+    def invalidate_namespace(self, namespace: str) -> bool:
+        """
+        Invalidate all values of a cache namespace (data type).
+        
+        Args:
+            namespace: Cache namespace, e.g. "volatility"
+            
+        Returns:
+            True if the namespace was invalidated
+        """
+        self._cache.invalidate_namespace(namespace)
+        return True
+    
+    def invalidate_tag(self, tag: str) -> bool:
+        """
+        Invalidate all values stored with an invalidation tag.
+        
+        Args:
+            tag: Invalidation tag, e.g. from get_ticker_tag
+            
+        Returns:
+            True if the tag was invalidated
+        """
+        self._cache.invalidate_tag(tag)
+        return True
 
 
 class TieredCacheStrategy(CacheStrategy):
@@ -226,6 +463,11 @@ class TieredCacheStrategy(CacheStrategy):
         First checks the primary cache, then falls back to the secondary cache.
         If found in secondary but not primary, it will update the primary cache.
         
+        Keys in a versioned namespace are only read from the secondary cache while
+        the primary is unreachable, and are never copied back into the primary: a
+        primary miss may be a namespace or tag invalidation made by another process,
+        which this process's secondary cache has not seen.
+        
         Args:
             key: Cache key
             value_type: Optional type hint for conversion
@@ -239,22 +481,28 @@ class TieredCacheStrategy(CacheStrategy):
             logger.debug(f"Cache hit in primary cache for key: {key}")
             return value
         
+        versioned = get_cache_namespace(key) is not None
+        if versioned and self._primary_available():
+            logger.debug(f"Cache miss in primary cache for versioned key: {key}")
+            return None
+        
         # If not in primary, try secondary cache
         logger.debug(f"Cache miss in primary cache for key: {key}, trying secondary")
         value = self._secondary_cache.get(key, value_type)
         
         if value is not None:
-            # Found in secondary, update primary cache
-            logger.debug(f"Cache hit in secondary cache for key: {key}, updating primary")
-            ttl = get_ttl_for_key_type(key)
-            self._primary_cache.set(key, value, ttl)
+            logger.debug(f"Cache hit in secondary cache for key: {key}")
+            if not versioned:
+                # Found in secondary, update primary cache
+                ttl = get_ttl_for_key_type(key)
+                self._primary_cache.set(key, value, ttl)
             return value
         
         # Not found in either cache
         logger.debug(f"Cache miss for key: {key} in both caches")
         return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None) -> bool:
         """
         Store a value in both primary and secondary caches.
         
@@ -262,6 +510,7 @@ class TieredCacheStrategy(CacheStrategy):
             key: Cache key
             value: Value to store
             ttl: Time-to-live in seconds (optional)
+            tags: Invalidation tags for the entry (optional)
             
         Returns:
             True if the value was successfully cached in at least one cache
@@ -275,12 +524,18 @@ class TieredCacheStrategy(CacheStrategy):
         secondary_success = False
         
         try:
-            primary_success = self._primary_cache.set(key, value, ttl)
+            if tags:
+                primary_success = self._primary_cache.set(key, value, ttl, tags=tags)
+            else:
+                primary_success = self._primary_cache.set(key, value, ttl)
         except Exception as e:
             logger.warning(f"Failed to set key {key} in primary cache: {str(e)}")
         
         try:
-            secondary_success = self._secondary_cache.set(key, value, ttl)
+            if tags:
+                secondary_success = self._secondary_cache.set(key, value, ttl, tags=tags)
+            else:
+                secondary_success = self._secondary_cache.set(key, value, ttl)
         except Exception as e:
             logger.warning(f"Failed to set key {key} in secondary cache: {str(e)}")
         
@@ -314,6 +569,120 @@ class TieredCacheStrategy(CacheStrategy):
         # Return True if at least one delete operation succeeded
         return primary_success or secondary_success
     
+    def get_many(self, keys: Iterable[str], value_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieve several values from the cache hierarchy in one batch per level.
+        
+        Keys missing from the primary cache are looked up in the secondary cache
+        with a single call, and the values found there are written back to the
+        primary cache with a single call. Keys in a versioned namespace follow the
+        same rules as in get.
+        
+        Args:
+            keys: Cache keys
+            value_type: Optional type hint for conversion
+            
+        Returns:
+            Cached values by key; keys not found in either cache are omitted
+        """
+        keys = list(dict.fromkeys(keys))
+        
+        # Try to get from primary cache first
+        values = self._primary_cache.get_many(keys, value_type)
+        missing = [key for key in keys if key not in values]
+        if not missing:
+            logger.debug(f"Cache hit in primary cache for all {len(keys)} keys")
+            return values
+        
+        if self._primary_available():
+            # Primary misses of versioned keys are authoritative
+            missing = [key for key in missing if get_cache_namespace(key) is None]
+            if not missing:
+                return values
+        
+        # Look up the misses in the secondary cache
+        logger.debug(f"Cache miss in primary cache for {len(missing)} of {len(keys)} keys, trying secondary")
+        secondary_values = self._secondary_cache.get_many(missing, value_type)
+        backfill = {key: value for key, value in secondary_values.items() if get_cache_namespace(key) is None}
+        
+        if backfill:
+            # Backfill the primary cache in one batch
+            logger.debug(f"Cache hit in secondary cache for {len(backfill)} keys, updating primary")
+            try:
+                self._primary_cache.set_many(
+                    backfill,
+                    ttls={key: get_ttl_for_key_type(key) for key in backfill}
+                )
+            except Exception as e:
+                logger.warning(f"Failed to backfill {len(backfill)} keys in primary cache: {str(e)}")
+        values.update(secondary_values)
+        
+        return values
+    
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Mapping[str, int]] = None
+    ) -> bool:
+        """
+        Store several values in both primary and secondary caches in one batch each.
+        
+        Args:
+            items: Values to store by cache key
+            ttl: Time-to-live in seconds for all items (optional)
+            ttls: Per-key time-to-live in seconds, overriding ttl (optional)
+            
+        Returns:
+            True if the values were successfully cached in at least one cache
+        """
+        ttls = resolve_ttls(items, ttl, ttls)
+        
+        # Try to set in both caches
+        primary_success = False
+        secondary_success = False
+        
+        try:
+            primary_success = self._primary_cache.set_many(items, ttls=ttls)
+        except Exception as e:
+            logger.warning(f"Failed to set {len(items)} keys in primary cache: {str(e)}")
+        
+        try:
+            secondary_success = self._secondary_cache.set_many(items, ttls=ttls)
+        except Exception as e:
+            logger.warning(f"Failed to set {len(items)} keys in secondary cache: {str(e)}")
+        
+        # Return True if at least one cache operation succeeded
+        return primary_success or secondary_success
+    
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Remove several values from both primary and secondary caches in one batch each.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Largest number of keys deleted from either cache
+        """
+        keys = list(keys)
+        
+        # Try to delete from both caches
+        primary_deleted = 0
+        secondary_deleted = 0
+        
+        try:
+            primary_deleted = self._primary_cache.delete_many(keys)
+        except Exception as e:
+            logger.warning(f"Failed to delete {len(keys)} keys from primary cache: {str(e)}")
+        
+        try:
+            secondary_deleted = self._secondary_cache.delete_many(keys)
+        except Exception as e:
+            logger.warning(f"Failed to delete {len(keys)} keys from secondary cache: {str(e)}")
+        
+        return max(primary_deleted, secondary_deleted)
+    
     def exists(self, key: str) -> bool:
         """
         Check if a key exists in either primary or secondary cache.
@@ -354,6 +723,402 @@ class TieredCacheStrategy(CacheStrategy):
         
         # Return True if at least one flush operation succeeded
         return primary_success or secondary_success
+    
+    def invalidate_namespace(self, namespace: str) -> bool:
+        """
+        Invalidate a cache namespace in both primary and secondary caches.
+        
+        Args:
+            namespace: Cache namespace, e.g. "volatility"
+            
+        Returns:
+            True if the namespace was invalidated in at least one cache
+        """
+        primary_success = False
+        secondary_success = False
+        
+        try:
+            self._primary_cache.invalidate_namespace(namespace)
+            primary_success = True
+        except Exception as e:
+            logger.warning(f"Failed to invalidate namespace {namespace} in primary cache: {str(e)}")
+        
+        try:
+            self._secondary_cache.invalidate_namespace(namespace)
+            secondary_success = True
+        except Exception as e:
+            logger.warning(f"Failed to invalidate namespace {namespace} in secondary cache: {str(e)}")
+        
+        return primary_success or secondary_success
+    
+    def invalidate_tag(self, tag: str) -> bool:
+        """
+        Invalidate a tag in both primary and secondary caches.
+        
+        Args:
+            tag: Invalidation tag, e.g. from get_ticker_tag
+            
+        Returns:
+            True if the tag was invalidated in at least one cache
+        """
+        primary_success = False
+        secondary_success = False
+        
+        try:
+            self._primary_cache.invalidate_tag(tag)
+            primary_success = True
+        except Exception as e:
+            logger.warning(f"Failed to invalidate tag {tag} in primary cache: {str(e)}")
+        
+        try:
+            self._secondary_cache.invalidate_tag(tag)
+            secondary_success = True
+        except Exception as e:
+            logger.warning(f"Failed to invalidate tag {tag} in secondary cache: {str(e)}")
+        
+        return primary_success or secondary_success
+    
+    def _primary_available(self) -> bool:
+        # RedisCache reports its last known connection state without a round trip
+        return getattr(self._primary_cache, "connected", True) is not False
+
+
+class NearCacheStrategy(CacheStrategy):
+    """
+    Process-local near cache for hot key types, kept coherent over Redis pub/sub.
+    
+    Reads of the configured key types are served from process memory and only
+    fall through to the wrapped strategy on a miss. Every write, delete and
+    invalidation made through this strategy is published on an invalidation
+    channel so that all processes drop their near copies. Near entries are only
+    used while the invalidation subscriber is connected, and are dropped when it
+    disconnects, so a lost subscription can never serve stale values beyond the
+    max_ttl bound.
+    """
+    
+    def __init__(
+        self,
+        inner: CacheStrategy,
+        redis_cache: Any,
+        key_types: Iterable[str] = NEAR_CACHE_KEY_TYPES,
+        max_ttl: int = NEAR_CACHE_MAX_TTL,
+        max_entries: int = NEAR_CACHE_MAX_ENTRIES
+    ):
+        """
+        Initialize the near cache around another cache strategy.
+        
+        Args:
+            inner: Strategy that owns the shared cache levels
+            redis_cache: RedisCache used to publish and subscribe to invalidations
+            key_types: Key prefixes (data types) held in the near cache
+            max_ttl: Maximum lifetime of a near entry in seconds
+            max_entries: Maximum number of near entries per process
+        """
+        self._inner = inner
+        self._redis_cache = redis_cache
+        self._key_types = frozenset(key_types)
+        self._max_ttl = max_ttl
+        self._max_entries = max_entries
+        self._entries: Dict[str, tuple] = {}  # key -> (monotonic expiry, value)
+        self._sequence = 0  # Bumped on every eviction to discard racing read-through stores
+        self._lock = threading.Lock()
+        self._subscribed = threading.Event()
+        self._subscriber: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        logger.info(f"Initialized NearCacheStrategy for key types: {', '.join(sorted(self._key_types))}")
+    
+    def get(self, key: str, value_type: Optional[str] = None) -> Optional[Any]:
+        """
+        Retrieve a value, serving near key types from process memory when possible.
+        
+        Args:
+            key: Cache key
+            value_type: Optional type hint for conversion
+            
+        Returns:
+            The cached value or None if not found
+        """
+        if not self._is_near_key(key):
+            return self._inner.get(key, value_type)
+        
+        self.ensure_subscriber()
+        if self._subscribed.is_set():
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                logger.debug(f"Cache hit in near cache for key: {key}")
+                return entry[1]
+        
+        sequence = self._sequence
+        value = self._inner.get(key, value_type)
+        if value is not None:
+            self._store_local({key: value}, sequence)
+        return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None) -> bool:
+        """
+        Store a value in the wrapped strategy and invalidate near copies everywhere.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (optional)
+            tags: Invalidation tags for the entry (optional)
+            
+        Returns:
+            True if the value was successfully cached
+        """
+        if tags:
+            success = self._inner.set(key, value, ttl, tags=tags)
+        else:
+            success = self._inner.set(key, value, ttl)
+        self._invalidate_keys([key])
+        return success
+    
+    def delete(self, key: str) -> bool:
+        """
+        Remove a value from the wrapped strategy and from near caches everywhere.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            True if the key was found and deleted
+        """
+        success = self._inner.delete(key)
+        self._invalidate_keys([key])
+        return success
+    
+    def get_many(self, keys: Iterable[str], value_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieve several values, sending only near misses to the wrapped strategy.
+        
+        Args:
+            keys: Cache keys
+            value_type: Optional type hint for conversion
+            
+        Returns:
+            Cached values by key; keys not found are omitted
+        """
+        keys = list(dict.fromkeys(keys))
+        values: Dict[str, Any] = {}
+        
+        if any(self._is_near_key(key) for key in keys):
+            self.ensure_subscriber()
+            if self._subscribed.is_set():
+                now = time.monotonic()
+                with self._lock:
+                    for key in keys:
+                        entry = self._entries.get(key)
+                        if entry is not None and entry[0] > now:
+                            values[key] = entry[1]
+        
+        missing = [key for key in keys if key not in values]
+        if not missing:
+            return values
+        
+        sequence = self._sequence
+        found = self._inner.get_many(missing, value_type)
+        self._store_local({key: value for key, value in found.items() if self._is_near_key(key)}, sequence)
+        values.update(found)
+        return values
+    
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Mapping[str, int]] = None
+    ) -> bool:
+        """
+        Store several values in the wrapped strategy and invalidate their near copies everywhere.
+        
+        Args:
+            items: Values to store by cache key
+            ttl: Time-to-live in seconds for all items (optional)
+            ttls: Per-key time-to-live in seconds, overriding ttl (optional)
+            
+        Returns:
+            True if the values were successfully cached
+        """
+        success = self._inner.set_many(items, ttl, ttls)
+        self._invalidate_keys(list(items))
+        return success
+    
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Remove several values from the wrapped strategy and from near caches everywhere.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Number of keys found and deleted
+        """
+        keys = list(keys)
+        deleted = self._inner.delete_many(keys)
+        self._invalidate_keys(keys)
+        return deleted
+    
+    def exists(self, key: str) -> bool:
+        """
+        Check if a key exists in the wrapped strategy.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            True if the key exists
+        """
+        return self._inner.exists(key)
+    
+    def flush(self) -> bool:
+        """
+        Clear the wrapped strategy and every near cache.
+        
+        Returns:
+            True if the cache was successfully cleared
+        """
+        success = self._inner.flush()
+        self._evict_local()
+        self._publish({"op": "flush"})
+        return success
+    
+    def invalidate_namespace(self, namespace: str) -> bool:
+        """
+        Invalidate a cache namespace in the wrapped strategy and in every near cache.
+        
+        Args:
+            namespace: Cache namespace, e.g. "borrow_rate"
+            
+        Returns:
+            True if the namespace was invalidated
+        """
+        success = self._inner.invalidate_namespace(namespace)
+        self._evict_local(namespace=namespace)
+        self._publish({"op": "namespace", "namespace": namespace})
+        return success
+    
+    def invalidate_tag(self, tag: str) -> bool:
+        """
+        Invalidate a tag in the wrapped strategy and in every near cache.
+        
+        Near entries populated by reads do not know their tags, so the receiving
+        processes drop their whole near cache.
+        
+        Args:
+            tag: Invalidation tag, e.g. from get_ticker_tag
+            
+        Returns:
+            True if the tag was invalidated
+        """
+        success = self._inner.invalidate_tag(tag)
+        self._evict_local()
+        self._publish({"op": "tag", "tag": tag})
+        return success
+    
+    def clear_local(self) -> None:
+        """Drop all near entries in this process."""
+        self._evict_local()
+    
+    def ensure_subscriber(self) -> None:
+        """Start the invalidation subscriber thread if it is not running."""
+        if self._subscriber is not None and self._subscriber.is_alive():
+            return
+        with self._lock:
+            if self._subscriber is not None and self._subscriber.is_alive():
+                return
+            self._stopping.clear()
+            self._subscriber = threading.Thread(
+                target=self._listen, name="near-cache-invalidation", daemon=True
+            )
+            self._subscriber.start()
+    
+    def stop(self) -> None:
+        """Stop the invalidation subscriber and drop all near entries."""
+        self._stopping.set()
+        self._subscribed.clear()
+        self.clear_local()
+    
+    def _listen(self) -> None:
+        while not self._stopping.is_set():
+            pubsub = None
+            try:
+                pubsub = self._redis_cache.subscribe(NEAR_CACHE_INVALIDATION_CHANNEL)
+                self._subscribed.set()
+                logger.info("Near cache invalidation subscriber connected")
+                while not self._stopping.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle_message(message["data"])
+            except (redis.RedisError, OSError) as e:
+                logger.warning(f"Near cache invalidation subscriber disconnected: {str(e)}")
+            finally:
+                # Without a subscription near entries could miss invalidations, so drop them
+                self._subscribed.clear()
+                self.clear_local()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except (redis.RedisError, OSError):
+                        pass
+            self._stopping.wait(SUBSCRIBER_RETRY_DELAY)
+    
+    def _handle_message(self, data: str) -> None:
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed near cache invalidation: {data!r}")
+            return
+        
+        op = message.get("op")
+        if op == "keys":
+            self._evict_local(keys=message.get("keys", ()))
+        elif op == "namespace":
+            self._evict_local(namespace=message.get("namespace"))
+        else:
+            # "tag", "flush" and unknown operations drop everything
+            self._evict_local()
+    
+    def _invalidate_keys(self, keys: list) -> None:
+        near_keys = [key for key in keys if self._is_near_key(key)]
+        if near_keys:
+            self._evict_local(keys=near_keys)
+            self._publish({"op": "keys", "keys": near_keys})
+    
+    def _publish(self, message: Dict[str, Any]) -> None:
+        try:
+            self._redis_cache.publish(NEAR_CACHE_INVALIDATION_CHANNEL, json.dumps(message))
+        except Exception as e:
+            logger.error(f"Failed to propagate near cache invalidation: {str(e)}")
+    
+    def _is_near_key(self, key: str) -> bool:
+        return key.split(':', 1)[0] in self._key_types
+    
+    def _store_local(self, values: Mapping[str, Any], sequence: int) -> None:
+        if not values or not self._subscribed.is_set():
+            return
+        now = time.monotonic()
+        with self._lock:
+            # An eviction since the read started means the values may already be stale
+            if self._sequence != sequence:
+                return
+            if len(self._entries) + len(values) > self._max_entries:
+                self._entries.clear()
+            for key, value in values.items():
+                expires_at = now + min(self._max_ttl, get_ttl_for_key_type(key))
+                self._entries[key] = (expires_at, value)
+    
+    def _evict_local(self, keys: Optional[Iterable[str]] = None, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            self._sequence += 1
+            if keys is not None:
+                for key in keys:
+                    self._entries.pop(key, None)
+            elif namespace is not None:
+                prefix = f"{namespace}:"
+                self._entries = {key: entry for key, entry in self._entries.items() if not key.startswith(prefix)}
+            else:
+                self._entries.clear()
 
 
 class NullCacheStrategy(CacheStrategy):
@@ -383,7 +1148,7 @@ class NullCacheStrategy(CacheStrategy):
         logger.debug(f"NullCache get operation for key: {key} (always misses)")
         return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None) -> bool:
         """
         No-op implementation that pretends to cache.
         
@@ -391,6 +1156,7 @@ class NullCacheStrategy(CacheStrategy):
             key: Cache key
             value: Value to store
             ttl: Time-to-live in seconds (optional)
+            tags: Invalidation tags for the entry (optional)
             
         Returns:
             bool: Always returns True
@@ -411,6 +1177,53 @@ class NullCacheStrategy(CacheStrategy):
         logger.debug(f"NullCache delete operation for key: {key} (no-op)")
         return True
     
+    def get_many(self, keys: Iterable[str], value_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Always returns an empty dictionary as if every key missed.
+        
+        Args:
+            keys: Cache keys
+            value_type: Optional type hint for conversion
+            
+        Returns:
+            Dict[str, Any]: Always returns an empty dictionary
+        """
+        logger.debug("NullCache get_many operation (always misses)")
+        return {}
+    
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Mapping[str, int]] = None
+    ) -> bool:
+        """
+        No-op implementation that pretends to cache.
+        
+        Args:
+            items: Values to store by cache key
+            ttl: Time-to-live in seconds for all items (optional)
+            ttls: Per-key time-to-live in seconds (optional)
+            
+        Returns:
+            bool: Always returns True
+        """
+        logger.debug(f"NullCache set_many operation for {len(items)} keys (no-op)")
+        return True
+    
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        No-op implementation that pretends to delete.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            int: Always returns 0
+        """
+        logger.debug("NullCache delete_many operation (no-op)")
+        return 0
+    
     def exists(self, key: str) -> bool:
         """
         Always returns False as if key doesn't exist.
@@ -431,4 +1244,30 @@ class NullCacheStrategy(CacheStrategy):
             bool: Always returns True
         """
         logger.debug("NullCache flush operation (no-op)")
+        return True
+    
+    def invalidate_namespace(self, namespace: str) -> bool:
+        """
+        No-op implementation that pretends to invalidate a namespace.
+        
+        Args:
+            namespace: Cache namespace
+            
+        Returns:
+            bool: Always returns True
+        """
+        logger.debug(f"NullCache invalidate_namespace operation for namespace: {namespace} (no-op)")
+        return True
+    
+    def invalidate_tag(self, tag: str) -> bool:
+        """
+        No-op implementation that pretends to invalidate a tag.
+        
+        Args:
+            tag: Invalidation tag
+            
+        Returns:
+            bool: Always returns True
+        """
+        logger.debug(f"NullCache invalidate_tag operation for tag: {tag} (no-op)")
         return True
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Ticker universe filter for the Borrow Rate & Locate Fee Pricing Engine.
+
+Requests for unknown or delisted tickers used to pass validation and reach the database
+and the external APIs (including the fallback path) before failing. This module keeps
+the set of known tickers in process memory, replaced whenever the reference data
+snapshot is reloaded, together with a short-lived negative cache of tickers that a
+database lookup confirmed missing. Either one lets callers raise TickerNotFoundException
+without any I/O.
+
+Until the universe has been loaded the filter only rejects negatively cached tickers,
+so a process without reference data never rejects a valid ticker.
+"""
+
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from ...core.exceptions import TickerNotFoundException
+from ...core.logging import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Seconds a ticker confirmed missing is rejected without another lookup
+TICKER_NOT_FOUND_TTL = 30.0
+
+# Maximum number of tickers held in the negative cache per process
+TICKER_NOT_FOUND_MAX_ENTRIES = 10000
+
+
+class TickerUniverseFilter:
+    """
+    Membership filter for the ticker universe with a negative cache of confirmed misses.
+    
+    The universe is an exact set, so known tickers are never rejected; the negative
+    cache takes precedence so that a stock deleted since the last reload is rejected
+    as soon as a lookup has confirmed it is gone.
+    """
+    
+    def __init__(
+        self,
+        not_found_ttl: float = TICKER_NOT_FOUND_TTL,
+        max_not_found: int = TICKER_NOT_FOUND_MAX_ENTRIES
+    ):
+        """
+        Initialize an empty filter that accepts every ticker until loaded.
+        
+        Args:
+            not_found_ttl: Seconds a confirmed missing ticker is rejected
+            max_not_found: Maximum number of negatively cached tickers
+        """
+        self._not_found_ttl = not_found_ttl
+        self._max_not_found = max_not_found
+        self._universe: Optional[FrozenSet[str]] = None
+        self._not_found: Dict[str, float] = {}  # ticker -> monotonic expiry
+        self._lock = threading.Lock()
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the ticker universe has been loaded."""
+        return self._universe is not None
+    
+    def update(self, tickers: Iterable[str]) -> None:
+        """
+        Replace the ticker universe and drop the negative cache.
+        
+        Args:
+            tickers: All known ticker symbols
+        """
+        universe = frozenset(ticker.upper() for ticker in tickers)
+        with self._lock:
+            self._universe = universe
+            self._not_found = {}
+        logger.debug(f"Ticker universe filter updated with {len(universe)} tickers")
+    
+    def add(self, tickers: Iterable[str]) -> None:
+        """
+        Accept newly created tickers before the next universe reload.
+        
+        Args:
+            tickers: Ticker symbols just written to the database
+        """
+        added = {ticker.upper() for ticker in tickers}
+        with self._lock:
+            if self._universe is not None:
+                self._universe = self._universe | added
+            for ticker in added:
+                self._not_found.pop(ticker, None)
+    
+    def reset(self) -> None:
+        """Forget the ticker universe and the negative cache, accepting every ticker."""
+        with self._lock:
+            self._universe = None
+            self._not_found = {}
+    
+    def might_exist(self, ticker: str) -> bool:
+        """
+        Check whether a ticker may exist, without I/O.
+        
+        Args:
+            ticker: Stock symbol
+            
+        Returns:
+            bool: False if the ticker is known to be missing
+        """
+        ticker = ticker.upper()
+        expires_at = self._not_found.get(ticker)
+        if expires_at is not None and expires_at > time.monotonic():
+            return False
+        universe = self._universe
+        return universe is None or ticker in universe
+    
+    def check(self, ticker: str) -> None:
+        """
+        Raise if a ticker is known to be missing.
+        
+        Args:
+            ticker: Stock symbol
+            
+        Raises:
+            TickerNotFoundException: If the ticker is outside the universe or negatively cached
+        """
+        if not self.might_exist(ticker):
+            logger.debug(f"Rejected unknown ticker without lookup: {ticker}")
+            raise TickerNotFoundException(ticker)
+    
+    def record_not_found(self, ticker: str) -> None:
+        """
+        Remember a ticker that a lookup confirmed missing.
+        
+        Args:
+            ticker: Stock symbol
+        """
+        now = time.monotonic()
+        with self._lock:
+            if len(self._not_found) >= self._max_not_found:
+                # Drop expired entries first, everything if the cache is still full
+                self._not_found = {key: expiry for key, expiry in self._not_found.items() if expiry > now}
+                if len(self._not_found) >= self._max_not_found:
+                    self._not_found = {}
+            self._not_found[ticker.upper()] = now + self._not_found_ttl
@@ -21,6 +21,9 @@ from ...core.logging import get_logger
 # Initialize logger for cache operations
 logger = get_logger(__name__)
 
+# Data types whose cache keys are versioned by a namespace generation counter
+CACHE_NAMESPACES = ('borrow_rate', 'volatility', 'event_risk', 'broker_config', 'calculation')
+
 
 def generate_cache_key(prefix: str, *components: Any) -> str:
     """
@@ -113,6 +116,33 @@ def get_calculation_key(ticker: str, client_id: str, position_value: float, loan
     return generate_cache_key('calculation', ticker, client_id, position_value, loan_days)
 
 
+def get_cache_namespace(key: str) -> Optional[str]:
+    """
+    Determines the versioned namespace a cache key belongs to.
+    
+    Args:
+        key: Cache key without prefix
+        
+    Returns:
+        Namespace (the data type prefix of the key), or None for unversioned keys
+    """
+    namespace = key.split(':', 1)[0]
+    return namespace if namespace in CACHE_NAMESPACES else None
+
+
+def get_ticker_tag(ticker: str) -> str:
+    """
+    Generates the invalidation tag shared by all cached data for a ticker.
+    
+    Args:
+        ticker: Stock symbol
+        
+    Returns:
+        Tag name for the ticker
+    """
+    return generate_cache_key('ticker', ticker)
+
+
 def get_ttl_for_data_type(data_type: str) -> int:
     """
     Returns the appropriate TTL for different data types.
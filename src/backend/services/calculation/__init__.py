@@ -12,7 +12,11 @@ import logging
 from .borrow_rate import (
     calculate_borrow_rate,
     get_real_time_borrow_rate,
-    get_fallback_borrow_rate
+    get_fallback_borrow_rate,
+    calculate_borrow_rate_details,
+    get_borrow_rate_with_source,
+    get_borrow_rates_bulk,
+    iter_borrow_rates_bulk
 )
 
 # Import locate fee calculation functions
@@ -52,6 +56,10 @@ __all__ = [
     'calculate_borrow_rate',
     'get_real_time_borrow_rate',
     'get_fallback_borrow_rate',
+    'calculate_borrow_rate_details',
+    'get_borrow_rate_with_source',
+    'get_borrow_rates_bulk',
+    'iter_borrow_rates_bulk',
     
     # Locate fee calculation
     'calculate_locate_fee',
@@ -4,9 +4,11 @@ This module implements the formulas and business logic for determining the base
 and event risk adjustments, and handling fallback scenarios when external data sources are unavailable.
 """
 
+import asyncio
 import logging
+import time
 from decimal import Decimal
-from typing import Dict, Optional, Union, Any
+from typing import AsyncIterator, Dict, Iterable, Mapping, Optional, Tuple, Union, Any
 
 # Import constants
 from ...core.constants import (
@@ -22,7 +24,7 @@ from ...core.exceptions import CalculationException, ExternalAPIException
 # Import utility functions
 from ...utils.math import round_decimal
 from ...utils.validation import convert_to_decimal
-from ...utils.timing import timed
+from ...utils.timing import timed, async_timed
 from ...utils.retry import retry_with_fallback
 from ...utils.circuit_breaker import circuit_breaker
 
@@ -31,7 +33,8 @@ from ..external.seclend_api import get_borrow_rate, create_fallback_response
 from ..external.market_api import (
     get_market_volatility,
     get_stock_volatility,
-    get_default_volatility
+    get_default_volatility,
+    get_cached_stock_volatilities
 )
 from ..external.event_api import get_event_risk_factor
 
@@ -40,11 +43,20 @@ from .volatility import (
     calculate_volatility_adjustment,
     apply_volatility_adjustment
 )
-from .event_risk import calculate_event_risk_adjustment
+from .event_risk import calculate_event_risk_adjustment, EVENT_RISK_CACHE_KEY_PREFIX
 from .utils import apply_minimum_borrow_rate
 
+# Import settings
+from ...config.settings import get_settings
+
 # Import cache
-from ..cache.redis import RedisCache
+from ..cache import get_cache_strategy, get_shared_rate_table, get_ticker_filter
+from ..cache.shared_rates import SharedRateRefresher, MAX_LOAD_FACTOR
+from ..cache.utils import get_ticker_tag
+
+# Import database access for the stock universe
+from ...db.session import get_read_db
+from ...db.crud.stocks import stock as stock_crud
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -53,6 +65,10 @@ logger = logging.getLogger(__name__)
 ROUNDING_PRECISION = 4
 BORROW_RATE_CACHE_PREFIX = 'borrow_rate'
 BORROW_RATE_CACHE_TTL = 300  # 5 minutes
+BULK_RATE_CHUNK_SIZE = 20  # Tickers calculated concurrently by get_borrow_rates_bulk
+
+# Background refresher of the shared-memory rate table
+_shared_rate_refresher = None
 
 
 @timed
@@ -67,14 +83,20 @@ def calculate_borrow_rate(ticker: str, min_rate: Optional[Decimal] = None, use_c
         
     Returns:
         Decimal: Fully adjusted borrow rate as a decimal
+    
+    Raises:
+        TickerNotFoundException: If the ticker is known not to exist
     """
-    logger.info(f"Calculating borrow rate for ticker: {ticker}")
+    logger.info("Calculating borrow rate for ticker: %s", ticker)
+    
+    # Reject unknown tickers before any cache, database or external API call
+    get_ticker_filter().check(ticker)
     
     # Check if use_cache is True (default) and try to get cached rate
     if use_cache:
         cached_rate = get_cached_borrow_rate(ticker)
         if cached_rate is not None:
-            logger.info(f"Using cached borrow rate for {ticker}: {cached_rate}")
+            logger.info("Using cached borrow rate for %s: %s", ticker, cached_rate)
             return cached_rate
     
     # Get real-time base borrow rate by calling get_real_time_borrow_rate
@@ -109,7 +131,7 @@ def calculate_borrow_rate(ticker: str, min_rate: Optional[Decimal] = None, use_c
             cache_borrow_rate(ticker, final_rate)
         
         # Log the final calculated rate
-        logger.info(f"Calculated borrow rate for {ticker}: {final_rate}")
+        logger.info("Calculated borrow rate for %s: %s", ticker, final_rate)
         
         # Return the calculated borrow rate
         return final_rate
@@ -121,6 +143,97 @@ def calculate_borrow_rate(ticker: str, min_rate: Optional[Decimal] = None, use_c
 
 
 @timed
+def calculate_borrow_rate_details(ticker: str, min_rate: Optional[Decimal] = None) -> Dict[str, Any]:
+    """
+    Calculates a live borrow rate with its adjustments and reports whether fallback data was used.
+    
+    Built on get_borrow_rate_with_adjustments. A rate counts as fallback when the SecLend
+    API served fallback data or the adjustments could not be calculated; unlike
+    calculate_borrow_rate, such rates are not cached, so the next request tries the
+    live sources again.
+    
+    Args:
+        ticker: Stock symbol
+        min_rate: Optional minimum rate to apply
+    
+    Returns:
+        Dict[str, Any]: Values with borrow_rate, volatility, event_risk_factor, borrow_status
+        (None if unknown), updated_at (epoch seconds) and source ('live' or 'fallback')
+    
+    Raises:
+        TickerNotFoundException: If the ticker is known not to exist
+    """
+    # Reject unknown tickers before any external API call
+    get_ticker_filter().check(ticker)
+    
+    try:
+        response = get_real_time_borrow_rate_response(ticker)
+        base_rate = convert_to_decimal(response.get('rate'))
+        is_fallback = bool(response.get('is_fallback'))
+        borrow_status = None if is_fallback else response.get('status')
+    except Exception as e:
+        logger.error(f"Error getting real-time borrow rate for {ticker}: {str(e)}")
+        base_rate = get_fallback_borrow_rate(ticker, min_rate)
+        is_fallback = True
+        borrow_status = None
+    
+    try:
+        adjustments = get_borrow_rate_with_adjustments(ticker, base_rate=base_rate, min_rate=min_rate)
+        final_rate = round_decimal(convert_to_decimal(adjustments["final_rate"]), ROUNDING_PRECISION)
+        volatility = convert_to_decimal(adjustments["volatility_index"])
+        event_risk_factor = adjustments["event_risk_factor"]
+    except Exception as e:
+        logger.error(f"Error calculating borrow rate adjustments for {ticker}: {str(e)}")
+        # Apply minimum rate to base rate if adjustments fail
+        final_rate = apply_minimum_borrow_rate(base_rate, min_rate)
+        volatility = None
+        event_risk_factor = None
+        is_fallback = True
+    
+    if not is_fallback:
+        cache_borrow_rate(ticker, final_rate)
+    
+    logger.info("Calculated %s borrow rate for %s: %s", "fallback" if is_fallback else "live", ticker, final_rate)
+    return {
+        "borrow_rate": final_rate,
+        "volatility": volatility,
+        "event_risk_factor": event_risk_factor,
+        "borrow_status": borrow_status,
+        "updated_at": time.time(),
+        "source": "fallback" if is_fallback else "live"
+    }
+
+
+@timed
+def get_borrow_rate_with_source(ticker: str, min_rate: Optional[Decimal] = None) -> Tuple[Decimal, str]:
+    """
+    Gets the borrow rate for a fee calculation together with where it came from.
+    
+    Serves cached rates like calculate_borrow_rate and otherwise calculates a live rate
+    with calculate_borrow_rate_details, so fallback rates can be recorded in the audit trail.
+    
+    Args:
+        ticker: Stock symbol
+        min_rate: Optional minimum rate to apply
+    
+    Returns:
+        Tuple[Decimal, str]: Borrow rate and its source ('cache', 'live' or 'fallback')
+    
+    Raises:
+        TickerNotFoundException: If the ticker is known not to exist
+    """
+    # Reject unknown tickers before any cache, database or external API call
+    get_ticker_filter().check(ticker)
+    
+    cached_rate = get_cached_borrow_rate(ticker)
+    if cached_rate is not None:
+        return cached_rate, 'cache'
+    
+    details = calculate_borrow_rate_details(ticker, min_rate)
+    return details["borrow_rate"], details["source"]
+
+
+@timed(stage='seclend')
 @retry_with_fallback(fallback_function='get_fallback_borrow_rate', max_retries=3)
 @circuit_breaker(name='seclend_api', failure_threshold=5, recovery_timeout=60, success_threshold=3)
 def get_real_time_borrow_rate(ticker: str, min_rate: Optional[Decimal] = None) -> Decimal:
@@ -135,7 +248,7 @@ def get_real_time_borrow_rate(ticker: str, min_rate: Optional[Decimal] = None) -
         Decimal: Base borrow rate from external API or fallback
     """
     # Log attempt to get real-time borrow rate for ticker
-    logger.info(f"Getting real-time borrow rate for ticker: {ticker}")
+    logger.info("Getting real-time borrow rate for ticker: %s", ticker)
     
     # Call get_borrow_rate from seclend_api module
     response = get_borrow_rate(ticker)
@@ -147,7 +260,7 @@ def get_real_time_borrow_rate(ticker: str, min_rate: Optional[Decimal] = None) -
     rate_decimal = convert_to_decimal(rate)
     
     # Log the retrieved rate
-    logger.info(f"Retrieved real-time borrow rate for {ticker}: {rate_decimal}")
+    logger.info("Retrieved real-time borrow rate for %s: %s", ticker, rate_decimal)
     
     # Return the borrow rate
     return rate_decimal
@@ -189,6 +302,25 @@ def get_fallback_borrow_rate(ticker: str, min_rate: Optional[Decimal] = None) ->
     return rate_decimal
 
 
+@timed(stage='seclend')
+@circuit_breaker(service_name='seclend_api', failure_threshold=5, timeout_seconds=60, success_threshold=3)
+def get_real_time_borrow_rate_response(ticker: str) -> Dict[str, Any]:
+    """
+    Retrieves the full SecLend API borrow rate response, which flags fallback data with is_fallback.
+    
+    Shares the seclend_api circuit with get_real_time_borrow_rate.
+    
+    Args:
+        ticker: Stock symbol
+    
+    Returns:
+        Dict[str, Any]: Response with rate, status and, for fallback data, is_fallback
+    """
+    logger.info("Getting real-time borrow rate response for ticker: %s", ticker)
+    return get_borrow_rate(ticker)
+
+
+@timed(stage='cache_lookup')
 def get_cached_borrow_rate(ticker: str) -> Optional[Decimal]:
     """
     Attempts to retrieve a cached borrow rate for a ticker.
@@ -202,21 +334,29 @@ def get_cached_borrow_rate(ticker: str) -> Optional[Decimal]:
     # Generate cache key using ticker and BORROW_RATE_CACHE_PREFIX
     cache_key = f"{BORROW_RATE_CACHE_PREFIX}:{ticker}"
     
-    # Get Redis cache instance
-    cache = RedisCache()
-    
     try:
+        # Check the shared-memory rate table first, it needs no I/O
+        shared_rate_table = get_shared_rate_table()
+        if shared_rate_table is not None:
+            record = shared_rate_table.get(ticker)
+            if record is not None:
+                logger.debug("Shared table hit for borrow rate - Ticker: %s, Rate: %s", ticker, record["borrow_rate"])
+                return record["borrow_rate"]
+        
+        # Get the configured cache strategy (near cache, Redis and local fallback)
+        cache = get_cache_strategy()
+        
         # Try to get value from cache using the key
         cached_value = cache.get(cache_key)
         
         # If value exists in cache, convert to Decimal and return
         if cached_value is not None:
             rate = Decimal(str(cached_value))
-            logger.debug(f"Cache hit for borrow rate - Ticker: {ticker}, Rate: {rate}")
+            logger.debug("Cache hit for borrow rate - Ticker: %s, Rate: %s", ticker, rate)
             return rate
         
         # If value doesn't exist or cache is unavailable, return None
-        logger.debug(f"Cache miss for borrow rate - Ticker: {ticker}")
+        logger.debug("Cache miss for borrow rate - Ticker: %s", ticker)
         return None
             
     except Exception as e:
@@ -240,8 +380,8 @@ def cache_borrow_rate(ticker: str, rate: Decimal, ttl: Optional[int] = None) ->
     # Generate cache key using ticker and BORROW_RATE_CACHE_PREFIX
     cache_key = f"{BORROW_RATE_CACHE_PREFIX}:{ticker}"
     
-    # Get Redis cache instance
-    cache = RedisCache()
+    # Get the configured cache strategy (near cache, Redis and local fallback)
+    cache = get_cache_strategy()
     
     try:
         # Convert Decimal rate to string for caching
@@ -249,11 +389,16 @@ def cache_borrow_rate(ticker: str, rate: Decimal, ttl: Optional[int] = None) ->
         
         # Set value in cache with specified TTL (default to BORROW_RATE_CACHE_TTL)
         ttl_value = ttl if ttl is not None else BORROW_RATE_CACHE_TTL
-        result = cache.set(cache_key, rate_str, ttl_value)
+        result = cache.set(cache_key, rate_str, ttl_value, tags=[get_ticker_tag(ticker)])
+        
+        # Stop every process serving the previous rate from the shared rate table
+        shared_rate_table = get_shared_rate_table()
+        if shared_rate_table is not None:
+            shared_rate_table.mark_changed([ticker])
         
         # Log cache operation result
         if result:
-            logger.debug(f"Cached borrow rate for {ticker}: {rate} (TTL: {ttl_value}s)")
+            logger.debug("Cached borrow rate for %s: %s (TTL: %ss)", ticker, rate, ttl_value)
         else:
             logger.warning(f"Failed to cache borrow rate for {ticker}")
             
@@ -265,6 +410,229 @@ def cache_borrow_rate(ticker: str, rate: Decimal, ttl: Optional[int] = None) ->
         return False
 
 
+def load_shared_rate_records() -> Dict[str, Dict[str, Any]]:
+    """
+    Loads the cached borrow rate, volatility and event risk of every stock for the shared rate table.
+    
+    Uses bulk cache lookups for all keys. Stocks without a cached borrow rate are
+    left out, so workers fall back to the regular cache path for them.
+    
+    Returns:
+        Dict[str, Dict[str, Any]]: Values by ticker for SharedRateTable.put_many
+    """
+    table = get_shared_rate_table()
+    limit = int(table.capacity * MAX_LOAD_FACTOR) if table is not None else None
+    with get_read_db() as db:
+        stocks = stock_crud.get_multi(db, limit=limit)
+    statuses = {stock.ticker: stock.borrow_status for stock in stocks}
+    
+    records = load_cached_rate_values(statuses)
+    for ticker, record in records.items():
+        record["borrow_status"] = statuses[ticker]
+    return records
+
+
+def get_rate_cache_keys(ticker: str) -> Tuple[str, str]:
+    """
+    Gets the cache keys of the borrow rate and event risk of a ticker.
+    
+    Volatility is cached by the market data client under its own prefix, see
+    get_cached_stock_volatilities.
+    
+    Args:
+        ticker: Stock symbol
+        
+    Returns:
+        Tuple[str, str]: Borrow rate and event risk cache keys
+    """
+    return (
+        f"{BORROW_RATE_CACHE_PREFIX}:{ticker}",
+        f"{EVENT_RISK_CACHE_KEY_PREFIX}:{ticker}"
+    )
+
+
+def load_cached_rate_values(tickers: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Reads the cached borrow rate, volatility and event risk of many tickers with bulk lookups.
+    
+    Borrow rates and event risk factors are read with one multi-get on the cache strategy,
+    and the volatility of the tickers that have a cached rate with one multi-get on the
+    market data cache.
+    
+    Args:
+        tickers: Stock symbols
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Values with borrow_rate, volatility and event_risk_factor
+        by ticker; tickers without a cached borrow rate are left out
+    """
+    tickers = list(tickers)
+    values = get_cache_strategy().get_many([key for ticker in tickers for key in get_rate_cache_keys(ticker)])
+    rated = [ticker for ticker in tickers if get_rate_cache_keys(ticker)[0] in values]
+    if not rated:
+        return {}
+    
+    try:
+        volatilities = get_cached_stock_volatilities(rated)
+    except Exception as e:
+        logger.warning(f"Bulk volatility cache lookup failed: {str(e)}")
+        volatilities = {}
+    return {ticker: read_cached_rate_values(values, ticker, volatilities.get(ticker)) for ticker in rated}
+
+
+def read_cached_rate_values(
+    values: Mapping[str, Any],
+    ticker: str,
+    volatility_data: Optional[Mapping[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Extracts a ticker's borrow rate, volatility and event risk from bulk cache lookups.
+    
+    Args:
+        values: Cached values by key, as returned by get_many on the cache strategy
+        ticker: Stock symbol
+        volatility_data: Cached volatility data of the ticker (optional)
+        
+    Returns:
+        Optional[Dict[str, Any]]: Values with borrow_rate, volatility and event_risk_factor,
+        or None if no borrow rate is available
+    """
+    rate_key, event_risk_key = get_rate_cache_keys(ticker)
+    rate = values.get(rate_key)
+    if rate is None:
+        return None
+    
+    volatility = volatility_data.get('volatility') if volatility_data else None
+    event_risk = values.get(event_risk_key)
+    return {
+        "borrow_rate": Decimal(str(rate)),
+        "volatility": convert_to_decimal(volatility) if volatility is not None else None,
+        "event_risk_factor": int(event_risk) if event_risk is not None else None
+    }
+
+
+async def iter_borrow_rates_bulk(
+    tickers: Iterable[str],
+    min_rates: Optional[Mapping[str, Decimal]] = None,
+    chunk_size: int = BULK_RATE_CHUNK_SIZE
+) -> AsyncIterator[Dict[str, Dict[str, Any]]]:
+    """
+    Resolves the borrow rates of many tickers with bulk lookups, yielding them batch by batch.
+    
+    Tickers are read from the shared-memory rate table first, then with bulk cache
+    lookups for all remaining tickers; those rates are yielded as the first batch. Only
+    tickers missing from both are calculated with calculate_borrow_rate_details, chunk_size
+    at a time concurrently in worker threads, and each chunk is yielded when it completes.
+    
+    Args:
+        tickers: Stock symbols
+        min_rates: Minimum borrow rate by ticker (optional)
+        chunk_size: Number of tickers calculated concurrently
+        
+    Yields:
+        Dict[str, Dict[str, Any]]: Values by ticker with borrow_rate, volatility,
+        event_risk_factor, borrow_status (None if unknown), updated_at (epoch seconds,
+        None if unknown) and source ('cache', 'live' or 'fallback'); tickers whose
+        calculation failed are left out
+    """
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    min_rates = min_rates or {}
+    records: Dict[str, Dict[str, Any]] = {}
+    
+    # Shared-memory rate table, no I/O
+    shared_rate_table = get_shared_rate_table()
+    if shared_rate_table is not None:
+        for ticker in tickers:
+            record = shared_rate_table.get(ticker)
+            if record is not None:
+                records[ticker] = {
+                    "borrow_rate": record["borrow_rate"],
+                    "volatility": record["volatility"],
+                    "event_risk_factor": record["event_risk_factor"],
+                    "borrow_status": record["borrow_status"],
+                    "updated_at": record["updated_at"],
+                    "source": "cache"
+                }
+    
+    # Bulk cache lookups for all remaining tickers
+    missing = [ticker for ticker in tickers if ticker not in records]
+    if missing:
+        try:
+            cached = await asyncio.to_thread(load_cached_rate_values, missing)
+        except Exception as e:
+            logger.warning(f"Bulk borrow rate cache lookup failed: {str(e)}")
+            cached = {}
+        for ticker, record in cached.items():
+            records[ticker] = dict(record, borrow_status=None, updated_at=None, source="cache")
+    if records:
+        yield records
+    
+    # Calculate the rest in concurrent chunks; live rates are cached by the calculation
+    missing = [ticker for ticker in missing if ticker not in records]
+    for start in range(0, len(missing), chunk_size):
+        chunk = missing[start:start + chunk_size]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(calculate_borrow_rate_details, ticker, min_rates.get(ticker)) for ticker in chunk),
+            return_exceptions=True
+        )
+        calculated = {}
+        for ticker, result in zip(chunk, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error calculating borrow rate for {ticker}: {str(result)}")
+            else:
+                calculated[ticker] = result
+        if calculated:
+            yield calculated
+
+
+@async_timed(stage='bulk_rates')
+async def get_borrow_rates_bulk(
+    tickers: Iterable[str],
+    min_rates: Optional[Mapping[str, Decimal]] = None,
+    chunk_size: int = BULK_RATE_CHUNK_SIZE
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolves the borrow rates of many tickers with bulk lookups instead of one round trip per ticker.
+    
+    Collects every batch of iter_borrow_rates_bulk.
+    
+    Args:
+        tickers: Stock symbols
+        min_rates: Minimum borrow rate by ticker (optional)
+        chunk_size: Number of tickers calculated concurrently
+    
+    Returns:
+        Dict[str, Dict[str, Any]]: Values by ticker as yielded by iter_borrow_rates_bulk;
+        tickers whose calculation failed are left out
+    """
+    records: Dict[str, Dict[str, Any]] = {}
+    async for batch in iter_borrow_rates_bulk(tickers, min_rates, chunk_size):
+        records.update(batch)
+    return records
+
+
+def get_shared_rate_refresher() -> Optional[SharedRateRefresher]:
+    """
+    Returns the background refresher of the shared-memory rate table, if enabled in settings.
+    
+    Returns:
+        Optional[SharedRateRefresher]: Refresher, or None when the shared rate table is disabled
+    """
+    global _shared_rate_refresher
+    
+    if _shared_rate_refresher is None:
+        table = get_shared_rate_table()
+        if table is None:
+            return None
+        _shared_rate_refresher = SharedRateRefresher(
+            table,
+            load_shared_rate_records,
+            interval=get_settings().shared_rate_table["refresh_interval"]
+        )
+    
+    return _shared_rate_refresher
+
+
 @timed
 def get_borrow_rate_with_adjustments(
     ticker: str,
@@ -285,7 +653,13 @@ def get_borrow_rate_with_adjustments(
         
     Returns:
         Dict[str, Any]: Dictionary with adjusted rate and adjustment details
+    
+    Raises:
+        TickerNotFoundException: If the ticker is known not to exist
     """
+    # Reject unknown tickers before any external API call
+    get_ticker_filter().check(ticker)
+    
     # If base_rate is not provided, get real-time rate by calling get_real_time_borrow_rate
     if base_rate is None:
         base_rate = get_real_time_borrow_rate(ticker, min_rate)
@@ -74,9 +74,9 @@ def calculate_locate_fee(
     Returns:
         Dict[str, Any]: Dictionary containing total fee and breakdown of fee components
     """
-    logger.info(f"Calculating locate fee for ticker: {ticker}, position_value: {position_value}, "
-               f"loan_days: {loan_days}, markup_percentage: {markup_percentage}, "
-               f"fee_type: {fee_type}, fee_amount: {fee_amount}")
+    logger.info("Calculating locate fee for ticker: %s, position_value: %s, "
+                "loan_days: %s, markup_percentage: %s, fee_type: %s, fee_amount: %s",
+                ticker, position_value, loan_days, markup_percentage, fee_type, fee_amount)
     
     # Check if use_cache is True (default) and try to get cached result
     if use_cache:
@@ -84,29 +84,29 @@ def calculate_locate_fee(
             ticker, position_value, loan_days, markup_percentage, fee_type, fee_amount
         )
         if cached_result is not None:
-            logger.info(f"Using cached locate fee result for {ticker}")
+            logger.info("Using cached locate fee result for %s", ticker)
             return cached_result
     
     # If borrow_rate is not provided, calculate it using calculate_borrow_rate
     if borrow_rate is None:
-        logger.info(f"Borrow rate not provided, calculating it for {ticker}")
+        logger.info("Borrow rate not provided, calculating it for %s", ticker)
         borrow_rate = calculate_borrow_rate(ticker)
     
     # Calculate base borrow cost
     base_borrow_cost = calculate_borrow_cost(position_value, borrow_rate, loan_days)
-    logger.debug(f"Base borrow cost calculated: {base_borrow_cost}")
+    logger.debug("Base borrow cost calculated: %s", base_borrow_cost)
     
     # Calculate markup amount
     markup_amount = calculate_markup_amount(base_borrow_cost, markup_percentage)
-    logger.debug(f"Markup amount calculated: {markup_amount}")
+    logger.debug("Markup amount calculated: %s", markup_amount)
     
     # Calculate transaction fee
     transaction_fee = calculate_fee(position_value, fee_type, fee_amount)
-    logger.debug(f"Transaction fee calculated: {transaction_fee}")
+    logger.debug("Transaction fee calculated: %s", transaction_fee)
     
     # Calculate total fee
     total_fee = sum_fee_components([base_borrow_cost, markup_amount, transaction_fee])
-    logger.debug(f"Total fee calculated: {total_fee}")
+    logger.debug("Total fee calculated: %s", total_fee)
     
     # Create result dictionary
     result = {
@@ -125,7 +125,7 @@ def calculate_locate_fee(
             ticker, position_value, loan_days, markup_percentage, fee_type, fee_amount, result
         )
     
-    logger.info(f"Locate fee calculation completed for {ticker}: {total_fee}")
+    logger.info("Locate fee calculation completed for %s: %s", ticker, total_fee)
     return result
 
 
@@ -168,11 +168,11 @@ def get_cached_locate_fee(
             # Deserialize JSON to dictionary
             result = json.loads(cached_value)
             
-            logger.debug(f"Cache hit for locate fee calculation - Key: {cache_key}")
+            logger.debug("Cache hit for locate fee calculation - Key: %s", cache_key)
             return result
         
         # If value doesn't exist or cache is unavailable, return None
-        logger.debug(f"Cache miss for locate fee calculation - Key: {cache_key}")
+        logger.debug("Cache miss for locate fee calculation - Key: %s", cache_key)
         return None
             
     except Exception as e:
@@ -223,7 +223,7 @@ def cache_locate_fee(
         success = cache.set(cache_key, result_json, ttl_value)
         
         if success:
-            logger.debug(f"Cached locate fee calculation - Key: {cache_key}, TTL: {ttl_value}s")
+            logger.debug("Cached locate fee calculation - Key: %s, TTL: %ss", cache_key, ttl_value)
         else:
             logger.warning(f"Failed to cache locate fee calculation - Key: {cache_key}")
             
@@ -314,7 +314,7 @@ def calculate_fee_breakdown(
     Returns:
         Dict[str, Any]: Dictionary with detailed breakdown of all fee components
     """
-    logger.info(f"Calculating detailed fee breakdown for ticker: {ticker}")
+    logger.info("Calculating detailed fee breakdown for ticker: %s", ticker)
     
     # Calculate base borrow cost
     base_borrow_cost = calculate_borrow_cost(position_value, borrow_rate, loan_days)
@@ -368,5 +368,5 @@ def calculate_fee_breakdown(
         }
     }
     
-    logger.info(f"Fee breakdown calculation completed for {ticker}")
+    logger.info("Fee breakdown calculation completed for %s", ticker)
     return breakdown
\ No newline at end of file
@@ -17,6 +17,9 @@ from .audit import get_client_audit_records  # Import function to get audit reco
 from .audit import get_ticker_audit_records  # Import function to get audit records for a ticker
 from .audit import get_fallback_audit_records  # Import function to get audit records for fallback events
 from .audit import get_audit_records_by_date_range  # Import function to get audit records by date range
+from .reference import ReferenceSnapshot  # Import immutable stock and broker snapshot
+from .reference import ReferenceDataCache  # Import background-refreshed holder of the snapshot
+from .reference import reference_data  # Import shared reference data instance
 from .utils import DataServiceBase  # Import base class for data services
 from .utils import validate_ticker  # Import function to validate ticker symbols
 from .utils import validate_client_id  # Import function to validate client IDs
@@ -42,6 +45,9 @@ __all__ = [
     "get_ticker_audit_records",
     "get_fallback_audit_records",
     "get_audit_records_by_date_range",
+    "ReferenceSnapshot",
+    "ReferenceDataCache",
+    "reference_data",
     "DataServiceBase",
     "validate_ticker",
     "validate_client_id",
@@ -16,16 +16,19 @@ from .utils import (
     cache_result,
     DEFAULT_CACHE_TTL
 )
-from ...db.crud.brokers import broker_crud
-from ..cache.redis import redis_cache
+from ...db.crud.brokers import broker_crud, async_broker_crud
+from .reference import reference_data
 from ...schemas.broker import BrokerSchema, BrokerCreate, BrokerUpdate
 from ...core.exceptions import ClientNotFoundException, ValidationException
 
 # Cache time-to-live for broker configurations (30 minutes)
 BROKER_CACHE_TTL = 1800
 
-# Cache key prefix for broker data
-BROKER_CACHE_KEY_PREFIX = 'broker'
+# Cache time-to-live for unknown client IDs (1 minute)
+BROKER_NOT_FOUND_CACHE_TTL = 60
+
+# Cache name shared by the sync and async broker loaders
+BROKER_CACHE_NAME = 'brokers.load_broker'
 
 
 class BrokerService(DataServiceBase):
@@ -37,10 +40,9 @@ class BrokerService(DataServiceBase):
         """Initialize the broker service."""
         super().__init__()
 
-    @cache_result(BROKER_CACHE_TTL)
     def get_broker(self, client_id: str) -> Dict[str, Any]:
         """
-        Get a broker by client ID with caching.
+        Get a broker by client ID from the reference snapshot, falling back to caching.
         
         Args:
             client_id: Client identifier
@@ -51,6 +53,24 @@ class BrokerService(DataServiceBase):
         # Validate client ID
         validate_client_id(client_id)
         
+        # Serve from the in-memory reference snapshot when it has the broker
+        broker = self._get_snapshot_broker(client_id)
+        if broker is not None:
+            return broker
+        
+        return self._load_broker(client_id)
+
+    @cache_result(BROKER_CACHE_TTL, negative_ttl=BROKER_NOT_FOUND_CACHE_TTL, name=BROKER_CACHE_NAME)
+    def _load_broker(self, client_id: str) -> Dict[str, Any]:
+        """
+        Load a broker by client ID from the database with caching.
+        
+        Args:
+            client_id: Client identifier
+            
+        Returns:
+            Dict[str, Any]: Broker data as a dictionary
+        """
         try:
             # Get database session
             with self._get_db_session() as db:
@@ -66,6 +86,57 @@ class BrokerService(DataServiceBase):
             # Handle database error
             self._handle_db_error(e, f"get_broker for {client_id}")
 
+    async def get_broker_async(self, client_id: str) -> Dict[str, Any]:
+        """
+        Get a broker by client ID with caching, without blocking the event loop.
+        
+        Cache misses are loaded through the async database session. Intended for
+        async request handlers; scripts should keep using get_broker.
+        
+        Args:
+            client_id: Client identifier
+            
+        Returns:
+            Dict[str, Any]: Broker data as a dictionary
+        """
+        # Validate client ID
+        validate_client_id(client_id)
+        
+        # Serve from the in-memory reference snapshot when it has the broker
+        broker = self._get_snapshot_broker(client_id)
+        if broker is not None:
+            return broker
+        
+        return await self._load_broker_async(client_id)
+
+    @cache_result(BROKER_CACHE_TTL, negative_ttl=BROKER_NOT_FOUND_CACHE_TTL, name=BROKER_CACHE_NAME)
+    async def _load_broker_async(self, client_id: str) -> Dict[str, Any]:
+        """
+        Load a broker by client ID through the async database session with caching.
+        
+        Shares its cache entries with _load_broker.
+        
+        Args:
+            client_id: Client identifier
+            
+        Returns:
+            Dict[str, Any]: Broker data as a dictionary
+        """
+        try:
+            # Get async database session
+            async with self._get_async_db_session() as db:
+                # Get broker from database
+                broker = await async_broker_crud.get_by_client_id_or_404(db, client_id)
+                
+                # Convert to dictionary and return
+                return broker.to_dict()
+        except ClientNotFoundException:
+            # Handle broker not found
+            self._handle_broker_not_found(client_id)
+        except sqlalchemy.exc.SQLAlchemyError as e:
+            # Handle database error
+            self._handle_db_error(e, f"get_broker for {client_id}")
+
     def get_active_brokers(self, skip: Optional[int] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all active brokers.
@@ -316,11 +387,11 @@ class BrokerService(DataServiceBase):
             bool: True if cache was invalidated, False otherwise
         """
         try:
-            # Generate cache key
-            cache_key = self._generate_broker_cache_key(client_id)
+            # Delete the cached result shared by _load_broker and _load_broker_async
+            deleted = self._load_broker.invalidate(client_id=client_id)
             
-            # Delete from cache
-            deleted = redis_cache.delete(cache_key)
+            # Reload the reference snapshot in every process
+            reference_data.notify_changed()
             
             if deleted:
                 self._log_operation(
@@ -338,17 +409,21 @@ class BrokerService(DataServiceBase):
             )
             return False
 
-    def _generate_broker_cache_key(self, client_id: str) -> str:
+    def _get_snapshot_broker(self, client_id: str) -> Optional[Dict[str, Any]]:
         """
-        Generate a cache key for a broker.
+        Get a broker from the reference snapshot without I/O.
         
         Args:
             client_id: Client identifier
             
         Returns:
-            str: Cache key string
+            Optional[Dict[str, Any]]: Copy of the broker data, or None if no snapshot is loaded or it lacks the broker
         """
-        return f"{BROKER_CACHE_KEY_PREFIX}:{client_id}"
+        snapshot = reference_data.snapshot
+        if snapshot is None:
+            return None
+        broker = snapshot.get_broker(client_id)
+        return dict(broker) if broker is not None else None
 
     def _handle_broker_not_found(self, client_id: str) -> None:
         """
@@ -0,0 +1,308 @@
+"""
+In-memory reference data snapshot for the Borrow Rate & Locate Fee Pricing Engine.
+
+Stocks and brokers are small tables that change rarely, yet every calculation and rate
+request used to look them up through Redis or the database. This module loads both
+tables into an immutable, versioned snapshot with indexes by ticker, by client ID and
+by borrow status (sorted ticker arrays), so request-path lookups are dictionary reads.
+A background thread replaces the snapshot atomically when a change notification
+arrives over Redis pub/sub, or when a cheap version query shows that either table has
+changed since the snapshot was loaded.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import redis  # redis 4.5.0+
+from sqlalchemy import func, select  # sqlalchemy 2.0.0+
+
+from ...core.constants import BorrowStatus
+from ...core.exceptions import TickerNotFoundException, ClientNotFoundException
+from ...db.crud.stocks import stock as stock_crud
+from ...db.crud.brokers import broker_crud
+from ...db.models.stock import Stock
+from ...db.models.broker import Broker
+from ...db.session import get_db
+from ...schemas.stock import StockSchema
+from ..cache import get_redis_cache, get_ticker_filter
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Seconds between version polls when no change notification arrives
+REFERENCE_POLL_INTERVAL = 10.0
+
+# Redis pub/sub channel announcing reference data changes
+REFERENCE_CHANGE_CHANNEL = "reference:changed"
+
+
+class ReferenceSnapshot:
+    """
+    Immutable, versioned view of the stock and broker tables with lookup indexes.
+    
+    Indexes are read-only mappings and tuples; the stock and broker records they hold
+    are shared by every reader and must not be modified.
+    """
+    
+    def __init__(self, stocks: Iterable[StockSchema], brokers: Iterable[Dict[str, Any]],
+                 version: int = 0, fingerprint: Optional[Tuple] = None):
+        """
+        Build the snapshot and its indexes.
+        
+        Args:
+            stocks: Stock records
+            brokers: Broker records as dictionaries with a client_id
+            version: Snapshot version, increased on every swap
+            fingerprint: Table version the snapshot was loaded at
+        """
+        self.version = version
+        self.fingerprint = fingerprint
+        self.loaded_at = time.time()
+        
+        stocks_by_ticker = {stock.ticker: stock for stock in stocks}
+        self._stocks: Mapping[str, StockSchema] = MappingProxyType(stocks_by_ticker)
+        self._brokers: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+            {broker["client_id"]: MappingProxyType(dict(broker)) for broker in brokers}
+        )
+        
+        # Sorted ticker arrays per borrow status support offset and keyset pagination
+        tickers_by_status: Dict[BorrowStatus, List[str]] = {status: [] for status in BorrowStatus}
+        for ticker in sorted(stocks_by_ticker):
+            tickers_by_status[stocks_by_ticker[ticker].borrow_status].append(ticker)
+        self._tickers_by_status: Mapping[BorrowStatus, Tuple[str, ...]] = MappingProxyType(
+            {status: tuple(tickers) for status, tickers in tickers_by_status.items()}
+        )
+    
+    @property
+    def stock_count(self) -> int:
+        """Number of stocks in the snapshot."""
+        return len(self._stocks)
+    
+    @property
+    def broker_count(self) -> int:
+        """Number of brokers in the snapshot."""
+        return len(self._brokers)
+    
+    @property
+    def tickers(self) -> Iterable[str]:
+        """Tickers of all stocks in the snapshot."""
+        return self._stocks.keys()
+    
+    def get_stock(self, ticker: str) -> Optional[StockSchema]:
+        """
+        Look up a stock by ticker.
+        
+        Args:
+            ticker: Stock symbol
+            
+        Returns:
+            Optional[StockSchema]: Stock record, or None if not in the snapshot
+        """
+        return self._stocks.get(ticker.upper())
+    
+    def get_stock_or_404(self, ticker: str) -> StockSchema:
+        """
+        Look up a stock by ticker, raising if it is not in the snapshot.
+        
+        Args:
+            ticker: Stock symbol
+            
+        Returns:
+            StockSchema: Stock record
+            
+        Raises:
+            TickerNotFoundException: If the ticker is not in the snapshot
+        """
+        stock = self.get_stock(ticker)
+        if stock is None:
+            raise TickerNotFoundException(ticker)
+        return stock
+    
+    def get_stocks_by_borrow_status(self, status: BorrowStatus, skip: int = 0, limit: Optional[int] = None,
+                                    after: Optional[str] = None) -> List[StockSchema]:
+        """
+        List stocks with a borrow status in ticker order.
+        
+        Args:
+            status: Borrow status
+            skip: Number of stocks to skip
+            limit: Maximum number of stocks to return (optional)
+            after: Only return tickers sorting after this one, for keyset pagination (optional)
+            
+        Returns:
+            List[StockSchema]: Stock records
+        """
+        tickers = self._tickers_by_status.get(status, ())
+        start = (bisect.bisect_right(tickers, after.upper()) if after else 0) + skip
+        end = len(tickers) if limit is None else start + limit
+        return [self._stocks[ticker] for ticker in tickers[start:end]]
+    
+    def get_broker(self, client_id: str) -> Optional[Mapping[str, Any]]:
+        """
+        Look up a broker by client ID.
+        
+        Args:
+            client_id: Client identifier
+            
+        Returns:
+            Optional[Mapping[str, Any]]: Read-only broker record, or None if not in the snapshot
+        """
+        return self._brokers.get(client_id)
+    
+    def get_broker_or_404(self, client_id: str) -> Mapping[str, Any]:
+        """
+        Look up a broker by client ID, raising if it is not in the snapshot.
+        
+        Args:
+            client_id: Client identifier
+            
+        Returns:
+            Mapping[str, Any]: Read-only broker record
+            
+        Raises:
+            ClientNotFoundException: If the client ID is not in the snapshot
+        """
+        broker = self.get_broker(client_id)
+        if broker is None:
+            raise ClientNotFoundException(client_id)
+        return broker
+
+
+class ReferenceDataCache:
+    """
+    Holder of the current reference snapshot, refreshed in the background.
+    
+    Readers take the snapshot reference once and use it for the whole lookup; the
+    refresher builds a new snapshot off to the side and swaps the reference, so a
+    reader never sees a partially updated snapshot.
+    """
+    
+    def __init__(self, redis_cache=None, poll_interval: float = REFERENCE_POLL_INTERVAL):
+        """
+        Initialize the reference data cache; no snapshot is loaded until refresh or start.
+        
+        Args:
+            redis_cache: Optional RedisCache instance, uses the shared instance if not provided
+            poll_interval: Seconds between version polls
+        """
+        self._redis_cache = redis_cache
+        self.poll_interval = poll_interval
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+    
+    @property
+    def redis_cache(self):
+        """Shared RedisCache instance, created on first use."""
+        if self._redis_cache is None:
+            self._redis_cache = get_redis_cache()
+        return self._redis_cache
+    
+    @property
+    def snapshot(self) -> Optional[ReferenceSnapshot]:
+        """Current snapshot, or None until the first load completes."""
+        return self._snapshot
+    
+    def refresh(self, force: bool = False) -> ReferenceSnapshot:
+        """
+        Reload the snapshot if the stock or broker table changed since it was loaded.
+        
+        Args:
+            force: Reload even if the table version is unchanged
+            
+        Returns:
+            ReferenceSnapshot: The current snapshot
+        """
+        with self._refresh_lock:
+            with get_db() as db:
+                # Read the version first so changes made during the load trigger another reload
+                fingerprint = self._load_fingerprint(db)
+                current = self._snapshot
+                if not force and current is not None and current.fingerprint == fingerprint:
+                    return current
+                
+                stocks = [
+                    StockSchema.model_validate(stock, from_attributes=True)
+                    for stock in stock_crud.get_multi(db, skip=None, limit=None)
+                ]
+                brokers = [broker.to_dict() for broker in broker_crud.get_multi(db, skip=None, limit=None)]
+            
+            version = current.version + 1 if current is not None else 1
+            self._snapshot = ReferenceSnapshot(stocks, brokers, version=version, fingerprint=fingerprint)
+            
+            # Unknown tickers are rejected against the reloaded universe
+            get_ticker_filter().update(self._snapshot.tickers)
+            logger.info(
+                f"Loaded reference snapshot v{version}: {len(stocks)} stocks, {len(brokers)} brokers"
+            )
+            return self._snapshot
+    
+    def notify_changed(self) -> None:
+        """Tell every process to reload its snapshot, including this one."""
+        try:
+            self.redis_cache.publish(REFERENCE_CHANGE_CHANNEL, "changed")
+        except Exception as e:
+            logger.warning(f"Failed to publish reference data change: {str(e)}")
+    
+    def start(self) -> None:
+        """Start the background refresh thread if it is not running."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stopping.clear()
+        self._worker = threading.Thread(target=self._run, name="reference-data-refresh", daemon=True)
+        self._worker.start()
+        logger.info(f"Reference data refresher started (poll interval={self.poll_interval}s)")
+    
+    def stop(self) -> None:
+        """Stop the background refresh thread; the current snapshot stays available."""
+        self._stopping.set()
+        logger.info("Reference data refresher stopped")
+    
+    def _run(self) -> None:
+        pubsub = None
+        while not self._stopping.is_set():
+            notified = False
+            try:
+                if pubsub is None:
+                    pubsub = self.redis_cache.subscribe(REFERENCE_CHANGE_CHANNEL)
+                # Wait for a change notification, polling the table version on timeout
+                message = pubsub.get_message(timeout=self.poll_interval)
+                notified = bool(message and message.get("type") == "message")
+            except (redis.RedisError, OSError) as e:
+                logger.warning(f"Reference data change subscriber disconnected: {str(e)}")
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except (redis.RedisError, OSError):
+                        pass
+                pubsub = None
+                self._stopping.wait(self.poll_interval)
+            
+            if self._stopping.is_set():
+                break
+            try:
+                self.refresh(force=notified)
+            except Exception as e:
+                logger.error(f"Failed to refresh reference snapshot: {str(e)}")
+        
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except (redis.RedisError, OSError):
+                pass
+    
+    @staticmethod
+    def _load_fingerprint(db) -> Tuple:
+        # Row counts catch inserts and deletes, the newest update time catches updates
+        stock_count, stock_updated = db.execute(select(func.count(), func.max(Stock.last_updated))).one()
+        broker_count, broker_updated = db.execute(select(func.count(), func.max(Broker.last_updated))).one()
+        return (stock_count, stock_updated, broker_count, broker_updated)
+
+
+# Shared instance used by the data services and API endpoints
+reference_data = ReferenceDataCache()
@@ -6,23 +6,35 @@ used across all data service components. Serves as a foundation for implementing
 consistent data access patterns and business logic.
 """
 
+import asyncio
+import collections
+import hashlib
+import inspect
+import json
 import logging
 import functools
 import re
-from typing import Any, Dict, Callable, Optional, TypeVar, cast
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Callable, Iterable, Optional, Tuple, TypeVar, cast
 
 import httpx
 from sqlalchemy import exc
 
 from ...db.session import get_db
+from ...db.async_session import get_async_db
 from ...core.exceptions import (
+    BaseAPIException,
     ValidationException,
     TickerNotFoundException,
     ClientNotFoundException,
     ExternalAPIException
 )
-from ..cache.redis import redis_cache
+from ..cache import get_redis_cache, get_local_cache
 from ...config.settings import get_settings
+from ...utils.metrics import record_cached_call
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -30,6 +42,25 @@ logger = logging.getLogger(__name__)
 # Default cache TTL (5 minutes)
 DEFAULT_CACHE_TTL = 300
 
+# Default maximum lifetime of process-local copies of cached results (30 seconds)
+DEFAULT_LOCAL_CACHE_TTL = 30
+
+# Key type prefix of results cached by cache_result
+CACHE_RESULT_KEY_PREFIX = 'fn'
+
+# Hex digits of the argument hash kept in cache keys
+CACHE_KEY_DIGEST_LENGTH = 32
+
+# Marker of cached negative results (None returns and not-found errors)
+NEGATIVE_RESULT_MARKER = '__negative__'
+
+# Not-found errors that can be cached as negative results, rebuilt from their params
+NEGATIVE_RESULT_EXCEPTIONS = (TickerNotFoundException, ClientNotFoundException)
+NEGATIVE_RESULT_FACTORIES = {
+    'TickerNotFoundException': lambda params: TickerNotFoundException(params['ticker']),
+    'ClientNotFoundException': lambda params: ClientNotFoundException(params['client_id'])
+}
+
 # Regex patterns for validation
 TICKER_PATTERN = re.compile(r'^[A-Z]{1,5}$')
 CLIENT_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{3,50}$')
@@ -89,69 +120,356 @@ def validate_client_id(client_id: str) -> str:
 
 T = TypeVar('T')
 
-def cache_result(ttl: int = DEFAULT_CACHE_TTL):
+
+class _Flight:
+    """A cache miss being computed, shared by concurrent callers of the same key."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _CachedFunction:
+    """
+    Cache state of a function decorated with cache_result.
+    
+    Derives stable keys from the call arguments, reads and writes the process-local
+    and Redis tiers, collapses concurrent misses and counts cache outcomes.
+    """
+    
+    def __init__(self, func: Callable[..., Any], ttl: int, key_params: Optional[Iterable[str]],
+                 local: bool, local_ttl: int, negative_ttl: Optional[int], name: Optional[str] = None):
+        self.name = name or f"{func.__module__}.{func.__qualname__}"
+        self._func = func
+        self._ttl = ttl
+        self._local = local
+        self._local_ttl = local_ttl
+        self._negative_ttl = negative_ttl
+        self._signature = inspect.signature(func)
+        self._key_params = tuple(key_params) if key_params is not None else None
+        self._key_prefix = f"{CACHE_RESULT_KEY_PREFIX}:{self.name}"
+        
+        # The instance or class is not part of the result's identity
+        parameters = list(self._signature.parameters)
+        self._bound_param = parameters[0] if parameters and parameters[0] in ('self', 'cls') else None
+        
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, _Flight] = {}
+        self._async_in_flight: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._stats: collections.Counter = collections.Counter()
+    
+    def cache_key(self, *args, **kwargs) -> str:
+        """
+        Get the cache key for a set of call arguments.
+        
+        Args:
+            args: Positional arguments as passed to the function
+            kwargs: Keyword arguments as passed to the function
+            
+        Returns:
+            Cache key string
+            
+        Raises:
+            TypeError: If the arguments do not match the signature or have no stable representation
+        """
+        bound = self._signature.bind_partial(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop(self._bound_param, None)
+        if self._key_params is not None:
+            arguments = {name: arguments.get(name) for name in self._key_params}
+        return get_cache_key(self._key_prefix, (), arguments)
+    
+    def invalidate(self, *args, **kwargs) -> bool:
+        """
+        Remove the cached result for a set of call arguments from both tiers.
+        
+        Args:
+            args: Positional arguments as passed to the function
+            kwargs: Keyword arguments as passed to the function (pass by keyword to omit self)
+            
+        Returns:
+            True if the result was found and removed from Redis
+        """
+        key = self.cache_key(*args, **kwargs)
+        if self._local:
+            self._cache_call(get_local_cache, 'delete', key)
+        return bool(self._cache_call(get_redis_cache, 'delete', key))
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache outcome counts of this process.
+        
+        Returns:
+            Counts by outcome ('hit', 'local_hit', 'negative_hit', 'miss', 'shared', 'uncacheable')
+        """
+        return dict(self._stats)
+    
+    def call(self, args: tuple, kwargs: dict) -> Any:
+        """Call a synchronous function through the cache."""
+        key = self._key_or_none(args, kwargs)
+        if key is None:
+            return self._func(*args, **kwargs)
+        
+        found, value = self._lookup(key)
+        if found:
+            return self._resolve(value)
+        
+        # Only one caller per key computes a miss; the others wait for its result
+        with self._lock:
+            flight = self._in_flight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._in_flight[key] = _Flight()
+        
+        if not is_leader:
+            self._record('shared')
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        
+        try:
+            flight.result = self._compute(key, args, kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.done.set()
+    
+    async def call_async(self, args: tuple, kwargs: dict) -> Any:
+        """Call a coroutine function through the cache, with Redis I/O off the event loop."""
+        key = self._key_or_none(args, kwargs)
+        if key is None:
+            return await self._func(*args, **kwargs)
+        
+        found, value = self._lookup_local(key)
+        if not found:
+            found, value = await asyncio.to_thread(self._lookup_remote, key)
+        if found:
+            return self._resolve(value)
+        
+        # Only one task per key and event loop computes a miss; the others await its result
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        future = self._async_in_flight.get(flight_key)
+        while future is not None:
+            self._record('shared')
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Only the leader was cancelled: retry, taking over if no other waiter has
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            future = self._async_in_flight.get(flight_key)
+        
+        future = loop.create_future()
+        self._async_in_flight[flight_key] = future
+        try:
+            try:
+                result = await self._func(*args, **kwargs)
+            except NEGATIVE_RESULT_EXCEPTIONS as e:
+                await asyncio.to_thread(self._store_negative_error, key, e)
+                raise
+            future.set_result(result)
+            await asyncio.to_thread(self._store, key, result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # Mark the error as retrieved when no other task awaited the future
+                future.exception()
+            raise
+        finally:
+            if self._async_in_flight.get(flight_key) is future:
+                del self._async_in_flight[flight_key]
+    
+    def _compute(self, key: str, args: tuple, kwargs: dict) -> Any:
+        try:
+            result = self._func(*args, **kwargs)
+        except NEGATIVE_RESULT_EXCEPTIONS as e:
+            self._store_negative_error(key, e)
+            raise
+        self._store(key, result)
+        return result
+    
+    def _key_or_none(self, args: tuple, kwargs: dict) -> Optional[str]:
+        try:
+            return self.cache_key(*args, **kwargs)
+        except TypeError as e:
+            # Call the function uncached rather than caching under an unstable key
+            logger.warning(f"Not caching {self.name}: {str(e)}")
+            self._record('uncacheable')
+            return None
+    
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        found, value = self._lookup_local(key)
+        if found:
+            return found, value
+        return self._lookup_remote(key)
+    
+    def _lookup_local(self, key: str) -> Tuple[bool, Any]:
+        if self._local:
+            value = self._cache_call(get_local_cache, 'get', key)
+            if value is not None:
+                self._record('negative_hit' if _is_negative_result(value) else 'local_hit')
+                return True, value
+        return False, None
+    
+    def _lookup_remote(self, key: str) -> Tuple[bool, Any]:
+        value = self._cache_call(get_redis_cache, 'get', key)
+        if value is not None:
+            is_negative = _is_negative_result(value)
+            if self._local:
+                local_ttl = min(self._local_ttl, self._negative_ttl or self._local_ttl) if is_negative else self._local_ttl
+                self._cache_call(get_local_cache, 'set', key, value, local_ttl)
+            self._record('negative_hit' if is_negative else 'hit')
+            return True, value
+        
+        logger.debug(f"Cache miss for key: {key}")
+        self._record('miss')
+        return False, None
+    
+    def _store(self, key: str, result: Any) -> None:
+        if result is None:
+            if self._negative_ttl:
+                self._store_value(key, {NEGATIVE_RESULT_MARKER: None}, self._negative_ttl)
+            return
+        self._store_value(key, result, self._ttl)
+    
+    def _store_negative_error(self, key: str, error: BaseAPIException) -> None:
+        if self._negative_ttl:
+            marker = {NEGATIVE_RESULT_MARKER: {"type": type(error).__name__, "params": error.params}}
+            self._store_value(key, marker, self._negative_ttl)
+    
+    def _store_value(self, key: str, value: Any, ttl: int) -> None:
+        self._cache_call(get_redis_cache, 'set', key, value, ttl)
+        if self._local:
+            self._cache_call(get_local_cache, 'set', key, value, min(ttl, self._local_ttl))
+        logger.debug(f"Cached result for key: {key}, TTL: {ttl}")
+    
+    def _resolve(self, value: Any) -> Any:
+        if not _is_negative_result(value):
+            return value
+        negative = value[NEGATIVE_RESULT_MARKER]
+        if negative is None:
+            return None
+        raise NEGATIVE_RESULT_FACTORIES[negative["type"]](negative["params"])
+    
+    def _record(self, result: str) -> None:
+        self._stats[result] += 1
+        record_cached_call(self.name, result)
+    
+    def _cache_call(self, get_cache: Callable[[], Any], method: str, *args) -> Any:
+        # A failing cache must never fail the decorated call
+        try:
+            return getattr(get_cache(), method)(*args)
+        except Exception as e:
+            logger.warning(f"Cache {method} failed for {self.name}: {str(e)}")
+            return None
+
+
+def _is_negative_result(value: Any) -> bool:
+    return isinstance(value, dict) and NEGATIVE_RESULT_MARKER in value
+
+
+def _canonical_value(value: Any) -> Any:
+    # json.dumps default hook: stable text for the argument types used by the services
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=lambda item: json.dumps(item, sort_keys=True, default=_canonical_value))
+    if hasattr(value, 'model_dump'):
+        return value.model_dump(mode='json')
+    raise TypeError(f"cannot derive a stable cache key from a {type(value).__name__} argument")
+
+
+def cache_result(
+    ttl: int = DEFAULT_CACHE_TTL,
+    key_params: Optional[Iterable[str]] = None,
+    local: bool = False,
+    local_ttl: int = DEFAULT_LOCAL_CACHE_TTL,
+    negative_ttl: Optional[int] = None,
+    name: Optional[str] = None
+):
     """
-    Decorator for caching function results.
+    Decorator for caching function results, for both regular and async functions.
+    
+    Keys are built from the function's qualified name (or name) and a hash of its canonical
+    arguments, bound by parameter name with defaults applied. The self or cls argument
+    is left out, so all instances and processes share the same entries. Concurrent
+    misses for the same key in a process run the function once.
+    
+    The decorated function also gets cache_key(...), invalidate(...) and cache_stats()
+    helpers; cache_key and invalidate take the function's arguments.
     
     Args:
         ttl: Time-to-live in seconds for cached results
+        key_params: Names of the parameters that identify a result (default: all except self/cls)
+        local: Also keep results in the process-local cache, in front of Redis
+        local_ttl: Maximum time-to-live in seconds of process-local copies
+        negative_ttl: Time-to-live in seconds for None results and not-found errors (default: not cached)
+        name: Cache name shared by functions that compute the same results, such as
+            a sync function and its async variant (default: the qualified function name)
         
     Returns:
         Decorated function with caching
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            # Generate cache key based on function name and arguments
-            cache_key = get_cache_key(func.__name__, args, kwargs)
-            
-            # Try to get result from cache
-            cached_result = redis_cache.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f"Cache hit for key: {cache_key}")
-                return cast(T, cached_result)
-            
-            # Cache miss, call original function
-            logger.debug(f"Cache miss for key: {cache_key}")
-            result = func(*args, **kwargs)
-            
-            # Cache the result
-            redis_cache.set(cache_key, result, ttl)
-            logger.debug(f"Cached result for key: {cache_key}, TTL: {ttl}")
-            
-            return result
-        return wrapper
+        cached = _CachedFunction(func, ttl, key_params, local, min(local_ttl, ttl), negative_ttl, name)
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await cached.call_async(args, kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return cached.call(args, kwargs)
+        
+        wrapper.cache_key = cached.cache_key
+        wrapper.invalidate = cached.invalidate
+        wrapper.cache_stats = cached.stats
+        return cast(Callable[..., T], wrapper)
     return decorator
 
 
 def get_cache_key(prefix: str, args: tuple, kwargs: dict) -> str:
     """
-    Generates a cache key from function name and arguments.
+    Generates a stable cache key from a prefix and call arguments.
+    
+    Arguments are serialized to canonical JSON (sorted keys; Decimal, date, Enum and
+    set values by their text) and hashed, so the key is the same in every process and
+    bounded in length.
     
     Args:
-        prefix: Prefix for the cache key (usually function name)
+        prefix: Prefix for the cache key (usually the qualified function name)
         args: Positional arguments
         kwargs: Keyword arguments
         
     Returns:
         Cache key string
+        
+    Raises:
+        TypeError: If an argument has no stable representation
     """
-    # Convert args to string representation
-    args_str = ':'.join(str(arg) for arg in args) if args else ''
-    
-    # Convert kwargs to sorted string representation
-    kwargs_items = sorted(kwargs.items())
-    kwargs_str = ':'.join(f"{k}={v}" for k, v in kwargs_items) if kwargs_items else ''
-    
-    # Combine prefix, args, and kwargs with separators
-    if args_str and kwargs_str:
-        return f"{prefix}:{args_str}:{kwargs_str}"
-    elif args_str:
-        return f"{prefix}:{args_str}"
-    elif kwargs_str:
-        return f"{prefix}:{kwargs_str}"
-    else:
+    if not args and not kwargs:
         return prefix
+    
+    canonical = json.dumps([list(args), kwargs], sort_keys=True, separators=(',', ':'), default=_canonical_value)
+    digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:CACHE_KEY_DIGEST_LENGTH]
+    return f"{prefix}:{digest}"
 
 
 class DataServiceBase:
@@ -175,6 +493,15 @@ class DataServiceBase:
         """
         return get_db()
     
+    def _get_async_db_session(self):
+        """
+        Get an async database session using async context manager.
+        
+        Returns:
+            Async database session context manager
+        """
+        return get_async_db()
+    
     def _log_operation(self, operation: str, message: str, level: str = "INFO"):
         """
         Log a service operation with appropriate level.
@@ -16,6 +16,7 @@ from .utils import (
     DEFAULT_CACHE_TTL
 )
 from ...db.crud.volatility import volatility
+from ...db.crud.volatility_rollup import volatility_rollup, DEFAULT_POINT_BUDGET
 from ...core.exceptions import TickerNotFoundException, ExternalAPIException
 from ...core.constants import VOLATILITY_CACHE_TTL, EVENT_RISK_CACHE_TTL
 from ..cache.redis import redis_cache
@@ -118,16 +119,23 @@ class VolatilityService(DataServiceBase):
         ticker: str,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        max_points: Optional[int] = None
     ) -> List[VolatilityResponse]:
         """
         Get historical volatility data for a stock
         
+        When no limit is given, the range is served from the time-series layer:
+        raw points if they fit within max_points, otherwise the finest 1m/1h/1d
+        rollup that does, with each bucket reported as its average volatility
+        and highest event risk.
+        
         Args:
             ticker: Stock symbol
             start_date: Optional start date for the data range
             end_date: Optional end date for the data range
-            limit: Optional maximum number of records to return
+            limit: Optional maximum number of most recent raw records to return
+            max_points: Optional point budget for the range (defaults to DEFAULT_POINT_BUDGET)
             
         Returns:
             List[VolatilityResponse]: List of historical volatility data
@@ -140,6 +148,32 @@ class VolatilityService(DataServiceBase):
         ticker = validate_ticker(ticker)
         
         try:
+            # A raw record limit keeps the original most-recent-N semantics
+            if limit is None:
+                with self._get_db_session() as db:
+                    resolution, points = volatility_rollup.get_series(
+                        db, ticker, start_date, end_date, max_points or DEFAULT_POINT_BUDGET
+                    )
+                
+                if points:
+                    response = [
+                        self._format_volatility_response({
+                            'stock_id': ticker,
+                            'vol_index': point['vol_avg'],
+                            'event_risk_factor': point['event_risk_max'],
+                            'timestamp': point['timestamp']
+                        })
+                        for point in points
+                    ]
+                    
+                    self._log_operation(
+                        "get_volatility_history",
+                        f"Retrieved {len(response)} {resolution} volatility points for {ticker}",
+                        "INFO"
+                    )
+                    
+                    return response
+            
             # Get historical data from database
             with self._get_db_session() as db:
                 history_data = volatility.get_historical_by_stock(
@@ -499,17 +533,19 @@ class VolatilityService(DataServiceBase):
         
         try:
             with self._get_db_session() as db:
-                # Get average volatility
-                avg_volatility = volatility.get_average_volatility(db, ticker, start_date, end_date)
-                
-                # Get maximum event risk
-                max_event_risk = volatility.get_max_event_risk(db, ticker, start_date, end_date)
+                # Average, range and event risk come back from one query
+                range_stats = volatility_rollup.get_range_stats(db, ticker, start_date, end_date)
+                avg_volatility = range_stats["average_volatility"]
+                max_event_risk = range_stats["max_event_risk"]
                 
                 # Build response
                 stats = {
                     "ticker": ticker,
                     "average_volatility": float(avg_volatility) if avg_volatility else None,
+                    "min_volatility": float(range_stats["min_volatility"]) if range_stats["min_volatility"] is not None else None,
+                    "max_volatility": float(range_stats["max_volatility"]) if range_stats["max_volatility"] is not None else None,
                     "max_event_risk": max_event_risk if max_event_risk else None,
+                    "sample_count": range_stats["sample_count"],
                     "period_start": start_date.isoformat() if start_date else None,
                     "period_end": end_date.isoformat() if end_date else None
                 }
@@ -17,6 +17,7 @@ from ...utils.retry import (
     retry, retry_async, retry_with_fallback, retry_async_with_fallback
 )
 from ...utils.circuit_breaker import circuit_breaker, async_circuit_breaker
+from ...utils.metrics import track_external_call
 from ...core.constants import ExternalAPIs
 
 # Set up logger
@@ -75,30 +76,31 @@ def get(
     params = params or {}
     headers = headers or {}
     
-    try:
-        response = requests.get(url, params=params, headers=headers, timeout=timeout)
-        
-        # Check if response was successful
-        if response.status_code >= 200 and response.status_code < 300:
-            try:
-                return response.json()
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing JSON response from {url}: {str(e)}")
-                raise ExternalAPIException(service_name, f"Invalid JSON response: {str(e)}")
-        else:
-            logger.error(f"Error response from {url}: {response.status_code} - {response.text}")
-            raise ExternalAPIException(
-                service_name, 
-                f"API returned error: HTTP {response.status_code}"
-            )
+    with track_external_call(service_name):
+        try:
+            response = requests.get(url, params=params, headers=headers, timeout=timeout)
             
-    except requests.RequestException as e:
-        logger.error(f"Request exception for {url}: {str(e)}")
-        raise
-        
-    except Exception as e:
-        logger.error(f"Unexpected error during GET request to {url}: {str(e)}")
-        raise ExternalAPIException(service_name, f"Unexpected error: {str(e)}")
+            # Check if response was successful
+            if response.status_code >= 200 and response.status_code < 300:
+                try:
+                    return response.json()
+                except json.JSONDecodeError as e:
+                    logger.error(f"Error parsing JSON response from {url}: {str(e)}")
+                    raise ExternalAPIException(service_name, f"Invalid JSON response: {str(e)}")
+            else:
+                logger.error(f"Error response from {url}: {response.status_code} - {response.text}")
+                raise ExternalAPIException(
+                    service_name, 
+                    f"API returned error: HTTP {response.status_code}"
+                )
+                
+        except requests.RequestException as e:
+            logger.error(f"Request exception for {url}: {str(e)}")
+            raise
+            
+        except Exception as e:
+            logger.error(f"Unexpected error during GET request to {url}: {str(e)}")
+            raise ExternalAPIException(service_name, f"Unexpected error: {str(e)}")
 
 
 @retry_async_with_fallback(
@@ -146,37 +148,38 @@ async def async_get(
     params = params or {}
     headers = headers or {}
     
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url, 
-                params=params, 
-                headers=headers, 
-                timeout=timeout
-            ) as response:
-                
-                # Check if response was successful
-                if response.status >= 200 and response.status < 300:
-                    try:
-                        return await response.json()
-                    except (json.JSONDecodeError, aiohttp.ContentTypeError) as e:
-                        logger.error(f"Error parsing JSON response from {url}: {str(e)}")
-                        raise ExternalAPIException(service_name, f"Invalid JSON response: {str(e)}")
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Error response from {url}: {response.status} - {error_text}")
-                    raise ExternalAPIException(
-                        service_name, 
-                        f"API returned error: HTTP {response.status}"
-                    )
-                
-    except aiohttp.ClientError as e:
-        logger.error(f"Request exception for {url}: {str(e)}")
-        raise
-        
-    except Exception as e:
-        logger.error(f"Unexpected error during async GET request to {url}: {str(e)}")
-        raise ExternalAPIException(service_name, f"Unexpected error: {str(e)}")
+    with track_external_call(service_name):
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(
+                    url, 
+                    params=params, 
+                    headers=headers, 
+                    timeout=timeout
+                ) as response:
+                    
+                    # Check if response was successful
+                    if response.status >= 200 and response.status < 300:
+                        try:
+                            return await response.json()
+                        except (json.JSONDecodeError, aiohttp.ContentTypeError) as e:
+                            logger.error(f"Error parsing JSON response from {url}: {str(e)}")
+                            raise ExternalAPIException(service_name, f"Invalid JSON response: {str(e)}")
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"Error response from {url}: {response.status} - {error_text}")
+                        raise ExternalAPIException(
+                            service_name, 
+                            f"API returned error: HTTP {response.status}"
+                        )
+                    
+        except aiohttp.ClientError as e:
+            logger.error(f"Request exception for {url}: {str(e)}")
+            raise
+            
+        except Exception as e:
+            logger.error(f"Unexpected error during async GET request to {url}: {str(e)}")
+            raise ExternalAPIException(service_name, f"Unexpected error: {str(e)}")
 
 
 @retry_with_fallback(
@@ -224,30 +227,31 @@ def post(
     json_data = json_data or {}
     headers = headers or {}
     
-    try:
-        response = requests.post(url, json=json_data, headers=headers, timeout=timeout)
-        
-        # Check if response was successful
-        if response.status_code >= 200 and response.status_code < 300:
-            try:
-                return response.json()
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing JSON response from {url}: {str(e)}")
-                raise ExternalAPIException(service_name, f"Invalid JSON response: {str(e)}")
-        else:
-            logger.error(f"Error response from {url}: {response.status_code} - {response.text}")
-            raise ExternalAPIException(
-                service_name, 
-                f"API returned error: HTTP {response.status_code}"
-            )
+    with track_external_call(service_name):
+        try:
+            response = requests.post(url, json=json_data, headers=headers, timeout=timeout)
             
-    except requests.RequestException as e:
-        logger.error(f"Request exception for {url}: {str(e)}")
-        raise
-        
-    except Exception as e:
-        logger.error(f"Unexpected error during POST request to {url}: {str(e)}")
-        raise ExternalAPIException(service_name, f"Unexpected error: {str(e)}")
+            # Check if response was successful
+            if response.status_code >= 200 and response.status_code < 300:
+                try:
+                    return response.json()
+                except json.JSONDecodeError as e:
+                    logger.error(f"Error parsing JSON response from {url}: {str(e)}")
+                    raise ExternalAPIException(service_name, f"Invalid JSON response: {str(e)}")
+            else:
+                logger.error(f"Error response from {url}: {response.status_code} - {response.text}")
+                raise ExternalAPIException(
+                    service_name, 
+                    f"API returned error: HTTP {response.status_code}"
+                )
+                
+        except requests.RequestException as e:
+            logger.error(f"Request exception for {url}: {str(e)}")
+            raise
+            
+        except Exception as e:
+            logger.error(f"Unexpected error during POST request to {url}: {str(e)}")
+            raise ExternalAPIException(service_name, f"Unexpected error: {str(e)}")
 
 
 @retry_async_with_fallback(
@@ -295,37 +299,38 @@ async def async_post(
     json_data = json_data or {}
     headers = headers or {}
     
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url, 
-                json=json_data, 
-                headers=headers, 
-                timeout=timeout
-            ) as response:
-                
-                # Check if response was successful
-                if response.status >= 200 and response.status < 300:
-                    try:
-                        return await response.json()
-                    except (json.JSONDecodeError, aiohttp.ContentTypeError) as e:
-                        logger.error(f"Error parsing JSON response from {url}: {str(e)}")
-                        raise ExternalAPIException(service_name, f"Invalid JSON response: {str(e)}")
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Error response from {url}: {response.status} - {error_text}")
-                    raise ExternalAPIException(
-                        service_name, 
-                        f"API returned error: HTTP {response.status}"
-                    )
-                
-    except aiohttp.ClientError as e:
-        logger.error(f"Request exception for {url}: {str(e)}")
-        raise
-        
-    except Exception as e:
-        logger.error(f"Unexpected error during async POST request to {url}: {str(e)}")
-        raise ExternalAPIException(service_name, f"Unexpected error: {str(e)}")
+    with track_external_call(service_name):
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    url, 
+                    json=json_data, 
+                    headers=headers, 
+                    timeout=timeout
+                ) as response:
+                    
+                    # Check if response was successful
+                    if response.status >= 200 and response.status < 300:
+                        try:
+                            return await response.json()
+                        except (json.JSONDecodeError, aiohttp.ContentTypeError) as e:
+                            logger.error(f"Error parsing JSON response from {url}: {str(e)}")
+                            raise ExternalAPIException(service_name, f"Invalid JSON response: {str(e)}")
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"Error response from {url}: {response.status} - {error_text}")
+                        raise ExternalAPIException(
+                            service_name, 
+                            f"API returned error: HTTP {response.status}"
+                        )
+                    
+        except aiohttp.ClientError as e:
+            logger.error(f"Request exception for {url}: {str(e)}")
+            raise
+            
+        except Exception as e:
+            logger.error(f"Unexpected error during async POST request to {url}: {str(e)}")
+            raise ExternalAPIException(service_name, f"Unexpected error: {str(e)}")
 
 
 def validate_response(response: Dict[str, Any], required_fields: list[str]) -> bool:
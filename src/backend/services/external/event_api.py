@@ -14,6 +14,7 @@ from .client import get, async_get, build_url, validate_response
 from ...core.exceptions import ExternalAPIException
 from ...core.constants import ExternalAPIs
 from ...utils.logging import setup_logger
+from ...utils.timing import timed, async_timed
 from ...config.settings import get_settings
 
 # Setup logger
@@ -52,6 +53,7 @@ def get_auth_headers() -> Dict[str, str]:
     
     return headers
 
+@timed(stage='event')
 def get_event_risk_factor(ticker: str) -> int:
     """
     Retrieves the event risk factor for a specific ticker.
@@ -115,6 +117,7 @@ def get_event_risk_factor(ticker: str) -> int:
     logger.info(f"Event risk factor for ticker {ticker}: {highest_risk}")
     return highest_risk
 
+@async_timed(stage='event')
 async def async_get_event_risk_factor(ticker: str) -> int:
     """
     Asynchronously retrieves the event risk factor for a specific ticker.
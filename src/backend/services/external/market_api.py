@@ -8,14 +8,16 @@ API is unavailable.
 """
 
 from decimal import Decimal
-from typing import Dict, Optional, Any, Union
+from typing import Dict, Iterable, Optional, Any, Union
 
 from .client import get, async_get, validate_response, build_url
 from ...core.exceptions import ExternalAPIException
 from ...config.settings import get_settings
 from ...utils.logging import setup_logger
+from ...utils.timing import timed, async_timed
 from ...core.constants import ExternalAPIs
 from ..cache.redis import RedisCache
+from ..cache.utils import get_volatility_key, get_ticker_tag
 
 # Initialize logger
 logger = setup_logger('market_api')
@@ -23,6 +25,9 @@ logger = setup_logger('market_api')
 # Cache key prefix for market volatility data
 CACHE_KEY_PREFIX = 'market_volatility:'
 
+# Cache key for the market volatility index, in the versioned volatility namespace
+MARKET_INDEX_CACHE_KEY = get_volatility_key('market_index')
+
 # Default value for when volatility data is unavailable
 DEFAULT_VOLATILITY_VALUE = Decimal('20.0')
 
@@ -60,6 +65,7 @@ def get_redis_cache() -> RedisCache:
     return _redis_cache
 
 
+@timed(stage='market')
 def get_market_volatility_index(use_cache: Optional[bool] = True) -> Dict[str, Any]:
     """
     Fetches the current market volatility index (e.g., VIX).
@@ -73,7 +79,7 @@ def get_market_volatility_index(use_cache: Optional[bool] = True) -> Dict[str, A
     Raises:
         ExternalAPIException: If the external API is unavailable and no fallback data exists
     """
-    cache_key = "market_index"
+    cache_key = MARKET_INDEX_CACHE_KEY
     
     # Try to get from cache if use_cache is True
     if use_cache:
@@ -133,6 +139,7 @@ def get_market_volatility_index(use_cache: Optional[bool] = True) -> Dict[str, A
         raise
 
 
+@async_timed(stage='market')
 async def async_get_market_volatility_index(use_cache: Optional[bool] = True) -> Dict[str, Any]:
     """
     Asynchronously fetches the current market volatility index.
@@ -146,7 +153,7 @@ async def async_get_market_volatility_index(use_cache: Optional[bool] = True) ->
     Raises:
         ExternalAPIException: If the external API is unavailable and no fallback data exists
     """
-    cache_key = "market_index"
+    cache_key = MARKET_INDEX_CACHE_KEY
     
     # Try to get from cache if use_cache is True
     if use_cache:
@@ -206,6 +213,7 @@ async def async_get_market_volatility_index(use_cache: Optional[bool] = True) ->
         raise
 
 
+@timed(stage='market')
 def get_stock_volatility(ticker: str, use_cache: Optional[bool] = True) -> Dict[str, Any]:
     """
     Fetches volatility metrics for a specific stock.
@@ -220,7 +228,7 @@ def get_stock_volatility(ticker: str, use_cache: Optional[bool] = True) -> Dict[
     Raises:
         ExternalAPIException: If the external API is unavailable and no fallback data exists
     """
-    cache_key = f"stock:{ticker}"
+    cache_key = get_volatility_key(ticker)
     
     # Try to get from cache if use_cache is True
     if use_cache:
@@ -269,7 +277,8 @@ def get_stock_volatility(ticker: str, use_cache: Optional[bool] = True) -> Dict[
             cache.set(
                 cache_key, 
                 response, 
-                ttl=settings.get_cache_ttl('volatility')
+                ttl=settings.get_cache_ttl('volatility'),
+                tags=[get_ticker_tag(ticker)]
             )
         
         logger.info(f"Successfully fetched stock volatility for {ticker}: {response.get('volatility')}")
@@ -280,6 +289,7 @@ def get_stock_volatility(ticker: str, use_cache: Optional[bool] = True) -> Dict[
         raise
 
 
+@async_timed(stage='market')
 async def async_get_stock_volatility(ticker: str, use_cache: Optional[bool] = True) -> Dict[str, Any]:
     """
     Asynchronously fetches volatility metrics for a specific stock.
@@ -294,7 +304,7 @@ async def async_get_stock_volatility(ticker: str, use_cache: Optional[bool] = Tr
     Raises:
         ExternalAPIException: If the external API is unavailable and no fallback data exists
     """
-    cache_key = f"stock:{ticker}"
+    cache_key = get_volatility_key(ticker)
     
     # Try to get from cache if use_cache is True
     if use_cache:
@@ -343,7 +353,8 @@ async def async_get_stock_volatility(ticker: str, use_cache: Optional[bool] = Tr
             cache.set(
                 cache_key, 
                 response, 
-                ttl=settings.get_cache_ttl('volatility')
+                ttl=settings.get_cache_ttl('volatility'),
+                tags=[get_ticker_tag(ticker)]
             )
         
         logger.info(f"Successfully fetched stock volatility for {ticker} (async): {response.get('volatility')}")
@@ -354,6 +365,25 @@ async def async_get_stock_volatility(ticker: str, use_cache: Optional[bool] = Tr
         raise
 
 
+def get_cached_stock_volatilities(tickers: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Reads the cached volatility data of several stocks with a single multi-get.
+    
+    Volatility is cached under this module's key prefix, so readers outside this
+    module must go through here rather than through the shared cache strategy.
+    
+    Args:
+        tickers: Stock symbols
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Cached volatility data by ticker; tickers not cached are omitted
+    """
+    keys = {get_volatility_key(ticker): ticker for ticker in tickers}
+    if not keys:
+        return {}
+    values = get_redis_cache().get_many(list(keys))
+    return {keys[key]: value for key, value in values.items() if isinstance(value, dict)}
+
 def get_volatility_adjustment_factor(ticker: str, use_cache: Optional[bool] = True) -> Decimal:
     """
     Calculates the volatility adjustment factor for a stock.
@@ -494,6 +524,9 @@ def clear_volatility_cache(ticker: Optional[str] = None) -> bool:
     """
     Clears cached volatility data for a specific ticker or all volatility data.
     
+    Clearing all volatility data invalidates the volatility cache namespace with a
+    single generation bump; other cached data and rate limit counters are untouched.
+    
     Args:
         ticker: Stock symbol to clear cache for. If None, all volatility cache will be cleared.
         
@@ -504,29 +537,16 @@ def clear_volatility_cache(ticker: Optional[str] = None) -> bool:
     
     if ticker:
         # Clear cache for specific ticker
-        cache_key = f"stock:{ticker}"
+        cache_key = get_volatility_key(ticker)
         success = cache.delete(cache_key)
         logger.info(f"Cleared volatility cache for {ticker}: {success}")
         return success
     else:
         # Clear all volatility cache
         try:
-            # Try to use the flush method if available
-            if hasattr(cache, 'flush') and callable(getattr(cache, 'flush')):
-                success = cache.flush()
-                logger.info("Cleared all volatility cache")
-                return success
-            else:
-                # Get all keys with the prefix and delete them
-                keys = cache._client.keys(f"{CACHE_KEY_PREFIX}*")
-                if keys:
-                    for key in keys:
-                        cache.delete(key)
-                    logger.info(f"Cleared all volatility cache ({len(keys)} keys)")
-                    return True
-                else:
-                    logger.info("No volatility cache found to clear")
-                    return True
+            generation = cache.invalidate_namespace('volatility')
+            logger.info(f"Cleared all volatility cache (generation {generation})")
+            return True
         except Exception as e:
             logger.error(f"Failed to clear all volatility cache: {str(e)}")
             return False
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""
+Package initialization file for the health service module in the Borrow Rate & Locate Fee Pricing Engine.
+
+This module exposes the background health monitor that probes system components on their
+own schedules and serves cached health snapshots to the health, readiness and liveness endpoints.
+"""
+
+from .monitor import (
+    HealthMonitor,
+    ComponentProbe,
+    is_component_healthy,
+    HEALTH_HISTORY_SIZE
+)
+
+__all__ = [
+    "HealthMonitor",
+    "ComponentProbe",
+    "is_component_healthy",
+    "HEALTH_HISTORY_SIZE"
+]
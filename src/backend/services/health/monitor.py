@@ -0,0 +1,255 @@
+"""
+Background health monitor for the Borrow Rate & Locate Fee Pricing Engine.
+
+This module probes each system component (database, cache, external APIs) on its own
+interval with a timeout, keeps a bounded latency history per component, and publishes an
+immutable health snapshot after every probe. Health, readiness and liveness endpoints
+read the latest snapshot instead of checking dependencies on every request, so probe
+traffic no longer scales with the number of pollers and a slow dependency cannot block
+request workers.
+"""
+
+import asyncio
+import statistics
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ...utils.logging import setup_logger
+
+# Set up module logger
+logger = setup_logger('services.health.monitor')
+
+# Number of probe results kept per component
+HEALTH_HISTORY_SIZE = 120
+
+# Component states that mark the system as degraded
+UNHEALTHY_STATES = {"disconnected", "unavailable", "error", "timeout"}
+
+
+def is_component_healthy(value: Any) -> bool:
+    """
+    Check whether a component status, or every status in a nested mapping, is healthy.
+    
+    Args:
+        value: Component status string or mapping of sub-component statuses
+    
+    Returns:
+        bool: True if no status is in UNHEALTHY_STATES
+    """
+    if isinstance(value, dict):
+        return all(is_component_healthy(v) for v in value.values())
+    return value not in UNHEALTHY_STATES
+
+
+class ComponentProbe:
+    """
+    Periodic probe of a single component with a bounded latency history.
+    """
+    
+    def __init__(self, name: str, check: Callable[[], Dict[str, Any]], interval: float, timeout: float,
+                 history_size: int = HEALTH_HISTORY_SIZE):
+        """
+        Initialize the component probe.
+        
+        Args:
+            name: Component name used as the key in the health report
+            check: Blocking function returning a {name: status} mapping
+            interval: Seconds between probes
+            timeout: Seconds before a probe is reported as timed out
+            history_size: Number of (timestamp, latency_ms, healthy) entries to keep
+        """
+        self.name = name
+        self.check = check
+        self.interval = interval
+        self.timeout = timeout
+        self.history: Deque[Tuple[float, float, bool]] = deque(maxlen=history_size)
+        self.result: Optional[Dict[str, Any]] = None
+        self.last_checked: Optional[float] = None
+        self._pending: Optional[asyncio.Future] = None
+    
+    async def probe(self) -> Dict[str, Any]:
+        """
+        Run the check in a worker thread, bounded by the probe timeout.
+        
+        A check that is still running from a previous timed-out probe is not started
+        again, so a hung dependency cannot accumulate blocked threads.
+        
+        Returns:
+            Dict[str, Any]: Component status mapping
+        """
+        start = time.perf_counter()
+        if self._pending is None or self._pending.done():
+            self._pending = asyncio.ensure_future(asyncio.to_thread(self.check))
+        
+        try:
+            result = await asyncio.wait_for(asyncio.shield(self._pending), self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Health probe for {self.name} timed out after {self.timeout}s")
+            result = {self.name: "timeout"}
+        except Exception as e:
+            logger.error(f"Health probe for {self.name} failed: {str(e)}")
+            result = {self.name: "error"}
+        
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.result = result
+        self.last_checked = time.time()
+        self.history.append((self.last_checked, latency_ms, is_component_healthy(result.get(self.name))))
+        return result
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the latency history of the probe.
+        
+        Returns:
+            Dict[str, Any]: Last and percentile latencies, failure count and last check time
+        """
+        if not self.history:
+            return {"samples": 0}
+        
+        latencies = sorted(entry[1] for entry in self.history)
+        return {
+            "samples": len(latencies),
+            "last_latency_ms": round(self.history[-1][1], 3),
+            "p50_latency_ms": round(statistics.median(latencies), 3),
+            "p95_latency_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+            "max_latency_ms": round(latencies[-1], 3),
+            "failures": sum(1 for entry in self.history if not entry[2]),
+            "last_checked": datetime.utcfromtimestamp(self.last_checked).isoformat() + "Z",
+            "interval": self.interval,
+        }
+
+
+class HealthMonitor:
+    """
+    Runs component probes in the background and serves the latest health snapshot.
+    """
+    
+    def __init__(self, version: str = "1.0.0", readiness_components: Optional[List[str]] = None):
+        """
+        Initialize the health monitor.
+        
+        Args:
+            version: Version reported in health snapshots
+            readiness_components: Components that must be healthy for readiness (defaults to database)
+        """
+        self.version = version
+        self.readiness_components = readiness_components or ["database"]
+        self._probes: Dict[str, ComponentProbe] = {}
+        self._tasks: List[asyncio.Task] = []
+        # Served until the first round of probes completes
+        self._snapshot: Dict[str, Any] = {
+            "status": "starting",
+            "version": version,
+            "components": {},
+            "checks": {},
+            "timestamp": datetime.utcnow(),
+        }
+    
+    def register(self, name: str, check: Callable[[], Dict[str, Any]], interval: float, timeout: float) -> None:
+        """
+        Register a component probe.
+        
+        Args:
+            name: Component name used as the key in the health report
+            check: Blocking function returning a {name: status} mapping
+            interval: Seconds between probes
+            timeout: Seconds before a probe is reported as timed out
+        """
+        self._probes[name] = ComponentProbe(name, check, interval, timeout)
+        logger.info(f"Registered health probe {name} (interval={interval}s, timeout={timeout}s)")
+    
+    @property
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest health snapshot; replaced atomically and never mutated."""
+        return self._snapshot
+    
+    @property
+    def running(self) -> bool:
+        """True while probe tasks are scheduled."""
+        return any(not task.done() for task in self._tasks)
+    
+    def is_ready(self) -> bool:
+        """
+        Check readiness from the latest snapshot.
+        
+        Returns:
+            bool: True if every readiness component has been probed and is healthy and fresh
+        """
+        components = self._snapshot["components"]
+        now = time.time()
+        for name in self.readiness_components:
+            probe = self._probes.get(name)
+            if probe is None or probe.last_checked is None or name not in components:
+                return False
+            if not is_component_healthy(components[name]):
+                return False
+            # A probe that has missed several intervals means the monitor is stuck
+            if now - probe.last_checked > max(3 * probe.interval, probe.timeout + probe.interval):
+                return False
+        return True
+    
+    def is_alive(self) -> bool:
+        """
+        Check liveness without touching any dependency.
+        
+        Returns:
+            bool: False only if the monitor was started and its probe tasks have died
+        """
+        return not self._tasks or self.running
+    
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Probe every component once and publish a new snapshot.
+        
+        Returns:
+            Dict[str, Any]: The new snapshot
+        """
+        await asyncio.gather(*(probe.probe() for probe in self._probes.values()))
+        return self._publish()
+    
+    def start(self) -> None:
+        """Start one background task per registered probe on the running event loop."""
+        if self.running:
+            return
+        self._tasks = [asyncio.ensure_future(self._run(probe)) for probe in self._probes.values()]
+        logger.info(f"Health monitor started with {len(self._tasks)} probes")
+    
+    async def stop(self) -> None:
+        """Cancel the background probe tasks."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Health monitor stopped")
+    
+    async def _run(self, probe: ComponentProbe) -> None:
+        while True:
+            await probe.probe()
+            self._publish()
+            await asyncio.sleep(probe.interval)
+    
+    def _publish(self) -> Dict[str, Any]:
+        components: Dict[str, Any] = {}
+        checks: Dict[str, Any] = {}
+        for name, probe in self._probes.items():
+            if probe.result is not None:
+                components.update(probe.result)
+                checks[name] = probe.stats()
+        
+        if len(checks) < len(self._probes):
+            overall_status = "starting"
+        elif all(is_component_healthy(value) for value in components.values()):
+            overall_status = "healthy"
+        else:
+            overall_status = "degraded"
+        
+        self._snapshot = {
+            "status": overall_status,
+            "version": self.version,
+            "components": components,
+            "checks": checks,
+            "timestamp": datetime.utcnow(),
+        }
+        return self._snapshot
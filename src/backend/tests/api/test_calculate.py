@@ -349,4 +349,56 @@ def test_calculate_locate_fee_unauthorized(api_client: httpx.Client, test_calcul
 
     # Assert response contains authentication error message
     assert "detail" in response_json
-    assert response_json["detail"] == "Not authenticated"
\ No newline at end of file
+    assert response_json["detail"] == "Not authenticated"
+
+def test_calculate_locate_fee_records_audit_with_request_session(api_client: httpx.Client, test_calculation_inputs: dict, test_api_key_header: dict, monkeypatch):
+    """Tests that the ticker check and the audit record use the injected async session"""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+    from ...main import app
+    from ...api.deps import get_async_db_session
+    from ...api.v1.endpoints import calculate as calculate_module
+    from ...core.exceptions import TickerNotFoundException
+
+    session = object()
+
+    async def override_session():
+        yield session
+    app.dependency_overrides[get_async_db_session] = override_session
+    monkeypatch.setattr(calculate_module.reference_data, "_snapshot", None)
+    get_by_ticker = AsyncMock(return_value=SimpleNamespace(ticker=test_calculation_inputs['ticker']))
+    monkeypatch.setattr(calculate_module.async_stock, "get_by_ticker_or_404", get_by_ticker)
+    monkeypatch.setattr(calculate_module.broker_service, "get_broker_async", AsyncMock(return_value={
+        "markup_percentage": Decimal('5'), "transaction_fee_type": "FLAT", "transaction_amount": Decimal('25')
+    }))
+    monkeypatch.setattr(calculate_module, "get_borrow_rate_with_source", lambda ticker: (Decimal('0.05'), "fallback"))
+    monkeypatch.setattr(calculate_module, "calculate_locate_fee", lambda **kwargs: {
+        "total_fee": 100.0,
+        "breakdown": {"borrow_cost": 70.0, "markup": 5.0, "transaction_fees": 25.0},
+        "borrow_rate_used": 0.05
+    })
+    log_calculation_async = AsyncMock()
+    monkeypatch.setattr(calculate_module.audit_logger, "log_calculation_async", log_calculation_async)
+
+    try:
+        # Assert the calculation is audited through the request's session
+        response = api_client.post("/api/v1/calculate-locate", json=test_calculation_inputs, headers=test_api_key_header)
+        assert response.status_code == 200
+        assert get_by_ticker.await_args.args == (session, test_calculation_inputs['ticker'])
+        assert log_calculation_async.await_args.args == (session,)
+        assert log_calculation_async.await_args.kwargs["total_fee"] == Decimal('100.0')
+
+        # Assert the audit record notes that the borrow rate came from fallback data
+        rate_source = log_calculation_async.await_args.kwargs["data_sources"][1]
+        assert rate_source["source_type"] == "borrow_rate"
+        assert rate_source["is_fallback"] is True
+
+        # Assert a ticker missing from the database is rejected before any calculation
+        get_by_ticker.side_effect = TickerNotFoundException("ZZZZ")
+        request_params = dict(test_calculation_inputs, ticker="ZZZZ")
+        response = api_client.post("/api/v1/calculate-locate", json=request_params, headers=test_api_key_header)
+        assert response.status_code == 404
+        assert log_calculation_async.await_count == 1
+    finally:
+        app.dependency_overrides.pop(get_async_db_session, None)
+        calculate_module.get_ticker_filter().reset()
\ No newline at end of file
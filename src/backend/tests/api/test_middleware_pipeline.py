@@ -0,0 +1,94 @@
+"""
+Test module for the fused request pipeline middleware in the Borrow Rate & Locate Fee Pricing Engine API.
+This file contains unit tests for exempt path matching, authentication failures, rate limit
+responses and the headers added by the single-pass ASGI middleware.
+"""
+
+import pytest  # pytest 7.0.0+
+from unittest.mock import patch
+from fastapi import FastAPI, status  # fastapi 0.103.0+
+from fastapi.testclient import TestClient  # fastapi 0.103.0+
+
+from src.backend.core.exceptions import RateLimitExceededException  # Internal imports
+from src.backend.middleware import pipeline  # Internal imports
+from src.backend.middleware.pipeline import FusedRequestMiddleware, ExemptPathMatcher  # Internal imports
+
+AUTH_RESULT = {"client_id": "test_client", "rate_limit": {"limit": 60, "remaining": 59, "reset": 30}}
+
+
+def create_app():
+    """Create a test app behind the fused middleware"""
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/api/v1/test")
+    async def protected():
+        return {"status": "success"}
+
+    app.add_middleware(FusedRequestMiddleware, exempt_paths=["/health", "/docs"])
+    return app
+
+
+@pytest.mark.unit
+def test_exempt_path_matcher():
+    """Test prefix matching against precompiled exempt paths"""
+    matcher = ExemptPathMatcher(["/health", "/docs", "/health"])
+
+    assert matcher("/health")
+    assert matcher("/health/readiness")
+    assert matcher("/docs/oauth2-redirect")
+    assert not matcher("/api/v1/rates/AAPL")
+    assert matcher.prefixes == ("/docs", "/health")
+
+
+@pytest.mark.unit
+def test_exempt_path_skips_authentication():
+    """Test that exempt paths bypass authentication but still get a correlation ID"""
+    client = TestClient(create_app())
+
+    with patch.object(pipeline, "authenticate_request") as mock_authenticate:
+        response = client.get("/health", headers={"X-Correlation-ID": "corr-123"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Correlation-ID"] == "corr-123"
+    mock_authenticate.assert_not_called()
+
+
+@pytest.mark.unit
+def test_missing_api_key_returns_401():
+    """Test that requests without an API key are rejected with a standardized error"""
+    client = TestClient(create_app())
+
+    response = client.get("/api/v1/test")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json()["error"] == "API key required"
+    assert "X-Correlation-ID" in response.headers
+
+
+@pytest.mark.unit
+def test_authenticated_request_adds_rate_limit_headers():
+    """Test that an authenticated request reaches the endpoint with rate limit headers"""
+    client = TestClient(create_app())
+
+    with patch.object(pipeline, "authenticate_request", return_value=AUTH_RESULT):
+        response = client.get("/api/v1/test", headers={"X-API-Key": "valid-key"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-RateLimit-Limit"] == "60"
+    assert response.headers["X-RateLimit-Remaining"] == "59"
+
+
+@pytest.mark.unit
+def test_rate_limit_exceeded_returns_429():
+    """Test that rate limit errors map to 429 with a Retry-After header"""
+    client = TestClient(create_app())
+
+    with patch.object(pipeline, "authenticate_request", side_effect=RateLimitExceededException("test_client", 42)):
+        response = client.get("/api/v1/test", headers={"X-API-Key": "valid-key"})
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == "42"
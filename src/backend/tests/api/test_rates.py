@@ -4,13 +4,14 @@ These tests verify the functionality of retrieving current borrow rates for secu
 including proper error handling, authentication, and response formatting.
 """
 
+import json  # standard library
 import pytest  # version: 7.4.0+
 import respx  # version: 0.20.0+
 import httpx  # version: 0.25.0+
 from decimal import Decimal  # standard library
 from fastapi import status  # version: 0.103.0+
 
-from ...schemas.response import BorrowRateResponse
+from ...schemas.response import BorrowRateResponse, MultiTickerRateResponse
 from ...core.constants import BorrowStatus
 from ..fixtures.stocks import (
     easy_to_borrow_stock,
@@ -281,6 +282,50 @@ def test_get_borrow_rates_by_status(
         assert item["borrow_status"] == BorrowStatus.HARD.value
 
 
+def test_get_borrow_rates_by_status_etag_and_failures(
+    api_client, test_api_key_header, monkeypatch
+):
+    """Tests that status pages are revalidated on their rate values and flag tickers without a rate."""
+    from datetime import datetime
+    from types import SimpleNamespace
+    from ...api.v1.endpoints import rates as rates_module
+    
+    stocks = [
+        SimpleNamespace(ticker=ticker, min_borrow_rate=Decimal('0.01'), borrow_status=BorrowStatus.EASY,
+                        last_updated=datetime(2026, 1, 1))
+        for ticker in ("AAPL", "MSFT")
+    ]
+    snapshot = SimpleNamespace(version=1, get_stocks_by_borrow_status=lambda *args, **kwargs: stocks)
+    monkeypatch.setattr(rates_module.reference_data, "_snapshot", snapshot)
+    records = {
+        ticker: {"borrow_rate": Decimal('0.05'), "volatility": Decimal('20'), "event_risk_factor": 0,
+                 "updated_at": 1767225600.0, "source": "cache"}
+        for ticker in ("AAPL", "MSFT")
+    }
+    
+    async def fake_bulk(tickers, min_rates):
+        return {ticker: dict(records[ticker]) for ticker in tickers if ticker in records}
+    monkeypatch.setattr(rates_module, "get_borrow_rates_bulk", fake_bulk)
+    
+    # Assert an unchanged page is answered with 304 and a changed rate gets a new ETag
+    response = api_client.get("/api/v1/rates/status/EASY", headers=test_api_key_header)
+    etag = response.headers["ETag"]
+    response = api_client.get("/api/v1/rates/status/EASY", headers={**test_api_key_header, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    records["MSFT"]["borrow_rate"] = Decimal('0.07')
+    response = api_client.get("/api/v1/rates/status/EASY", headers={**test_api_key_header, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    
+    # Assert a ticker without a rate is flagged and the partial page carries no ETag
+    del records["MSFT"]
+    response = api_client.get("/api/v1/rates/status/EASY", headers=test_api_key_header)
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["ticker"] for item in response.json()] == ["AAPL"]
+    assert response.headers["X-Failed-Tickers"] == "MSFT"
+    assert "ETag" not in response.headers
+
+
 def test_calculate_custom_rate(
     api_client, easy_to_borrow_stock, test_api_key_header, test_db, seed_test_data
 ):
@@ -363,4 +408,67 @@ def test_cache_usage(
     assert response.status_code == status.HTTP_200_OK
     
     # Verify that mock_seclend_api was called again (cache bypass)
-    assert mock_seclend_api.called
\ No newline at end of file
+    assert mock_seclend_api.called
+
+
+def test_get_borrow_rates_multiple_tickers(
+    api_client, easy_to_borrow_stock, hard_to_borrow_stock,
+    test_api_key_header, test_db, seed_test_data
+):
+    """Tests retrieval of several borrow rates in one request, with duplicates and unknown tickers."""
+    easy_ticker = easy_to_borrow_stock["ticker"]
+    hard_ticker = hard_to_borrow_stock["ticker"]
+    
+    # Make GET request to /api/v1/rates with a comma-separated, duplicated ticker list
+    response = api_client.get(
+        "/api/v1/rates",
+        params={"tickers": f"{easy_ticker},{hard_ticker},{easy_ticker.lower()},ZZZZZ"},
+        headers=test_api_key_header
+    )
+    
+    # Assert response status code is 200
+    assert response.status_code == status.HTTP_200_OK
+    
+    # Validate response against MultiTickerRateResponse schema
+    response_model = MultiTickerRateResponse(**response.json())
+    assert response_model.status == "success"
+    
+    # Assert each ticker is returned once, in request order, with its source
+    assert [rate.ticker for rate in response_model.rates] == [easy_ticker, hard_ticker]
+    for rate in response_model.rates:
+        assert rate.current_rate > Decimal('0')
+        assert rate.source in ("cache", "live", "fallback")
+    
+    # Assert the unknown ticker is reported as not found
+    assert response_model.not_found == ["ZZZZZ"]
+
+
+def test_query_borrow_rates_ndjson(
+    api_client, easy_to_borrow_stock, medium_to_borrow_stock,
+    test_api_key_header, test_db, seed_test_data
+):
+    """Tests the POST body variant of the multi-ticker endpoint streamed as NDJSON."""
+    tickers = [easy_to_borrow_stock["ticker"], medium_to_borrow_stock["ticker"]]
+    
+    # Make POST request to /api/v1/rates asking for NDJSON
+    response = api_client.post(
+        "/api/v1/rates",
+        json={"tickers": tickers},
+        headers={**test_api_key_header, "Accept": "application/x-ndjson"}
+    )
+    
+    # Assert response status code is 200 and the body is one JSON object per line
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    assert sorted(line["ticker"] for line in lines) == sorted(tickers)
+    for line in lines:
+        assert line["source"] in ("cache", "live", "fallback")
+    
+    # Make POST request with an invalid ticker format and assert it is rejected
+    response = api_client.post(
+        "/api/v1/rates",
+        json={"tickers": ["NOT-A-TICKER"]},
+        headers=test_api_key_header
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
\ No newline at end of file
@@ -0,0 +1,165 @@
+# Third-Party Imports
+import pytest  # pytest 7.4.0+
+
+# Internal Imports
+from src.backend.core.security import compute_api_key_digest, generate_api_key, hash_password
+from src.backend.db.crud.api_keys import api_key_crud
+from src.backend.db.models.api_key import APIKey
+from src.backend.schemas.api_key import ApiKeyCreate
+from src.backend.tests.conftest import test_db
+
+
+def test_create_api_key_stores_digest(test_db):
+    """Test that new API keys are stored with their lookup digest"""
+    # Act
+    db_key, plaintext_key = api_key_crud.create_api_key(
+        test_db, ApiKeyCreate(client_id="standard_broker", rate_limit=60)
+    )
+
+    # Assert
+    assert db_key.key_digest == compute_api_key_digest(plaintext_key)
+
+
+def test_get_by_key_uses_digest(test_db):
+    """Test retrieving an API key through the digest index"""
+    # Arrange
+    db_key, plaintext_key = api_key_crud.create_api_key(
+        test_db, ApiKeyCreate(client_id="standard_broker", rate_limit=60)
+    )
+
+    # Act
+    found_key = api_key_crud.get_by_key(test_db, plaintext_key)
+
+    # Assert
+    assert found_key is not None
+    assert found_key.key_id == db_key.key_id
+    assert api_key_crud.get_by_key(test_db, generate_api_key(48)) is None
+
+
+def test_get_by_key_migrates_legacy_key(test_db):
+    """Test that a key without a digest is found and migrated on first use"""
+    # Arrange
+    plaintext_key = generate_api_key(48)
+    test_db.add(APIKey(
+        key_id="legacy_key",
+        client_id="standard_broker",
+        hashed_key=hash_password(plaintext_key),
+        key_digest=None
+    ))
+    test_db.commit()
+    assert api_key_crud.count_legacy_keys(test_db) >= 1
+
+    # Act
+    found_key = api_key_crud.get_by_key(test_db, plaintext_key)
+
+    # Assert
+    assert found_key is not None
+    assert found_key.key_id == "legacy_key"
+    assert found_key.key_digest == compute_api_key_digest(plaintext_key)
+
+
+def test_migrate_legacy_keys(test_db):
+    """Test backfilling digests for legacy keys with known plaintext"""
+    # Arrange
+    plaintext_key = generate_api_key(48)
+    test_db.add(APIKey(
+        key_id="legacy_backfill",
+        client_id="standard_broker",
+        hashed_key=hash_password(plaintext_key),
+        key_digest=None
+    ))
+    test_db.commit()
+
+    # Act
+    migrated = api_key_crud.migrate_legacy_keys(test_db, [plaintext_key, generate_api_key(48)])
+
+    # Assert
+    assert migrated == 1
+    assert api_key_crud.get(test_db, "legacy_backfill", id_field="key_id").key_digest is not None
+
+
+def test_get_by_key_legacy_scan_is_gated_and_rate_limited(test_db, monkeypatch):
+    """Test that unknown keys only trigger a bounded legacy scan within the scan budget"""
+    # Arrange
+    from src.backend.db.crud import api_keys as api_keys_module
+    plaintext_key = generate_api_key(48)
+    test_db.add(APIKey(
+        key_id="legacy_gated",
+        client_id="standard_broker",
+        hashed_key=hash_password(plaintext_key),
+        key_digest=None
+    ))
+    test_db.commit()
+    lookup = {"enabled": False, "rate": 1.0, "max_rows": 50}
+    monkeypatch.setattr(api_keys_module.get_settings(), "legacy_api_key_lookup", lookup)
+    monkeypatch.setattr(api_keys_module, "_legacy_scan_bucket", [])
+    verified = []
+    verify = api_keys_module.verify_password
+    monkeypatch.setattr(api_keys_module, "verify_password", lambda *args: verified.append(args) or verify(*args))
+
+    # Act / Assert - disabled scan never verifies legacy rows
+    assert api_key_crud.get_by_key(test_db, plaintext_key) is None
+    assert verified == []
+
+    # Act / Assert - one scan per second is admitted, the next unknown key is rejected unscanned
+    lookup["enabled"] = True
+    assert api_key_crud.get_by_key(test_db, generate_api_key(48)) is None
+    scanned = len(verified)
+    assert scanned >= 1
+    assert api_key_crud.get_by_key(test_db, plaintext_key) is None
+    assert len(verified) == scanned
+
+
+def test_bounded_legacy_scans_rotate_through_all_legacy_keys(test_db, monkeypatch):
+    """Test that a legacy key beyond the scan window is reached by later scans"""
+    # Arrange
+    from src.backend.db.crud import api_keys as api_keys_module
+    plaintext_keys = {}
+    for key_id in ["legacy_rotate_a", "legacy_rotate_b", "legacy_rotate_c"]:
+        plaintext_keys[key_id] = generate_api_key(48)
+        test_db.add(APIKey(
+            key_id=key_id,
+            client_id="standard_broker",
+            hashed_key=hash_password(plaintext_keys[key_id]),
+            key_digest=None
+        ))
+    test_db.commit()
+    monkeypatch.setattr(api_keys_module.get_settings(), "legacy_api_key_lookup", {"enabled": True, "rate": 100.0, "max_rows": 1})
+    monkeypatch.setattr(api_keys_module, "_legacy_scan_bucket", [])
+    monkeypatch.setattr(api_keys_module, "_legacy_scan_cursor", [])
+
+    legacy_count = api_key_crud.count_legacy_keys(test_db)
+
+    # Act - each attempt verifies the next legacy row
+    attempts = [api_key_crud.get_by_key(test_db, plaintext_keys["legacy_rotate_c"]) for _ in range(legacy_count)]
+
+    # Assert
+    assert attempts[0] is None
+    assert attempts[-1] is not None
+    assert attempts[-1].key_id == "legacy_rotate_c"
+
+
+def test_rotate_legacy_keys(test_db):
+    """Test that legacy keys are replaced by digest keys for the same client and deactivated"""
+    # Arrange
+    legacy_plaintext = generate_api_key(48)
+    test_db.add(APIKey(
+        key_id="legacy_rotated",
+        client_id="standard_broker",
+        rate_limit=120,
+        hashed_key=hash_password(legacy_plaintext),
+        key_digest=None
+    ))
+    test_db.commit()
+
+    # Act
+    replacements = api_key_crud.rotate_legacy_keys(test_db)
+
+    # Assert
+    assert api_key_crud.count_legacy_keys(test_db) == 0
+    assert api_key_crud.get(test_db, "legacy_rotated", id_field="key_id").active is False
+    new_key, plaintext_key = next(
+        (db_obj, plaintext) for db_obj, plaintext in replacements if db_obj.rate_limit == 120
+    )
+    assert new_key.client_id == "standard_broker"
+    assert api_key_crud.get_by_key(test_db, plaintext_key).key_id == new_key.key_id
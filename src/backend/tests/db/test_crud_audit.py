@@ -0,0 +1,95 @@
+# Standard Library Imports
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Third-Party Imports
+import pytest  # pytest 7.4.0+
+from sqlalchemy.dialects import postgresql
+
+# Internal Imports
+from src.backend.db.crud.audit import FALLBACK_SOURCE_PATH, audit
+from src.backend.services.audit import transactions
+from src.backend.services.audit.transactions import (
+    cache_activity,
+    clear_activity_cache,
+    get_cached_activity,
+)
+
+
+def test_activity_columns_check_fallback_inside_data_sources_object():
+    """Test that the fallback flag looks at every source entry of the data_sources object"""
+    # Arrange
+    db = MagicMock()
+    db.execute.return_value.all.return_value = [
+        ("standard_broker", "AAPL", datetime(2023, 10, 15, 14, 30), 10000000, 13699, 500, 30, True),
+        ("standard_broker", "GME", datetime(2023, 10, 15, 15, 0), 5000000, 8219, 1500, 10, False),
+    ]
+
+    # Act
+    columns = audit.get_activity_columns(db, client_id="standard_broker")
+    compiled = db.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+
+    # Assert
+    assert "@?" in str(compiled)
+    assert FALLBACK_SOURCE_PATH in compiled.params.values()
+    assert columns["has_fallback"].tolist() == [True, False]
+
+
+def test_audit_writes_invalidate_cached_activity(monkeypatch):
+    """Test that a new audit record drops the cached analyses for its client and ticker"""
+    # Arrange
+    clear_activity_cache()
+    for cache_key in [
+        ("client", "standard_broker", None, None),
+        ("ticker", "AAPL", datetime(2023, 10, 1).date(), None),
+        ("client", "premium_broker", None, None),
+    ]:
+        cache_activity(cache_key, {"transaction_count": 1})
+    monkeypatch.setattr(audit, "create", lambda db, obj_in: SimpleNamespace(**obj_in))
+
+    # Act
+    audit.create_audit_log(MagicMock(), {"client_id": "standard_broker", "ticker": "AAPL"})
+
+    # Assert
+    assert get_cached_activity(("client", "standard_broker", None, None)) is None
+    assert get_cached_activity(("ticker", "AAPL", datetime(2023, 10, 1).date(), None)) is None
+    assert get_cached_activity(("client", "premium_broker", None, None)) == {"transaction_count": 1}
+    clear_activity_cache()
+
+
+class SharedTokens:
+    """Minimal stand-in for the Redis cache shared by all processes"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key, value_type=None):
+        return self.values.get(key)
+
+    def set_many(self, items, ttl=None):
+        self.values.update(items)
+        return True
+
+
+def test_audit_writes_invalidate_activity_cached_by_other_processes(monkeypatch):
+    """Test that an audit record written by another process makes this process's cached analysis stale"""
+    # Arrange
+    clear_activity_cache()
+    shared = SharedTokens()
+    monkeypatch.setattr(transactions, "get_redis_cache", lambda: shared)
+    cache_key = ("client", "standard_broker", None, None)
+    cache_activity(cache_key, {"transaction_count": 1})
+    local_entries = transactions._activity_cache
+    monkeypatch.setattr(audit, "create", lambda db, obj_in: SimpleNamespace(**obj_in))
+
+    # Act: the other process has its own local entries but shares the tokens
+    monkeypatch.setattr(transactions, "_activity_cache", {})
+    audit.create_audit_log(MagicMock(), {"client_id": "standard_broker", "ticker": "AAPL"})
+    monkeypatch.setattr(transactions, "_activity_cache", local_entries)
+
+    # Assert
+    assert cache_key in transactions._activity_cache
+    assert get_cached_activity(cache_key) is None
+    assert cache_key not in transactions._activity_cache
+    clear_activity_cache()
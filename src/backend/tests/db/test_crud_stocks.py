@@ -144,6 +144,25 @@ def test_create_with_ticker(test_db):
     assert retrieved_stock.min_borrow_rate == Decimal("0.03")
 
 
+def test_stock_writes_publish_reference_changes(test_db, monkeypatch):
+    """Test that stock writes reach the ticker filter and reload reference snapshots"""
+    # Arrange
+    from src.backend.services.cache import get_ticker_filter
+    from src.backend.services.data.reference import reference_data
+    notifications = []
+    monkeypatch.setattr(reference_data, "notify_changed", lambda: notifications.append(True))
+    get_ticker_filter().update(["AAPL"])
+
+    # Act
+    stock.create_with_ticker(test_db, "AMD", {"borrow_status": BorrowStatus.EASY, "min_borrow_rate": Decimal("0.01")})
+    stock.update_borrow_status(test_db, "AMD", BorrowStatus.HARD)
+
+    # Assert
+    assert get_ticker_filter().might_exist("AMD")
+    assert len(notifications) == 2
+    get_ticker_filter().reset()
+
+
 def test_upsert_create(test_db):
     """Test upserting a new stock (create case)"""
     # Arrange
@@ -188,6 +207,31 @@ def test_upsert_update(test_db, easy_to_borrow_stock):
     assert retrieved_stock.min_borrow_rate == Decimal("0.50")
 
 
+def test_bulk_upsert(test_db, easy_to_borrow_stock):
+    """Test bulk upserting a mix of new and existing stocks"""
+    # Arrange
+    existing_ticker = easy_to_borrow_stock["ticker"]
+    stocks_in = [
+        {"ticker": existing_ticker, "borrow_status": BorrowStatus.HARD, "min_borrow_rate": Decimal("0.75")},
+        {"ticker": "NFLX", "borrow_status": BorrowStatus.EASY, "min_borrow_rate": Decimal("0.02")},
+        {"ticker": "NFLX", "borrow_status": BorrowStatus.MEDIUM, "min_borrow_rate": Decimal("0.04")},
+    ]
+
+    # Act
+    upserted_stocks = stock.bulk_upsert(test_db, stocks_in)
+
+    # Assert - duplicate keys collapse to the last value
+    assert len(upserted_stocks) == 2
+
+    updated_stock = stock.get_by_ticker(test_db, existing_ticker)
+    assert updated_stock.borrow_status == BorrowStatus.HARD
+    assert updated_stock.min_borrow_rate == Decimal("0.75")
+
+    created_stock = stock.get_by_ticker(test_db, "NFLX")
+    assert created_stock.borrow_status == BorrowStatus.MEDIUM
+    assert created_stock.min_borrow_rate == Decimal("0.04")
+
+
 def test_remove_by_ticker(test_db, easy_to_borrow_stock):
     """Test removing a stock by ticker symbol"""
     # Arrange
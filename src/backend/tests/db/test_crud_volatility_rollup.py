@@ -0,0 +1,191 @@
+# Standard Library Imports
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# Third-Party Imports
+import pytest  # pytest 7.4.0+
+
+# Internal Imports
+from src.backend.db.crud.volatility import volatility
+from src.backend.db.crud.volatility_rollup import (
+    aggregate_points,
+    choose_resolution,
+    floor_to_bucket,
+    merge_buckets,
+    volatility_rollup,
+)
+from src.backend.db.models.volatility import Volatility
+from src.backend.db.models.volatility_rollup import VolatilityRollup
+from src.backend.tests.conftest import test_db
+
+
+def test_floor_to_bucket():
+    """Test truncating timestamps to rollup bucket boundaries"""
+    # Arrange
+    timestamp = datetime(2023, 10, 15, 14, 37, 42)
+
+    # Act & Assert
+    assert floor_to_bucket(timestamp, "1m") == datetime(2023, 10, 15, 14, 37)
+    assert floor_to_bucket(timestamp, "1h") == datetime(2023, 10, 15, 14, 0)
+    assert floor_to_bucket(timestamp, "1d") == datetime(2023, 10, 15)
+
+
+def test_aggregate_points():
+    """Test downsampling raw points into min/max/avg/last buckets"""
+    # Arrange
+    base = datetime(2023, 10, 15, 14, 0)
+    points = [
+        (base, Decimal("20.00"), 1),
+        (base + timedelta(minutes=20), Decimal("30.00"), 4),
+        (base + timedelta(minutes=40), Decimal("25.00"), 2),
+        (base + timedelta(hours=1), Decimal("10.00"), 0),
+    ]
+
+    # Act
+    buckets = aggregate_points(points, "1h")
+
+    # Assert
+    first = buckets[base]
+    assert first["vol_min"] == Decimal("20.00")
+    assert first["vol_max"] == Decimal("30.00")
+    assert first["vol_avg"] == Decimal("25.00")
+    assert first["vol_last"] == Decimal("25.00")
+    assert first["sample_count"] == 3
+    assert first["event_risk_max"] == 4
+    assert buckets[base + timedelta(hours=1)]["sample_count"] == 1
+
+
+def test_merge_buckets_matches_aggregating_raw_points():
+    """Test that coarser buckets built from finer ones equal buckets built from raw points"""
+    # Arrange
+    base = datetime(2023, 10, 15, 14, 0)
+    points = [
+        (base + timedelta(minutes=minute, seconds=second), Decimal("20.00") + minute, minute % 4)
+        for minute in range(0, 90, 7) for second in (0, 30)
+    ]
+    minutes = aggregate_points(points, "1m")
+    rollups = [VolatilityRollup(bucket_start=bucket_start, **values) for bucket_start, values in sorted(minutes.items())]
+
+    # Act
+    merged = merge_buckets(rollups, "1h")
+
+    # Assert
+    expected = aggregate_points(points, "1h")
+    assert merged.keys() == expected.keys()
+    for bucket_start, values in expected.items():
+        assert {key: merged[bucket_start][key] for key in values} == values
+
+
+@pytest.mark.parametrize(
+    "range_length, max_points, expected",
+    [
+        (timedelta(hours=2), 1000, "1m"),
+        (timedelta(days=7), 1000, "1h"),
+        (timedelta(days=365), 1000, "1d"),
+        (timedelta(days=3650), 100, "1d"),
+    ],
+)
+def test_choose_resolution(range_length, max_points, expected):
+    """Test picking the finest resolution that fits the point budget"""
+    # Arrange
+    end_date = datetime(2023, 10, 15)
+
+    # Act & Assert
+    assert choose_resolution(end_date - range_length, end_date, max_points) == expected
+
+
+def test_bulk_create_refreshes_rollups(test_db):
+    """Test that bulk volatility writes keep rollups and range stats in step"""
+    # Arrange
+    base = datetime(2023, 10, 15, 9, 0)
+    points = [
+        {"stock_id": "AAPL", "vol_index": Decimal("18.00") + i, "event_risk_factor": i % 3,
+         "timestamp": base + timedelta(minutes=i)}
+        for i in range(10)
+    ]
+
+    # Act
+    volatility.bulk_create_volatility(test_db, points)
+    resolution, series = volatility_rollup.get_series(test_db, "AAPL", base, base + timedelta(hours=1), max_points=5)
+    stats = volatility_rollup.get_range_stats(test_db, "AAPL", base, base + timedelta(hours=1))
+
+    # Assert
+    assert resolution == "1h"
+    assert len(series) == 1
+    assert series[0]["sample_count"] == 10
+    assert series[0]["vol_last"] == Decimal("27.00")
+    assert stats["sample_count"] == 10
+    assert stats["min_volatility"] == Decimal("18.00")
+    assert stats["max_volatility"] == Decimal("27.00")
+    assert stats["max_event_risk"] == 2
+
+
+def test_single_write_refreshes_only_its_buckets_in_the_same_transaction(test_db):
+    """Test that one point rewrites only its own buckets and commits them with the point"""
+    # Arrange
+    base = datetime(2023, 10, 16, 9, 0)
+    volatility.bulk_create_volatility(test_db, [
+        {"stock_id": "MSFT", "vol_index": Decimal("20.00"), "event_risk_factor": 0, "timestamp": base},
+        {"stock_id": "MSFT", "vol_index": Decimal("30.00"), "event_risk_factor": 0, "timestamp": base + timedelta(hours=3)},
+    ])
+
+    # Act
+    volatility.create_volatility(test_db, {
+        "stock_id": "MSFT", "vol_index": Decimal("40.00"), "event_risk_factor": 5, "timestamp": base + timedelta(minutes=1)
+    })
+    test_db.rollback()
+    buckets = {
+        (bucket.resolution, bucket.bucket_start): bucket
+        for bucket in test_db.query(VolatilityRollup).filter(VolatilityRollup.stock_id == "MSFT")
+    }
+
+    # Assert
+    assert buckets[("1m", base + timedelta(minutes=1))].vol_last == Decimal("40.00")
+    assert buckets[("1h", base)].sample_count == 2
+    assert buckets[("1h", base)].vol_max == Decimal("40.00")
+    assert buckets[("1h", base + timedelta(hours=3))].sample_count == 1
+    assert buckets[("1d", datetime(2023, 10, 16))].sample_count == 3
+    assert buckets[("1d", datetime(2023, 10, 16))].event_risk_max == 5
+
+
+def test_range_stats_fall_back_to_raw_points_without_rollups(test_db):
+    """Test that history written before rollups existed is still counted until it is backfilled"""
+    # Arrange
+    base = datetime(2023, 10, 17)
+    for i in range(3):
+        test_db.add(Volatility(stock_id="GME", vol_index=Decimal("30.00") + i, event_risk_factor=i,
+                               timestamp=base + timedelta(hours=i)))
+    test_db.commit()
+
+    # Act
+    stats = volatility_rollup.get_range_stats(test_db, "GME", base)
+
+    # Assert
+    assert stats["sample_count"] == 3
+    assert stats["min_volatility"] == Decimal("30.00")
+    assert stats["max_volatility"] == Decimal("32.00")
+    assert stats["max_event_risk"] == 2
+
+
+def test_rebuild_for_stock_backfills_every_day_with_history(test_db):
+    """Test that a rebuild writes rollups for each day with raw points, skipping the gaps"""
+    # Arrange
+    first_day = datetime(2023, 9, 1)
+    last_day = datetime(2023, 9, 20)
+    for timestamp in [first_day + timedelta(hours=9), first_day + timedelta(hours=10), last_day + timedelta(hours=9)]:
+        test_db.add(Volatility(stock_id="TSLA", vol_index=Decimal("25.00"), event_risk_factor=1, timestamp=timestamp))
+    test_db.commit()
+
+    # Act
+    written = volatility_rollup.rebuild_for_stock(test_db, "TSLA")
+    daily = {
+        bucket.bucket_start: bucket.sample_count
+        for bucket in test_db.query(VolatilityRollup).filter(
+            VolatilityRollup.stock_id == "TSLA", VolatilityRollup.resolution == "1d"
+        )
+    }
+
+    # Assert
+    assert written == 5 + 3
+    assert daily == {first_day: 2, last_day: 1}
+    assert "TSLA" in volatility_rollup.get_stock_ids(test_db)
@@ -0,0 +1,97 @@
+# Third-Party Imports
+import pytest  # pytest 7.4.0+
+from sqlalchemy import create_engine, select, text
+
+# Internal Imports
+from src.backend.db.models.stock import Stock
+from src.backend.db.session import (
+    REPLICA_EXECUTION_OPTION,
+    SESSION_WRITES_KEY,
+    ReplicaRouter,
+    RoutingSession,
+    in_read_your_writes_window,
+    mark_primary_write,
+    replica_ok,
+)
+
+
+class StaticLagRouter(ReplicaRouter):
+    """Replica router with fixed lag values instead of live lag queries"""
+
+    def __init__(self, lags, max_lag=5.0, check_interval=60.0):
+        engines = [create_engine("sqlite://") for _ in lags]
+        super().__init__(engines, max_lag=max_lag, check_interval=check_interval)
+        self.lags = list(lags)
+        self.checks = 0
+
+    def measure_lag(self, index):
+        self.checks += 1
+        return self.lags[index]
+
+
+def test_replica_ok_sets_execution_option():
+    """Test that replica_ok marks a select as replica-eligible"""
+    query = replica_ok(select(Stock))
+
+    assert query.get_execution_options()[REPLICA_EXECUTION_OPTION] is True
+
+
+def test_router_round_robins_healthy_replicas():
+    """Test that the router alternates between healthy replicas"""
+    router = StaticLagRouter([0.0, 1.0])
+
+    chosen = [router.choose() for _ in range(4)]
+
+    assert chosen[0] is not chosen[1]
+    assert chosen[0] is chosen[2]
+    assert chosen[1] is chosen[3]
+
+
+def test_router_skips_lagging_and_unreachable_replicas():
+    """Test that replicas over the lag threshold or failing checks are skipped"""
+    router = StaticLagRouter([30.0, None, 0.5])
+
+    for _ in range(3):
+        assert router.choose() is router.engines[2]
+
+
+def test_router_falls_back_to_primary():
+    """Test that no replica is chosen when none is healthy"""
+    router = StaticLagRouter([30.0, None])
+
+    assert router.choose() is None
+
+
+def test_router_caches_lag_checks():
+    """Test that lag is measured at most once per check interval"""
+    router = StaticLagRouter([0.0])
+
+    for _ in range(10):
+        router.choose()
+
+    assert router.checks == 1
+
+
+def test_read_your_writes_window():
+    """Test that a recent primary write pins reads to the primary"""
+    mark_primary_write()
+
+    assert in_read_your_writes_window(5.0) is True
+    assert in_read_your_writes_window(0.0) is False
+
+
+def test_statement_writes_pin_session_to_primary():
+    """Test that executed DML marks the session as written without a flush"""
+    engine = create_engine("sqlite://")
+    session = RoutingSession(bind=engine)
+    session.execute(text("CREATE TABLE t (x INTEGER)"))
+    session.commit()
+
+    session.execute(select(1))
+    assert not session.info.get(SESSION_WRITES_KEY)
+
+    session.execute(text("INSERT INTO t VALUES (1)"))
+    assert session.info[SESSION_WRITES_KEY] is True
+    assert not session._can_use_replica(replica_ok(select(Stock)))
+    session.close()
+
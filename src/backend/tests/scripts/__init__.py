@@ -0,0 +1,6 @@
+"""
+Initialization module for the scripts test package.
+
+This module makes the test package importable for tests of the benchmark
+load generator and its latency histograms.
+"""
@@ -0,0 +1,107 @@
+"""
+Unit tests for the open-loop load generator used by the benchmark suite.
+
+This module tests histogram precision, serialization and merging, coordinated omission
+accounting in open-loop runs, and baseline regression detection.
+"""
+
+import asyncio
+import random
+
+from src.backend.scripts.loadgen import LatencyHistogram, compare_to_baseline, mann_whitney_greater, run_open_loop
+
+
+def make_histogram(values):
+    """Creates a histogram from latencies in microseconds"""
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+def test_histogram_percentiles_within_precision():
+    """Tests that percentiles match exact order statistics within the configured precision"""
+    # Arrange
+    rng = random.Random(42)
+    values = sorted(int(rng.expovariate(1 / 5000)) for _ in range(20000))
+
+    # Act
+    histogram = make_histogram(values)
+
+    # Assert
+    for percentile in (50, 90, 99, 99.9):
+        exact = values[int(percentile / 100 * len(values)) - 1]
+        assert abs(histogram.percentile(percentile) - exact) <= max(1, exact * 0.002)
+    assert histogram.total_count == len(values)
+    assert histogram.max_us == values[-1]
+
+
+def test_histogram_round_trip_and_merge():
+    """Tests that serialized and merged histograms keep their counts"""
+    # Arrange
+    first = make_histogram(range(0, 10000, 7))
+    second = make_histogram(range(5000, 50000, 11))
+
+    # Act
+    restored = LatencyHistogram.from_dict(first.to_dict())
+    merged = LatencyHistogram.from_dict(first.to_dict()).merge(second)
+
+    # Assert
+    assert restored.counts == first.counts
+    assert restored.percentile(99) == first.percentile(99)
+    assert merged.total_count == first.total_count + second.total_count
+    assert merged.min_us == 0
+    assert merged.max_us == second.max_us
+
+
+def test_record_corrected_backfills_missing_requests():
+    """Tests coordinated omission correction for closed-loop measurements"""
+    histogram = LatencyHistogram()
+
+    histogram.record_corrected(100000, 10000)
+
+    assert histogram.total_count == 10
+    assert histogram.percentile(0) == 10000
+
+
+def test_open_loop_charges_queueing_to_waiting_requests():
+    """Tests that a stall is reflected in latency from the intended send time"""
+    # Arrange
+    async def operation(index):
+        await asyncio.sleep(0.2 if index == 10 else 0)
+
+    # Act
+    result = asyncio.run(run_open_loop("stall", operation, rate=200, duration=0.5, max_in_flight=1))
+
+    # Assert
+    assert result.sent == 100
+    assert result.errors == 0
+    # Requests queued behind the stall see it; their service time does not
+    assert result.latency.percentile(90) > 50000
+    assert result.service_time.percentile(90) < 50000
+
+
+def test_compare_to_baseline_flags_only_significant_regressions():
+    """Tests that large, significant shifts regress and identical runs do not"""
+    # Arrange
+    rng = random.Random(7)
+    baseline_values = [rng.expovariate(1 / 5000) for _ in range(5000)]
+
+    async def noop(index):
+        return None
+
+    result = asyncio.run(run_open_loop("scenario", noop, rate=1000, duration=0.05))
+    baseline = {"scenarios": {"scenario": {"sent": 5000, "errors": 0,
+                                           "histogram": make_histogram(baseline_values).to_dict()}}}
+
+    # Act
+    result.latency = make_histogram(baseline_values)
+    unchanged = compare_to_baseline({"scenario": result}, baseline)
+    result.latency = make_histogram([value * 1.5 for value in baseline_values])
+    slower = compare_to_baseline({"scenario": result}, baseline)
+
+    # Assert
+    assert not unchanged[0]["regression"]
+    assert slower[0]["regression"]
+    assert slower[0]["p_value"] < 0.01
+    assert mann_whitney_greater(make_histogram(baseline_values), make_histogram(baseline_values))[1] == 0.5
@@ -0,0 +1,145 @@
+import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+import fakeredis
+
+from src.backend.services.cache.codecs import (
+    CacheCodecRegistry,
+    JsonCodec,
+    FRAME_MARKER,
+    CODEC_SCHEMA_VERSION,
+    COMPRESSED_FLAG,
+    CODEC_ID_MSGPACK
+)
+from src.backend.services.cache.redis import RedisCache
+from src.backend.services.cache.utils import serialize_cache_value, wrap_cache_value
+from src.backend.core.constants import BorrowStatus
+
+msgpack = pytest.importorskip("msgpack")
+
+
+def test_json_codec_is_default_and_unchanged():
+    """Tests that the default codec writes the same payloads as serialize_cache_value"""
+    registry = CacheCodecRegistry()
+    value = {"rate": 0.05, "status": "EASY", "ticker": "AAPL"}
+    
+    # Verify JSON is used for every key type
+    assert isinstance(registry.get_codec("borrow_rate:AAPL"), JsonCodec)
+    
+    # Verify the payload is identical to the legacy serialization
+    payload = registry.encode("borrow_rate:AAPL", value)
+    assert payload == serialize_cache_value(value)
+    assert registry.decode(payload) == value
+
+
+def test_msgpack_codec_preserves_types():
+    """Tests that the msgpack codec round-trips Decimal, datetime, date and Enum values exactly"""
+    registry = CacheCodecRegistry(codecs_by_type={"borrow_rate": "msgpack"})
+    value = {
+        "rate": Decimal("0.050000000000000000000001"),
+        "status": BorrowStatus.HARD,
+        "updated_at": datetime.datetime(2024, 3, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        "as_of": datetime.date(2024, 3, 1),
+        "history": [Decimal("0.04"), Decimal("0.045")],
+        "source": "api"
+    }
+    
+    # Encode with the codec configured for the key type
+    payload = registry.encode("borrow_rate:AAPL", value)
+    
+    # Verify the frame header
+    assert payload[0] == FRAME_MARKER
+    assert payload[1] == CODEC_SCHEMA_VERSION
+    assert payload[2] == CODEC_ID_MSGPACK
+    
+    # Verify values are restored with their original types
+    decoded = registry.decode(payload)
+    assert decoded == value
+    assert isinstance(decoded["rate"], Decimal)
+    assert decoded["status"] is BorrowStatus.HARD
+    
+    # Verify other key types still use JSON
+    assert registry.encode("volatility:AAPL", {"value": 1.5}) == serialize_cache_value({"value": 1.5})
+
+
+def test_msgpack_codec_compresses_large_payloads():
+    """Tests that binary payloads above the compression threshold are compressed"""
+    registry = CacheCodecRegistry(default="msgpack", compression_threshold=256)
+    
+    # Small payloads are stored uncompressed
+    small = registry.encode("calculation:AAPL", {"fee": Decimal("12.34")})
+    assert not small[2] & COMPRESSED_FLAG
+    
+    # Large, repetitive payloads are compressed and still decode
+    large_value = {"rows": [{"ticker": "AAPL", "rate": Decimal("0.05")} for _ in range(100)]}
+    large = registry.encode("calculation:AAPL", large_value)
+    assert large[2] & COMPRESSED_FLAG
+    assert len(large) < len(msgpack.packb(large_value, default=str))
+    assert registry.decode(large) == large_value
+
+
+def test_decode_detects_format_and_schema_version():
+    """Tests that payloads are decoded by format and newer schema versions read as a miss"""
+    json_registry = CacheCodecRegistry()
+    msgpack_registry = CacheCodecRegistry(default="msgpack")
+    value = {"rate": Decimal("0.05")}
+    
+    # A reader configured for JSON still decodes binary frames, also as surrogate-escaped strings
+    payload = msgpack_registry.encode("borrow_rate:AAPL", value)
+    assert json_registry.decode(payload) == value
+    assert json_registry.decode(payload.decode("utf-8", "surrogateescape")) == value
+    
+    # A reader configured for msgpack still decodes JSON payloads
+    assert msgpack_registry.decode('{"rate": 0.05}') == {"rate": 0.05}
+    
+    # Frames of a newer schema version are treated as a cache miss
+    newer = bytes((FRAME_MARKER, CODEC_SCHEMA_VERSION + 1, CODEC_ID_MSGPACK)) + payload[3:]
+    assert msgpack_registry.decode(newer) is None
+    
+    # Corrupt frames are treated as a cache miss
+    corrupt = bytes((FRAME_MARKER, CODEC_SCHEMA_VERSION, CODEC_ID_MSGPACK | COMPRESSED_FLAG)) + b"not zlib"
+    assert msgpack_registry.decode(corrupt) is None
+
+
+def test_unknown_codec_and_unsupported_values_fall_back_to_json():
+    """Tests the JSON fallbacks for unknown codec names and values msgpack cannot encode"""
+    # Unknown codec names fall back to JSON
+    registry = CacheCodecRegistry(default="protobuf")
+    assert isinstance(registry.get_codec("borrow_rate:AAPL"), JsonCodec)
+    
+    # Values the binary codec cannot represent are written as JSON
+    msgpack_registry = CacheCodecRegistry(default="msgpack")
+    payload = msgpack_registry.encode("calculation:AAPL", {"tickers": {"AAPL"}})
+    assert payload == serialize_cache_value({"tickers": {"AAPL"}})
+
+
+def test_redis_cache_round_trip_with_msgpack():
+    """Tests that RedisCache stores binary payloads and reads them back exactly"""
+    server = fakeredis.FakeServer()
+    fake_redis = fakeredis.FakeStrictRedis(
+        server=server, decode_responses=True, encoding_errors="surrogateescape"
+    )
+    
+    with patch('redis.Redis', return_value=fake_redis):
+        redis_cache = RedisCache(
+            host='localhost',
+            port=6379,
+            codecs=CacheCodecRegistry(codecs_by_type={"borrow_rate": "msgpack"})
+        )
+        
+        # Store a Decimal through single and bulk writes
+        redis_cache.set("borrow_rate:AAPL", Decimal("0.0525"))
+        redis_cache.set_many({"borrow_rate:MSFT": Decimal("0.0310")})
+        
+        # Verify values come back as Decimals with their exact digits
+        assert redis_cache.get("borrow_rate:AAPL") == Decimal("0.0525")
+        assert redis_cache.get_many(["borrow_rate:AAPL", "borrow_rate:MSFT"]) == {
+            "borrow_rate:AAPL": Decimal("0.0525"),
+            "borrow_rate:MSFT": Decimal("0.0310")
+        }
+        
+        # Verify a JSON entry written before the codec change is still readable
+        fake_redis.set("borrow_rate_engine:borrow_rate:v0:GME", serialize_cache_value(wrap_cache_value(0.25)))
+        assert redis_cache.get("borrow_rate:GME") == 0.25
@@ -0,0 +1,136 @@
+"""
+Unit tests for the authenticated-principal cache in the Borrow Rate & Locate Fee Pricing Engine.
+
+This module tests principal validity checks, TTL capping by key expiry, revocation
+tombstones and L1 eviction on invalidation.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+from src.backend.core.principal_cache import (
+    PrincipalCache,
+    PRINCIPAL_CACHE_PREFIX,
+    PRINCIPAL_INVALIDATION_CHANNEL,
+    is_principal_usable
+)
+
+
+def make_principal(**overrides):
+    """Creates a principal dictionary for tests"""
+    principal = {
+        "client_id": "standard_broker",
+        "key_id": "key_1",
+        "rate_limit": 60,
+        "expires_at": None,
+        "active": True
+    }
+    principal.update(overrides)
+    return principal
+
+
+def make_cache(redis_values=None):
+    """Creates a PrincipalCache backed by a mock Redis cache with a connected subscriber"""
+    redis_cache = MagicMock()
+    redis_cache.get.side_effect = lambda key: (redis_values or {}).get(key)
+    redis_cache.set_unless.side_effect = lambda key, value, ttl, skip_if: not skip_if((redis_values or {}).get(key))
+    cache = PrincipalCache(redis_cache=redis_cache, ttl=30)
+    cache.ensure_subscriber = MagicMock()
+    cache._subscribed.set()
+    return cache, redis_cache
+
+
+def test_is_principal_usable():
+    """Tests that inactive, expired and revoked principals are rejected"""
+    assert is_principal_usable(make_principal())
+    assert not is_principal_usable(make_principal(active=False))
+    assert not is_principal_usable(make_principal(expires_at=time.time() - 1))
+    assert not is_principal_usable({"revoked": True})
+
+
+def test_set_caps_ttl_at_key_expiry():
+    """Tests that a principal is never cached beyond its key's expiry"""
+    # Arrange
+    cache, redis_cache = make_cache()
+    principal = make_principal(expires_at=time.time() + 10.5)
+
+    # Act
+    cache.set("digest", principal)
+
+    # Assert
+    assert redis_cache.set_unless.call_args.args[:3] == (PRINCIPAL_CACHE_PREFIX + "digest", principal, 10)
+    assert cache.get("digest") == principal
+    redis_cache.get.assert_not_called()  # Lookup was served from L1
+
+
+def test_set_does_not_overwrite_tombstone():
+    """Tests that a revocation tombstone in Redis blocks re-caching"""
+    # Arrange
+    cache, redis_cache = make_cache({PRINCIPAL_CACHE_PREFIX + "digest": {"revoked": True}})
+
+    # Act
+    cache.set("digest", make_principal())
+
+    # Assert
+    redis_cache.set.assert_not_called()
+    assert cache._entries == {}
+    assert cache.get("digest") is None
+
+
+def test_invalidate_evicts_and_publishes():
+    """Tests that invalidation drops L1, writes a tombstone and publishes the digest"""
+    # Arrange
+    cache, redis_cache = make_cache()
+    cache.set("digest", make_principal())
+
+    # Act
+    cache.invalidate("digest")
+
+    # Assert
+    redis_cache.set.assert_called_with(PRINCIPAL_CACHE_PREFIX + "digest", {"revoked": True}, 30)
+    redis_cache.publish.assert_called_once_with(PRINCIPAL_INVALIDATION_CHANNEL, "digest")
+    assert cache.get("digest") is None
+
+
+def test_l1_disabled_without_subscription():
+    """Tests that L1 is bypassed while the invalidation subscriber is disconnected"""
+    # Arrange
+    cache, redis_cache = make_cache()
+    cache._subscribed.clear()
+
+    # Act
+    cache.set("digest", make_principal())
+    cache.get("digest")
+
+    # Assert
+    assert cache._entries == {}
+    redis_cache.get.assert_called()
+
+
+def test_set_unless_aborts_when_tombstone_races_the_store():
+    """Tests that a tombstone written between the tombstone check and the store wins"""
+    # Arrange
+    import fakeredis
+    from unittest.mock import patch
+    from src.backend.services.cache.redis import RedisCache
+    server = fakeredis.FakeServer()
+    with patch('redis.Redis', return_value=fakeredis.FakeStrictRedis(server=server)):
+        redis_cache = RedisCache(host='localhost', port=6379)
+        revoker = RedisCache(host='localhost', port=6379)
+    cache = PrincipalCache(redis_cache=redis_cache, ttl=30)
+    cache.ensure_subscriber = MagicMock()
+    cache._subscribed.set()
+    key = PRINCIPAL_CACHE_PREFIX + "digest"
+
+    def revoke_during_check(current):
+        revoker.set(key, {"revoked": True}, 30)
+        return False
+
+    # Act
+    stored = redis_cache.set_unless(key, make_principal(), 30, revoke_during_check)
+    cache.set("digest", make_principal())
+
+    # Assert
+    assert stored is False
+    assert redis_cache.get(key) == {"revoked": True}
+    assert cache._entries == {}
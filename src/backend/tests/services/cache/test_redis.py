@@ -11,15 +11,15 @@ from unittest.mock import patch, MagicMock
 import fakeredis
 import redis  # redis 4.5.0+
 
-from ../../../services/cache/redis import RedisCache
-from ../../../services/cache/utils import (
+from src.backend.services.cache.redis import RedisCache
+from src.backend.services.cache.utils import (
     serialize_cache_value,
     deserialize_cache_value,
     wrap_cache_value,
     unwrap_cache_value,
     get_ttl_for_data_type
 )
-from ../../../core/constants import (
+from src.backend.core.constants import (
     CACHE_TTL_BORROW_RATE,
     CACHE_TTL_VOLATILITY,
     CACHE_TTL_EVENT_RISK,
@@ -46,7 +46,8 @@ def test_redis_cache_initialization():
             db=0,
             socket_timeout=5,
             socket_connect_timeout=2,
-            decode_responses=True
+            decode_responses=True,
+            encoding_errors="surrogateescape"
         )
         
         # Verify default prefix
@@ -80,7 +81,8 @@ def test_redis_cache_initialization():
             db=1,
             socket_timeout=10,
             socket_connect_timeout=5,
-            decode_responses=True
+            decode_responses=True,
+            encoding_errors="surrogateescape"
         )
         
         # Verify custom prefix
@@ -542,8 +544,7 @@ def test_redis_cache_flush():
         mock_instance = MagicMock()
         mock_redis.return_value = mock_instance
         mock_instance.ping.return_value = True
-        mock_instance.keys.return_value = ["key1", "key2"]
-        mock_instance.delete.side_effect = redis.RedisError("Redis error")
+        mock_instance.pipeline.return_value.execute.side_effect = redis.RedisError("Redis error")
         
         # Patch backoff to avoid actual retries in testing
         with patch('backoff.on_exception', lambda *args, **kwargs: lambda func: func):
@@ -554,6 +555,115 @@ def test_redis_cache_flush():
                 redis_cache.flush()
 
 
+def test_redis_cache_bulk_operations():
+    """Tests get_many, set_many and delete_many of RedisCache"""
+    server = fakeredis.FakeServer()
+    fake_redis = fakeredis.FakeStrictRedis(server=server, decode_responses=True)
+    
+    with patch('redis.Redis', return_value=fake_redis):
+        redis_cache = RedisCache(host='localhost', port=6379)
+        
+        # Store several values with a per-key TTL override
+        result = redis_cache.set_many(
+            {"borrow_rate:AAPL": 0.05, "volatility:AAPL": 25.5, "event_risk:AAPL": 3},
+            ttls={"event_risk:AAPL": 60}
+        )
+        assert result is True
+        
+        # Verify TTLs default by key type unless overridden
+        assert fake_redis.ttl("borrow_rate_engine:borrow_rate:v0:AAPL") == CACHE_TTL_BORROW_RATE
+        assert fake_redis.ttl("borrow_rate_engine:event_risk:v0:AAPL") == 60
+        
+        # Verify values are read back in one call, misses omitted
+        values = redis_cache.get_many(["borrow_rate:AAPL", "volatility:AAPL", "event_risk:AAPL", "borrow_rate:GME"])
+        assert values == {"borrow_rate:AAPL": 0.05, "volatility:AAPL": 25.5, "event_risk:AAPL": 3}
+        
+        # Verify bulk delete reports the number of keys removed
+        assert redis_cache.delete_many(["borrow_rate:AAPL", "volatility:AAPL", "borrow_rate:GME"]) == 2
+        assert redis_cache.get_many(["borrow_rate:AAPL", "event_risk:AAPL"]) == {"event_risk:AAPL": 3}
+
+
+def test_redis_cache_invalidate_namespace():
+    """Tests that invalidating a namespace only hides keys of that data type"""
+    server = fakeredis.FakeServer()
+    fake_redis = fakeredis.FakeStrictRedis(server=server, decode_responses=True)
+    
+    with patch('redis.Redis', return_value=fake_redis):
+        redis_cache = RedisCache(host='localhost', port=6379)
+        
+        # Set values in two namespaces and an unversioned rate limit counter
+        redis_cache.set("volatility:AAPL", 25.5)
+        redis_cache.set("borrow_rate:AAPL", 0.05)
+        redis_cache.set("rate_limit:client123:1", 3, 60)
+        
+        # Invalidate the volatility namespace
+        generation = redis_cache.invalidate_namespace("volatility")
+        
+        # Verify only the volatility entry is gone
+        assert generation == 1
+        assert redis_cache.get("volatility:AAPL") is None
+        assert redis_cache.get("borrow_rate:AAPL") == 0.05
+        assert redis_cache.get("rate_limit:client123:1") == 3
+        
+        # Verify new values are stored under the new generation
+        redis_cache.set("volatility:AAPL", 30.0)
+        assert redis_cache.get("volatility:AAPL") == 30.0
+        
+        # Verify another process sees the new generation
+        other_cache = RedisCache(host='localhost', port=6379, generation_refresh_seconds=0)
+        assert other_cache.get("volatility:AAPL") == 30.0
+        
+        # Verify unknown namespaces are rejected
+        with pytest.raises(ValueError):
+            redis_cache.invalidate_namespace("rate_limit")
+
+
+def test_redis_cache_invalidate_tag():
+    """Tests that tag invalidation removes exactly the tagged entries"""
+    server = fakeredis.FakeServer()
+    fake_redis = fakeredis.FakeStrictRedis(server=server, decode_responses=True)
+    
+    with patch('redis.Redis', return_value=fake_redis):
+        redis_cache = RedisCache(host='localhost', port=6379)
+        
+        # Set values tagged with their ticker
+        redis_cache.set("borrow_rate:AAPL", 0.05, tags=["ticker:AAPL"])
+        redis_cache.set("volatility:AAPL", 25.5, tags=["ticker:AAPL"])
+        redis_cache.set("borrow_rate:MSFT", 0.03, tags=["ticker:MSFT"])
+        
+        # Invalidate everything cached for AAPL
+        removed = redis_cache.invalidate_tag("ticker:AAPL")
+        
+        # Verify only the AAPL entries were removed
+        assert removed == 2
+        assert redis_cache.exists("borrow_rate:AAPL") is False
+        assert redis_cache.exists("volatility:AAPL") is False
+        assert redis_cache.exists("borrow_rate:MSFT") is True
+
+
+def test_redis_cache_reclaim_namespace():
+    """Tests that entries of old generations are reclaimed"""
+    server = fakeredis.FakeServer()
+    fake_redis = fakeredis.FakeStrictRedis(server=server, decode_responses=True)
+    
+    with patch('redis.Redis', return_value=fake_redis):
+        redis_cache = RedisCache(host='localhost', port=6379)
+        
+        # Set values, invalidate the namespace and set a value in the new generation
+        redis_cache.set("borrow_rate:AAPL", 0.05)
+        redis_cache.set("borrow_rate:MSFT", 0.03)
+        redis_cache.invalidate_namespace("borrow_rate")
+        redis_cache.set("borrow_rate:AAPL", 0.06)
+        
+        # Reclaim the orphaned entries
+        removed = redis_cache.reclaim_namespace("borrow_rate")
+        
+        # Verify only the current generation is left
+        assert removed == 2
+        assert redis_cache.get("borrow_rate:AAPL") == 0.06
+        assert len(list(fake_redis.scan_iter(match="borrow_rate_engine:borrow_rate:*"))) == 1
+
+
 def test_redis_cache_get_stats():
     """Tests the get_stats method of RedisCache"""
     # Create Redis cache instance with fakeredis
@@ -0,0 +1,280 @@
+"""
+Unit tests for the shared-memory rate table in the Borrow Rate & Locate Fee Pricing Engine.
+
+This module tests record round trips between a writer and reader handles, writer
+election, seqlock retries, record expiry and the background refresher.
+"""
+
+import json
+import time
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from src.backend.services.cache.shared_rates import (
+    SharedRateTable,
+    SharedRateRefresher,
+    SEQUENCE,
+    HEADER_SIZE,
+    SHARED_RATE_CHANGE_CHANNEL
+)
+from src.backend.core.constants import BorrowStatus
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    """Path of a shared rate table file in a temporary directory"""
+    return str(tmp_path / "borrow_rate_table")
+
+
+def test_writer_and_reader_share_records(table_path):
+    """Tests that records written by the writer are read by another handle with their types"""
+    # Arrange
+    writer = SharedRateTable(table_path, capacity=64)
+    reader = SharedRateTable(table_path, capacity=64)
+    
+    # Act
+    assert writer.try_acquire_writer()
+    writer.put_many({
+        "AAPL": {
+            "borrow_rate": Decimal("0.0525"),
+            "volatility": Decimal("18.5"),
+            "event_risk_factor": 3,
+            "borrow_status": BorrowStatus.EASY
+        },
+        "GME": {"borrow_rate": Decimal("0.25")}
+    })
+    
+    # Assert
+    record = reader.get("aapl")
+    assert record["ticker"] == "AAPL"
+    assert record["borrow_rate"] == Decimal("0.0525")
+    assert str(record["borrow_rate"]) == "0.0525"
+    assert record["volatility"] == Decimal("18.5")
+    assert record["event_risk_factor"] == 3
+    assert record["borrow_status"] is BorrowStatus.EASY
+    
+    # Unknown values read back as None, unknown tickers as a miss
+    record = reader.get("GME")
+    assert record["volatility"] is None
+    assert record["event_risk_factor"] is None
+    assert record["borrow_status"] is None
+    assert reader.get("MSFT") is None
+    
+    writer.close()
+    reader.close()
+
+
+def test_single_writer_election(table_path):
+    """Tests that only one handle holds the writer lock and another takes over after release"""
+    first = SharedRateTable(table_path, capacity=64)
+    second = SharedRateTable(table_path, capacity=64)
+    
+    assert first.try_acquire_writer()
+    assert not second.try_acquire_writer()
+    with pytest.raises(RuntimeError):
+        second.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}})
+    
+    # A new writer keeps the records of the existing table
+    first.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}})
+    first.release_writer()
+    assert second.try_acquire_writer()
+    assert second.tickers() == ["AAPL"]
+    assert second.get("AAPL")["borrow_rate"] == Decimal("0.05")
+    
+    first.close()
+    second.close()
+
+
+def test_reader_retries_records_being_written(table_path):
+    """Tests that a record with an odd sequence number is never returned"""
+    writer = SharedRateTable(table_path, capacity=64)
+    reader = SharedRateTable(table_path, capacity=64)
+    writer.try_acquire_writer()
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}})
+    record = reader.get("AAPL")
+    assert record["version"] == 1
+    
+    # Simulate a writer stopped half way through an update
+    offset = writer._slots["AAPL"]
+    sequence = SEQUENCE.unpack_from(writer._buffer, offset)[0]
+    SEQUENCE.pack_into(writer._buffer, offset, sequence + 1)
+    assert reader.get("AAPL") is None
+    
+    # The record is served again once the update completes
+    SEQUENCE.pack_into(writer._buffer, offset, sequence + 2)
+    assert reader.get("AAPL")["version"] == 2
+    assert offset >= HEADER_SIZE
+    
+    writer.close()
+    reader.close()
+
+
+def test_expired_and_invalidated_records_are_not_served(table_path):
+    """Tests that records older than max_age and invalidated records read as a miss"""
+    writer = SharedRateTable(table_path, capacity=64, max_age=30)
+    writer.try_acquire_writer()
+    
+    # Records older than max_age are not served
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}}, updated_at=0)
+    assert writer.get("AAPL") is None
+    
+    # Invalidated records are not served until written again
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}})
+    assert writer.invalidate_many(["AAPL"]) == 1
+    assert writer.get("AAPL") is None
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.06")}})
+    assert writer.get("AAPL")["borrow_rate"] == Decimal("0.06")
+    
+    writer.close()
+
+
+def test_refresher_writes_loaded_records_and_invalidates_dropped_tickers(table_path):
+    """Tests that a refresh writes the loaded values and invalidates tickers no longer loaded"""
+    table = SharedRateTable(table_path, capacity=64)
+    load = Mock(return_value={
+        "AAPL": {"borrow_rate": Decimal("0.05")},
+        "GME": {"borrow_rate": Decimal("0.25")}
+    })
+    refresher = SharedRateRefresher(table, load, interval=1)
+    
+    assert refresher.refresh() == 2
+    
+    # GME is no longer loaded, for example because its cached rate expired
+    load.return_value = {"AAPL": {"borrow_rate": Decimal("0.055")}}
+    assert refresher.refresh() == 1
+    
+    reader = SharedRateTable(table_path, capacity=64)
+    assert reader.get("AAPL")["borrow_rate"] == Decimal("0.055")
+    assert reader.get("GME") is None
+    
+    # A refresher that cannot take the writer lock does not load anything
+    other = SharedRateRefresher(reader, Mock(), interval=1)
+    assert other.refresh() == 0
+    other.load.assert_not_called()
+    
+    table.close()
+    reader.close()
+
+
+def test_refresher_reclaims_slots_of_dropped_tickers(table_path):
+    """Tests that tickers dropped from the loaded set free their slots for new and returning tickers"""
+    # Arrange: capacity 8 takes at most 6 tickers
+    table = SharedRateTable(table_path, capacity=8)
+    reader = SharedRateTable(table_path, capacity=8)
+    first = {f"OLD{index}": {"borrow_rate": Decimal("0.05")} for index in range(6)}
+    second = {f"NEW{index}": {"borrow_rate": Decimal("0.07")} for index in range(6)}
+    load = Mock(return_value=first)
+    refresher = SharedRateRefresher(table, load, interval=1)
+    assert refresher.refresh() == 6
+    assert reader.get("OLD0")["borrow_rate"] == Decimal("0.05")
+    
+    # Act: every ticker is replaced
+    load.return_value = second
+    written = refresher.refresh()
+    reader._next_attach_check = 0.0
+    
+    # Assert
+    assert written == 6
+    assert sorted(table.tickers()) == sorted(second)
+    assert all(reader.get(ticker)["borrow_rate"] == Decimal("0.07") for ticker in second)
+    assert all(reader.get(ticker) is None for ticker in first)
+    
+    # Act: a dropped ticker comes back in place of a new one
+    load.return_value = {"OLD0": {"borrow_rate": Decimal("0.06")}, **dict(list(second.items())[1:])}
+    written = refresher.refresh()
+    reader._next_attach_check = 0.0
+    
+    # Assert
+    assert written == 6
+    assert reader.get("OLD0")["borrow_rate"] == Decimal("0.06")
+    assert reader.get("NEW0") is None
+    assert reader.get("NEW5")["borrow_rate"] == Decimal("0.07")
+    
+    table.close()
+    reader.close()
+
+
+def test_generation_counts_write_batches(table_path):
+    """Tests that every batch of writes or invalidations bumps the table generation"""
+    writer = SharedRateTable(table_path, capacity=64)
+    assert writer.generation is None
+    assert writer.try_acquire_writer()
+    
+    start = writer.generation
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}, "MSFT": {"borrow_rate": Decimal("0.03")}})
+    assert writer.generation == start + 1
+    
+    # Readers see the writer's generation
+    reader = SharedRateTable(table_path, capacity=64)
+    assert reader.generation == start + 1
+    
+    # Rewriting the same values only refreshes their update time
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}, "MSFT": {"borrow_rate": Decimal("0.03")}})
+    assert writer.generation == start + 1
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}, "MSFT": {"borrow_rate": Decimal("0.035")}})
+    assert writer.generation == start + 2
+    
+    # Invalidations bump the generation only when a record changed
+    writer.invalidate_many(["AAPL"])
+    writer.invalidate_many(["XYZ"])
+    assert writer.generation == start + 3
+    
+    writer.close()
+    reader.close()
+
+
+
+def test_changed_tickers_are_not_served_until_rewritten(table_path):
+    """Tests that a cache write or invalidation hides a record in every process until it is refreshed"""
+    writer = SharedRateTable(table_path, capacity=64)
+    reader = SharedRateTable(table_path, capacity=64)
+    writer.try_acquire_writer()
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}, "GME": {"borrow_rate": Decimal("0.25")}})
+    
+    # A local change is announced to the other processes
+    redis_cache = Mock()
+    writer._redis_cache = redis_cache
+    writer._subscribed.set()
+    writer.mark_changed(["aapl"])
+    redis_cache.publish.assert_called_once_with(SHARED_RATE_CHANGE_CHANNEL, json.dumps(["AAPL"]))
+    assert writer.get("AAPL") is None
+    assert writer.get("GME")["borrow_rate"] == Decimal("0.25")
+    
+    # Another process receiving the announcement stops serving the record too
+    assert reader.get("AAPL") is not None
+    reader._handle_message(redis_cache.publish.call_args[0][1])
+    assert reader.get("AAPL") is None
+    
+    # Values loaded after the change are served again
+    time.sleep(0.01)
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.06")}})
+    assert reader.get("AAPL")["borrow_rate"] == Decimal("0.06")
+    
+    writer.close()
+    reader.close()
+
+
+def test_records_are_only_served_while_subscribed(table_path):
+    """Tests that a listening table serves nothing while its change subscriber is disconnected"""
+    writer = SharedRateTable(table_path, capacity=64)
+    writer.try_acquire_writer()
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}})
+    
+    pubsub = Mock()
+    pubsub.get_message.return_value = None
+    redis_cache = Mock()
+    redis_cache.subscribe.return_value = pubsub
+    
+    # Nothing is served until the subscriber connects, then only records written after it
+    writer._redis_cache = redis_cache
+    assert writer.get("AAPL") is None
+    writer.listen(redis_cache)
+    assert writer._subscribed.wait(timeout=5)
+    assert writer.get("AAPL") is None
+    time.sleep(0.01)
+    writer.put_many({"AAPL": {"borrow_rate": Decimal("0.05")}})
+    assert writer.get("AAPL")["borrow_rate"] == Decimal("0.05")
+    
+    writer.close()
\ No newline at end of file
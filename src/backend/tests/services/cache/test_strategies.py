@@ -1,12 +1,17 @@
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 import fakeredis
+import redis
 
 from src.backend.services.cache.strategies import (
     CacheStrategy,
     SingleCacheStrategy,
     TieredCacheStrategy,
+    NearCacheStrategy,
     NullCacheStrategy,
+    NEAR_CACHE_INVALIDATION_CHANNEL,
     get_ttl_for_key_type
 )
 from src.backend.services.cache.local import LocalCache
@@ -254,6 +259,152 @@ def test_tiered_cache_strategy_get_both_miss():
     assert result is None
 
 
+def test_tiered_cache_strategy_get_many_backfills_primary():
+    """Tests that get_many looks up primary misses in the secondary cache in one batch and backfills them"""
+    # Create mock primary cache holding one of four keys
+    mock_primary = Mock()
+    mock_primary.connected = True
+    mock_primary.get_many.return_value = {"borrow_rate:AAPL": "0.05"}
+    # Create mock secondary cache holding one of the missing keys
+    mock_secondary = Mock()
+    mock_secondary.get_many.return_value = {"report:daily": "done"}
+    
+    # Initialize TieredCacheStrategy with mock caches
+    strategy = TieredCacheStrategy(mock_primary, mock_secondary)
+    
+    # Call get_many with duplicated keys
+    result = strategy.get_many(["borrow_rate:AAPL", "volatility:AAPL", "report:daily", "report:weekly", "borrow_rate:AAPL"])
+    
+    # Verify each level was queried once, the secondary only for unversioned primary misses
+    mock_primary.get_many.assert_called_once_with(["borrow_rate:AAPL", "volatility:AAPL", "report:daily", "report:weekly"], None)
+    mock_secondary.get_many.assert_called_once_with(["report:daily", "report:weekly"], None)
+    
+    # Verify the secondary hit was written back to the primary cache in one batch
+    mock_primary.set_many.assert_called_once_with(
+        {"report:daily": "done"},
+        ttls={"report:daily": CACHE_TTL_CALCULATION}
+    )
+    mock_primary.get.assert_not_called()
+    mock_primary.set.assert_not_called()
+    
+    # Verify hits from both levels are returned and the misses are omitted
+    assert result == {"borrow_rate:AAPL": "0.05", "report:daily": "done"}
+
+
+def test_tiered_cache_strategy_serves_versioned_keys_from_secondary_only_while_primary_is_down():
+    """Tests that versioned keys fall back to the secondary cache without being written back"""
+    # Create a disconnected primary and a secondary holding a versioned key
+    mock_primary = Mock()
+    mock_primary.connected = False
+    mock_primary.get.return_value = None
+    mock_primary.get_many.side_effect = lambda keys, value_type=None: {}
+    mock_secondary = Mock()
+    mock_secondary.get.return_value = "0.05"
+    mock_secondary.get_many.return_value = {"borrow_rate:AAPL": "0.05"}
+    strategy = TieredCacheStrategy(mock_primary, mock_secondary)
+    
+    # Verify the secondary value is served but not copied into the primary
+    assert strategy.get("borrow_rate:AAPL") == "0.05"
+    assert strategy.get_many(["borrow_rate:AAPL"]) == {"borrow_rate:AAPL": "0.05"}
+    mock_primary.set.assert_not_called()
+    mock_primary.set_many.assert_not_called()
+    
+    # Verify a connected primary's miss is final
+    mock_primary.connected = True
+    assert strategy.get("borrow_rate:AAPL") is None
+    assert strategy.get_many(["borrow_rate:AAPL"]) == {}
+    assert mock_secondary.get.call_count == 1
+    assert mock_secondary.get_many.call_count == 1
+
+
+def test_tiered_cache_strategy_invalidation_reaches_other_processes():
+    """Tests that a namespace or tag invalidated by one process is not served or restored by another"""
+    server = fakeredis.FakeServer()
+    
+    def make_process():
+        fake_redis = fakeredis.FakeStrictRedis(server=server, decode_responses=True)
+        with patch('redis.Redis', return_value=fake_redis):
+            redis_cache = RedisCache(host='localhost', port=6379, generation_refresh_seconds=0)
+        return TieredCacheStrategy(redis_cache, LocalCache()), redis_cache
+    
+    process_a, redis_a = make_process()
+    process_b, redis_b = make_process()
+    
+    # Process B caches values in Redis and in its own local tier
+    process_b.set("borrow_rate:AAPL", "0.05", tags=["ticker:AAPL"])
+    process_b.set("volatility:AAPL", "25.5")
+    
+    # Process A invalidates the tag and the namespace
+    process_a.invalidate_tag("ticker:AAPL")
+    process_a.invalidate_namespace("volatility")
+    
+    # Process B misses instead of serving its stale local copies
+    assert process_b.get("borrow_rate:AAPL") is None
+    assert process_b.get_many(["volatility:AAPL"]) == {}
+    
+    # Nothing stale was written back for other processes to read
+    assert redis_a.get("borrow_rate:AAPL") is None
+    assert redis_a.get("volatility:AAPL") is None
+
+
+def test_tiered_cache_strategy_set_many():
+    """Tests that set_many resolves per-key TTLs and writes each cache level in one batch"""
+    # Create mock caches
+    mock_primary = Mock()
+    mock_primary.set_many.return_value = True
+    mock_secondary = Mock()
+    mock_secondary.set_many.side_effect = Exception("Secondary cache failure")
+    
+    # Initialize TieredCacheStrategy with mock caches
+    strategy = TieredCacheStrategy(mock_primary, mock_secondary)
+    
+    # Call set_many with an explicit TTL for one key
+    items = {"borrow_rate:AAPL": "0.05", "event_risk:AAPL": 3}
+    result = strategy.set_many(items, ttls={"borrow_rate:AAPL": 60})
+    
+    # Verify both caches received the same resolved TTLs
+    expected_ttls = {"borrow_rate:AAPL": 60, "event_risk:AAPL": CACHE_TTL_EVENT_RISK}
+    mock_primary.set_many.assert_called_once_with(items, ttls=expected_ttls)
+    mock_secondary.set_many.assert_called_once_with(items, ttls=expected_ttls)
+    
+    # Verify success when at least one cache succeeded
+    assert result is True
+
+
+def test_single_cache_strategy_bulk_operations_with_local_cache():
+    """Integration test for the bulk operations of SingleCacheStrategy with LocalCache"""
+    # Initialize SingleCacheStrategy with a LocalCache
+    local_cache = LocalCache()
+    strategy = SingleCacheStrategy(local_cache)
+    
+    # Store several values at once
+    assert strategy.set_many({"borrow_rate:AAPL": 0.05, "borrow_rate:MSFT": 0.03}) is True
+    
+    # Verify they are visible to single and bulk reads
+    assert local_cache.get("borrow_rate:AAPL") == 0.05
+    assert strategy.get_many(["borrow_rate:AAPL", "borrow_rate:MSFT", "borrow_rate:GME"]) == {
+        "borrow_rate:AAPL": 0.05,
+        "borrow_rate:MSFT": 0.03
+    }
+    
+    # Delete several values at once
+    assert strategy.delete_many(["borrow_rate:AAPL", "borrow_rate:GME"]) == 1
+    assert strategy.get_many(["borrow_rate:AAPL", "borrow_rate:MSFT"]) == {"borrow_rate:MSFT": 0.03}
+
+
+@pytest.mark.asyncio
+async def test_cache_strategy_async_bulk_operations():
+    """Tests the async bulk variants delegate to the synchronous bulk operations"""
+    # Initialize SingleCacheStrategy with a LocalCache
+    strategy = SingleCacheStrategy(LocalCache())
+    
+    # Store, read and delete values through the async variants
+    assert await strategy.set_many_async({"volatility:AAPL": 25.5}) is True
+    assert await strategy.get_many_async(["volatility:AAPL"]) == {"volatility:AAPL": 25.5}
+    assert await strategy.delete_many_async(["volatility:AAPL"]) == 1
+    assert await strategy.get_many_async(["volatility:AAPL"]) == {}
+
+
 def test_tiered_cache_strategy_set():
     """Tests the set method of TieredCacheStrategy"""
     # Create mock primary and secondary caches with set methods
@@ -718,4 +869,175 @@ def test_tiered_cache_strategy_fallback():
     
     # Test flush method falls back to secondary cache
     result = strategy.flush()
-    assert result is True
\ No newline at end of file
+    assert result is True
+
+def make_near_cache(inner_values=None):
+    """Creates a NearCacheStrategy around a mock strategy with a connected subscriber"""
+    inner = Mock()
+    inner.get.side_effect = lambda key, value_type=None: (inner_values or {}).get(key)
+    inner.get_many.side_effect = lambda keys, value_type=None: {
+        key: (inner_values or {})[key] for key in keys if key in (inner_values or {})
+    }
+    redis_cache = Mock()
+    strategy = NearCacheStrategy(inner, redis_cache, max_ttl=60)
+    strategy.ensure_subscriber = Mock()
+    strategy._subscribed.set()
+    return strategy, inner, redis_cache
+
+
+def test_near_cache_strategy_serves_hot_keys_from_memory():
+    """Tests that near key types skip the wrapped strategy after the first read"""
+    strategy, inner, _ = make_near_cache({"borrow_rate:AAPL": "0.05", "volatility:AAPL": "25.5"})
+    
+    # Near key types are read through once, then served from memory
+    assert strategy.get("borrow_rate:AAPL") == "0.05"
+    assert strategy.get("borrow_rate:AAPL") == "0.05"
+    assert inner.get.call_count == 1
+    
+    # Other key types always go to the wrapped strategy
+    strategy.get("volatility:AAPL")
+    strategy.get("volatility:AAPL")
+    assert inner.get.call_count == 3
+    
+    # Bulk reads only send near misses to the wrapped strategy
+    result = strategy.get_many(["borrow_rate:AAPL", "volatility:AAPL"])
+    assert result == {"borrow_rate:AAPL": "0.05", "volatility:AAPL": "25.5"}
+    inner.get_many.assert_called_once_with(["volatility:AAPL"], None)
+
+
+def test_near_cache_strategy_disabled_without_subscription():
+    """Tests that near entries are not used while the invalidation subscriber is disconnected"""
+    strategy, inner, _ = make_near_cache({"borrow_rate:AAPL": "0.05"})
+    strategy._subscribed.clear()
+    
+    strategy.get("borrow_rate:AAPL")
+    strategy.get("borrow_rate:AAPL")
+    
+    # Verify every read went to the wrapped strategy
+    assert inner.get.call_count == 2
+
+
+def test_near_cache_strategy_writes_publish_invalidations():
+    """Tests that writes and invalidations evict locally and notify other processes"""
+    strategy, inner, redis_cache = make_near_cache({"borrow_rate:AAPL": "0.05"})
+    strategy.get("borrow_rate:AAPL")
+    
+    # Writing a near key evicts it and publishes the key
+    strategy.set("borrow_rate:AAPL", "0.06", tags=["ticker:AAPL"])
+    inner.set.assert_called_once_with("borrow_rate:AAPL", "0.06", None, tags=["ticker:AAPL"])
+    redis_cache.publish.assert_called_once_with(
+        NEAR_CACHE_INVALIDATION_CHANNEL, json.dumps({"op": "keys", "keys": ["borrow_rate:AAPL"]})
+    )
+    strategy.get("borrow_rate:AAPL")
+    assert inner.get.call_count == 2
+    
+    # Writing other key types publishes nothing
+    redis_cache.publish.reset_mock()
+    strategy.set("volatility:AAPL", "25.5")
+    redis_cache.publish.assert_not_called()
+    
+    # Namespace invalidations are forwarded and published
+    strategy.invalidate_namespace("borrow_rate")
+    inner.invalidate_namespace.assert_called_once_with("borrow_rate")
+    redis_cache.publish.assert_called_once_with(
+        NEAR_CACHE_INVALIDATION_CHANNEL, json.dumps({"op": "namespace", "namespace": "borrow_rate"})
+    )
+    strategy.get("borrow_rate:AAPL")
+    assert inner.get.call_count == 3
+
+
+def test_near_cache_strategy_handles_invalidation_messages():
+    """Tests that invalidation messages from other processes evict near entries"""
+    strategy, inner, _ = make_near_cache({"borrow_rate:AAPL": "0.05", "broker_config:client1": {"markup": 5}})
+    strategy.get_many(["borrow_rate:AAPL", "broker_config:client1"])
+    
+    # A key message evicts only that key
+    strategy._handle_message(json.dumps({"op": "keys", "keys": ["borrow_rate:AAPL"]}))
+    strategy.get_many(["borrow_rate:AAPL", "broker_config:client1"])
+    assert inner.get_many.call_args[0][0] == ["borrow_rate:AAPL"]
+    
+    # A namespace message evicts the whole namespace
+    strategy._handle_message(json.dumps({"op": "namespace", "namespace": "broker_config"}))
+    strategy.get_many(["borrow_rate:AAPL", "broker_config:client1"])
+    assert inner.get_many.call_args[0][0] == ["broker_config:client1"]
+    
+    # Tag messages and malformed messages never leave stale entries behind
+    strategy._handle_message(json.dumps({"op": "tag", "tag": "ticker:AAPL"}))
+    strategy._handle_message("not json")
+    strategy.get_many(["borrow_rate:AAPL", "broker_config:client1"])
+    assert inner.get_many.call_args[0][0] == ["borrow_rate:AAPL", "broker_config:client1"]
+
+
+def test_near_cache_strategy_discards_reads_racing_an_invalidation():
+    """Tests that a value read while an invalidation arrives is not stored in the near cache"""
+    strategy, inner, _ = make_near_cache()
+    
+    def racing_get(key, value_type=None):
+        # Simulate an invalidation delivered while the value is being loaded
+        strategy._handle_message(json.dumps({"op": "keys", "keys": [key]}))
+        return "stale"
+    
+    inner.get.side_effect = racing_get
+    assert strategy.get("borrow_rate:AAPL") == "stale"
+    
+    # Verify the stale value was not kept
+    inner.get.side_effect = lambda key, value_type=None: "fresh"
+    assert strategy.get("borrow_rate:AAPL") == "fresh"
+
+
+def test_near_cache_strategy_listener_applies_messages_and_drops_on_disconnect():
+    """Tests that the subscriber evicts published keys and clears the near cache when it disconnects"""
+    strategy, inner, redis_cache = make_near_cache({"borrow_rate:AAPL": "0.05", "borrow_rate:MSFT": "0.03"})
+    strategy.get_many(["borrow_rate:AAPL", "borrow_rate:MSFT"])
+    remaining = []
+    
+    def disconnect(timeout=None):
+        remaining.extend(strategy._entries)
+        strategy._stopping.set()
+        raise redis.ConnectionError("connection lost")
+    
+    # Deliver one invalidation, then drop the connection
+    pubsub = Mock()
+    messages = [
+        lambda timeout: {"type": "message", "data": json.dumps({"op": "keys", "keys": ["borrow_rate:AAPL"]})},
+        disconnect
+    ]
+    pubsub.get_message.side_effect = lambda timeout=None: messages.pop(0)(timeout)
+    redis_cache.subscribe.return_value = pubsub
+    strategy._listen()
+    
+    # Verify only the published key was evicted while connected
+    redis_cache.subscribe.assert_called_once_with(NEAR_CACHE_INVALIDATION_CHANNEL)
+    assert remaining == ["borrow_rate:MSFT"]
+    
+    # Verify the disconnect disabled and cleared the near cache
+    assert not strategy._subscribed.is_set()
+    assert strategy._entries == {}
+    pubsub.close.assert_called_once()
+
+def test_get_cache_strategy_reprobes_redis_after_degrading(monkeypatch):
+    """Tests that the local-only strategy chosen while Redis was down is replaced once Redis answers"""
+    import src.backend.services.cache as cache_module
+    
+    redis_cache = Mock()
+    redis_cache.is_connected.return_value = False
+    clock = [1000.0]
+    monkeypatch.setattr(cache_module, "get_redis_cache", lambda: redis_cache)
+    monkeypatch.setattr(cache_module, "get_local_cache", LocalCache)
+    monkeypatch.setattr(cache_module, "get_settings", lambda: Mock(near_cache={"enabled": False}))
+    monkeypatch.setattr(cache_module, "time", Mock(monotonic=lambda: clock[0]))
+    cache_module.reset_cache_strategy()
+    
+    # Verify Redis being down at first use selects the local-only strategy
+    degraded = cache_module.get_cache_strategy()
+    assert isinstance(degraded, SingleCacheStrategy)
+    
+    # Verify Redis is not probed again before the interval elapses
+    redis_cache.is_connected.return_value = True
+    clock[0] += cache_module.REDIS_REPROBE_SECONDS - 1
+    assert cache_module.get_cache_strategy() is degraded
+    
+    # Verify the strategy switches back to Redis once the probe succeeds
+    clock[0] += 1
+    assert isinstance(cache_module.get_cache_strategy(), TieredCacheStrategy)
+    cache_module.reset_cache_strategy()
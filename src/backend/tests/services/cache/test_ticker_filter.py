@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import patch
+
+from src.backend.services.cache.ticker_filter import TickerUniverseFilter
+from src.backend.core.exceptions import TickerNotFoundException
+
+
+def test_unloaded_filter_accepts_every_ticker():
+    """Tests that nothing is rejected before the ticker universe is loaded"""
+    ticker_filter = TickerUniverseFilter()
+    
+    assert not ticker_filter.loaded
+    assert ticker_filter.might_exist("XYZ")
+    ticker_filter.check("XYZ")
+
+
+def test_filter_rejects_tickers_outside_the_universe():
+    """Tests exact membership checks against the loaded universe"""
+    ticker_filter = TickerUniverseFilter()
+    ticker_filter.update(["AAPL", "msft"])
+    
+    # Known tickers pass in any case
+    ticker_filter.check("AAPL")
+    ticker_filter.check("MSFT")
+    assert ticker_filter.might_exist("aapl")
+    
+    # Unknown tickers are rejected
+    with pytest.raises(TickerNotFoundException) as exc_info:
+        ticker_filter.check("XYZ")
+    assert exc_info.value.params == {"ticker": "XYZ"}
+    
+    # Reset falls back to accepting every ticker
+    ticker_filter.reset()
+    ticker_filter.check("XYZ")
+
+
+def test_added_tickers_pass_before_the_next_reload():
+    """Tests that tickers created in this process are accepted without a universe reload"""
+    ticker_filter = TickerUniverseFilter()
+    ticker_filter.add(["NEW"])
+    assert not ticker_filter.loaded
+    
+    ticker_filter.update(["AAPL"])
+    ticker_filter.record_not_found("NVDA")
+    ticker_filter.add(["nvda"])
+    
+    ticker_filter.check("NVDA")
+    ticker_filter.check("AAPL")
+    assert not ticker_filter.might_exist("XYZ")
+
+
+def test_negative_cache_expires_and_clears_on_update():
+    """Tests that confirmed misses are rejected until they expire or the universe reloads"""
+    ticker_filter = TickerUniverseFilter(not_found_ttl=30)
+    
+    with patch("src.backend.services.cache.ticker_filter.time.monotonic", return_value=1000.0):
+        ticker_filter.record_not_found("xyz")
+        with pytest.raises(TickerNotFoundException):
+            ticker_filter.check("XYZ")
+    
+    # Entries expire after the TTL
+    with patch("src.backend.services.cache.ticker_filter.time.monotonic", return_value=1031.0):
+        ticker_filter.check("XYZ")
+    
+    # A confirmed miss wins over a stale universe until the next reload
+    ticker_filter.update(["AAPL"])
+    ticker_filter.record_not_found("AAPL")
+    assert not ticker_filter.might_exist("AAPL")
+    ticker_filter.update(["AAPL"])
+    assert ticker_filter.might_exist("AAPL")
+
+
+def test_negative_cache_is_bounded():
+    """Tests that the negative cache never grows beyond its maximum size"""
+    ticker_filter = TickerUniverseFilter(max_not_found=3)
+    
+    for ticker in ["AAA", "BBB", "CCC", "DDD"]:
+        ticker_filter.record_not_found(ticker)
+    
+    assert len(ticker_filter._not_found) <= 3
+    assert not ticker_filter.might_exist("DDD")
@@ -6,12 +6,16 @@ including volatility adjustments, event risk adjustments, and fallback mechanism
 """
 
 import pytest
+import fakeredis
 from decimal import Decimal
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, MagicMock, AsyncMock, call
 
 # Import functions being tested
 from ...services.calculation.borrow_rate import (
     calculate_borrow_rate,
+    calculate_borrow_rate_details,
+    get_borrow_rates_bulk,
+    iter_borrow_rates_bulk,
     get_real_time_borrow_rate,
     get_fallback_borrow_rate,
     get_borrow_rate_with_adjustments,
@@ -32,6 +36,7 @@ from ...services.external.event_api import get_event_risk_factor
 
 # Import Redis cache for mocking
 from ...services.cache.redis import RedisCache
+from src.backend.services.external import market_api
 
 # Import enums and constants
 from ...core.constants import (
@@ -605,4 +610,124 @@ def test_cache_expiration():
         mock_get_rate.assert_called_once()
         
         # Verify result was cached again
-        mock_set_cache.assert_called_once()
\ No newline at end of file
+        mock_set_cache.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_borrow_rates_bulk():
+    """Tests that bulk resolution uses the shared table, one cache multi-get and calculates only misses."""
+    shared_table = MagicMock()
+    shared_table.get.side_effect = lambda ticker: {
+        "borrow_rate": Decimal('0.05'),
+        "volatility": Decimal('15'),
+        "event_risk_factor": 2,
+        "borrow_status": BorrowStatus.HARD,
+        "updated_at": 1700000000.0
+    } if ticker == "AAPL" else None
+    
+    cache = MagicMock()
+    cache.get_many.return_value = {"borrow_rate:MSFT": "0.03", "event_risk:MSFT": "4"}
+    
+    def calculate(ticker, min_rate=None):
+        if ticker == "BAD":
+            raise ValueError("calculation failed")
+        return {
+            "borrow_rate": Decimal('0.25'),
+            "volatility": Decimal('30'),
+            "event_risk_factor": 5,
+            "borrow_status": None,
+            "updated_at": 1700000100.0,
+            "source": "fallback" if ticker == "TSLA" else "live"
+        }
+    
+    with patch('src.backend.services.calculation.borrow_rate.get_shared_rate_table', return_value=shared_table), \
+         patch('src.backend.services.calculation.borrow_rate.get_cache_strategy', return_value=cache), \
+         patch('src.backend.services.calculation.borrow_rate.get_cached_stock_volatilities',
+               return_value={"MSFT": {"volatility": 20.0}}) as mock_volatilities, \
+         patch('src.backend.services.calculation.borrow_rate.calculate_borrow_rate_details', side_effect=calculate) as mock_calculate:
+        
+        batches = [
+            batch async for batch in iter_borrow_rates_bulk(["AAPL", "MSFT", "GME", "TSLA", "BAD", "aapl"], chunk_size=2)
+        ]
+        records = await get_borrow_rates_bulk(["AAPL", "MSFT", "GME", "TSLA", "BAD", "aapl"], {"GME": Decimal('0.2')})
+    
+    # Cached rates come first, then one batch per calculated chunk
+    assert [sorted(batch) for batch in batches] == [["AAPL", "MSFT"], ["GME", "TSLA"]]
+    
+    # Each ticker is served by the cheapest source, failed calculations are left out
+    assert {ticker: record["source"] for ticker, record in records.items()} == {
+        "AAPL": "cache",
+        "MSFT": "cache",
+        "GME": "live",
+        "TSLA": "fallback"
+    }
+    assert records["AAPL"]["borrow_status"] == BorrowStatus.HARD
+    assert records["MSFT"]["borrow_rate"] == Decimal('0.03')
+    assert records["MSFT"]["volatility"] == Decimal('20.0')
+    assert records["MSFT"]["event_risk_factor"] == 4
+    assert records["GME"]["borrow_rate"] == Decimal('0.25')
+    assert records["GME"]["event_risk_factor"] == 5
+    
+    # Only the cache misses were calculated, with their minimum rates
+    assert call("GME", Decimal('0.2')) in mock_calculate.call_args_list
+    assert cache.get_many.call_count == 2
+    
+    # Volatility is only looked up for tickers with a cached rate
+    mock_volatilities.assert_called_with(["MSFT"])
+
+
+def test_calculate_borrow_rate_details_reports_fallback():
+    """Tests that fallback rates are reported as such and not cached, while live rates are cached."""
+    adjustments = {"final_rate": 0.06251, "volatility_index": 25.0, "event_risk_factor": 3}
+    
+    with patch('src.backend.services.calculation.borrow_rate.get_real_time_borrow_rate_response') as mock_response, \
+         patch('src.backend.services.calculation.borrow_rate.get_borrow_rate_with_adjustments', return_value=adjustments), \
+         patch('src.backend.services.calculation.borrow_rate.cache_borrow_rate') as mock_cache:
+        
+        # Live SecLend data is cached and reported as live
+        mock_response.return_value = {"rate": 0.05, "status": BorrowStatus.MEDIUM}
+        live = calculate_borrow_rate_details("AAPL")
+        assert live["source"] == "live"
+        assert live["borrow_rate"] == Decimal('0.0625')
+        assert live["volatility"] == Decimal('25.0')
+        assert live["borrow_status"] == BorrowStatus.MEDIUM
+        mock_cache.assert_called_once_with("AAPL", Decimal('0.0625'))
+        
+        # Fallback SecLend data is reported as fallback and not cached
+        mock_cache.reset_mock()
+        mock_response.return_value = {"rate": 0.05, "status": BorrowStatus.HARD, "is_fallback": True}
+        fallback = calculate_borrow_rate_details("AAPL")
+        assert fallback["source"] == "fallback"
+        assert fallback["borrow_status"] is None
+        mock_cache.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_rates_read_volatility_cached_by_market_api():
+    """Tests that volatility written by the market data client is returned by the bulk path."""
+    server = fakeredis.FakeServer()
+    fake_redis = fakeredis.FakeStrictRedis(server=server, decode_responses=True)
+    
+    with patch('redis.Redis', return_value=fake_redis):
+        market_cache = RedisCache(host='localhost', port=6379, prefix=market_api.CACHE_KEY_PREFIX)
+        rate_cache = RedisCache(host='localhost', port=6379)
+    
+    settings = MagicMock()
+    settings.get_cache_ttl.return_value = 300
+    volatility_response = {"ticker": "AAPL", "volatility": 22.5, "timestamp": "2023-10-15T14:30:22Z"}
+    with patch.object(market_api, '_redis_cache', market_cache), \
+         patch.object(market_api, 'get', return_value=volatility_response), \
+         patch.object(market_api, 'build_url', return_value="https://market.example.com/volatility"), \
+         patch.object(market_api, 'get_settings', return_value=settings), \
+         patch('src.backend.services.calculation.borrow_rate.get_shared_rate_table', return_value=None), \
+         patch('src.backend.services.calculation.borrow_rate.get_cache_strategy', return_value=rate_cache):
+        
+        # Volatility is cached by the market data client, the rate through the cache strategy
+        market_api.get_stock_volatility("AAPL")
+        rate_cache.set("borrow_rate:AAPL", "0.0525", 300)
+        
+        records = await get_borrow_rates_bulk(["AAPL"])
+    
+    assert records["AAPL"]["source"] == "cache"
+    assert records["AAPL"]["borrow_rate"] == Decimal('0.0525')
+    assert records["AAPL"]["volatility"] == Decimal('22.5')
\ No newline at end of file
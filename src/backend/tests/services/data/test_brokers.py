@@ -5,12 +5,11 @@ used in fee calculations.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from decimal import Decimal
 
 from ...services.data.brokers import BrokerService
 from ...db.crud.brokers import broker_crud
-from ...services.cache.redis import redis_cache
 from ...core.exceptions import ClientNotFoundException, ValidationException
 from ...schemas.broker import BrokerCreate, BrokerUpdate, BrokerSchema
 
@@ -85,9 +84,10 @@ def test_broker_service_init():
 
 
 @patch('src.backend.services.data.brokers.broker_crud')
-@patch('src.backend.services.data.brokers.redis_cache')
-def test_get_broker_success(mock_redis_cache, mock_broker_crud, standard_broker):
+@patch('src.backend.services.data.utils.get_redis_cache')
+def test_get_broker_success(mock_get_redis_cache, mock_broker_crud, standard_broker):
     """Test successful retrieval of a broker by client ID"""
+    mock_redis_cache = mock_get_redis_cache.return_value
     # Setup mock responses
     mock_broker = MagicMock()
     mock_broker.to_dict.return_value = standard_broker
@@ -106,9 +106,10 @@ def test_get_broker_success(mock_redis_cache, mock_broker_crud, standard_broker)
 
 
 @patch('src.backend.services.data.brokers.broker_crud')
-@patch('src.backend.services.data.brokers.redis_cache')
-def test_get_broker_from_cache(mock_redis_cache, mock_broker_crud, standard_broker):
+@patch('src.backend.services.data.utils.get_redis_cache')
+def test_get_broker_from_cache(mock_get_redis_cache, mock_broker_crud, standard_broker):
     """Test retrieval of a broker from cache"""
+    mock_redis_cache = mock_get_redis_cache.return_value
     # Setup mock responses
     mock_redis_cache.get.return_value = standard_broker  # Cache hit
     
@@ -123,9 +124,10 @@ def test_get_broker_from_cache(mock_redis_cache, mock_broker_crud, standard_brok
 
 
 @patch('src.backend.services.data.brokers.broker_crud')
-@patch('src.backend.services.data.brokers.redis_cache')
-def test_get_broker_not_found(mock_redis_cache, mock_broker_crud, invalid_client_id):
+@patch('src.backend.services.data.utils.get_redis_cache')
+def test_get_broker_not_found(mock_get_redis_cache, mock_broker_crud, invalid_client_id):
     """Test handling of broker not found error"""
+    mock_redis_cache = mock_get_redis_cache.return_value
     # Setup mock responses
     mock_broker_crud.get_by_client_id_or_404.side_effect = ClientNotFoundException(invalid_client_id)
     mock_redis_cache.get.return_value = None  # Cache miss
@@ -164,9 +166,10 @@ def test_get_active_brokers(mock_broker_crud, broker_data):
 
 
 @patch('src.backend.services.data.brokers.broker_crud')
-@patch('src.backend.services.data.brokers.redis_cache')
-def test_create_broker(mock_redis_cache, mock_broker_crud):
+@patch('src.backend.services.data.utils.get_redis_cache')
+def test_create_broker(mock_get_redis_cache, mock_broker_crud):
     """Test creation of a new broker"""
+    mock_redis_cache = mock_get_redis_cache.return_value
     # Setup test data
     broker_data = BrokerCreate(
         client_id="test_broker",
@@ -204,9 +207,10 @@ def test_create_broker(mock_redis_cache, mock_broker_crud):
 
 
 @patch('src.backend.services.data.brokers.broker_crud')
-@patch('src.backend.services.data.brokers.redis_cache')
-def test_update_broker(mock_redis_cache, mock_broker_crud, standard_broker):
+@patch('src.backend.services.data.utils.get_redis_cache')
+def test_update_broker(mock_get_redis_cache, mock_broker_crud, standard_broker):
     """Test updating an existing broker"""
+    mock_redis_cache = mock_get_redis_cache.return_value
     # Setup test data
     client_id = standard_broker["client_id"]
     update_data = BrokerUpdate(
@@ -236,9 +240,10 @@ def test_update_broker(mock_redis_cache, mock_broker_crud, standard_broker):
 
 
 @patch('src.backend.services.data.brokers.broker_crud')
-@patch('src.backend.services.data.brokers.redis_cache')
-def test_deactivate_broker(mock_redis_cache, mock_broker_crud, standard_broker):
+@patch('src.backend.services.data.utils.get_redis_cache')
+def test_deactivate_broker(mock_get_redis_cache, mock_broker_crud, standard_broker):
     """Test deactivation of a broker"""
+    mock_redis_cache = mock_get_redis_cache.return_value
     # Setup test data
     client_id = standard_broker["client_id"]
     
@@ -262,9 +267,10 @@ def test_deactivate_broker(mock_redis_cache, mock_broker_crud, standard_broker):
 
 
 @patch('src.backend.services.data.brokers.broker_crud')
-@patch('src.backend.services.data.brokers.redis_cache')
-def test_activate_broker(mock_redis_cache, mock_broker_crud, inactive_broker):
+@patch('src.backend.services.data.utils.get_redis_cache')
+def test_activate_broker(mock_get_redis_cache, mock_broker_crud, inactive_broker):
     """Test activation of a broker"""
+    mock_redis_cache = mock_get_redis_cache.return_value
     # Setup test data
     client_id = inactive_broker["client_id"]
     
@@ -288,9 +294,10 @@ def test_activate_broker(mock_redis_cache, mock_broker_crud, inactive_broker):
 
 
 @patch('src.backend.services.data.brokers.broker_crud')
-@patch('src.backend.services.data.brokers.redis_cache')
-def test_delete_broker(mock_redis_cache, mock_broker_crud, standard_broker):
+@patch('src.backend.services.data.utils.get_redis_cache')
+def test_delete_broker(mock_get_redis_cache, mock_broker_crud, standard_broker):
     """Test deletion of a broker"""
+    mock_redis_cache = mock_get_redis_cache.return_value
     # Setup test data
     client_id = standard_broker["client_id"]
     
@@ -343,9 +350,10 @@ def test_broker_not_exists(mock_broker_crud, invalid_client_id):
     assert result is False
 
 
-@patch('src.backend.services.data.brokers.redis_cache')
-def test_invalidate_broker_cache(mock_redis_cache, standard_broker):
+@patch('src.backend.services.data.utils.get_redis_cache')
+def test_invalidate_broker_cache(mock_get_redis_cache, standard_broker):
     """Test invalidation of broker cache"""
+    mock_redis_cache = mock_get_redis_cache.return_value
     # Setup test data
     client_id = standard_broker["client_id"]
     
@@ -372,4 +380,36 @@ def test_validation_error_handling():
     
     # Test with None client_id
     with pytest.raises(ValidationException):
-        service.get_broker(None)
\ No newline at end of file
+        service.get_broker(None)
+
+@pytest.mark.asyncio
+@patch('src.backend.services.data.brokers.async_broker_crud')
+@patch('src.backend.services.data.brokers.broker_crud')
+@patch('src.backend.services.data.utils.get_redis_cache')
+async def test_get_broker_async_shares_cache_with_get_broker(mock_get_redis_cache, mock_broker_crud,
+                                                             mock_async_broker_crud, standard_broker):
+    """Test that brokers loaded asynchronously are cached once, under the get_broker entry"""
+    # Arrange
+    cached = {}
+    mock_redis_cache = mock_get_redis_cache.return_value
+    mock_redis_cache.get.side_effect = lambda key, value_type=None: cached.get(key)
+    mock_redis_cache.set.side_effect = lambda key, value, ttl=None: cached.__setitem__(key, value)
+    mock_broker = MagicMock()
+    mock_broker.to_dict.return_value = standard_broker
+    mock_async_broker_crud.get_by_client_id_or_404 = AsyncMock(return_value=mock_broker)
+    service = BrokerService()
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=MagicMock())
+    session.__aexit__ = AsyncMock(return_value=False)
+    
+    # Act
+    with patch.object(service, '_get_async_db_session', return_value=session):
+        result = await service.get_broker_async(standard_broker['client_id'])
+    sync_result = service.get_broker(standard_broker['client_id'])
+    
+    # Assert
+    assert result == standard_broker
+    assert sync_result == standard_broker
+    assert len(cached) == 1
+    mock_async_broker_crud.get_by_client_id_or_404.assert_awaited_once()
+    mock_broker_crud.get_by_client_id_or_404.assert_not_called()
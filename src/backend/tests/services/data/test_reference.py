@@ -0,0 +1,128 @@
+"""
+Unit tests for the in-memory reference data snapshot in the Borrow Rate & Locate Fee Pricing Engine.
+Tests the snapshot indexes, not-found handling and version-based reloading.
+"""
+
+import pytest
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from src.backend.services.data.reference import ReferenceSnapshot, ReferenceDataCache
+from src.backend.schemas.stock import StockSchema
+from src.backend.core.constants import BorrowStatus
+from src.backend.core.exceptions import TickerNotFoundException, ClientNotFoundException
+
+
+def make_stock(ticker, borrow_status=BorrowStatus.EASY):
+    """Creates a stock record for tests"""
+    return StockSchema(
+        ticker=ticker,
+        borrow_status=borrow_status,
+        lender_api_id=None,
+        min_borrow_rate=Decimal("0.01"),
+        last_updated=datetime(2024, 3, 1)
+    )
+
+
+@pytest.fixture
+def snapshot():
+    """Snapshot with stocks of every borrow status and one broker"""
+    stocks = [
+        make_stock("MSFT"),
+        make_stock("AAPL"),
+        make_stock("GME", BorrowStatus.HARD),
+        make_stock("AMZN"),
+        make_stock("TSLA", BorrowStatus.MEDIUM)
+    ]
+    brokers = [{"client_id": "test_broker", "markup_percentage": Decimal("5.0"), "active": True}]
+    return ReferenceSnapshot(stocks, brokers, version=3)
+
+
+def test_snapshot_lookups(snapshot):
+    """Test lookups by ticker and client ID"""
+    assert snapshot.version == 3
+    assert snapshot.stock_count == 5
+    assert snapshot.broker_count == 1
+    assert snapshot.get_stock("aapl").ticker == "AAPL"
+    assert snapshot.get_stock("XYZ") is None
+    assert snapshot.get_broker("test_broker")["markup_percentage"] == Decimal("5.0")
+    
+    # Not-found lookups raise the service exceptions
+    with pytest.raises(TickerNotFoundException):
+        snapshot.get_stock_or_404("XYZ")
+    with pytest.raises(ClientNotFoundException):
+        snapshot.get_broker_or_404("unknown_broker")
+    
+    # Broker records are read-only
+    with pytest.raises(TypeError):
+        snapshot.get_broker("test_broker")["active"] = False
+
+
+def test_snapshot_stocks_by_borrow_status(snapshot):
+    """Test sorted listing by borrow status with offset and keyset pagination"""
+    easy = [stock.ticker for stock in snapshot.get_stocks_by_borrow_status(BorrowStatus.EASY)]
+    assert easy == ["AAPL", "AMZN", "MSFT"]
+    
+    # Offset pagination
+    page = snapshot.get_stocks_by_borrow_status(BorrowStatus.EASY, skip=1, limit=1)
+    assert [stock.ticker for stock in page] == ["AMZN"]
+    
+    # Keyset pagination continues after the last ticker of the previous page
+    page = snapshot.get_stocks_by_borrow_status(BorrowStatus.EASY, limit=2, after="AMZN")
+    assert [stock.ticker for stock in page] == ["MSFT"]
+    
+    assert [stock.ticker for stock in snapshot.get_stocks_by_borrow_status(BorrowStatus.HARD)] == ["GME"]
+
+
+def test_refresh_reloads_only_when_version_changes():
+    """Test that refresh swaps in a new snapshot only when the table version changes"""
+    cache = ReferenceDataCache(redis_cache=MagicMock())
+    db = MagicMock()
+    
+    @contextmanager
+    def fake_get_db():
+        yield db
+    
+    fingerprints = [(1, None, 1, None), (1, None, 1, None), (2, None, 1, None)]
+    with patch("src.backend.services.data.reference.get_db", fake_get_db), \
+         patch("src.backend.services.data.reference.stock_crud") as mock_stock_crud, \
+         patch("src.backend.services.data.reference.broker_crud") as mock_broker_crud, \
+         patch.object(ReferenceDataCache, "_load_fingerprint", side_effect=fingerprints), \
+         patch("src.backend.services.data.reference.get_ticker_filter") as mock_get_ticker_filter:
+        mock_stock_crud.get_multi.return_value = [make_stock("AAPL")]
+        broker = MagicMock()
+        broker.to_dict.return_value = {"client_id": "test_broker"}
+        mock_broker_crud.get_multi.return_value = [broker]
+        
+        # First refresh loads the snapshot
+        first = cache.refresh()
+        assert cache.snapshot is first
+        assert first.version == 1
+        
+        # An unchanged version keeps the same snapshot
+        assert cache.refresh() is first
+        assert mock_stock_crud.get_multi.call_count == 1
+        
+        # A changed version swaps in a new snapshot
+        mock_stock_crud.get_multi.return_value = [make_stock("AAPL"), make_stock("GME", BorrowStatus.HARD)]
+        second = cache.refresh()
+        assert second is not first
+        assert second.version == 2
+        assert second.get_stock("GME") is not None
+        assert first.get_stock("GME") is None
+        
+        # The ticker universe filter follows every reload
+        assert mock_get_ticker_filter.return_value.update.call_count == 2
+        assert set(mock_get_ticker_filter.return_value.update.call_args[0][0]) == {"AAPL", "GME"}
+
+
+def test_notify_changed_publishes():
+    """Test that change notifications are published for every process"""
+    redis_cache = MagicMock()
+    cache = ReferenceDataCache(redis_cache=redis_cache)
+    
+    cache.notify_changed()
+    
+    redis_cache.publish.assert_called_once_with("reference:changed", "changed")
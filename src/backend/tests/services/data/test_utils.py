@@ -0,0 +1,265 @@
+"""
+Unit tests for the data service utilities in the Borrow Rate & Locate Fee Pricing Engine.
+Tests the cache_result decorator: stable keys, single-flight misses, async functions,
+process-local tiering and negative caching.
+"""
+
+import asyncio
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+from unittest.mock import patch
+
+from src.backend.services.data.utils import cache_result, get_cache_key
+from src.backend.core.constants import BorrowStatus
+from src.backend.core.exceptions import ClientNotFoundException
+
+
+class DictCache:
+    """Minimal in-memory cache with the get/set/delete interface of RedisCache"""
+    
+    def __init__(self):
+        self.values = {}
+        self.gets = 0
+    
+    def get(self, key, value_type=None):
+        self.gets += 1
+        return self.values.get(key)
+    
+    def set(self, key, value, ttl=None):
+        self.values[key] = value
+        return True
+    
+    def delete(self, key):
+        return self.values.pop(key, None) is not None
+
+
+@pytest.fixture
+def caches():
+    """Patches the Redis and local caches used by cache_result"""
+    redis_cache, local_cache = DictCache(), DictCache()
+    with patch("src.backend.services.data.utils.get_redis_cache", return_value=redis_cache), \
+         patch("src.backend.services.data.utils.get_local_cache", return_value=local_cache):
+        yield redis_cache, local_cache
+
+
+class QuoteService:
+    """Service with a cached method for tests"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    @cache_result(ttl=60)
+    def get_quote(self, ticker, status=BorrowStatus.EASY, rate=Decimal("0.05")):
+        self.calls += 1
+        return {"ticker": ticker, "status": status.value, "rate": str(rate)}
+
+
+def test_cache_keys_are_stable_across_instances(caches):
+    """Test that keys exclude self and bind arguments by name with defaults applied"""
+    redis_cache, _ = caches
+    first, second = QuoteService(), QuoteService()
+    
+    # Positional, keyword and defaulted forms of the same call share one key
+    key = QuoteService.get_quote.cache_key(first, "AAPL")
+    assert key == QuoteService.get_quote.cache_key(second, ticker="AAPL", status=BorrowStatus.EASY)
+    assert key == QuoteService.get_quote.cache_key(ticker="AAPL", rate=Decimal("0.05"))
+    assert key.startswith("fn:") and "QuoteService.get_quote" in key
+    assert key != QuoteService.get_quote.cache_key(ticker="AAPL", status=BorrowStatus.HARD)
+    
+    # A second instance is served from the entry written by the first
+    first.get_quote("AAPL")
+    second.get_quote(ticker="AAPL")
+    assert (first.calls, second.calls) == (1, 0)
+    assert list(redis_cache.values) == [key]
+    
+    # Invalidation removes the entry
+    assert QuoteService.get_quote.invalidate(ticker="AAPL")
+    second.get_quote("AAPL")
+    assert second.calls == 1
+
+
+def test_get_cache_key_is_order_independent():
+    """Test that keyword order does not change the key and unsupported values are rejected"""
+    assert get_cache_key("prefix", (1,), {"a": 1, "b": 2}) == get_cache_key("prefix", (1,), {"b": 2, "a": 1})
+    assert get_cache_key("prefix", (), {}) == "prefix"
+    
+    with pytest.raises(TypeError):
+        get_cache_key("prefix", (object(),), {})
+
+
+def test_uncacheable_arguments_call_through(caches):
+    """Test that arguments without a stable representation bypass the cache"""
+    redis_cache, _ = caches
+    calls = []
+    
+    @cache_result(ttl=60)
+    def describe(value):
+        calls.append(value)
+        return "described"
+    
+    describe(object())
+    describe(object())
+    
+    assert len(calls) == 2
+    assert redis_cache.values == {}
+    assert describe.cache_stats()["uncacheable"] == 2
+
+
+def test_concurrent_misses_are_computed_once(caches):
+    """Test that concurrent callers of the same key share one computation"""
+    calls = []
+    started = threading.Event()
+    
+    @cache_result(ttl=60)
+    def slow_lookup(ticker):
+        calls.append(ticker)
+        started.set()
+        time.sleep(0.1)
+        return ticker.lower()
+    
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow_lookup("AAPL"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert calls == ["AAPL"]
+    assert results == ["aapl"] * 5
+
+
+@pytest.mark.asyncio
+async def test_async_functions_are_cached(caches):
+    """Test that coroutine functions are awaited once per key and cached"""
+    calls = []
+    
+    @cache_result(ttl=60)
+    async def fetch_rate(ticker):
+        calls.append(ticker)
+        await asyncio.sleep(0.01)
+        return 0.05
+    
+    # Concurrent misses share one call
+    results = await asyncio.gather(*(fetch_rate("AAPL") for _ in range(5)))
+    assert results == [0.05] * 5
+    assert calls == ["AAPL"]
+    
+    # Later calls are cache hits
+    assert await fetch_rate("AAPL") == 0.05
+    assert calls == ["AAPL"]
+    assert fetch_rate.cache_stats()["hit"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_redis_calls_run_off_the_event_loop(caches):
+    """Test that Redis reads and writes of coroutine functions do not block the event loop"""
+    redis_cache, _ = caches
+    loop_thread = threading.get_ident()
+    threads = []
+    get, set_ = redis_cache.get, redis_cache.set
+    redis_cache.get = lambda *args: threads.append(threading.get_ident()) or get(*args)
+    redis_cache.set = lambda *args: threads.append(threading.get_ident()) or set_(*args)
+    
+    @cache_result(ttl=60)
+    async def fetch_rate(ticker):
+        return 0.05
+    
+    assert await fetch_rate("AAPL") == 0.05
+    assert await fetch_rate("AAPL") == 0.05
+    assert len(threads) == 3
+    assert loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_waiter_takes_over_when_leader_is_cancelled(caches):
+    """Test that a cancelled leader does not cancel the tasks sharing its miss"""
+    calls = []
+    started = asyncio.Event()
+    
+    @cache_result(ttl=60)
+    async def fetch_rate(ticker):
+        calls.append(ticker)
+        started.set()
+        await asyncio.sleep(0.05)
+        return 0.05
+    
+    leader = asyncio.create_task(fetch_rate("AAPL"))
+    await started.wait()
+    waiters = [asyncio.create_task(fetch_rate("AAPL")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    
+    assert await asyncio.gather(*waiters) == [0.05] * 3
+    assert leader.cancelled()
+    assert calls == ["AAPL", "AAPL"]
+
+
+def test_local_tier_serves_repeated_reads(caches):
+    """Test that results are kept in the local cache in front of Redis"""
+    redis_cache, local_cache = caches
+    
+    @cache_result(ttl=60, local=True)
+    def lookup(ticker):
+        return ticker.lower()
+    
+    lookup("AAPL")
+    lookup("AAPL")
+    lookup("AAPL")
+    
+    assert redis_cache.gets == 1
+    assert lookup.cache_stats() == {"miss": 1, "local_hit": 2}
+    assert list(local_cache.values) == list(redis_cache.values)
+
+
+def test_negative_results_are_cached(caches):
+    """Test that not-found errors and None results are cached when negative_ttl is set"""
+    calls = []
+    
+    @cache_result(ttl=60, negative_ttl=10)
+    def load_broker(client_id):
+        calls.append(client_id)
+        if client_id == "unknown_broker":
+            raise ClientNotFoundException(client_id)
+        return None
+    
+    # Not-found errors are raised again from the cache
+    for _ in range(2):
+        with pytest.raises(ClientNotFoundException) as exc_info:
+            load_broker("unknown_broker")
+        assert exc_info.value.params == {"client_id": "unknown_broker"}
+    
+    # None results are returned from the cache
+    assert load_broker("empty_broker") is None
+    assert load_broker("empty_broker") is None
+    
+    assert calls == ["unknown_broker", "empty_broker"]
+    assert load_broker.cache_stats()["negative_hit"] == 2
+
+
+@pytest.mark.asyncio
+async def test_named_sync_and_async_functions_share_entries(caches):
+    """Test that a sync function and its async variant cached under one name share results"""
+    redis_cache, _ = caches
+    calls = []
+    
+    @cache_result(ttl=60, name="brokers.load_broker")
+    def load_broker(client_id):
+        calls.append("sync")
+        return {"client_id": client_id}
+    
+    @cache_result(ttl=60, name="brokers.load_broker")
+    async def load_broker_async(client_id):
+        calls.append("async")
+        return {"client_id": client_id}
+    
+    assert await load_broker_async("standard_broker") == {"client_id": "standard_broker"}
+    assert load_broker("standard_broker") == {"client_id": "standard_broker"}
+    assert calls == ["async"]
+    assert len(redis_cache.values) == 1
+    
+    # Invalidating through either function drops the shared entry
+    assert load_broker.invalidate("standard_broker") is True
+    assert redis_cache.values == {}
@@ -379,7 +379,7 @@ def test_clear_volatility_cache_specific_ticker():
         result = clear_volatility_cache(ticker)
         
         # Verify the Redis delete method was called with the correct key
-        mock_redis.return_value.delete.assert_called_once_with(f"stock:{ticker}")
+        mock_redis.return_value.delete.assert_called_once_with(f"volatility:{ticker}")
         
         # Verify the result is True
         assert result is True
@@ -389,29 +389,17 @@ def test_clear_volatility_cache_all():
     """Tests clearing all volatility cache entries."""
     # Mock the Redis cache
     with patch('src.backend.services.external.market_api.get_redis_cache') as mock_redis:
-        # Create a mock Redis client
-        mock_client = MagicMock()
-        
-        # Set up the cache keys to return when scanning
-        cache_keys = [
-            f"{CACHE_KEY_PREFIX}stock:AAPL",
-            f"{CACHE_KEY_PREFIX}stock:TSLA",
-            f"{CACHE_KEY_PREFIX}market_index"
-        ]
-        mock_client.keys.return_value = cache_keys
-        
-        # Set the mock client on the mock cache instance
-        mock_redis.return_value._client = mock_client
-        mock_redis.return_value.delete.return_value = True
+        # Set up mock to return the new namespace generation
+        mock_redis.return_value = MagicMock()
+        mock_redis.return_value.invalidate_namespace.return_value = 2
         
         # Call the function under test without a specific ticker
         result = clear_volatility_cache()
         
-        # Verify the Redis keys method was called to scan for keys
-        mock_client.keys.assert_called_once()
-        
-        # Verify the Redis delete method was called for each key
-        assert mock_redis.return_value.delete.call_count == len(cache_keys)
+        # Verify only the volatility namespace was invalidated, without scanning keys
+        mock_redis.return_value.invalidate_namespace.assert_called_once_with('volatility')
+        mock_redis.return_value._client.keys.assert_not_called()
+        mock_redis.return_value.flush.assert_not_called()
         
         # Verify the result is True
         assert result is True
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""
+Initialization module for the health service test package.
+
+This module makes the test package importable for tests of the background
+health monitor and its cached health snapshots.
+"""
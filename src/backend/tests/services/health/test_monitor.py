@@ -0,0 +1,81 @@
+"""
+Unit tests for the background health monitor in the Borrow Rate & Locate Fee Pricing Engine.
+
+This module tests probe timeouts, latency history, snapshot publication and the
+readiness and liveness decisions made from cached snapshots.
+"""
+
+import asyncio
+import time
+
+import pytest  # pytest 7.4.0+
+
+from src.backend.services.health import HealthMonitor, ComponentProbe, is_component_healthy
+
+
+def test_is_component_healthy():
+    """Tests health evaluation of flat and nested component statuses"""
+    assert is_component_healthy("connected")
+    assert not is_component_healthy("timeout")
+    assert is_component_healthy({"seclend_api": "available", "market_data_api": "available"})
+    assert not is_component_healthy({"seclend_api": "available", "market_data_api": "unavailable"})
+
+
+@pytest.mark.asyncio
+async def test_probe_times_out_and_records_history():
+    """Tests that a slow check is reported as timed out and recorded in the history"""
+    # Arrange
+    def slow_check():
+        time.sleep(0.2)
+        return {"database": "connected"}
+
+    probe = ComponentProbe("database", slow_check, interval=10, timeout=0.05)
+
+    # Act
+    result = await probe.probe()
+
+    # Assert
+    assert result == {"database": "timeout"}
+    assert probe.stats()["samples"] == 1
+    assert probe.stats()["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_publishes_snapshot():
+    """Tests that a refresh publishes a snapshot with components and latency checks"""
+    # Arrange
+    monitor = HealthMonitor(version="1.0.0")
+    monitor.register("database", lambda: {"database": "connected"}, interval=10, timeout=1)
+    monitor.register("cache", lambda: {"cache": "disconnected"}, interval=10, timeout=1)
+    assert monitor.snapshot["status"] == "starting"
+    assert not monitor.is_ready()
+
+    # Act
+    snapshot = await monitor.refresh()
+
+    # Assert
+    assert monitor.snapshot is snapshot
+    assert snapshot["status"] == "degraded"
+    assert snapshot["components"] == {"database": "connected", "cache": "disconnected"}
+    assert snapshot["checks"]["database"]["samples"] == 1
+    assert monitor.is_ready()
+
+
+@pytest.mark.asyncio
+async def test_background_probes_and_liveness():
+    """Tests that started probes update the snapshot and stop cleanly"""
+    # Arrange
+    monitor = HealthMonitor(version="1.0.0")
+    monitor.register("database", lambda: {"database": "connected"}, interval=0.01, timeout=1)
+
+    # Act
+    monitor.start()
+    await asyncio.sleep(0.1)
+
+    # Assert
+    assert monitor.is_alive()
+    assert monitor.snapshot["status"] == "healthy"
+    assert monitor.snapshot["checks"]["database"]["samples"] > 1
+
+    await monitor.stop()
+    assert not monitor.running
@@ -1,13 +1,8 @@
 """
 Test utilities package for the Borrow Rate & Locate Fee Pricing Engine.
 
-This package contains utility functions and classes for testing the system's 
-validation capabilities and fallback mechanisms, ensuring that error handling
-and circuit breaker patterns function correctly.
+This package contains tests for the system's validation capabilities, fallback
+mechanisms, logging pipeline, metrics and profiler. Test modules are collected
+by pytest directly and are not imported here, so a module that fails to import
+does not prevent the rest of the package from being collected.
 """
-
-from .test_validation import *
-from .test_circuit_breaker import *
-
-# Re-export modules to make them accessible at the package level
-__all__ = ['test_validation', 'test_circuit_breaker']
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Unit tests for the queued and sampled logging pipeline in the Borrow Rate & Locate Fee Pricing Engine.
+
+This module tests per-logger INFO sampling, that warnings are never dropped, and that
+queued records are formatted by the listener with the caller's correlation ID.
+"""
+
+import json
+import logging
+
+from src.backend.config.logging_config import SamplingFilter, FastJsonFormatter, create_queue_handler
+from src.backend.core.logging import correlation_id_var
+
+
+def make_record(name="calc", level=logging.INFO, msg="Calculated %s", args=("AAPL",)):
+    """Creates a log record for tests"""
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class ListHandler(logging.Handler):
+    """Handler collecting formatted records"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def test_sampling_filter_limits_info_per_logger():
+    """Tests that INFO records are limited per logger and the drop count is reported"""
+    # Arrange
+    sampling = SamplingFilter(rate=0.001, burst=2)
+
+    # Act
+    admitted = [sampling.filter(make_record()) for _ in range(5)]
+    other_logger = sampling.filter(make_record(name="api"))
+
+    # Assert
+    assert admitted == [True, True, False, False, False]
+    assert other_logger
+    sampling._buckets["calc"][0] = 1
+    record = make_record()
+    assert sampling.filter(record)
+    assert record.sampled_dropped == 3
+
+
+def test_sampling_filter_never_drops_warnings():
+    """Tests that WARNING and ERROR records bypass sampling"""
+    sampling = SamplingFilter(rate=0.001, burst=1)
+    sampling.filter(make_record())
+
+    assert sampling.filter(make_record(level=logging.WARNING))
+    assert sampling.filter(make_record(level=logging.ERROR))
+    assert not sampling.filter(make_record())
+
+
+def test_sampling_filter_never_drops_audit_records():
+    """Tests that audit and compliance records are never sampled"""
+    sampling = SamplingFilter(rate=0.001, burst=1)
+
+    audit_admitted = [sampling.filter(make_record(name="audit")) for _ in range(50)]
+    compliance_admitted = [sampling.filter(make_record(name="compliance.locates")) for _ in range(50)]
+
+    assert all(audit_admitted)
+    assert all(compliance_admitted)
+    assert sampling.filter(make_record(name="auditor"))
+    assert not sampling.filter(make_record(name="auditor"))
+
+
+def test_queue_handler_formats_in_listener_with_correlation_id():
+    """Tests that the listener writes lazily formatted records with the caller's correlation ID"""
+    # Arrange
+    target = ListHandler()
+    target.setFormatter(FastJsonFormatter())
+    queue_handler, listener = create_queue_handler([target])
+    test_logger = logging.getLogger("tests.logging_pipeline")
+    test_logger.handlers = [queue_handler]
+    test_logger.propagate = False
+    test_logger.setLevel(logging.INFO)
+    token = correlation_id_var.set("corr-42")
+
+    # Act
+    listener.start()
+    try:
+        test_logger.info("Borrow rate for %s: %s", "AAPL", 0.05)
+    finally:
+        listener.stop()
+        correlation_id_var.reset(token)
+        test_logger.handlers = []
+
+    # Assert
+    entry = json.loads(target.messages[0])
+    assert entry["message"] == "Borrow rate for AAPL: 0.05"
+    assert entry["correlation_id"] == "corr-42"
@@ -0,0 +1,108 @@
+"""
+Unit tests for the in-service Prometheus metrics in the Borrow Rate & Locate Fee Pricing Engine.
+
+This module tests that the @timed decorator feeds the stage histogram in both its bare
+and called forms, and that cache, circuit breaker and external call metrics are exported.
+"""
+
+import os
+
+import pytest
+
+from src.backend.utils import metrics
+from src.backend.utils.timing import timed, async_timed
+
+pytestmark = pytest.mark.skipif(not metrics.metrics_available(), reason="prometheus_client not installed")
+
+
+def sample_value(name, labels):
+    """Reads a sample from the default registry, 0 if absent"""
+    from prometheus_client import REGISTRY
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_bare_timed_decorator_records_stage():
+    """Tests that @timed without arguments wraps the function and observes its latency"""
+    # Arrange
+    @timed
+    def bare_stage(value):
+        return value * 2
+
+    before = sample_value("calculation_stage_duration_seconds_count", {"stage": "bare_stage"})
+
+    # Act
+    result = bare_stage(21)
+
+    # Assert
+    assert result == 42
+    assert sample_value("calculation_stage_duration_seconds_count", {"stage": "bare_stage"}) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_async_timed_records_named_stage_on_error():
+    """Tests that a failing async stage is still observed under its stage name"""
+    # Arrange
+    @async_timed(stage="test_failing_stage")
+    async def failing():
+        raise ValueError("boom")
+
+    before = sample_value("calculation_stage_duration_seconds_count", {"stage": "test_failing_stage"})
+
+    # Act
+    with pytest.raises(ValueError):
+        await failing()
+
+    # Assert
+    assert sample_value("calculation_stage_duration_seconds_count", {"stage": "test_failing_stage"}) == before + 1
+
+
+def test_cache_and_circuit_metrics_exported():
+    """Tests cache hit/miss counters by key type and circuit breaker state gauges"""
+    # Act
+    metrics.record_cache_access("redis", "test_type:AAPL", True)
+    metrics.record_cache_access("redis", "test_type:MSFT", False)
+    metrics.set_circuit_state("test_service", "OPEN")
+    payload, content_type = metrics.generate_metrics()
+
+    # Assert
+    assert sample_value("cache_requests_total", {"cache": "redis", "key_type": "test_type", "result": "hit"}) == 1
+    assert sample_value("cache_requests_total", {"cache": "redis", "key_type": "test_type", "result": "miss"}) == 1
+    assert sample_value("circuit_breaker_state", {"service": "test_service"}) == 2
+    assert b"cache_requests_total" in payload
+    assert content_type.startswith("text/plain")
+
+
+def test_external_call_tracks_in_flight_and_outcome():
+    """Tests that in-flight calls are counted while running and the outcome is labelled"""
+    # Act
+    with metrics.track_external_call("test_api"):
+        in_flight = sample_value("external_calls_in_flight", {"service": "test_api"})
+    with pytest.raises(RuntimeError):
+        with metrics.track_external_call("test_api"):
+            raise RuntimeError("down")
+
+    # Assert
+    assert in_flight == 1
+    assert sample_value("external_calls_in_flight", {"service": "test_api"}) == 0
+    assert sample_value("external_call_duration_seconds_count", {"service": "test_api", "outcome": "success"}) == 1
+    assert sample_value("external_call_duration_seconds_count", {"service": "test_api", "outcome": "error"}) == 1
+
+
+def test_ensure_multiproc_dir_creates_missing_directory(tmp_path, monkeypatch):
+    """Tests that the multiprocess directory is created outside gunicorn and dropped if it cannot be"""
+    # Arrange
+    multiproc_dir = tmp_path / "prometheus_multiproc"
+    blocked_dir = tmp_path / "not_a_directory"
+    blocked_dir.write_text("")
+
+    # Act
+    monkeypatch.setenv(metrics.MULTIPROC_DIR_ENV, str(multiproc_dir))
+    created = metrics.ensure_multiproc_dir()
+    monkeypatch.setenv(metrics.MULTIPROC_DIR_ENV, str(blocked_dir / "metrics"))
+    blocked = metrics.ensure_multiproc_dir()
+
+    # Assert
+    assert created == str(multiproc_dir)
+    assert multiproc_dir.is_dir()
+    assert blocked is None
+    assert metrics.MULTIPROC_DIR_ENV not in os.environ
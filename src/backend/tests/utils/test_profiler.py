@@ -0,0 +1,106 @@
+"""
+Unit tests for the sampling profiler in the Borrow Rate & Locate Fee Pricing Engine.
+
+This module tests that samples are attributed to the request route, correlation ID and
+calculation stage, that filters apply to the folded output, and that the profiler
+stops on its own after the requested duration.
+"""
+
+import threading
+import time
+
+from src.backend.utils.profiler import SamplingProfiler, describe_scope, register_stage, request_scope_var, UNTAGGED
+
+
+class FakeRoute:
+    """Route stand-in exposing a path template"""
+    path = "/api/v1/rates/{ticker}"
+
+
+def make_scope(correlation_id="corr-1"):
+    """Creates an ASGI scope after routing"""
+    return {"type": "http", "path": "/api/v1/rates/AAPL", "route": FakeRoute(), "state": {"correlation_id": correlation_id}}
+
+
+def test_describe_scope():
+    """Tests route template and correlation ID extraction with fallbacks"""
+    assert describe_scope(make_scope()) == ("/api/v1/rates/{ticker}", "corr-1")
+    assert describe_scope({"path": "/api/v1/calculate-locate"}) == ("/api/v1/calculate-locate", UNTAGGED)
+    assert describe_scope(None) == (UNTAGGED, UNTAGGED)
+
+
+def test_samples_bound_thread_with_route_and_stage():
+    """Tests that a thread bound to a request is attributed to its route, correlation ID and stage"""
+    # Arrange
+    profiler = SamplingProfiler()
+    release = threading.Event()
+
+    def busy_stage():
+        release.wait(5)
+
+    register_stage(busy_stage, "seclend")
+
+    def worker():
+        request_scope_var.set(make_scope())
+        previous = profiler.bind_thread()
+        try:
+            busy_stage()
+        finally:
+            profiler.restore_thread(previous)
+
+    profiler.active = True
+    thread = threading.Thread(target=worker)
+    thread.start()
+    time.sleep(0.05)
+
+    # Act
+    profiler._sample()
+    release.set()
+    thread.join()
+    folded = profiler.folded(correlation_id="corr-1")
+
+    # Assert
+    lines = folded.strip().splitlines()
+    assert len(lines) == 1
+    assert lines[0].startswith("/api/v1/rates/{ticker};seclend;")
+    assert "busy_stage" in lines[0]
+    assert lines[0].endswith(" 1")
+    assert profiler.folded(route="/api/v1/other") == ""
+
+
+def test_event_loop_frames_attributed_through_scope_argument():
+    """Tests that frames receiving an ASGI scope tag samples without explicit binding"""
+    # Arrange
+    profiler = SamplingProfiler()
+    release = threading.Event()
+
+    def handle(scope):
+        release.wait(5)
+
+    thread = threading.Thread(target=handle, args=(make_scope("corr-2"),))
+    thread.start()
+    time.sleep(0.05)
+
+    # Act
+    profiler._sample()
+    release.set()
+    thread.join()
+
+    # Assert
+    assert profiler.folded(correlation_id="corr-2", by_stage=False).startswith("/api/v1/rates/{ticker};")
+
+
+def test_start_stops_after_duration():
+    """Tests that sampling stops by itself and keeps samples for download"""
+    # Arrange
+    profiler = SamplingProfiler()
+
+    # Act
+    profiler.start(interval=0.001, duration=0.05)
+    time.sleep(0.2)
+    status = profiler.status()
+
+    # Assert
+    assert not status["running"]
+    assert status["samples"] > 0
+    assert profiler.folded() != ""
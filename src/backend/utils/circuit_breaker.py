@@ -10,6 +10,7 @@ from typing import Callable, TypeVar, Any, Optional, Dict
 
 from ..utils.logging import setup_logger
 from ..core.exceptions import ExternalAPIException
+from .metrics import set_circuit_state
 
 # Set up logger
 logger = setup_logger('circuit_breaker')
@@ -122,6 +123,7 @@ def update_circuit_state(
                 circuit_state["success_count"] = 0
                 logger.info(f"Circuit for {service_name} transitioned from {old_state} to {HALF_OPEN} after {elapsed_time:.2f} seconds")
         
+        set_circuit_state(service_name, circuit_state["state"])
         return circuit_state["state"]
 
 def circuit_breaker(
@@ -248,6 +250,7 @@ def reset_circuit(service_name: str) -> None:
                 "open_time": 0
             }
             logger.info(f"Circuit for {service_name} manually reset from {old_state} to {CLOSED}")
+            set_circuit_state(service_name, CLOSED)
 
 def get_all_circuit_states() -> Dict[str, Dict[str, Any]]:
     """
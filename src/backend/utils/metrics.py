@@ -0,0 +1,349 @@
+"""
+In-service Prometheus metrics for the Borrow Rate & Locate Fee Pricing Engine.
+
+This module defines the service's latency histograms (per endpoint and per calculation
+stage), cache hit/miss counters, circuit breaker state gauges, external call
+concurrency and database pool saturation gauges, and renders them for the /metrics
+endpoint.
+
+Each worker process aggregates its own samples. When PROMETHEUS_MULTIPROC_DIR is set
+(as it is under gunicorn), prometheus_client keeps every worker's values in its own
+memory-mapped file, so workers never coordinate on the hot path, and the samples of all
+workers are merged only when /metrics is scraped. The directory is created on import if
+it does not exist. If prometheus_client is not installed, every recording function is
+a no-op.
+"""
+
+import contextlib
+import logging
+import os
+import time
+from typing import Any, Iterator, Optional, Tuple
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Environment variable selecting multiprocess (per-worker file) export
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def ensure_multiproc_dir() -> Optional[str]:
+    """
+    Create the multiprocess metrics directory named by PROMETHEUS_MULTIPROC_DIR.
+    
+    gunicorn.conf.py empties and creates the directory for gunicorn; this covers
+    uvicorn and tests, where prometheus_client would otherwise fail on the first
+    sample. It runs before prometheus_client is imported, because the client picks
+    its storage at import time. If the directory cannot be created, this process
+    falls back to single-process metrics.
+    
+    Returns:
+        Optional[str]: Directory in use, or None in single-process mode
+    """
+    multiproc_dir = os.environ.get(MULTIPROC_DIR_ENV)
+    if not multiproc_dir:
+        return None
+    
+    try:
+        os.makedirs(multiproc_dir, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Cannot create {MULTIPROC_DIR_ENV} {multiproc_dir}, using single-process metrics: {e}")
+        del os.environ[MULTIPROC_DIR_ENV]
+        return None
+    
+    return multiproc_dir
+
+
+ensure_multiproc_dir()
+
+try:
+    import prometheus_client  # prometheus-client 0.17.0+
+    from prometheus_client import multiprocess
+except ImportError:  # pragma: no cover - metrics are optional
+    prometheus_client = None
+    multiprocess = None
+
+# Latency buckets in seconds, dense around the 100ms response time target
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Numeric values reported for circuit breaker states
+CIRCUIT_STATE_VALUES = {"CLOSED": 0, "HALF_OPEN": 1, "OPEN": 2}
+
+# Route label for requests that matched no route, to bound label cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template",
+        ["method", "route", "status"],
+        buckets=LATENCY_BUCKETS
+    )
+    STAGE_LATENCY = prometheus_client.Histogram(
+        "calculation_stage_duration_seconds",
+        "Latency of calculation stages and @timed functions",
+        ["stage"],
+        buckets=LATENCY_BUCKETS
+    )
+    CACHE_REQUESTS = prometheus_client.Counter(
+        "cache_requests_total",
+        "Cache lookups by cache layer, key type and result",
+        ["cache", "key_type", "result"]
+    )
+    CACHED_FUNCTION_CALLS = prometheus_client.Counter(
+        "cached_function_calls_total",
+        "Calls of @cache_result functions by function and cache outcome",
+        ["function", "result"]
+    )
+    CIRCUIT_BREAKER_STATE = prometheus_client.Gauge(
+        "circuit_breaker_state",
+        "Circuit breaker state per service (0=closed, 1=half-open, 2=open)",
+        ["service"],
+        multiprocess_mode="livemax"
+    )
+    EXTERNAL_CALLS_IN_FLIGHT = prometheus_client.Gauge(
+        "external_calls_in_flight",
+        "External API calls currently in progress",
+        ["service"],
+        multiprocess_mode="livesum"
+    )
+    EXTERNAL_CALL_LATENCY = prometheus_client.Histogram(
+        "external_call_duration_seconds",
+        "External API call latency by service and outcome",
+        ["service", "outcome"],
+        buckets=LATENCY_BUCKETS
+    )
+    DB_POOL_CHECKED_OUT = prometheus_client.Gauge(
+        "db_pool_connections_checked_out",
+        "Database connections currently checked out of the pool",
+        ["engine"],
+        multiprocess_mode="livesum"
+    )
+    DB_POOL_CAPACITY = prometheus_client.Gauge(
+        "db_pool_connections_capacity",
+        "Maximum database connections per pool (pool_size + max_overflow)",
+        ["engine"],
+        multiprocess_mode="livesum"
+    )
+else:
+    REQUEST_LATENCY = STAGE_LATENCY = CACHE_REQUESTS = CACHED_FUNCTION_CALLS = CIRCUIT_BREAKER_STATE = None
+    EXTERNAL_CALLS_IN_FLIGHT = EXTERNAL_CALL_LATENCY = DB_POOL_CHECKED_OUT = DB_POOL_CAPACITY = None
+
+
+def metrics_available() -> bool:
+    """
+    Check whether prometheus_client is installed.
+    
+    Returns:
+        bool: True if metrics are recorded
+    """
+    return prometheus_client is not None
+
+
+def stage_timer(stage: str) -> Optional[Any]:
+    """
+    Get the bound stage histogram for a stage name.
+    
+    Binding the label once (e.g. at decoration time) keeps the per-call cost to a
+    single observe().
+    
+    Args:
+        stage: Calculation stage or function name
+    
+    Returns:
+        Optional[Any]: Histogram child with an observe(seconds) method, or None if metrics are unavailable
+    """
+    if STAGE_LATENCY is None:
+        return None
+    return STAGE_LATENCY.labels(stage)
+
+
+@contextlib.contextmanager
+def track_stage(stage: str) -> Iterator[None]:
+    """
+    Context manager observing the duration of a calculation stage.
+    
+    Args:
+        stage: Calculation stage name (e.g. 'cache_lookup', 'seclend', 'market', 'event', 'db', 'audit_write')
+    """
+    if STAGE_LATENCY is None:
+        yield
+        return
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_LATENCY.labels(stage).observe(time.perf_counter() - start_time)
+
+
+def observe_request(method: str, route: Optional[str], status_code: int, duration: float) -> None:
+    """
+    Record the latency of an HTTP request.
+    
+    Args:
+        method: HTTP method
+        route: Route template (e.g. '/api/v1/rates/{ticker}'), None if no route matched
+        status_code: Response status code
+        duration: Request duration in seconds
+    """
+    if REQUEST_LATENCY is not None:
+        REQUEST_LATENCY.labels(method, route or UNMATCHED_ROUTE, str(status_code)).observe(duration)
+
+
+def get_route_template(scope: dict) -> Optional[str]:
+    """
+    Get the route template matched for an ASGI request.
+    
+    Args:
+        scope: ASGI connection scope after routing
+    
+    Returns:
+        Optional[str]: Route path template, or None if no route matched
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None)
+
+
+def cache_key_type(key: str) -> str:
+    """
+    Derive the key type label from a cache key.
+    
+    Args:
+        key: Cache key such as 'borrow_rate:AAPL'
+    
+    Returns:
+        str: Key prefix before the first ':'
+    """
+    return key.split(":", 1)[0]
+
+
+def record_cache_access(cache: str, key: str, hit: bool) -> None:
+    """
+    Count a cache lookup.
+    
+    Args:
+        cache: Cache layer ('local' or 'redis')
+        key: Cache key looked up
+        hit: Whether the lookup returned a value
+    """
+    if CACHE_REQUESTS is not None:
+        CACHE_REQUESTS.labels(cache, cache_key_type(key), "hit" if hit else "miss").inc()
+
+
+def record_cached_call(function: str, result: str) -> None:
+    """
+    Count a call of a @cache_result function.
+    
+    Args:
+        function: Qualified function name
+        result: Cache outcome ('hit', 'local_hit', 'negative_hit', 'miss', 'shared' or 'uncacheable')
+    """
+    if CACHED_FUNCTION_CALLS is not None:
+        CACHED_FUNCTION_CALLS.labels(function, result).inc()
+
+
+def set_circuit_state(service: str, state: str) -> None:
+    """
+    Publish the state of a circuit breaker.
+    
+    Args:
+        service: Service protected by the circuit
+        state: Circuit state (CLOSED, HALF_OPEN or OPEN)
+    """
+    if CIRCUIT_BREAKER_STATE is not None:
+        CIRCUIT_BREAKER_STATE.labels(service).set(CIRCUIT_STATE_VALUES.get(state, 0))
+
+
+@contextlib.contextmanager
+def track_external_call(service: str) -> Iterator[None]:
+    """
+    Context manager tracking concurrency and latency of an external API call.
+    
+    Works around both blocking calls and awaited calls.
+    
+    Args:
+        service: External service name
+    """
+    if EXTERNAL_CALLS_IN_FLIGHT is None:
+        yield
+        return
+    in_flight = EXTERNAL_CALLS_IN_FLIGHT.labels(service)
+    in_flight.inc()
+    start_time = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        in_flight.dec()
+        EXTERNAL_CALL_LATENCY.labels(service, outcome).observe(time.perf_counter() - start_time)
+
+
+def instrument_engine(engine: Any, label: str, capacity: int) -> None:
+    """
+    Attach pool saturation and query latency metrics to an SQLAlchemy engine.
+    
+    Args:
+        engine: SQLAlchemy Engine (use AsyncEngine.sync_engine for async engines)
+        label: Engine name for the metric label (e.g. 'primary', 'replica-0')
+        capacity: Maximum connections of the pool (pool_size + max_overflow)
+    """
+    if prometheus_client is None:
+        return
+    
+    from sqlalchemy import event
+    
+    checked_out = DB_POOL_CHECKED_OUT.labels(label)
+    DB_POOL_CAPACITY.labels(label).set(capacity)
+    query_latency = STAGE_LATENCY.labels("db")
+    
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_out.inc()
+    
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+    
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start_time"] = time.perf_counter()
+    
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start_time = conn.info.pop("query_start_time", None)
+        if start_time is not None:
+            query_latency.observe(time.perf_counter() - start_time)
+
+
+def generate_metrics() -> Tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text exposition format.
+    
+    In multiprocess mode the per-worker files are merged, so any worker can answer
+    the scrape with values for the whole server.
+    
+    Returns:
+        Tuple[bytes, str]: Exposition payload and its content type
+    """
+    if prometheus_client is None:
+        return b"", "text/plain; charset=utf-8"
+    
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead(pid: int) -> None:
+    """
+    Drop the live gauges of an exited worker process (gunicorn child_exit hook).
+    
+    Args:
+        pid: Process ID of the exited worker
+    """
+    if multiprocess is not None and os.environ.get(MULTIPROC_DIR_ENV):
+        multiprocess.mark_process_dead(pid)
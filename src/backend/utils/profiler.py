@@ -0,0 +1,317 @@
+"""
+Opt-in statistical stack profiler for the Borrow Rate & Locate Fee Pricing Engine.
+
+A background thread samples the Python stacks of every thread in the worker process at
+a fixed interval and aggregates them as folded stacks (the input format of flamegraph.pl
+and speedscope). Each sample is attributed to the request it belongs to (route template
+and correlation ID) and to the innermost calculation stage on the stack:
+
+- Threads running a @timed function (calculations in the threadpool) are bound to the
+  request scope published by the tracing middleware for the duration of the call.
+- The event loop thread is attributed through the ASGI scope of the innermost frame on
+  its stack that received one.
+
+Nothing runs until the profiler is started; when stopped the only cost left on the hot
+path is one attribute check per @timed call. Profiles are per worker process.
+"""
+
+import contextvars
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Default sampling interval in seconds (100 Hz)
+DEFAULT_SAMPLE_INTERVAL = 0.01
+
+# Smallest accepted sampling interval in seconds
+MIN_SAMPLE_INTERVAL = 0.001
+
+# Sampling stops by itself after this many seconds unless stopped earlier
+DEFAULT_MAX_DURATION = 300
+
+# Upper bound on distinct (route, correlation ID, stage, stack) entries kept
+MAX_STACKS = 20000
+
+# Frames recorded per stack, counted from the outermost frame
+MAX_STACK_DEPTH = 128
+
+# Placeholder for samples without a request, correlation ID or stage
+UNTAGGED = "-"
+
+# ASGI scope of the request being handled in the current context
+request_scope_var: contextvars.ContextVar = contextvars.ContextVar('profiler_request_scope', default=None)
+
+# Code objects of @timed functions mapped to their stage names
+_stage_codes: Dict[CodeType, str] = {}
+
+
+def register_stage(func: Callable, stage: str) -> None:
+    """
+    Register a function as a calculation stage for sample attribution.
+    
+    Args:
+        func: Function whose frames mark the stage
+        stage: Stage name
+    """
+    code = getattr(func, '__code__', None)
+    if code is not None:
+        _stage_codes[code] = stage
+
+
+def bind_request_scope(scope: Dict[str, Any]) -> contextvars.Token:
+    """
+    Publish the ASGI scope of the current request to the profiler.
+    
+    Args:
+        scope: ASGI connection scope
+    
+    Returns:
+        contextvars.Token: Token for reset_request_scope
+    """
+    return request_scope_var.set(scope)
+
+
+def reset_request_scope(token: contextvars.Token) -> None:
+    """
+    Restore the request scope published before bind_request_scope.
+    
+    Args:
+        token: Token returned by bind_request_scope
+    """
+    request_scope_var.reset(token)
+
+
+def describe_scope(scope: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    """
+    Get the route and correlation ID of an ASGI scope.
+    
+    Args:
+        scope: ASGI connection scope, or None
+    
+    Returns:
+        Tuple[str, str]: Route template (or raw path before routing) and correlation ID
+    """
+    if not scope:
+        return UNTAGGED, UNTAGGED
+    route = getattr(scope.get("route"), "path", None) or scope.get("path") or UNTAGGED
+    state = scope.get("state") or {}
+    return route, state.get("correlation_id") or UNTAGGED
+
+
+class SamplingProfiler:
+    """
+    Thread-based sampling profiler aggregating folded stacks per request and stage.
+    """
+    
+    def __init__(self, max_stacks: int = MAX_STACKS):
+        """
+        Initialize the profiler in the stopped state.
+        
+        Args:
+            max_stacks: Maximum number of distinct aggregated entries
+        """
+        self.active = False
+        self.max_stacks = max_stacks
+        self.interval = DEFAULT_SAMPLE_INTERVAL
+        self.samples = 0
+        self.dropped = 0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        self._counts: Counter = Counter()
+        self._thread_scopes: Dict[int, Dict[str, Any]] = {}
+        self._frame_names: Dict[CodeType, str] = {}
+        self._scope_codes: Dict[CodeType, bool] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self, interval: float = DEFAULT_SAMPLE_INTERVAL, duration: float = DEFAULT_MAX_DURATION) -> Dict[str, Any]:
+        """
+        Discard previous samples and start sampling.
+        
+        Args:
+            interval: Seconds between samples
+            duration: Seconds after which sampling stops by itself
+        
+        Returns:
+            Dict[str, Any]: Profiler status
+        
+        Raises:
+            RuntimeError: If the profiler is already running
+        """
+        with self._lock:
+            if self.active:
+                raise RuntimeError("Profiler is already running")
+            self.interval = max(interval, MIN_SAMPLE_INTERVAL)
+            self._counts = Counter()
+            self.samples = 0
+            self.dropped = 0
+            self.started_at = time.time()
+            self.stopped_at = None
+            self._stop_event.clear()
+            self.active = True
+            self._thread = threading.Thread(
+                target=self._run, args=(time.monotonic() + duration,), name="sampling-profiler", daemon=True
+            )
+            self._thread.start()
+        
+        logger.info("Sampling profiler started (pid %s, interval %.1f ms, max %ss)",
+                    os.getpid(), self.interval * 1000, duration)
+        return self.status()
+    
+    def stop(self) -> Dict[str, Any]:
+        """
+        Stop sampling, keeping the collected samples for download.
+        
+        Returns:
+            Dict[str, Any]: Profiler status
+        """
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return self.status()
+    
+    def status(self) -> Dict[str, Any]:
+        """
+        Describe the profiler state.
+        
+        Returns:
+            Dict[str, Any]: Running flag, worker pid, interval, sample counts and timestamps
+        """
+        return {
+            "running": self.active,
+            "pid": os.getpid(),
+            "interval_ms": round(self.interval * 1000, 3),
+            "samples": self.samples,
+            "stacks": len(self._counts),
+            "dropped": self.dropped,
+            "started_at": self.started_at,
+            "stopped_at": self.stopped_at,
+        }
+    
+    def bind_thread(self) -> Optional[Dict[str, Any]]:
+        """
+        Attribute samples of the calling thread to the current request scope.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Previously bound scope, to pass to restore_thread
+        """
+        ident = threading.get_ident()
+        previous = self._thread_scopes.get(ident)
+        scope = request_scope_var.get()
+        if scope is not None:
+            self._thread_scopes[ident] = scope
+        return previous
+    
+    def restore_thread(self, previous: Optional[Dict[str, Any]]) -> None:
+        """
+        Restore the scope bound to the calling thread before bind_thread.
+        
+        Args:
+            previous: Value returned by bind_thread
+        """
+        ident = threading.get_ident()
+        if previous is None:
+            self._thread_scopes.pop(ident, None)
+        else:
+            self._thread_scopes[ident] = previous
+    
+    def folded(self, route: Optional[str] = None, correlation_id: Optional[str] = None,
+               by_stage: bool = True) -> str:
+        """
+        Export collected samples as folded stacks.
+        
+        Each line is 'route;[stage;]frame;...;leaf count', so flamegraphs split by
+        endpoint first and calculation stage second.
+        
+        Args:
+            route: Only include samples for this route template
+            correlation_id: Only include samples for this correlation ID
+            by_stage: Add the calculation stage as the second root frame
+        
+        Returns:
+            str: Folded stacks, one per line
+        """
+        with self._lock:
+            items = list(self._counts.items())
+        
+        merged: Counter = Counter()
+        for (sample_route, sample_correlation_id, stage, stack), count in items:
+            if route is not None and sample_route != route:
+                continue
+            if correlation_id is not None and sample_correlation_id != correlation_id:
+                continue
+            prefix = f"{sample_route};{stage}" if by_stage else sample_route
+            merged[f"{prefix};{stack}" if stack else prefix] += count
+        
+        return "".join(f"{stack} {count}\n" for stack, count in merged.most_common())
+    
+    def _run(self, deadline: float) -> None:
+        try:
+            while not self._stop_event.is_set() and time.monotonic() < deadline:
+                self._sample()
+                self._stop_event.wait(self.interval)
+        except Exception as e:
+            logger.error(f"Sampling profiler failed: {str(e)}")
+        finally:
+            self.active = False
+            self.stopped_at = time.time()
+            self._thread_scopes.clear()
+            logger.info("Sampling profiler stopped after %d samples", self.samples)
+    
+    def _sample(self) -> None:
+        own_ident = threading.get_ident()
+        entries = []
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            scope = self._thread_scopes.get(ident)
+            stage = None
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                if stage is None:
+                    stage = _stage_codes.get(code)
+                if scope is None and self._has_scope_argument(code):
+                    scope = frame.f_locals.get("scope")
+                names.append(self._frame_name(frame))
+                frame = frame.f_back
+            
+            sample_route, sample_correlation_id = describe_scope(scope if isinstance(scope, dict) else None)
+            stack = ";".join(reversed(names[-MAX_STACK_DEPTH:]))
+            entries.append((sample_route, sample_correlation_id, stage or UNTAGGED, stack))
+        
+        with self._lock:
+            for key in entries:
+                if key in self._counts or len(self._counts) < self.max_stacks:
+                    self._counts[key] += 1
+                else:
+                    self.dropped += 1
+            self.samples += 1
+    
+    def _frame_name(self, frame: Any) -> str:
+        code = frame.f_code
+        name = self._frame_names.get(code)
+        if name is None:
+            module = frame.f_globals.get("__name__", "?")
+            name = self._frame_names[code] = f"{module}.{code.co_qualname}"
+        return name
+    
+    def _has_scope_argument(self, code: CodeType) -> bool:
+        has_scope = self._scope_codes.get(code)
+        if has_scope is None:
+            has_scope = self._scope_codes[code] = "scope" in code.co_varnames[:code.co_argcount]
+        return has_scope
+
+
+# Shared profiler for this worker process
+profiler = SamplingProfiler()
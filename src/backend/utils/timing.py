@@ -15,6 +15,9 @@ from typing import Any, Callable, TypeVar, cast, Optional, Union
 import contextlib
 import signal
 
+from .metrics import stage_timer
+from .profiler import profiler, register_stage
+
 # Type variables for decorator typing
 F = TypeVar('F', bound=Callable[..., Any])
 AsyncF = TypeVar('AsyncF', bound=Callable[..., Any])
@@ -36,54 +39,89 @@ def get_current_time_ms() -> float:
     return time.time() * 1000
 
 
-def timed(logger: Optional[logging.Logger] = None) -> Callable[[F], F]:
+def timed(logger: Optional[Union[logging.Logger, Callable]] = None, stage: Optional[str] = None) -> Any:
     """
     Decorator that measures and logs the execution time of a function.
     
+    The elapsed time is also observed in the calculation stage latency histogram,
+    labelled with the stage name or, if not given, the function name. The decorator
+    can be applied bare (@timed) or called (@timed(), @timed(stage='seclend')).
+    
     Args:
         logger: Logger to use for logging. If None, uses module logger.
+        stage: Stage label for the latency histogram. If None, uses the function name.
         
     Returns:
-        Callable: Decorated function
+        Callable: Decorated function, or a decorator when called with arguments
     """
+    if callable(logger) and not isinstance(logger, logging.Logger):
+        # Applied bare as @timed
+        return timed()(logger)
+    
     if logger is None:
         logger = logging.getLogger(__name__)
         
     def decorator(func: F) -> F:
+        stage_name = stage or func.__name__
+        stage_metric = stage_timer(stage_name)
+        register_stage(func, stage_name)
+        
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Attribute profiler samples of this thread to the current request
+            bound_scope = profiler.bind_thread() if profiler.active else None
             start_time = time.perf_counter()
-            result = func(*args, **kwargs)
-            end_time = time.perf_counter()
-            elapsed_time = (end_time - start_time) * 1000  # Convert to ms
-            logger.debug(f"{func.__name__} executed in {elapsed_time:.2f} ms")
-            return result
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start_time
+                if profiler.active:
+                    profiler.restore_thread(bound_scope)
+                if stage_metric is not None:
+                    stage_metric.observe(elapsed)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s executed in %.2f ms", func.__name__, elapsed * 1000)
         return cast(F, wrapper)
     return decorator
 
 
-def async_timed(logger: Optional[logging.Logger] = None) -> Callable[[AsyncF], AsyncF]:
+def async_timed(logger: Optional[Union[logging.Logger, Callable]] = None, stage: Optional[str] = None) -> Any:
     """
     Decorator that measures and logs the execution time of an async function.
     
+    The elapsed time is also observed in the calculation stage latency histogram,
+    labelled with the stage name or, if not given, the function name.
+    
     Args:
         logger: Logger to use for logging. If None, uses module logger.
+        stage: Stage label for the latency histogram. If None, uses the function name.
         
     Returns:
-        Callable: Decorated async function
+        Callable: Decorated async function, or a decorator when called with arguments
     """
+    if callable(logger) and not isinstance(logger, logging.Logger):
+        # Applied bare as @async_timed
+        return async_timed()(logger)
+    
     if logger is None:
         logger = logging.getLogger(__name__)
         
     def decorator(func: AsyncF) -> AsyncF:
+        stage_name = stage or func.__name__
+        stage_metric = stage_timer(stage_name)
+        register_stage(func, stage_name)
+        
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             start_time = time.perf_counter()
-            result = await func(*args, **kwargs)
-            end_time = time.perf_counter()
-            elapsed_time = (end_time - start_time) * 1000  # Convert to ms
-            logger.debug(f"{func.__name__} executed in {elapsed_time:.2f} ms")
-            return result
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start_time
+                if stage_metric is not None:
+                    stage_metric.observe(elapsed)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s executed in %.2f ms", func.__name__, elapsed * 1000)
         return cast(AsyncF, wrapper)
     return decorator
 
@@ -22,6 +22,7 @@ import yaml
 from test.metrics.visualizers.generate_charts import ChartGenerator
 from test.metrics.exporters.csv import CSVExporter
 from test.metrics.exporters.json import JSONExporter
+from test.load_testing.streaming_analysis import StreamingAggregator, DEFAULT_BUCKET_SECONDS
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -345,38 +346,7 @@ def process_metrics(test_results):
     
     # Extract calculation metrics if available
     # This might be in custom files or derived from API metrics for calculate-locate endpoint
-    calculation_metrics = {}
-    
-    # Check if we have the calculate-locate endpoint in the API metrics
-    if 'api_metrics' in metrics and 'endpoints' in metrics['api_metrics']:
-        for endpoint, data in metrics['api_metrics']['endpoints'].items():
-            if 'calculate-locate' in endpoint:
-                # Extract calculation metrics from this endpoint
-                calculation_metrics = {
-                    'total_calculations': data.get('requests', 0),
-                    'failed_calculations': data.get('failures', 0),
-                    'error_rate': data.get('error_rate', 0),
-                    'calculation_time': {
-                        'median': data.get('median_response_time', 0),
-                        'average': data.get('avg_response_time', 0),
-                        'min': data.get('min_response_time', 0),
-                        'max': data.get('max_response_time', 0)
-                    }
-                }
-                
-                # Add percentiles if available
-                percentiles = {}
-                for key, value in data.items():
-                    if key.startswith('p') and key[1:].isdigit():
-                        percentiles[key] = value
-                
-                if percentiles:
-                    calculation_metrics['calculation_time']['percentiles'] = percentiles
-                
-                break
-    
-    # Add calculation metrics
-    metrics['calculation_metrics'] = calculation_metrics
+    metrics['calculation_metrics'] = derive_calculation_metrics(metrics['api_metrics'])
     
     # Process resource metrics if available in custom files
     resource_metrics = {}
@@ -429,6 +399,48 @@ def process_metrics(test_results):
     return metrics
 
 
+def derive_calculation_metrics(api_metrics):
+    """
+    Derive calculation metrics from the calculate-locate endpoint's API metrics
+
+    Args:
+        api_metrics (dict): API metrics as built by process_metrics
+
+    Returns:
+        dict: Calculation metrics, empty if the endpoint was not exercised
+    """
+    calculation_metrics = {}
+    
+    # Check if we have the calculate-locate endpoint in the API metrics
+    for endpoint, data in (api_metrics or {}).get('endpoints', {}).items():
+        if 'calculate-locate' in endpoint:
+            # Extract calculation metrics from this endpoint
+            calculation_metrics = {
+                'total_calculations': data.get('requests', 0),
+                'failed_calculations': data.get('failures', 0),
+                'error_rate': data.get('error_rate', 0),
+                'calculation_time': {
+                    'median': data.get('median_response_time', 0),
+                    'average': data.get('avg_response_time', 0),
+                    'min': data.get('min_response_time', 0),
+                    'max': data.get('max_response_time', 0)
+                }
+            }
+            
+            # Add percentiles if available
+            percentiles = {}
+            for key, value in data.items():
+                if key.startswith('p') and key[1:].isdigit():
+                    percentiles[key] = value
+            
+            if percentiles:
+                calculation_metrics['calculation_time']['percentiles'] = percentiles
+            
+            break
+    
+    return calculation_metrics
+
+
 def compare_with_thresholds(metrics, thresholds):
     """
     Compare metrics with defined performance thresholds
@@ -1642,7 +1654,27 @@ def parse_arguments():
     parser.add_argument(
         '--results-dir',
         required=True,
-        help='Directory containing the load test results to analyze'
+        nargs='+',
+        help='Directory containing the load test results to analyze; in streaming mode, '
+             'several directories (one per Locust worker) or saved *.sketch.json files are merged'
+    )
+    
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Analyze results incrementally with mergeable sketches in bounded memory'
+    )
+    
+    parser.add_argument(
+        '--bucket-seconds',
+        type=int,
+        default=DEFAULT_BUCKET_SECONDS,
+        help=f'Time bucket width for streaming time series (default: {DEFAULT_BUCKET_SECONDS})'
+    )
+    
+    parser.add_argument(
+        '--save-sketch',
+        help='In streaming mode, save the merged aggregates to this *.sketch.json file'
     )
     
     parser.add_argument(
@@ -1845,6 +1877,40 @@ class ResultAnalyzer:
         return chart_generator.visualize(self.metrics, vis_dir)
 
 
+class StreamingResultAnalyzer(ResultAnalyzer):
+    """
+    Result analyzer that streams result files into mergeable sketches instead of loading them
+    """
+    
+    def __init__(self, config, bucket_seconds=DEFAULT_BUCKET_SECONDS):
+        """
+        Initialize the streaming result analyzer
+
+        Args:
+            config (dict): Configuration dictionary
+            bucket_seconds (int): Width of the time buckets in seconds
+        """
+        super().__init__(config)
+        self.aggregator = StreamingAggregator(bucket_seconds)
+    
+    def process_metrics(self, test_results):
+        """
+        Stream result sources into the aggregator and build metrics from the sketches
+
+        Args:
+            test_results (list): Results directories or saved *.sketch.json files, merged in order
+
+        Returns:
+            dict: Processed metrics dictionary in the format of process_metrics()
+        """
+        for source in test_results:
+            self.aggregator.ingest(source)
+        
+        self.metrics = self.aggregator.to_metrics()
+        self.metrics['calculation_metrics'] = derive_calculation_metrics(self.metrics['api_metrics'])
+        return self.metrics
+
+
 def main():
     """
     Main function to orchestrate the analysis process
@@ -1868,21 +1934,40 @@ def main():
             logger.error("Failed to load configuration. Exiting.")
             return 1
         
-        # Load test results
-        test_results = load_test_results(args.results_dir)
-        if not test_results or (not test_results.get('stats') and not test_results.get('stats_json')):
-            logger.error("Failed to load test results. Exiting.")
-            return 1
+        if args.streaming:
+            # Stream every results directory into mergeable sketches
+            analyzer = StreamingResultAnalyzer(config, args.bucket_seconds)
+            results = analyzer.analyze(
+                args.results_dir,
+                args.output_dir,
+                args.previous_results
+            )
+            if not results['metrics']['api_metrics']:
+                logger.error("No streamable test results found. Exiting.")
+                return 1
+            if args.save_sketch:
+                analyzer.aggregator.save(args.save_sketch)
         
-        # Create result analyzer
-        analyzer = ResultAnalyzer(config)
-        
-        # Analyze results
-        results = analyzer.analyze(
-            test_results,
-            args.output_dir,
-            args.previous_results
-        )
+        else:
+            if len(args.results_dir) > 1:
+                logger.error("Multiple results directories require --streaming. Exiting.")
+                return 1
+            
+            # Load test results
+            test_results = load_test_results(args.results_dir[0])
+            if not test_results or (not test_results.get('stats') and not test_results.get('stats_json')):
+                logger.error("Failed to load test results. Exiting.")
+                return 1
+            
+            # Create result analyzer
+            analyzer = ResultAnalyzer(config)
+            
+            # Analyze results
+            results = analyzer.analyze(
+                test_results,
+                args.output_dir,
+                args.previous_results
+            )
         
         logger.info(f"Analysis completed successfully. Report generated at {results.get('summary_report', 'unknown')}")
         
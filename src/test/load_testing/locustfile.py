@@ -1,8 +1,12 @@
 import os
+import csv
 import json
 import logging
+import socket
+import time
 import yaml
-from locust import HttpUser, between
+from locust import HttpUser, between, events
+from locust.runners import MasterRunner
 
 # Import the specific scenario classes
 from scenarios.borrow_rate_scenario import BorrowRateScenario
@@ -12,6 +16,12 @@ from scenarios.mixed_workload_scenario import MixedWorkloadScenario
 # Default config file location, can be overridden via environment variable
 CONFIG_FILE = os.getenv('LOAD_TEST_CONFIG', 'config.yaml')
 
+# Directory for per-request logs used by streaming analysis (disabled when unset)
+REQUEST_LOG_DIR = os.getenv('LOAD_TEST_REQUEST_LOG_DIR')
+
+# Rows buffered before each per-request log write
+REQUEST_LOG_FLUSH_ROWS = 1000
+
 def load_config(config_file):
     """
     Loads test configuration from the specified YAML file
@@ -120,4 +130,43 @@ class MixedWorkloadUser(LoadTestUser):
         """Initializes the mixed workload user"""
         super().__init__(environment)
         # Set user weight based on configuration
-        self.weight = self.config.get("scenarios", {}).get("mixed_workload", {}).get("weight", 5)
\ No newline at end of file
+        self.weight = self.config.get("scenarios", {}).get("mixed_workload", {}).get("weight", 5)
+
+class RequestLogWriter:
+    """Appends one CSV row per request for streaming analysis (analyze_results.py --streaming)"""
+    
+    def __init__(self, log_dir):
+        """Opens a per-process log file so distributed workers never share a file"""
+        os.makedirs(log_dir, exist_ok=True)
+        path = os.path.join(log_dir, f"requests_{socket.gethostname()}_{os.getpid()}.csv")
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(['timestamp', 'method', 'name', 'response_time', 'success'])
+        self.rows = []
+    
+    def on_request(self, request_type, name, response_time, response_length, exception=None, start_time=None, **kwargs):
+        """Buffers a request row, writing the buffer in batches"""
+        self.rows.append((
+            round(start_time or time.time(), 3), request_type, name, round(response_time, 3), 0 if exception else 1
+        ))
+        if len(self.rows) >= REQUEST_LOG_FLUSH_ROWS:
+            self.flush()
+    
+    def flush(self):
+        """Writes buffered rows to the log file"""
+        self.writer.writerows(self.rows)
+        self.rows = []
+        self.file.flush()
+    
+    def close(self, **kwargs):
+        """Writes remaining rows and closes the log file"""
+        self.flush()
+        self.file.close()
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    """Enables per-request logging on workers and standalone runs when LOAD_TEST_REQUEST_LOG_DIR is set"""
+    if REQUEST_LOG_DIR and not isinstance(environment.runner, MasterRunner):
+        request_log = RequestLogWriter(REQUEST_LOG_DIR)
+        environment.events.request.add_listener(request_log.on_request)
+        environment.events.quitting.add_listener(request_log.close)
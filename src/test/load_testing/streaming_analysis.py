@@ -0,0 +1,573 @@
+"""
+Streaming, bounded-memory analysis of load test results for the Borrow Rate & Locate Fee Pricing Engine
+
+Result files are read incrementally and folded into mergeable quantile sketches per
+endpoint and per time bucket, so multi-hour soak tests are analyzed without loading
+every sample into memory. Aggregates built from different result directories (one per
+distributed Locust worker) or saved with save() merge exactly, and to_metrics() returns
+the same structure as process_metrics() in analyze_results.py.
+
+Supported inputs in a results directory:
+- requests*.csv: per-request logs written by locustfile.py when LOAD_TEST_REQUEST_LOG_DIR is set
+- results.json: Locust --json output (per-endpoint response time histograms and per-second counts)
+- *resource*.csv: resource utilization samples (timestamp plus utilization columns)
+- *.sketch.json: aggregates saved by an earlier streaming analysis
+"""
+
+import csv
+import json
+import logging
+import math
+from datetime import datetime
+from pathlib import Path
+
+from test.metrics.sketches import QuantileSketch
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Width of the time buckets used for time series, in seconds
+DEFAULT_BUCKET_SECONDS = 60
+
+# Name under which all endpoints are aggregated, as in Locust's own stats
+AGGREGATED = 'Aggregated'
+
+# Percentiles reported for endpoints and the aggregate
+REPORTED_PERCENTILES = (50, 90, 95, 99)
+
+# Resource utilization columns recognized in resource files
+RESOURCE_COLUMNS = {
+    'cpu_utilization': ('cpu', 'utilization'),
+    'memory_utilization': ('memory', 'utilization'),
+    'network_throughput': ('network', 'throughput'),
+}
+
+# Version of the saved aggregate layout
+SKETCH_FORMAT_VERSION = 1
+
+
+class RequestAggregate:
+    """
+    Request counts, failures and a latency sketch for one endpoint (or time bucket).
+    """
+    
+    def __init__(self):
+        """Initialize an empty aggregate."""
+        self.requests = 0
+        self.failures = 0
+        self.response_times = QuantileSketch()
+    
+    def add(self, response_time, success=True, count=1):
+        """
+        Record requests.
+        
+        Args:
+            response_time (float): Response time in milliseconds
+            success (bool): Whether the requests succeeded
+            count (int): Number of requests with this response time
+        """
+        self.requests += count
+        if not success:
+            self.failures += count
+        self.response_times.add(response_time, count)
+    
+    def merge(self, other):
+        """
+        Add another aggregate to this one.
+        
+        Args:
+            other (RequestAggregate): Aggregate to merge
+        
+        Returns:
+            RequestAggregate: This aggregate
+        """
+        self.requests += other.requests
+        self.failures += other.failures
+        self.response_times.merge(other.response_times)
+        return self
+    
+    def summary(self):
+        """
+        Summarize the aggregate in the endpoint format of process_metrics().
+        
+        Returns:
+            dict: Counts, error rate and response time statistics in milliseconds
+        """
+        sketch = self.response_times
+        summary = {
+            'requests': self.requests,
+            'failures': self.failures,
+            'median_response_time': sketch.percentile(50) or 0,
+            'avg_response_time': sketch.mean or 0,
+            'min_response_time': sketch.min if sketch.count else 0,
+            'max_response_time': sketch.max if sketch.count else 0,
+            'error_rate': (self.failures / self.requests * 100) if self.requests > 0 else 0
+        }
+        for percentile in REPORTED_PERCENTILES:
+            summary[f'p{percentile}'] = sketch.percentile(percentile) or 0
+        return summary
+    
+    def to_dict(self):
+        """Serialize the aggregate."""
+        return {'requests': self.requests, 'failures': self.failures, 'response_times': self.response_times.to_dict()}
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild an aggregate serialized with to_dict."""
+        aggregate = cls()
+        aggregate.requests = data['requests']
+        aggregate.failures = data['failures']
+        aggregate.response_times = QuantileSketch.from_dict(data['response_times'])
+        return aggregate
+
+
+class ResourceAggregate:
+    """
+    Running statistics and per-bucket means for one resource utilization metric.
+    """
+    
+    def __init__(self):
+        """Initialize an empty aggregate."""
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.buckets = {}
+    
+    def add(self, value, bucket):
+        """
+        Record a sample.
+        
+        Args:
+            value (float): Sample value
+            bucket (int): Start of the sample's time bucket (epoch seconds), or None
+        """
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if bucket is not None:
+            bucket_count, bucket_sum = self.buckets.get(bucket, (0, 0.0))
+            self.buckets[bucket] = (bucket_count + 1, bucket_sum + value)
+    
+    def merge(self, other):
+        """
+        Add another aggregate to this one.
+        
+        Args:
+            other (ResourceAggregate): Aggregate to merge
+        
+        Returns:
+            ResourceAggregate: This aggregate
+        """
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for bucket, (count, total) in other.buckets.items():
+            bucket_count, bucket_sum = self.buckets.get(bucket, (0, 0.0))
+            self.buckets[bucket] = (bucket_count + count, bucket_sum + total)
+        return self
+    
+    def summary(self, column):
+        """
+        Summarize the metric in the resource format of process_metrics().
+        
+        Args:
+            column (str): Source column name used for the time series values
+        
+        Returns:
+            dict: Mean, max, min and a per-bucket time series
+        """
+        return {
+            'mean': self.sum / self.count if self.count else 0,
+            'max': self.max if self.count else 0,
+            'min': self.min if self.count else 0,
+            'time_series': [
+                {'timestamp': bucket, column: total / count}
+                for bucket, (count, total) in sorted(self.buckets.items())
+            ]
+        }
+    
+    def to_dict(self):
+        """Serialize the aggregate."""
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'buckets': {str(bucket): list(values) for bucket, values in self.buckets.items()}
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild an aggregate serialized with to_dict."""
+        aggregate = cls()
+        aggregate.count = data['count']
+        aggregate.sum = data['sum']
+        if aggregate.count:
+            aggregate.min = data['min']
+            aggregate.max = data['max']
+        aggregate.buckets = {int(bucket): tuple(values) for bucket, values in data['buckets'].items()}
+        return aggregate
+
+
+class StreamingAggregator:
+    """
+    Incrementally aggregates load test results in bounded memory.
+    
+    Memory grows with the number of endpoints and time buckets, never with the number
+    of requests.
+    """
+    
+    def __init__(self, bucket_seconds=DEFAULT_BUCKET_SECONDS):
+        """
+        Initialize an empty aggregator.
+        
+        Args:
+            bucket_seconds (int): Width of the time buckets in seconds
+        """
+        self.bucket_seconds = bucket_seconds
+        self.endpoints = {}
+        self.buckets = {}
+        self.resources = {}
+        self.sources = []
+    
+    def bucket_for(self, timestamp):
+        """
+        Get the start of the time bucket containing a timestamp.
+        
+        Args:
+            timestamp (float): Epoch seconds, or None
+        
+        Returns:
+            int: Bucket start in epoch seconds, or None if the timestamp is unknown
+        """
+        if timestamp is None:
+            return None
+        return int(timestamp // self.bucket_seconds * self.bucket_seconds)
+    
+    def add_request(self, name, response_time, success=True, timestamp=None, count=1):
+        """
+        Record requests for an endpoint.
+        
+        Args:
+            name (str): Endpoint name as reported by Locust
+            response_time (float): Response time in milliseconds
+            success (bool): Whether the requests succeeded
+            timestamp (float): Epoch seconds when the requests were sent, if known
+            count (int): Number of requests with this response time
+        """
+        self.endpoints.setdefault(name, RequestAggregate()).add(response_time, success, count)
+        bucket = self.bucket_for(timestamp)
+        if bucket is not None:
+            self.buckets.setdefault(bucket, RequestAggregate()).add(response_time, success, count)
+    
+    def add_resource_sample(self, column, value, timestamp=None):
+        """
+        Record a resource utilization sample.
+        
+        Args:
+            column (str): Resource column name (e.g. 'cpu_utilization')
+            value (float): Sample value
+            timestamp (float): Epoch seconds of the sample, if known
+        """
+        self.resources.setdefault(column, ResourceAggregate()).add(value, self.bucket_for(timestamp))
+    
+    def ingest_request_log(self, path):
+        """
+        Stream a per-request log (timestamp, method, name, response_time, success).
+        
+        Args:
+            path (str): Path to the CSV file
+        
+        Returns:
+            int: Number of requests read
+        """
+        rows = 0
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                try:
+                    self.add_request(
+                        row['name'],
+                        float(row['response_time']),
+                        row.get('success', '1') in ('1', 'True', 'true'),
+                        float(row['timestamp']) if row.get('timestamp') else None
+                    )
+                    rows += 1
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.debug(f"Skipping malformed row in {path}: {e}")
+        logger.info(f"Streamed {rows} requests from {path}")
+        return rows
+    
+    def ingest_locust_json(self, path):
+        """
+        Read Locust --json output, merging its per-endpoint response time histograms.
+        
+        Failures are attributed to the response time distribution in proportion, since
+        Locust does not record failure latencies separately. Per-second request counts
+        are folded into the time buckets.
+        
+        Args:
+            path (str): Path to the JSON file
+        
+        Returns:
+            int: Number of requests read
+        """
+        with open(path) as f:
+            data = json.load(f)
+        
+        stats = data.get('stats', []) if isinstance(data, dict) else data
+        total = 0
+        for stat in stats:
+            name = stat.get('name')
+            if not name or name == AGGREGATED:
+                continue
+            
+            aggregate = self.endpoints.setdefault(name, RequestAggregate())
+            for response_time, count in (stat.get('response_times') or {}).items():
+                aggregate.response_times.add(float(response_time), count)
+            aggregate.requests += stat.get('num_requests', 0)
+            aggregate.failures += stat.get('num_failures', 0)
+            total += stat.get('num_requests', 0)
+            
+            failures_per_sec = stat.get('num_fail_per_sec') or {}
+            for second, count in (stat.get('num_reqs_per_sec') or {}).items():
+                bucket = self.buckets.setdefault(self.bucket_for(float(second)), RequestAggregate())
+                bucket.requests += count
+                bucket.failures += failures_per_sec.get(second, 0)
+        
+        logger.info(f"Merged {total} requests from {path}")
+        return total
+    
+    def ingest_resource_csv(self, path):
+        """
+        Stream resource utilization samples.
+        
+        Args:
+            path (str): Path to the CSV file
+        
+        Returns:
+            int: Number of rows read
+        """
+        rows = 0
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                timestamp = parse_timestamp(row.get('timestamp'))
+                for column in RESOURCE_COLUMNS:
+                    if row.get(column) not in (None, ''):
+                        try:
+                            self.add_resource_sample(column, float(row[column]), timestamp)
+                        except ValueError:
+                            continue
+                rows += 1
+        logger.info(f"Streamed {rows} resource samples from {path}")
+        return rows
+    
+    def ingest(self, source):
+        """
+        Ingest a results directory or a saved aggregate file.
+        
+        Args:
+            source (str): Results directory (one per Locust worker) or *.sketch.json file
+        
+        Returns:
+            int: Number of files read
+        """
+        path = Path(source)
+        if path.is_file():
+            self.merge(StreamingAggregator.load(str(path)))
+            return 1
+        if not path.is_dir():
+            logger.error(f"Results source not found: {source}")
+            return 0
+        
+        files = 0
+        request_logs = sorted(path.glob('requests*.csv'))
+        for file in request_logs:
+            self.ingest_request_log(str(file))
+            files += 1
+        
+        # Locust's JSON summary duplicates the per-request logs when both exist
+        json_file = path / 'results.json'
+        if json_file.exists() and not request_logs:
+            self.ingest_locust_json(str(json_file))
+            files += 1
+        
+        for file in sorted(path.glob('*resource*.csv')):
+            self.ingest_resource_csv(str(file))
+            files += 1
+        
+        for file in sorted(path.glob('*.sketch.json')):
+            self.merge(StreamingAggregator.load(str(file)))
+            files += 1
+        
+        if files:
+            self.sources.append(str(path))
+        else:
+            logger.warning(f"No streamable results found in {source}")
+        return files
+    
+    def merge(self, other):
+        """
+        Add another aggregator's contents to this one.
+        
+        Args:
+            other (StreamingAggregator): Aggregator with the same bucket width
+        
+        Returns:
+            StreamingAggregator: This aggregator
+        
+        Raises:
+            ValueError: If the bucket widths differ
+        """
+        if other.bucket_seconds != self.bucket_seconds:
+            raise ValueError("Cannot merge aggregates with different bucket widths")
+        for name, aggregate in other.endpoints.items():
+            self.endpoints.setdefault(name, RequestAggregate()).merge(aggregate)
+        for bucket, aggregate in other.buckets.items():
+            self.buckets.setdefault(bucket, RequestAggregate()).merge(aggregate)
+        for column, aggregate in other.resources.items():
+            self.resources.setdefault(column, ResourceAggregate()).merge(aggregate)
+        self.sources.extend(other.sources)
+        return self
+    
+    def to_metrics(self):
+        """
+        Build the metrics structure produced by process_metrics() in analyze_results.py.
+        
+        The request rate is reported per time bucket rather than per second.
+        
+        Returns:
+            dict: Dictionary containing api_metrics and resource_metrics
+        """
+        metrics = {
+            'api_metrics': {},
+            'calculation_metrics': {},
+            'resource_metrics': {}
+        }
+        
+        if self.endpoints:
+            overall = RequestAggregate()
+            endpoints = {}
+            for name in sorted(self.endpoints):
+                overall.merge(self.endpoints[name])
+                endpoints[name] = self.endpoints[name].summary()
+            
+            summary = overall.summary()
+            time_series = []
+            request_rate = []
+            for bucket in sorted(self.buckets):
+                aggregate = self.buckets[bucket]
+                request_rate.append({
+                    'timestamp': bucket,
+                    'requests_per_second': aggregate.requests / self.bucket_seconds
+                })
+                entry = {'timestamp': bucket, 'requests': aggregate.requests, 'failures': aggregate.failures}
+                if aggregate.response_times.count:
+                    for percentile in REPORTED_PERCENTILES:
+                        entry[f'p{percentile}'] = aggregate.response_times.percentile(percentile)
+                time_series.append(entry)
+            
+            metrics['api_metrics'] = {
+                'total_requests': summary['requests'],
+                'total_failures': summary['failures'],
+                'error_rate': summary['error_rate'],
+                'response_time': {
+                    'median': summary['median_response_time'],
+                    'average': summary['avg_response_time'],
+                    'min': summary['min_response_time'],
+                    'max': summary['max_response_time'],
+                    'percentiles': {f'p{p}': summary[f'p{p}'] for p in REPORTED_PERCENTILES}
+                },
+                'endpoints': endpoints,
+                'request_rate': request_rate,
+                'time_series': time_series
+            }
+        
+        for column, aggregate in self.resources.items():
+            resource, kind = RESOURCE_COLUMNS[column]
+            metrics['resource_metrics'][resource] = {kind: aggregate.summary(column)}
+        
+        return metrics
+    
+    def to_dict(self):
+        """Serialize the aggregator."""
+        return {
+            'version': SKETCH_FORMAT_VERSION,
+            'bucket_seconds': self.bucket_seconds,
+            'sources': self.sources,
+            'endpoints': {name: aggregate.to_dict() for name, aggregate in self.endpoints.items()},
+            'buckets': {str(bucket): aggregate.to_dict() for bucket, aggregate in self.buckets.items()},
+            'resources': {column: aggregate.to_dict() for column, aggregate in self.resources.items()}
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild an aggregator serialized with to_dict.
+        
+        Args:
+            data (dict): Serialized aggregator
+        
+        Returns:
+            StreamingAggregator: Aggregator with the stored contents
+        
+        Raises:
+            ValueError: If the data has an unsupported format version
+        """
+        if data.get('version') != SKETCH_FORMAT_VERSION:
+            raise ValueError(f"Unsupported sketch format version: {data.get('version')}")
+        aggregator = cls(data['bucket_seconds'])
+        aggregator.sources = list(data.get('sources', []))
+        aggregator.endpoints = {name: RequestAggregate.from_dict(d) for name, d in data['endpoints'].items()}
+        aggregator.buckets = {int(bucket): RequestAggregate.from_dict(d) for bucket, d in data['buckets'].items()}
+        aggregator.resources = {column: ResourceAggregate.from_dict(d) for column, d in data['resources'].items()}
+        return aggregator
+    
+    def save(self, path):
+        """
+        Save the aggregates for merging in a later analysis.
+        
+        Args:
+            path (str): Output file path (conventionally *.sketch.json)
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+        logger.info(f"Saved streaming aggregates to {path}")
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Load aggregates saved with save().
+        
+        Args:
+            path (str): Aggregate file path
+        
+        Returns:
+            StreamingAggregator: Loaded aggregator
+        """
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def parse_timestamp(value):
+    """
+    Parse a timestamp given as epoch seconds or an ISO 8601 string.
+    
+    Args:
+        value (str): Timestamp value
+    
+    Returns:
+        float: Epoch seconds, or None if the value is empty or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
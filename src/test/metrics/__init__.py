@@ -33,6 +33,9 @@ from .visualizers import (
     DashboardGenerator
 )
 
+# Import mergeable quantile sketches
+from .sketches import QuantileSketch, WindowedSketch, as_sketch, sketch_statistics
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
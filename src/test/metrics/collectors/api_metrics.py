@@ -5,6 +5,15 @@ from collections import defaultdict
 from abc import ABC, abstractmethod
 import threading
 
+from ..sketches import (
+    DEFAULT_RELATIVE_ACCURACY,
+    DEFAULT_WINDOW_SECONDS,
+    DEFAULT_WINDOW_SLOTS,
+    WindowedSketch,
+    as_sketch,
+    sketch_statistics,
+)
+
 logger = logging.getLogger(__name__)
 
 class BaseMetricsCollector(ABC):
@@ -82,6 +91,63 @@ class BaseMetricsCollector(ABC):
         """
         return self.name
 
+    def create_sketch(self):
+        """Create an empty windowed sketch using the collector's configuration.
+        
+        The window length, slot count and relative accuracy are read from the
+        'window_seconds', 'window_slots' and 'relative_accuracy' configuration keys.
+        
+        Returns:
+            WindowedSketch: Empty sketch
+        """
+        return WindowedSketch(
+            window_seconds=self.config.get('window_seconds', DEFAULT_WINDOW_SECONDS),
+            slots=self.config.get('window_slots', DEFAULT_WINDOW_SLOTS),
+            relative_accuracy=self.config.get('relative_accuracy', DEFAULT_RELATIVE_ACCURACY)
+        )
+    
+    def select_sketch(self, sketch, window_seconds=None):
+        """Get the values of a windowed sketch to report.
+        
+        Args:
+            sketch (WindowedSketch): Recorded values
+            window_seconds (float, optional): Only report the most recent seconds. Defaults to None (all values).
+        
+        Returns:
+            QuantileSketch: Sketch of the values to report
+        """
+        return sketch.total if window_seconds is None else sketch.window(window_seconds)
+    
+    def merge_sketches(self, target, source):
+        """Merge a dictionary of windowed sketches into another, key by key.
+        
+        Args:
+            target (defaultdict): Sketches of this collector, creating missing keys
+            source (dict): Windowed sketches or their serialized form
+        
+        Returns:
+            None
+        """
+        for key, sketch in source.items():
+            if isinstance(sketch, dict):
+                sketch = WindowedSketch.from_dict(sketch)
+            target[key].merge(sketch)
+    
+    def merge_period(self, start_time, end_time):
+        """Widen the collection period to cover another collector's period.
+        
+        Args:
+            start_time (float): Start time of the other collection period
+            end_time (float): End time of the other collection period
+        
+        Returns:
+            None
+        """
+        if start_time is not None:
+            self._start_time = start_time if self._start_time is None else min(self._start_time, start_time)
+        if end_time is not None:
+            self._end_time = end_time if self._end_time is None else max(self._end_time, end_time)
+
 
 class APIMetricsCollector(BaseMetricsCollector):
     """Collects and analyzes API performance metrics such as request rates, response times, and error rates."""
@@ -93,7 +159,7 @@ class APIMetricsCollector(BaseMetricsCollector):
             config (dict, optional): Configuration dictionary. Defaults to None.
         """
         super().__init__(name="api_metrics", config=config or {})
-        self._response_times = defaultdict(list)  # Store response times by endpoint
+        self._response_times = defaultdict(self.create_sketch)  # Response time sketches by endpoint
         self._error_counts = defaultdict(int)     # Count errors by endpoint
         self._request_counts = defaultdict(int)   # Count requests by endpoint
         self._status_codes = defaultdict(lambda: defaultdict(int))  # Count status codes by endpoint
@@ -139,7 +205,7 @@ class APIMetricsCollector(BaseMetricsCollector):
             return
         
         self._request_counts[endpoint] += 1
-        self._response_times[endpoint].append(response_time)
+        self._response_times[endpoint].add(response_time)
         self._status_codes[endpoint][status_code] += 1
         
         if status_code >= 400:
@@ -147,9 +213,17 @@ class APIMetricsCollector(BaseMetricsCollector):
         
         logger.debug(f"Recorded API request: {method} {endpoint} - {status_code} in {response_time:.4f}s")
     
-    def collect(self):
+    def collect(self, window_seconds=None):
         """Collect and calculate API metrics.
         
+        Request and error counts always cover the whole collection period. The
+        serialized response time sketches are returned under "sketches" so exporters
+        and other processes can work from them directly.
+        
+        Args:
+            window_seconds (float, optional): Compute response time statistics over the most
+                recent seconds only, up to the configured window. Defaults to None (whole period).
+        
         Returns:
             dict: Dictionary containing calculated metrics
         """
@@ -173,7 +247,8 @@ class APIMetricsCollector(BaseMetricsCollector):
                 "requests_per_second": requests_per_second,
                 "duration_seconds": duration
             },
-            "endpoints": {}
+            "endpoints": {},
+            "sketches": {"response_times": {}}
         }
         
         # Calculate per-endpoint metrics
@@ -183,7 +258,9 @@ class APIMetricsCollector(BaseMetricsCollector):
             endpoint_error_rate = (errors / requests) * 100 if requests > 0 else 0
             
             # Get response time stats
-            rt_stats = self.get_response_time_stats(self._response_times[endpoint])
+            rt_sketch = self.select_sketch(self._response_times[endpoint], window_seconds)
+            rt_stats = self.get_response_time_stats(rt_sketch)
+            results["sketches"]["response_times"][endpoint] = rt_sketch.to_dict()
             
             # Get status code distribution
             status_distribution = dict(self._status_codes[endpoint])
@@ -216,49 +293,63 @@ class APIMetricsCollector(BaseMetricsCollector):
             self._end_time = None
         logger.info("Reset API metrics collector")
     
+    def to_dict(self):
+        """Serialize the collected state for merging in another process.
+        
+        Returns:
+            dict: JSON-compatible counters, status codes, response time sketches and period
+        """
+        return {
+            "start_time": self._start_time,
+            "end_time": self._end_time,
+            "request_counts": dict(self._request_counts),
+            "error_counts": dict(self._error_counts),
+            "status_codes": {endpoint: dict(codes) for endpoint, codes in self._status_codes.items()},
+            "response_times": {endpoint: sketch.to_dict() for endpoint, sketch in self._response_times.items()}
+        }
+    
+    def merge(self, other):
+        """Merge the state of another API metrics collector into this one.
+        
+        Args:
+            other (APIMetricsCollector or dict): Collector, or its to_dict() output from another process
+        
+        Returns:
+            APIMetricsCollector: This collector
+        """
+        state = other.to_dict() if isinstance(other, APIMetricsCollector) else other
+        
+        for endpoint, count in state.get("request_counts", {}).items():
+            self._request_counts[endpoint] += count
+        for endpoint, count in state.get("error_counts", {}).items():
+            self._error_counts[endpoint] += count
+        for endpoint, codes in state.get("status_codes", {}).items():
+            for status_code, count in codes.items():
+                self._status_codes[endpoint][int(status_code)] += count
+        self.merge_sketches(self._response_times, state.get("response_times", {}))
+        self.merge_period(state.get("start_time"), state.get("end_time"))
+        return self
+    
     def calculate_percentile(self, response_times, percentile):
-        """Calculate a percentile value from a list of response times.
+        """Estimate a percentile of recorded response times.
         
         Args:
-            response_times (list): List of response times
+            response_times (QuantileSketch or list): Response time sketch or list of response times
             percentile (float): Percentile to calculate (0-100)
             
         Returns:
-            float: The calculated percentile value
+            float: The estimated percentile value, within the sketch's relative accuracy
         """
-        if not response_times:
-            return 0
-        
-        sorted_times = sorted(response_times)
-        index = int(len(sorted_times) * (percentile / 100))
-        # Ensure index is within bounds
-        index = max(0, min(index, len(sorted_times) - 1))
-        return sorted_times[index]
+        sketch = as_sketch(response_times)
+        return sketch.percentile(percentile) if sketch.count else 0
     
     def get_response_time_stats(self, response_times):
-        """Calculate response time statistics for a list of response times.
+        """Calculate response time statistics from a sketch of response times.
         
         Args:
-            response_times (list): List of response times
+            response_times (QuantileSketch or list): Response time sketch or list of response times
             
         Returns:
             dict: Dictionary with response time statistics
         """
-        if not response_times:
-            return {
-                "min": 0,
-                "max": 0,
-                "avg": 0,
-                "median": 0,
-                "p95": 0,
-                "p99": 0
-            }
-        
-        return {
-            "min": min(response_times),
-            "max": max(response_times),
-            "avg": sum(response_times) / len(response_times),
-            "median": self.calculate_percentile(response_times, 50),
-            "p95": self.calculate_percentile(response_times, 95),
-            "p99": self.calculate_percentile(response_times, 99)
-        }
\ No newline at end of file
+        return sketch_statistics(response_times)
\ No newline at end of file
@@ -5,9 +5,13 @@ from collections import defaultdict
 from decimal import Decimal
 
 from .api_metrics import BaseMetricsCollector
+from ..sketches import as_sketch, sketch_statistics
 
 logger = logging.getLogger(__name__)
 
+# Accuracy at or above this counts as a perfect calculation
+PERFECT_ACCURACY = 0.9999
+
 class CalculationMetricsCollector(BaseMetricsCollector):
     """Collects and analyzes calculation performance metrics such as execution times, throughput, and accuracy"""
     
@@ -18,8 +22,8 @@ class CalculationMetricsCollector(BaseMetricsCollector):
             config (dict, optional): Configuration dictionary. Defaults to None.
         """
         super().__init__(name="calculation_metrics", config=config or {})
-        self._execution_times = defaultdict(list)    # Store execution times by calculation type
-        self._accuracy_measurements = defaultdict(list)  # Store accuracy measurements by calculation type
+        self._execution_times = defaultdict(self.create_sketch)    # Execution time sketches by calculation type
+        self._accuracy_measurements = {}  # Running accuracy aggregates by calculation type
         self._calculation_counts = defaultdict(int)   # Count calculations by type
         self._start_time = None
         self._end_time = None
@@ -61,7 +65,7 @@ class CalculationMetricsCollector(BaseMetricsCollector):
             return
         
         self._calculation_counts[calculation_type] += 1
-        self._execution_times[calculation_type].append(execution_time)
+        self._execution_times[calculation_type].add(execution_time)
         
         logger.debug(f"Recorded calculation: {calculation_type} in {execution_time:.6f}s")
     
@@ -89,14 +93,48 @@ class CalculationMetricsCollector(BaseMetricsCollector):
             relative_error = difference / abs(expected_result)
             accuracy = Decimal('1.0') - relative_error
         
-        self._accuracy_measurements[calculation_type].append(float(accuracy))
+        self.add_accuracy(calculation_type, {
+            "count": 1,
+            "perfect_count": 1 if float(accuracy) >= PERFECT_ACCURACY else 0,
+            "sum": float(accuracy),
+            "min": float(accuracy),
+            "max": float(accuracy)
+        })
         
         logger.debug(f"Recorded accuracy for {calculation_type}: {float(accuracy):.6f} " 
                      f"(expected: {expected_result}, actual: {actual_result})")
     
-    def collect(self):
+    def add_accuracy(self, calculation_type, aggregate):
+        """Fold an accuracy aggregate into the running aggregate of a calculation type.
+        
+        Args:
+            calculation_type (str): The type of calculation
+            aggregate (dict): Accuracy aggregate with count, perfect_count, sum, min and max
+        
+        Returns:
+            None
+        """
+        current = self._accuracy_measurements.get(calculation_type)
+        if current is None:
+            self._accuracy_measurements[calculation_type] = dict(aggregate)
+            return
+        
+        current["count"] += aggregate["count"]
+        current["perfect_count"] += aggregate["perfect_count"]
+        current["sum"] += aggregate["sum"]
+        current["min"] = min(current["min"], aggregate["min"])
+        current["max"] = max(current["max"], aggregate["max"])
+    
+    def collect(self, window_seconds=None):
         """Collect and calculate calculation performance metrics.
         
+        Counts and accuracy always cover the whole collection period. The serialized
+        execution time sketches are returned under "sketches".
+        
+        Args:
+            window_seconds (float, optional): Compute execution time statistics over the most
+                recent seconds only, up to the configured window. Defaults to None (whole period).
+        
         Returns:
             dict: Dictionary containing calculated metrics
         """
@@ -117,7 +155,8 @@ class CalculationMetricsCollector(BaseMetricsCollector):
                 "duration_seconds": duration,
                 "calculation_types": len(self._calculation_counts)
             },
-            "calculation_types": {}
+            "calculation_types": {},
+            "sketches": {"execution_times": {}}
         }
         
         # Calculate per-calculation-type metrics
@@ -125,7 +164,9 @@ class CalculationMetricsCollector(BaseMetricsCollector):
             count = self._calculation_counts[calc_type]
             
             # Get execution time stats
-            exec_time_stats = self.get_execution_time_stats(self._execution_times[calc_type])
+            exec_time_sketch = self.select_sketch(self._execution_times[calc_type], window_seconds)
+            exec_time_stats = self.get_execution_time_stats(exec_time_sketch)
+            results["sketches"]["execution_times"][calc_type] = exec_time_sketch.to_dict()
             
             # Get accuracy stats if available
             accuracy_stats = self.get_accuracy_stats(self._accuracy_measurements[calc_type]) if calc_type in self._accuracy_measurements else None
@@ -166,73 +207,83 @@ class CalculationMetricsCollector(BaseMetricsCollector):
             self._end_time = None
         logger.info("Reset calculation metrics collector")
     
+    def to_dict(self):
+        """Serialize the collected state for merging in another process.
+        
+        Returns:
+            dict: JSON-compatible counts, execution time sketches, accuracy aggregates and period
+        """
+        return {
+            "start_time": self._start_time,
+            "end_time": self._end_time,
+            "calculation_counts": dict(self._calculation_counts),
+            "execution_times": {calc_type: sketch.to_dict() for calc_type, sketch in self._execution_times.items()},
+            "accuracy": {calc_type: dict(aggregate) for calc_type, aggregate in self._accuracy_measurements.items()}
+        }
+    
+    def merge(self, other):
+        """Merge the state of another calculation metrics collector into this one.
+        
+        Args:
+            other (CalculationMetricsCollector or dict): Collector, or its to_dict() output from another process
+        
+        Returns:
+            CalculationMetricsCollector: This collector
+        """
+        state = other.to_dict() if isinstance(other, CalculationMetricsCollector) else other
+        
+        for calc_type, count in state.get("calculation_counts", {}).items():
+            self._calculation_counts[calc_type] += count
+        self.merge_sketches(self._execution_times, state.get("execution_times", {}))
+        for calc_type, aggregate in state.get("accuracy", {}).items():
+            self.add_accuracy(calc_type, aggregate)
+        self.merge_period(state.get("start_time"), state.get("end_time"))
+        return self
+    
     def calculate_percentile(self, execution_times, percentile):
-        """Calculate a percentile value from a list of execution times.
+        """Estimate a percentile of recorded execution times.
         
         Args:
-            execution_times (list): List of execution times
+            execution_times (QuantileSketch or list): Execution time sketch or list of execution times
             percentile (float): Percentile to calculate (0-100)
             
         Returns:
-            float: The calculated percentile value
+            float: The estimated percentile value, within the sketch's relative accuracy
         """
-        if not execution_times:
-            return 0
-        
-        sorted_times = sorted(execution_times)
-        index = int(len(sorted_times) * (percentile / 100))
-        # Ensure index is within bounds
-        index = max(0, min(index, len(sorted_times) - 1))
-        return sorted_times[index]
+        sketch = as_sketch(execution_times)
+        return sketch.percentile(percentile) if sketch.count else 0
     
     def get_execution_time_stats(self, execution_times):
-        """Calculate execution time statistics for a list of execution times.
+        """Calculate execution time statistics from a sketch of execution times.
         
         Args:
-            execution_times (list): List of execution times
+            execution_times (QuantileSketch or list): Execution time sketch or list of execution times
             
         Returns:
             dict: Dictionary with execution time statistics
         """
-        if not execution_times:
-            return {
-                "min": 0,
-                "max": 0,
-                "avg": 0,
-                "median": 0,
-                "p95": 0,
-                "p99": 0
-            }
-        
-        return {
-            "min": min(execution_times),
-            "max": max(execution_times),
-            "avg": sum(execution_times) / len(execution_times),
-            "median": self.calculate_percentile(execution_times, 50),
-            "p95": self.calculate_percentile(execution_times, 95),
-            "p99": self.calculate_percentile(execution_times, 99)
-        }
+        return sketch_statistics(execution_times)
     
     def get_accuracy_stats(self, accuracy_measurements):
-        """Calculate accuracy statistics for a list of accuracy measurements.
+        """Calculate accuracy statistics from a running accuracy aggregate.
         
         Args:
-            accuracy_measurements (list): List of accuracy measurements (0.0-1.0)
+            accuracy_measurements (dict): Aggregate with count, perfect_count, sum, min and max
+                of accuracy measurements (0.0-1.0)
             
         Returns:
             dict: Dictionary with accuracy statistics
         """
-        if not accuracy_measurements:
+        if not accuracy_measurements or not accuracy_measurements["count"]:
             return None
         
-        # Count measurements with perfect accuracy (1.0)
-        perfect_count = sum(1 for acc in accuracy_measurements if acc >= 0.9999)
-        perfect_percentage = (perfect_count / len(accuracy_measurements)) * 100 if accuracy_measurements else 0
+        count = accuracy_measurements["count"]
+        perfect_count = accuracy_measurements["perfect_count"]
         
         return {
-            "min": min(accuracy_measurements),
-            "max": max(accuracy_measurements),
-            "avg": sum(accuracy_measurements) / len(accuracy_measurements),
+            "min": accuracy_measurements["min"],
+            "max": accuracy_measurements["max"],
+            "avg": accuracy_measurements["sum"] / count,
             "perfect_count": perfect_count,
-            "perfect_percentage": perfect_percentage
-        }
\ No newline at end of file
+            "perfect_percentage": (perfect_count / count) * 100
+        }
@@ -5,6 +5,7 @@ from collections import defaultdict
 import psutil
 import threading
 from .api_metrics import BaseMetricsCollector
+from ..sketches import as_sketch, sketch_statistics
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +19,11 @@ class ResourceMetricsCollector(BaseMetricsCollector):
             config (dict, optional): Configuration dictionary. Defaults to None.
         """
         super().__init__(name="resource_metrics", config=config or {})
-        self._cpu_metrics = defaultdict(list)
-        self._memory_metrics = defaultdict(list)
-        self._disk_metrics = defaultdict(list)
-        self._network_metrics = defaultdict(list)
+        self._cpu_metrics = defaultdict(self.create_sketch)
+        self._memory_metrics = defaultdict(self.create_sketch)
+        self._disk_metrics = defaultdict(self.create_sketch)
+        self._network_metrics = defaultdict(self.create_sketch)
+        self._last_values = {}  # Latest raw counter readings for rate calculations
         self._collection_interval = config.get('collection_interval', 1.0)  # seconds
         self._collection_thread = None
         self._stop_collection_flag = False
@@ -121,12 +123,12 @@ class ResourceMetricsCollector(BaseMetricsCollector):
         # Store per-CPU percentages
         for i, cpu_percent in enumerate(per_cpu_percent):
             current_metrics[f'cpu_{i}_percent'] = cpu_percent
-            self._cpu_metrics[f'cpu_{i}_percent'].append(cpu_percent)
+            self._cpu_metrics[f'cpu_{i}_percent'].add(cpu_percent)
         
         # Store other metrics
         for key, value in current_metrics.items():
             if value is not None:  # Don't store None values
-                self._cpu_metrics[key].append(value)
+                self._cpu_metrics[key].add(value)
         
         return current_metrics
     
@@ -157,7 +159,7 @@ class ResourceMetricsCollector(BaseMetricsCollector):
         
         # Store in metrics collection
         for key, value in current_metrics.items():
-            self._memory_metrics[key].append(value)
+            self._memory_metrics[key].add(value)
         
         return current_metrics
     
@@ -190,8 +192,8 @@ class ResourceMetricsCollector(BaseMetricsCollector):
             current_metrics[f'{disk_name}_write_count'] = io_stats.write_count
             
             # Calculate rates based on previous values
-            prev_read_bytes = self._disk_metrics.get(f'{disk_name}_read_bytes', [0])[-1] if self._disk_metrics.get(f'{disk_name}_read_bytes') else 0
-            prev_write_bytes = self._disk_metrics.get(f'{disk_name}_write_bytes', [0])[-1] if self._disk_metrics.get(f'{disk_name}_write_bytes') else 0
+            prev_read_bytes = self._last_values.get(f'{disk_name}_read_bytes', 0)
+            prev_write_bytes = self._last_values.get(f'{disk_name}_write_bytes', 0)
             
             if prev_read_bytes != 0 and prev_write_bytes != 0:
                 read_bytes_rate = (io_stats.read_bytes - prev_read_bytes) / self._collection_interval
@@ -200,13 +202,14 @@ class ResourceMetricsCollector(BaseMetricsCollector):
                 current_metrics[f'{disk_name}_read_bytes_per_sec'] = read_bytes_rate
                 current_metrics[f'{disk_name}_write_bytes_per_sec'] = write_bytes_rate
                 
-                self._disk_metrics[f'{disk_name}_read_bytes_per_sec'].append(read_bytes_rate)
-                self._disk_metrics[f'{disk_name}_write_bytes_per_sec'].append(write_bytes_rate)
+                self._disk_metrics[f'{disk_name}_read_bytes_per_sec'].add(read_bytes_rate)
+                self._disk_metrics[f'{disk_name}_write_bytes_per_sec'].add(write_bytes_rate)
         
         # Store in metrics collection
         for key, value in current_metrics.items():
             if key not in self._disk_metrics or not key.endswith('_per_sec'):  # Avoid duplicating rate metrics
-                self._disk_metrics[key].append(value)
+                self._disk_metrics[key].add(value)
+            self._last_values[key] = value
         
         return current_metrics
     
@@ -243,8 +246,8 @@ class ResourceMetricsCollector(BaseMetricsCollector):
             current_metrics[f'{nic_name}_errout'] = io_stats.errout
             
             # Calculate rates based on previous values
-            prev_bytes_sent = self._network_metrics.get(f'{nic_name}_bytes_sent', [0])[-1] if self._network_metrics.get(f'{nic_name}_bytes_sent') else 0
-            prev_bytes_recv = self._network_metrics.get(f'{nic_name}_bytes_recv', [0])[-1] if self._network_metrics.get(f'{nic_name}_bytes_recv') else 0
+            prev_bytes_sent = self._last_values.get(f'{nic_name}_bytes_sent', 0)
+            prev_bytes_recv = self._last_values.get(f'{nic_name}_bytes_recv', 0)
             
             if prev_bytes_sent != 0 and prev_bytes_recv != 0:
                 bytes_sent_rate = (io_stats.bytes_sent - prev_bytes_sent) / self._collection_interval
@@ -262,20 +265,28 @@ class ResourceMetricsCollector(BaseMetricsCollector):
                 
                 current_metrics[f'{nic_name}_utilization_percent'] = min(100, utilization_percent)  # Cap at 100%
                 
-                self._network_metrics[f'{nic_name}_bytes_sent_per_sec'].append(bytes_sent_rate)
-                self._network_metrics[f'{nic_name}_bytes_recv_per_sec'].append(bytes_recv_rate)
-                self._network_metrics[f'{nic_name}_utilization_percent'].append(min(100, utilization_percent))
+                self._network_metrics[f'{nic_name}_bytes_sent_per_sec'].add(bytes_sent_rate)
+                self._network_metrics[f'{nic_name}_bytes_recv_per_sec'].add(bytes_recv_rate)
+                self._network_metrics[f'{nic_name}_utilization_percent'].add(min(100, utilization_percent))
         
         # Store in metrics collection
         for key, value in current_metrics.items():
             if key not in self._network_metrics or not key.endswith(('_per_sec', '_utilization_percent')):  # Avoid duplicating rate metrics
-                self._network_metrics[key].append(value)
+                self._network_metrics[key].add(value)
+            self._last_values[key] = value
         
         return current_metrics
     
-    def collect(self):
+    def collect(self, window_seconds=None):
         """Collect and calculate resource utilization metrics
         
+        The serialized sketch of every metric is returned under "sketches", grouped
+        like the statistics.
+        
+        Args:
+            window_seconds (float, optional): Compute statistics over the most recent seconds only,
+                up to the configured window. Defaults to None (whole period).
+        
         Returns:
             dict: Dictionary containing calculated resource metrics
         """
@@ -292,14 +303,17 @@ class ResourceMetricsCollector(BaseMetricsCollector):
             "cpu": {},
             "memory": {},
             "disk": {},
-            "network": {}
+            "network": {},
+            "sketches": {"cpu": {}, "memory": {}, "disk": {}, "network": {}}
         }
         
         # Process CPU metrics
-        for metric_name, values in self._cpu_metrics.items():
-            if values:  # Skip empty metrics
+        for metric_name, sketch in list(self._cpu_metrics.items()):
+            values = self.select_sketch(sketch, window_seconds)
+            if values.count:  # Skip empty metrics
                 stats = self.get_statistics(values)
                 results["cpu"][metric_name] = stats
+                results["sketches"]["cpu"][metric_name] = values.to_dict()
                 
                 # Add overall CPU metrics to top level for convenience
                 if metric_name == 'cpu_overall_percent':
@@ -309,10 +323,12 @@ class ResourceMetricsCollector(BaseMetricsCollector):
                     results["overall"]["cpu_p95"] = stats["p95"]
         
         # Process memory metrics
-        for metric_name, values in self._memory_metrics.items():
-            if values:  # Skip empty metrics
+        for metric_name, sketch in list(self._memory_metrics.items()):
+            values = self.select_sketch(sketch, window_seconds)
+            if values.count:  # Skip empty metrics
                 stats = self.get_statistics(values)
                 results["memory"][metric_name] = stats
+                results["sketches"]["memory"][metric_name] = values.to_dict()
                 
                 # Add overall memory metrics to top level for convenience
                 if metric_name == 'memory_percent':
@@ -322,10 +338,12 @@ class ResourceMetricsCollector(BaseMetricsCollector):
                     results["overall"]["memory_p95"] = stats["p95"]
         
         # Process disk metrics
-        for metric_name, values in self._disk_metrics.items():
-            if values:  # Skip empty metrics
+        for metric_name, sketch in list(self._disk_metrics.items()):
+            values = self.select_sketch(sketch, window_seconds)
+            if values.count:  # Skip empty metrics
                 stats = self.get_statistics(values)
                 results["disk"][metric_name] = stats
+                results["sketches"]["disk"][metric_name] = values.to_dict()
                 
                 # Add overall disk metrics to top level for convenience
                 if metric_name == 'disk_space_percent':
@@ -335,10 +353,12 @@ class ResourceMetricsCollector(BaseMetricsCollector):
                     results["overall"]["disk_usage_p95"] = stats["p95"]
         
         # Process network metrics
-        for metric_name, values in self._network_metrics.items():
-            if values:  # Skip empty metrics
+        for metric_name, sketch in list(self._network_metrics.items()):
+            values = self.select_sketch(sketch, window_seconds)
+            if values.count:  # Skip empty metrics
                 stats = self.get_statistics(values)
                 results["network"][metric_name] = stats
+                results["sketches"]["network"][metric_name] = values.to_dict()
                 
                 # Add network utilization to top level if available
                 if metric_name.endswith('_utilization_percent'):
@@ -359,6 +379,7 @@ class ResourceMetricsCollector(BaseMetricsCollector):
         self._memory_metrics.clear()
         self._disk_metrics.clear()
         self._network_metrics.clear()
+        self._last_values.clear()
         
         if not self._is_collecting:
             self._start_time = None
@@ -366,49 +387,60 @@ class ResourceMetricsCollector(BaseMetricsCollector):
         
         logger.info("Reset resource metrics collector")
     
+    def to_dict(self):
+        """Serialize the collected state for merging in another process
+        
+        Returns:
+            dict: JSON-compatible sketches of every metric and the collection period
+        """
+        return {
+            "start_time": self._start_time,
+            "end_time": self._end_time,
+            "cpu": {name: sketch.to_dict() for name, sketch in list(self._cpu_metrics.items())},
+            "memory": {name: sketch.to_dict() for name, sketch in list(self._memory_metrics.items())},
+            "disk": {name: sketch.to_dict() for name, sketch in list(self._disk_metrics.items())},
+            "network": {name: sketch.to_dict() for name, sketch in list(self._network_metrics.items())}
+        }
+    
+    def merge(self, other):
+        """Merge the state of another resource metrics collector into this one
+        
+        Args:
+            other (ResourceMetricsCollector or dict): Collector, or its to_dict() output from another process
+        
+        Returns:
+            ResourceMetricsCollector: This collector
+        """
+        state = other.to_dict() if isinstance(other, ResourceMetricsCollector) else other
+        
+        self.merge_sketches(self._cpu_metrics, state.get("cpu", {}))
+        self.merge_sketches(self._memory_metrics, state.get("memory", {}))
+        self.merge_sketches(self._disk_metrics, state.get("disk", {}))
+        self.merge_sketches(self._network_metrics, state.get("network", {}))
+        self.merge_period(state.get("start_time"), state.get("end_time"))
+        return self
+    
     def calculate_percentile(self, measurements, percentile):
-        """Calculate a percentile value from a list of measurements
+        """Estimate a percentile of recorded measurements
         
         Args:
-            measurements (list): List of numeric measurements
+            measurements (QuantileSketch or list): Measurement sketch or list of numeric measurements
             percentile (float): Percentile to calculate (0-100)
             
         Returns:
-            float: The calculated percentile value
+            float: The estimated percentile value, within the sketch's relative accuracy
         """
-        if not measurements:
-            return 0
-        
-        sorted_values = sorted(measurements)
-        index = int(len(sorted_values) * (percentile / 100))
-        # Ensure index is within bounds
-        index = max(0, min(index, len(sorted_values) - 1))
-        return sorted_values[index]
+        sketch = as_sketch(measurements)
+        return sketch.percentile(percentile) if sketch.count else 0
     
     def get_statistics(self, measurements):
-        """Calculate statistics for a list of measurements
+        """Calculate statistics from a sketch of measurements
         
         Args:
-            measurements (list): List of numeric measurements
+            measurements (QuantileSketch or list): Measurement sketch or list of numeric measurements
             
         Returns:
             dict: Dictionary with statistical measures
         """
-        if not measurements:
-            return {
-                "min": 0,
-                "max": 0,
-                "avg": 0,
-                "median": 0,
-                "p95": 0,
-                "p99": 0
-            }
-        
-        return {
-            "min": min(measurements),
-            "max": max(measurements),
-            "avg": sum(measurements) / len(measurements),
-            "median": self.calculate_percentile(measurements, 50),
-            "p95": self.calculate_percentile(measurements, 95),
-            "p99": self.calculate_percentile(measurements, 99)
-        }
\ No newline at end of file
+        return sketch_statistics(measurements)
+        
\ No newline at end of file
@@ -5,10 +5,17 @@ from datetime import datetime
 from pathlib import Path
 
 from .prometheus import BaseExporter
+from ..sketches import as_sketch
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Percentiles added as columns for every exported sketch
+SKETCH_PERCENTILES = (50, 90, 95, 99)
+
+# Columns describing one sketch bin in distribution files
+DISTRIBUTION_HEADERS = ['lower_bound', 'upper_bound', 'count']
+
 class CSVExporter(BaseExporter):
     """
     Exports metrics in CSV format for analysis in spreadsheet applications and data visualization tools.
@@ -126,6 +133,7 @@ class CSVExporter(BaseExporter):
             # Create headers and rows for endpoints
             endpoint_headers = ['endpoint']
             endpoint_data = []
+            response_time_sketches = self.get_sketches(api_metrics, 'response_times')
             
             for endpoint, metrics in api_metrics['endpoints'].items():
                 row_data = {'endpoint': endpoint}
@@ -136,9 +144,13 @@ class CSVExporter(BaseExporter):
                         if key not in endpoint_headers:
                             endpoint_headers.append(key)
                         row_data[key] = value
-                    elif isinstance(value, list) and key == 'response_times':
-                        # Handle response times separately
-                        continue
+                
+                # Add response time percentiles from the endpoint's sketch
+                if endpoint in response_time_sketches:
+                    for key, value in self.sketch_percentiles('response_time', response_time_sketches[endpoint]).items():
+                        if key not in endpoint_headers:
+                            endpoint_headers.append(key)
+                        row_data[key] = value
                 
                 endpoint_data.append(row_data)
             
@@ -155,23 +167,14 @@ class CSVExporter(BaseExporter):
                 results['file_paths']['api_endpoints'] = str(endpoints_file)
                 logger.info(f"Exported API endpoint metrics to {endpoints_file}")
             
-            # Export response times as time series if present
-            if any('response_times' in metrics for _, metrics in api_metrics['endpoints'].items()):
-                response_times_file = output_dir / f"api_response_times_{timestamp}.csv"
+            # Export the response time distribution of each endpoint from its sketch
+            if response_time_sketches:
+                distribution_file = output_dir / f"api_response_time_distribution_{timestamp}.csv"
                 
-                # Process response times for each endpoint
-                rt_headers = ['endpoint', 'response_time']
-                rt_rows = []
-                
-                for endpoint, metrics in api_metrics['endpoints'].items():
-                    if 'response_times' in metrics and metrics['response_times']:
-                        for rt in metrics['response_times']:
-                            rt_rows.append([endpoint, rt])
-                
-                if self.write_csv(str(response_times_file), rt_headers, rt_rows):
-                    results['files'].append(str(response_times_file))
-                    results['file_paths']['api_response_times'] = str(response_times_file)
-                    logger.info(f"Exported API response times to {response_times_file}")
+                if self.write_sketch_distribution(str(distribution_file), ['endpoint'], response_time_sketches):
+                    results['files'].append(str(distribution_file))
+                    results['file_paths']['api_response_time_distribution'] = str(distribution_file)
+                    logger.info(f"Exported API response time distribution to {distribution_file}")
         
         return results
     
@@ -208,6 +211,7 @@ class CSVExporter(BaseExporter):
             # Create headers and rows for calculation types
             type_headers = ['calculation_type']
             type_data = []
+            execution_time_sketches = self.get_sketches(calculation_metrics, 'execution_times')
             
             for calc_type, metrics in calculation_metrics['calculation_types'].items():
                 row_data = {'calculation_type': calc_type}
@@ -218,9 +222,13 @@ class CSVExporter(BaseExporter):
                         if key not in type_headers:
                             type_headers.append(key)
                         row_data[key] = value
-                    elif isinstance(value, list) and key == 'calculation_times':
-                        # Handle calculation times separately
-                        continue
+                
+                # Add execution time percentiles from the calculation type's sketch
+                if calc_type in execution_time_sketches:
+                    for key, value in self.sketch_percentiles('execution_time', execution_time_sketches[calc_type]).items():
+                        if key not in type_headers:
+                            type_headers.append(key)
+                        row_data[key] = value
                 
                 type_data.append(row_data)
             
@@ -237,23 +245,14 @@ class CSVExporter(BaseExporter):
                 results['file_paths']['calculation_types'] = str(calc_types_file)
                 logger.info(f"Exported calculation type metrics to {calc_types_file}")
             
-            # Export calculation times as time series if present
-            if any('calculation_times' in metrics for _, metrics in calculation_metrics['calculation_types'].items()):
-                calc_times_file = output_dir / f"calculation_times_{timestamp}.csv"
-                
-                # Process calculation times for each type
-                ct_headers = ['calculation_type', 'calculation_time']
-                ct_rows = []
-                
-                for calc_type, metrics in calculation_metrics['calculation_types'].items():
-                    if 'calculation_times' in metrics and metrics['calculation_times']:
-                        for ct in metrics['calculation_times']:
-                            ct_rows.append([calc_type, ct])
+            # Export the execution time distribution of each calculation type from its sketch
+            if execution_time_sketches:
+                distribution_file = output_dir / f"calculation_time_distribution_{timestamp}.csv"
                 
-                if self.write_csv(str(calc_times_file), ct_headers, ct_rows):
-                    results['files'].append(str(calc_times_file))
-                    results['file_paths']['calculation_times'] = str(calc_times_file)
-                    logger.info(f"Exported calculation times to {calc_times_file}")
+                if self.write_sketch_distribution(str(distribution_file), ['calculation_type'], execution_time_sketches):
+                    results['files'].append(str(distribution_file))
+                    results['file_paths']['calculation_time_distribution'] = str(distribution_file)
+                    logger.info(f"Exported calculation time distribution to {distribution_file}")
         
         return results
     
@@ -328,6 +327,20 @@ class CSVExporter(BaseExporter):
                 results['file_paths']['resource_time_series'] = str(ts_file)
                 logger.info(f"Exported resource time series to {ts_file}")
         
+        # Export the distribution of every sampled resource metric from its sketch
+        resource_sketches = {}
+        for group in ('cpu', 'memory', 'disk', 'network'):
+            for metric_name, sketch in self.get_sketches(resource_metrics, group).items():
+                resource_sketches[(group, metric_name)] = sketch
+        
+        if resource_sketches:
+            distribution_file = output_dir / f"resource_distribution_{timestamp}.csv"
+            
+            if self.write_sketch_distribution(str(distribution_file), ['group', 'metric'], resource_sketches):
+                results['files'].append(str(distribution_file))
+                results['file_paths']['resource_distribution'] = str(distribution_file)
+                logger.info(f"Exported resource metric distribution to {distribution_file}")
+        
         return results
     
     def write_csv(self, file_path, headers, rows):
@@ -354,6 +367,54 @@ class CSVExporter(BaseExporter):
             logger.error(f"Error writing CSV file {file_path}: {str(e)}")
             return False
     
+    def get_sketches(self, metrics, group):
+        """
+        Rebuild the sketches a collector serialized under metrics['sketches'][group]
+        
+        Args:
+            metrics (dict): Metrics dictionary returned by a collector
+            group (str): Sketch group, e.g. 'response_times' or 'execution_times'
+        
+        Returns:
+            dict: Sketch keys (endpoint, calculation type, metric name) mapped to QuantileSketch
+        """
+        return {key: as_sketch(data) for key, data in metrics.get('sketches', {}).get(group, {}).items()}
+    
+    def sketch_percentiles(self, prefix, sketch):
+        """
+        Compute percentile columns from a sketch
+        
+        Args:
+            prefix (str): Column name prefix
+            sketch (QuantileSketch): Sketch of recorded values
+        
+        Returns:
+            dict: Column names mapped to percentile estimates, empty for an empty sketch
+        """
+        if not sketch.count:
+            return {}
+        return {f"{prefix}_p{p}": sketch.percentile(p) for p in SKETCH_PERCENTILES}
+    
+    def write_sketch_distribution(self, file_path, key_headers, sketches):
+        """
+        Write the bins of several sketches to a CSV file, one row per non-empty bin
+        
+        Args:
+            file_path (str): Path to the CSV file
+            key_headers (list): Column names identifying each sketch
+            sketches (dict): Sketch keys (a value or a tuple matching key_headers) mapped to QuantileSketch
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        rows = []
+        for key, sketch in sketches.items():
+            key_values = list(key) if isinstance(key, tuple) else [key]
+            for lower_bound, upper_bound, count in sketch.iter_bins():
+                rows.append(key_values + [lower_bound, upper_bound, count])
+        
+        return self.write_csv(file_path, list(key_headers) + DISTRIBUTION_HEADERS, rows)
+    
     def flatten_metrics(self, metrics, prefix=''):
         """
         Flatten nested metrics dictionary into rows suitable for CSV export
@@ -370,11 +431,7 @@ class CSVExporter(BaseExporter):
         
         for key, value in metrics.items():
             # Skip nested dictionaries that will be handled separately
-            if key in ('endpoints', 'calculation_types', 'components', 'time_series'):
-                continue
-            
-            # Skip list values that are handled separately
-            if isinstance(value, list) and key in ('response_times', 'calculation_times'):
+            if key in ('endpoints', 'calculation_types', 'components', 'time_series', 'sketches'):
                 continue
             
             # Handle flat values
@@ -385,10 +442,10 @@ class CSVExporter(BaseExporter):
             # Handle nested dictionaries
             elif isinstance(value, dict):
                 nested_prefix = f"{prefix}{key}_" if prefix else f"{key}_"
-                nested_headers, nested_data = self.flatten_metrics(value, nested_prefix)
+                nested_headers, nested_rows = self.flatten_metrics(value, nested_prefix)
                 
                 headers.extend(nested_headers)
-                row_data.update(nested_data)
+                row_data.update(zip(nested_headers, nested_rows[0]))
             # Handle other types (convert to string)
             elif value is not None:
                 col_name = f"{prefix}{key}" if prefix else key
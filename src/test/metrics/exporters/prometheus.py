@@ -4,10 +4,119 @@ import time
 import threading
 import abc
 from prometheus_client import Counter, Gauge, Histogram, Summary, start_http_server, generate_latest, REGISTRY
+from prometheus_client.core import GaugeMetricFamily, HistogramMetricFamily
+from prometheus_client.utils import floatToGoString
+
+from ..sketches import QuantileSketch, as_sketch
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Bucket upper bounds for API response time histograms, in seconds
+API_RESPONSE_TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# Bucket upper bounds for calculation time histograms, in seconds
+CALCULATION_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0)
+
+# Quantiles exported next to every sketch-backed histogram
+SKETCH_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+# Shared collector serving sketch-backed metrics from the default registry
+_sketch_collector = None
+_sketch_collector_lock = threading.Lock()
+
+
+class SketchCollector:
+    """
+    Custom Prometheus collector exposing quantile sketches as histograms.
+    
+    Bucket counts, sums and quantile estimates are derived from the sketches at scrape
+    time, so exporting a run costs one pass over the sketch bins instead of replaying
+    every recorded value through Histogram.observe.
+    """
+    
+    def __init__(self):
+        """
+        Initialize the collector without any sketches
+        """
+        self._families = {}
+        self._lock = threading.Lock()
+    
+    def set_sketch(self, name, description, sketch, buckets=(), labels=None):
+        """
+        Publish a sketch, replacing the one previously published with the same labels
+        
+        Args:
+            name (str): Metric family name
+            description (str): Metric family description
+            sketch (QuantileSketch): Sketch to expose
+            buckets (tuple): Ascending histogram bucket upper bounds
+            labels (dict): Label names mapped to label values
+        """
+        labels = labels or {}
+        with self._lock:
+            family = self._families.setdefault(name, {
+                'description': description,
+                'label_names': tuple(labels),
+                'buckets': tuple(buckets),
+                'sketches': {}
+            })
+            family['sketches'][tuple(labels.values())] = sketch
+    
+    def clear(self):
+        """
+        Remove all published sketches
+        """
+        with self._lock:
+            self._families = {}
+    
+    def collect(self):
+        """
+        Build the metric families for a scrape
+        
+        Yields:
+            Metric: A histogram and a quantile gauge family per published metric name
+        """
+        with self._lock:
+            families = [(name, dict(family), dict(family['sketches'])) for name, family in self._families.items()]
+        
+        for name, family, sketches in families:
+            label_names = list(family['label_names'])
+            histogram = HistogramMetricFamily(name, family['description'], labels=label_names)
+            quantiles = GaugeMetricFamily(
+                f"{name}_quantile", f"{family['description']} (sketch quantile estimate)",
+                labels=label_names + ['quantile']
+            )
+            
+            for label_values, sketch in sketches.items():
+                counts = sketch.cumulative_counts(family['buckets'])
+                buckets = [(floatToGoString(bound), count) for bound, count in zip(family['buckets'], counts)]
+                buckets.append(('+Inf', sketch.count))
+                histogram.add_metric(list(label_values), buckets, sketch.sum)
+                
+                if sketch.count:
+                    for q in SKETCH_QUANTILES:
+                        quantiles.add_metric(list(label_values) + [floatToGoString(q)], sketch.quantile(q))
+            
+            yield histogram
+            yield quantiles
+
+
+def get_sketch_collector():
+    """
+    Get the sketch collector registered with the default registry, registering it on first use
+    
+    Returns:
+        SketchCollector: Shared sketch collector
+    """
+    global _sketch_collector
+    with _sketch_collector_lock:
+        if _sketch_collector is None:
+            _sketch_collector = SketchCollector()
+            REGISTRY.register(_sketch_collector)
+        return _sketch_collector
+
+
 class BaseExporter(abc.ABC):
     """
     Abstract base class for all metrics exporters, defining the common interface 
@@ -67,6 +176,7 @@ class PrometheusExporter(BaseExporter):
         self._server_thread = None
         self._server_running = False
         self._server_port = self.config.get('port', 8000)
+        self._sketches = get_sketch_collector()
         
         # Register default metrics if enabled
         if self.config.get('default_metrics', True):
@@ -87,6 +197,7 @@ class PrometheusExporter(BaseExporter):
         # Clear existing metrics registry if configured
         if self.config.get('clear_registry_on_export', False):
             self._metrics = {}
+            self._sketches.clear()
         
         # Process API metrics
         if 'api_metrics' in metrics_data:
@@ -182,15 +293,13 @@ class PrometheusExporter(BaseExporter):
         )
         error_rate.set(api_metrics.get('error_rate', 0))
         
-        # Response time histogram with appropriate buckets for API latency
-        response_time = self.get_or_create_metric(
-            'histogram', 'api_response_time',
-            'API response time in seconds',
-            [], buckets=[0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0]
+        # Response time histogram built from the per-endpoint sketches
+        endpoint_sketches = self.get_sketches(api_metrics, 'response_times')
+        self._sketches.set_sketch(
+            'api_response_time', 'API response time in seconds',
+            self.merge_sketches(endpoint_sketches.values(), api_metrics.get('response_times')),
+            API_RESPONSE_TIME_BUCKETS
         )
-        # Add response time observations
-        for rt in api_metrics.get('response_times', []):
-            response_time.observe(rt)
         
         # Requests per second gauge
         rps = self.get_or_create_metric(
@@ -218,14 +327,11 @@ class PrometheusExporter(BaseExporter):
             endpoint_error_rate.labels(endpoint=endpoint).set(metrics.get('error_rate', 0))
             
             # Endpoint response time
-            endpoint_response_time = self.get_or_create_metric(
-                'histogram', 'api_endpoint_response_time',
-                'Response time per endpoint in seconds',
-                ['endpoint'], buckets=[0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0]
+            if endpoint in endpoint_sketches:
+                self._sketches.set_sketch(
+                    'api_endpoint_response_time', 'Response time per endpoint in seconds',
+                    endpoint_sketches[endpoint], API_RESPONSE_TIME_BUCKETS, {'endpoint': endpoint}
             )
-            # Add response time observations for this endpoint
-            for rt in metrics.get('response_times', []):
-                endpoint_response_time.labels(endpoint=endpoint).observe(rt)
         
         logger.debug("Processed API metrics successfully")
     
@@ -250,15 +356,13 @@ class PrometheusExporter(BaseExporter):
         )
         error_rate.set(calculation_metrics.get('error_rate', 0))
         
-        # Calculation time histogram
-        calculation_time = self.get_or_create_metric(
-            'histogram', 'calculation_time',
-            'Calculation time in seconds',
-            [], buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0]
+        # Calculation time histogram built from the per-type sketches
+        type_sketches = self.get_sketches(calculation_metrics, 'execution_times')
+        self._sketches.set_sketch(
+            'calculation_time', 'Calculation time in seconds',
+            self.merge_sketches(type_sketches.values(), calculation_metrics.get('calculation_times')),
+            CALCULATION_TIME_BUCKETS
         )
-        # Add calculation time observations
-        for ct in calculation_metrics.get('calculation_times', []):
-            calculation_time.observe(ct)
         
         # Calculations per second gauge
         cps = self.get_or_create_metric(
@@ -293,14 +397,11 @@ class PrometheusExporter(BaseExporter):
             type_error_rate.labels(type=calc_type).set(metrics.get('error_rate', 0))
             
             # Calculation type timing
-            type_calculation_time = self.get_or_create_metric(
-                'histogram', 'calculation_type_time',
-                'Calculation time by type in seconds',
-                ['type'], buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5]
+            if calc_type in type_sketches:
+                self._sketches.set_sketch(
+                    'calculation_type_time', 'Calculation time by type in seconds',
+                    type_sketches[calc_type], CALCULATION_TIME_BUCKETS, {'type': calc_type}
             )
-            # Add calculation time observations for this type
-            for ct in metrics.get('calculation_times', []):
-                type_calculation_time.labels(type=calc_type).observe(ct)
         
         logger.debug("Processed calculation metrics successfully")
     
@@ -357,8 +458,48 @@ class PrometheusExporter(BaseExporter):
             )
             component_memory.labels(component=component).set(metrics.get('memory_utilization', 0))
             
+        # Distribution of every sampled resource metric, from the collector's sketches
+        for group in ('cpu', 'memory', 'disk', 'network'):
+            for metric_name, sketch in self.get_sketches(resource_metrics, group).items():
+                self._sketches.set_sketch(
+                    'resource_metric', 'Sampled resource metric values',
+                    sketch, (), {'group': group, 'metric': metric_name}
+                )
+        
         logger.debug("Processed resource metrics successfully")
     
+    def get_sketches(self, metrics, group):
+        """
+        Rebuild the sketches a collector serialized under metrics['sketches'][group]
+        
+        Args:
+            metrics (dict): Metrics dictionary returned by a collector
+            group (str): Sketch group, e.g. 'response_times' or 'execution_times'
+        
+        Returns:
+            dict: Sketch keys (endpoint, calculation type, metric name) mapped to QuantileSketch
+        """
+        return {key: as_sketch(data) for key, data in metrics.get('sketches', {}).get(group, {}).items()}
+    
+    def merge_sketches(self, sketches, raw_values=None):
+        """
+        Merge sketches into a new one, optionally adding a list of raw values
+        
+        Args:
+            sketches (iterable): QuantileSketch objects with the same relative accuracy
+            raw_values (list): Raw values recorded outside any sketch
+        
+        Returns:
+            QuantileSketch: Merged sketch
+        """
+        sketches = list(sketches)
+        merged = QuantileSketch(sketches[0].relative_accuracy, sketches[0].max_bins) if sketches else QuantileSketch()
+        for sketch in sketches:
+            merged.merge(sketch)
+        if isinstance(raw_values, list):
+            merged.add_all(raw_values)
+        return merged
+    
     def get_or_create_metric(self, metric_type, name, description, labels=None, **kwargs):
         """
         Get an existing metric or create a new one if it doesn't exist
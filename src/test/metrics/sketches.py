@@ -0,0 +1,456 @@
+"""
+Mergeable quantile sketches for performance metrics of the Borrow Rate & Locate Fee Pricing Engine.
+
+QuantileSketch is a DDSketch: values are counted in logarithmically sized bins, so every
+quantile is returned with a bounded relative error (1% by default) using memory that
+depends on the range of the values, not on how many were recorded. Sketches built on
+different machines or from different files merge exactly by adding bin counts, which
+makes them suitable for multi-hour soak tests and distributed Locust workers.
+
+WindowedSketch adds sliding time windows on top: recent values are also kept in a ring
+of per-slot sketches, so quantiles over the last N seconds cost one merge of a few
+sketches instead of a scan over raw samples.
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Relative accuracy guaranteed for every quantile (1%)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Upper bound on bins per sketch; the lowest bins are collapsed beyond this
+DEFAULT_MAX_BINS = 2048
+
+# Values at or below this are counted in the zero bin
+MIN_POSITIVE_VALUE = 1e-9
+
+# Length of the sliding window kept by WindowedSketch in seconds
+DEFAULT_WINDOW_SECONDS = 60
+
+# Number of slots the sliding window is divided into
+DEFAULT_WINDOW_SLOTS = 12
+
+
+class QuantileSketch:
+    """
+    DDSketch with bounded relative error, exact merging and a bounded number of bins.
+    
+    Values are expected to be non-negative (latencies, utilization percentages);
+    negative values are counted as zero.
+    """
+    
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, max_bins: int = DEFAULT_MAX_BINS):
+        """
+        Initialize an empty sketch.
+        
+        Args:
+            relative_accuracy: Maximum relative error of returned quantiles (0 < accuracy < 1)
+            max_bins: Maximum number of bins kept; low quantiles lose accuracy first if exceeded
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def add(self, value: float, count: int = 1) -> None:
+        """
+        Record a value.
+        
+        Args:
+            value: Value to record
+            count: Number of occurrences
+        """
+        if count <= 0:
+            return
+        value = max(float(value), 0.0)
+        if value <= MIN_POSITIVE_VALUE:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def add_all(self, values: Iterable[float]) -> None:
+        """
+        Record several values.
+        
+        Args:
+            values: Values to record
+        """
+        for value in values:
+            self.add(value)
+    
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Add the contents of another sketch to this one.
+        
+        Args:
+            other: Sketch with the same relative accuracy
+        
+        Returns:
+            QuantileSketch: This sketch
+        
+        Raises:
+            ValueError: If the sketches have different relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other.count == 0:
+            return self
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+        
+        Args:
+            q: Quantile between 0 and 1
+        
+        Returns:
+            Optional[float]: Estimated value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        
+        rank = q * (self.count - 1)
+        cumulative = self.zero_count
+        if cumulative > rank:
+            return 0.0
+        for key in sorted(self.bins):
+            cumulative += self.bins[key]
+            if cumulative > rank:
+                estimate = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+    
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Estimate a percentile.
+        
+        Args:
+            percentile: Percentile between 0 and 100
+        
+        Returns:
+            Optional[float]: Estimated value, or None if the sketch is empty
+        """
+        return self.quantile(percentile / 100.0)
+    
+    @property
+    def mean(self) -> Optional[float]:
+        """Exact mean of the recorded values, or None if the sketch is empty."""
+        return self.sum / self.count if self.count else None
+    
+    def iter_bins(self) -> Iterator[Tuple[float, float, int]]:
+        """
+        Iterate over the non-empty bins in ascending order.
+        
+        Yields:
+            Tuple[float, float, int]: Lower bound, upper bound and count of each bin
+        """
+        if self.zero_count:
+            yield 0.0, MIN_POSITIVE_VALUE, self.zero_count
+        for key in sorted(self.bins):
+            yield self._gamma ** (key - 1), self._gamma ** key, self.bins[key]
+    
+    def cumulative_counts(self, bounds: Iterable[float]) -> List[int]:
+        """
+        Count the values at or below each bound, as in a cumulative histogram.
+        
+        Each bin is attributed to its representative value, so counts are exact except
+        for bins straddling a bound.
+        
+        Args:
+            bounds: Ascending upper bounds
+        
+        Returns:
+            List[int]: Number of values at or below each bound
+        """
+        keys = sorted(self.bins)
+        counts = []
+        cumulative = self.zero_count
+        position = 0
+        for bound in bounds:
+            while position < len(keys):
+                key = keys[position]
+                if min(max(2 * self._gamma ** key / (self._gamma + 1), self.min), self.max) > bound:
+                    break
+                cumulative += self.bins[key]
+                position += 1
+            counts.append(cumulative if bound >= 0 else 0)
+        return counts
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the sketch to JSON-compatible data.
+        
+        Returns:
+            Dict[str, Any]: Configuration, bins and exact aggregates
+        """
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'max_bins': self.max_bins,
+            'bins': {str(key): count for key, count in self.bins.items()},
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """
+        Rebuild a sketch serialized with to_dict.
+        
+        Args:
+            data: Serialized sketch
+        
+        Returns:
+            QuantileSketch: Sketch with the stored contents
+        """
+        sketch = cls(data['relative_accuracy'], data.get('max_bins', DEFAULT_MAX_BINS))
+        sketch.bins = {int(key): count for key, count in data['bins'].items()}
+        sketch.zero_count = data['zero_count']
+        sketch.count = data['count']
+        sketch.sum = data['sum']
+        if sketch.count:
+            sketch.min = data['min']
+            sketch.max = data['max']
+        return sketch
+    
+    def _collapse(self) -> None:
+        # Fold the lowest bins into one, keeping the high quantiles exact
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.bins[target] += self.bins.pop(key)
+
+
+class WindowedSketch:
+    """
+    QuantileSketch over every recorded value plus a ring of time slots for sliding windows.
+    
+    The window is divided into equal slots, each holding its own QuantileSketch. Slots
+    that fall out of the window are dropped as new ones start, so memory is bounded by
+    slots + 1 sketches however long the collection runs. Sketches with the same slot
+    length merge slot by slot, which keeps windows meaningful across processes whose
+    clocks agree.
+    """
+    
+    def __init__(self, window_seconds: float = DEFAULT_WINDOW_SECONDS, slots: int = DEFAULT_WINDOW_SLOTS,
+                 relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, max_bins: int = DEFAULT_MAX_BINS):
+        """
+        Initialize an empty windowed sketch.
+        
+        Args:
+            window_seconds: Longest window that can be queried, in seconds
+            slots: Number of slots the window is divided into
+            relative_accuracy: Maximum relative error of returned quantiles
+            max_bins: Maximum number of bins per sketch
+        """
+        if window_seconds <= 0 or slots < 1:
+            raise ValueError("window_seconds must be positive and slots at least 1")
+        self.window_seconds = float(window_seconds)
+        self.slots = int(slots)
+        self.slot_seconds = self.window_seconds / self.slots
+        self.total = QuantileSketch(relative_accuracy, max_bins)
+        self._slots: Dict[int, QuantileSketch] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def count(self) -> int:
+        """Number of values recorded since the sketch was created."""
+        return self.total.count
+    
+    def add(self, value: float, timestamp: Optional[float] = None, count: int = 1) -> None:
+        """
+        Record a value.
+        
+        Args:
+            value: Value to record
+            timestamp: Unix time of the observation, defaults to now
+            count: Number of occurrences
+        """
+        index = self._slot_index(timestamp)
+        with self._lock:
+            self.total.add(value, count)
+            slot = self._slots.get(index)
+            if slot is None:
+                slot = self._slots[index] = self._new_sketch()
+                self._expire()
+            slot.add(value, count)
+    
+    def window(self, seconds: Optional[float] = None, now: Optional[float] = None) -> QuantileSketch:
+        """
+        Merge the slots covering the most recent seconds.
+        
+        The window is rounded up to whole slots and capped at window_seconds.
+        
+        Args:
+            seconds: Window length, defaults to window_seconds
+            now: Unix time the window ends at, defaults to now
+        
+        Returns:
+            QuantileSketch: New sketch with the values recorded in the window
+        """
+        seconds = self.window_seconds if seconds is None else min(seconds, self.window_seconds)
+        newest = self._slot_index(now)
+        oldest = newest - max(1, math.ceil(seconds / self.slot_seconds)) + 1
+        result = self._new_sketch()
+        with self._lock:
+            for index, slot in self._slots.items():
+                if oldest <= index <= newest:
+                    result.merge(slot)
+        return result
+    
+    def merge(self, other: "WindowedSketch") -> "WindowedSketch":
+        """
+        Add the contents of another windowed sketch to this one.
+        
+        Args:
+            other: Sketch with the same slot length and relative accuracy
+        
+        Returns:
+            WindowedSketch: This sketch
+        
+        Raises:
+            ValueError: If the slot lengths or relative accuracies differ
+        """
+        if other.slot_seconds != self.slot_seconds:
+            raise ValueError("Cannot merge windowed sketches with different slot lengths")
+        with other._lock:
+            other_total = self._new_sketch().merge(other.total)
+            other_slots = {index: self._new_sketch().merge(slot) for index, slot in other._slots.items()}
+        with self._lock:
+            self.total.merge(other_total)
+            for index, slot in other_slots.items():
+                if index in self._slots:
+                    self._slots[index].merge(slot)
+                else:
+                    self._slots[index] = slot
+            self._expire()
+        return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the sketch to JSON-compatible data.
+        
+        Returns:
+            Dict[str, Any]: Window configuration, total sketch and slot sketches
+        """
+        with self._lock:
+            return {
+                'window_seconds': self.window_seconds,
+                'slots': self.slots,
+                'total': self.total.to_dict(),
+                'slot_sketches': {str(index): slot.to_dict() for index, slot in self._slots.items()},
+            }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WindowedSketch":
+        """
+        Rebuild a sketch serialized with to_dict.
+        
+        Args:
+            data: Serialized windowed sketch
+        
+        Returns:
+            WindowedSketch: Sketch with the stored contents
+        """
+        total = QuantileSketch.from_dict(data['total'])
+        sketch = cls(data['window_seconds'], data['slots'], total.relative_accuracy, total.max_bins)
+        sketch.total = total
+        sketch._slots = {
+            int(index): QuantileSketch.from_dict(slot) for index, slot in data.get('slot_sketches', {}).items()
+        }
+        return sketch
+    
+    def _slot_index(self, timestamp: Optional[float]) -> int:
+        return int((time.time() if timestamp is None else timestamp) // self.slot_seconds)
+    
+    def _new_sketch(self) -> QuantileSketch:
+        return QuantileSketch(self.total.relative_accuracy, self.total.max_bins)
+    
+    def _expire(self) -> None:
+        # Drop slots that no longer overlap the window ending at the newest slot
+        newest = max(self._slots)
+        for index in [index for index in self._slots if index <= newest - self.slots]:
+            del self._slots[index]
+
+
+def as_sketch(values: Any) -> QuantileSketch:
+    """
+    Coerce recorded values to a QuantileSketch.
+    
+    Args:
+        values: QuantileSketch, WindowedSketch (its total), serialized form of either,
+            or an iterable of raw values
+    
+    Returns:
+        QuantileSketch: Sketch of the values; sketches are returned as-is, not copied
+    """
+    if isinstance(values, QuantileSketch):
+        return values
+    if isinstance(values, WindowedSketch):
+        return values.total
+    if isinstance(values, dict):
+        if 'total' in values:
+            return QuantileSketch.from_dict(values['total'])
+        return QuantileSketch.from_dict(values)
+    sketch = QuantileSketch()
+    sketch.add_all(values or [])
+    return sketch
+
+
+def sketch_statistics(values: Any) -> Dict[str, float]:
+    """
+    Summarize recorded values as min, max, average, median, p95 and p99.
+    
+    Args:
+        values: Anything accepted by as_sketch
+    
+    Returns:
+        Dict[str, float]: Statistics, all zero when nothing was recorded
+    """
+    sketch = as_sketch(values)
+    if sketch.count == 0:
+        return {"min": 0, "max": 0, "avg": 0, "median": 0, "p95": 0, "p99": 0}
+    return {
+        "min": sketch.min,
+        "max": sketch.max,
+        "avg": sketch.mean,
+        "median": sketch.quantile(0.5),
+        "p95": sketch.quantile(0.95),
+        "p99": sketch.quantile(0.99)
+    }